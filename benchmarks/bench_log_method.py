@@ -0,0 +1,117 @@
+# benchmarks/bench_log_method.py
+
+"""
+Micro-benchmark of the overhead added by the log_method decorator.
+
+It times a trivial getter (like FacebookPublication.get_text) undecorated, decorated
+with the previous implementation of log_method (eager f-strings, full repr of the
+arguments, stack walk in the formatter) and decorated with the current one, with
+logging disabled (WARNING) and enabled (DEBUG, formatted into memory).
+
+Usage:
+    python benchmarks/bench_log_method.py [--calls 20000]
+"""
+
+import argparse
+import inspect
+import io
+import logging
+import os
+import sys
+import timeit
+from functools import wraps
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from src.infrastructure.logging.logger import ColoredFormatter, CustomLogger, log_method
+from src.infrastructure.logging import logger as logger_module
+
+PROMPT = "Rédige une publication LinkedIn sur le mentorat des développeurs juniors. " * 40
+
+
+def legacy_log_method(logger):
+    """The decorator as it was before the fast path, kept here as the baseline."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            logger.entering(f"Entering {func.__name__}")
+            logger.info(f"Executing {func.__name__}")
+            try:
+                logger.debug(f"Arguments: {args}, {kwargs}")
+                result = func(*args, **kwargs)
+                logger.success(f"Successfully executed {func.__name__}")
+                return result
+            except Exception as e:
+                logger.error(f"Exception in {func.__name__}: {str(e)}")
+                raise
+            finally:
+                logger.exiting(f"Exiting {func.__name__}")
+        return wrapper
+    return decorator
+
+
+class LegacyColoredFormatter(ColoredFormatter):
+    """The formatter as it was before, walking the stack for every record."""
+
+    def get_caller_info(self, record):
+        frame = inspect.currentframe()
+        while frame and (frame.f_code.co_filename == logger_module.__file__
+                         or 'logging' in frame.f_code.co_filename):
+            frame = frame.f_back
+        if frame:
+            return {'file': os.path.basename(frame.f_code.co_filename),
+                    'function': frame.f_code.co_name, 'line': frame.f_lineno}
+        return {'file': 'unknown', 'function': 'unknown', 'line': 0}
+
+
+class Publication:
+    def __init__(self, text):
+        self.text = text
+
+    def get_text(self):
+        return self.text
+
+
+def make_logger(name, level, formatter):
+    logger = CustomLogger(name)
+    logger.setLevel(level)
+    logger.propagate = False
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    return logger
+
+
+def measure(func, calls):
+    """Return the best time per call, in microseconds, over 5 repetitions."""
+    return min(timeit.repeat(func, number=calls, repeat=5)) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the overhead of log_method')
+    parser.add_argument('--calls', type=int, default=20000, help='Calls per repetition')
+    args = parser.parse_args()
+
+    publication = Publication(PROMPT)
+    baseline = measure(publication.get_text, args.calls)
+    print(f"{'scenario':<32} {'before (us)':>12} {'after (us)':>12} {'speed-up':>9}")
+
+    for label, level in (("logging disabled (WARNING)", logging.WARNING),
+                         ("logging enabled (DEBUG)", logging.DEBUG)):
+        calls = args.calls if level == logging.WARNING else max(1, args.calls // 20)
+        before_logger = make_logger(f"before.{level}", level, LegacyColoredFormatter())
+        after_logger = make_logger(f"after.{level}", level, ColoredFormatter())
+
+        before = legacy_log_method(before_logger)(Publication.get_text)
+        after = log_method(after_logger)(Publication.get_text)
+
+        before_cost = measure(lambda: before(publication), calls) - baseline
+        after_cost = measure(lambda: after(publication), calls) - baseline
+        print(f"{label:<32} {before_cost:>12.2f} {after_cost:>12.2f} {before_cost / after_cost:>8.1f}x")
+
+    print(f"\nUndecorated call: {baseline:.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+# benchmarks/run_benchmarks.py
+
+"""
+Benchmark suite of the hot path, with stored baselines.
+
+Each benchmark times one stage of a publication, with logging disabled as in
+production and without any network access:
+- prompt_build: the PromptBuilder chain (reset, platform and topic, instructions, build)
+- prompt_render: the builder-free rendering of a precompiled template
+- entity_tweet, entity_linkedin, entity_facebook: creating and validating an entity
+- log_method: a trivial method wrapped by log_method
+- openai_generate: OpenAIAPI.generate with a canned completion (extraction and repairs)
+- dedup_find: a near-duplicate search of a 400-word post among 2,000 indexed texts
+- post_command: PostCommand.execute against stub OpenAI and LinkedIn gateways, through
+  the topic rotation, the duplicate check and the outbox (temporary SQLite files)
+
+The best time per call, over several repetitions, is compared with the baseline of the
+same benchmark in baselines.json: a benchmark slower than its baseline by more than the
+threshold is a regression, and the exit status is then 1.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--only prompt_build post_command] [--quick]
+        [--output results.json] [--threshold 0.25] [--update-baseline]
+"""
+
+import argparse
+import atexit
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from typing import Callable, Dict, Tuple
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+# Aucune requête n'est envoyée : la clé sert seulement à construire les clients
+os.environ.setdefault('OPENAI_API_KEY', 'sk-benchmark')
+
+from src.infrastructure.logging.logger import logger, log_method
+from src.infrastructure.prompting.prompt_builder import PromptBuilder, random_topic, random_voice, render
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+DEFAULT_THRESHOLD = 0.25
+REPEAT = 5
+
+INSTRUCTIONS = "Ensure the tweet is attention-grabbing and concise."
+TWEET = ("Nos développeurs juniors, encadrés par des seniors, livrent vos projets digitaux à moindre "
+         "coût. Découvrez comment sur tech-aware.fr #DevJunior #Mentorat")
+LINKEDIN_POST = TWEET * 12
+RAW_COMPLETION = (
+    "Voici la publication demandée :\n<social_media_post>\n  **Nos développeurs juniors**, encadrés par "
+    "des seniors, livrent vos projets digitaux à moindre coût.  Découvrez comment sur "
+    "https://tech-aware.fr  #DevJunior #Mentorat\n</social_media_post>\nN'hésitez pas à l'adapter."
+)
+# Vocabulaire des publications factices : des tirages distincts ne sont jamais des quasi-doublons
+VOCABULARY = [f"terme{number}" for number in range(500)]
+
+
+def bench_prompt_build() -> Callable[[], object]:
+    builder = PromptBuilder()
+
+    def build():
+        builder.reset()
+        return (builder
+                .set_platform_and_topic_category('twitter', 'business')
+                .add_custom_instructions(INSTRUCTIONS)
+                .build())
+    return build
+
+
+def bench_prompt_render() -> Callable[[], object]:
+    return lambda: render('twitter', random_topic('business'), random_voice(), INSTRUCTIONS)
+
+
+def bench_entity_tweet() -> Callable[[], object]:
+    from src.domain.entities.tweet import Tweet
+    return lambda: Tweet(TWEET).validate()
+
+
+def bench_entity_linkedin() -> Callable[[], object]:
+    from src.domain.entities.linkedin_publication import LinkedInPublication
+    return lambda: LinkedInPublication(LINKEDIN_POST).validate()
+
+
+def bench_entity_facebook() -> Callable[[], object]:
+    from src.domain.entities.facebook_publication import FacebookPublication
+    return lambda: FacebookPublication(LINKEDIN_POST).validate()
+
+
+def bench_log_method() -> Callable[[], object]:
+    class Publication:
+        def __init__(self, text):
+            self.text = text
+
+        @log_method(logger)
+        def get_text(self):
+            return self.text
+
+    return Publication(TWEET).get_text
+
+
+def bench_openai_generate() -> Callable[[], object]:
+    from src.infrastructure.external.openai_api import OpenAIAPI
+    api = OpenAIAPI(cache=None)
+    api._complete = lambda prompt, max_tokens=None: RAW_COMPLETION
+    return lambda: api.generate("prompt", max_length=280)
+
+
+class StubOpenAIGateway:
+    """Answers every prompt at once with a new random publication."""
+
+    def __init__(self, seed: int = 0):
+        self._random = random.Random(seed)
+
+    def generate(self, prompt, max_length=None):
+        return ' '.join(self._random.sample(VOCABULARY, 25))
+
+
+class StubLinkedInGateway:
+    def __init__(self):
+        self.posts = 0
+
+    def post(self, publication):
+        self.posts += 1
+        return {"id": f"urn:li:share:{self.posts}"}
+
+
+def bench_dedup_find() -> Callable[[], object]:
+    from src.infrastructure.persistence.duplicate_index import DuplicateIndex
+    rng = random.Random(0)
+    index = DuplicateIndex(':memory:')
+    for number in range(2000):
+        index.add('facebook', ' '.join(rng.choice(VOCABULARY) for _ in range((60, 150, 400)[number % 3])))
+    text = ' '.join(rng.choice(VOCABULARY) for _ in range(400))
+    index.find('facebook', text, 0.8)  # construction des buckets
+    return lambda: index.find('facebook', text, 0.8)
+
+
+def bench_post_command() -> Callable[[], object]:
+    from src.infrastructure.container import Container
+    from src.presentation.post_command import PostCommand
+    directory = tempfile.mkdtemp(prefix='benchmark-')
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    for variable, name in (('OUTBOX_PATH', 'outbox'), ('DEDUP_PATH', 'dedup'),
+                           ('ROTATION_PATH', 'rotation'), ('OPENAI_CACHE_PATH', 'cache')):
+        os.environ[variable] = os.path.join(directory, f'{name}.sqlite3')
+    command = PostCommand(container=Container())
+    command.container.override('openai_gateway', StubOpenAIGateway())
+    command.container.override('linkedin_gateway', StubLinkedInGateway())
+    return lambda: command.execute('linkedin')
+
+
+# Nom : (préparation, appels par répétition)
+BENCHMARKS: Dict[str, Tuple[Callable[[], Callable[[], object]], int]] = {
+    'prompt_build': (bench_prompt_build, 2000),
+    'prompt_render': (bench_prompt_render, 5000),
+    'entity_tweet': (bench_entity_tweet, 5000),
+    'entity_linkedin': (bench_entity_linkedin, 5000),
+    'entity_facebook': (bench_entity_facebook, 5000),
+    'log_method': (bench_log_method, 20000),
+    'openai_generate': (bench_openai_generate, 2000),
+    'dedup_find': (bench_dedup_find, 1000),
+    'post_command': (bench_post_command, 100),
+}
+
+
+def measure(func: Callable[[], object], calls: int) -> Dict[str, float]:
+    """Return the best and median time per call, in microseconds, over ``REPEAT`` repetitions."""
+    timeit.timeit(func, number=max(1, calls // 10))  # échauffement : imports, caches et connexions
+    times = [total / calls * 1e6 for total in timeit.repeat(func, number=calls, repeat=REPEAT)]
+    return {'best_us': round(min(times), 3), 'median_us': round(statistics.median(times), 3), 'calls': calls}
+
+
+def compare(results: Dict[str, Dict], baselines: Dict[str, Dict], threshold: float) -> Dict[str, Dict]:
+    """
+    Compare each result with its baseline.
+
+    Returns:
+        Dict[str, Dict]: Per benchmark, the 'baseline_us', the 'ratio' of the best time to
+            the baseline, and whether it is a 'regression'; benchmarks without a baseline
+            are left out
+    """
+    comparison = {}
+    for name, result in results.items():
+        baseline = baselines.get(name, {}).get('best_us')
+        if not baseline:
+            continue
+        ratio = result['best_us'] / baseline
+        comparison[name] = {'baseline_us': baseline, 'ratio': round(ratio, 3), 'regression': ratio > 1 + threshold}
+    return comparison
+
+
+def load_baselines(path: str) -> Dict[str, Dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as baseline_file:
+        return json.load(baseline_file).get('results', {})
+
+
+def write_json(path: str, data: Dict) -> None:
+    with open(path, 'w', encoding='utf-8') as output_file:
+        json.dump(data, output_file, indent=2, sort_keys=True)
+        output_file.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the benchmark suite and compare it with the baselines')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='Benchmarks to run (all by default)')
+    parser.add_argument('--quick', action='store_true', help='Run a tenth of the calls, for a rough check')
+    parser.add_argument('--output', help='Write the results and the comparison to this JSON file')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help='JSON file of the baselines')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Slowdown over the baseline reported as a regression (0.25 = 25%%)')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store these results as the new baselines of the benchmarks run')
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    random.seed(0)
+    results = {}
+    for name in args.only or BENCHMARKS:
+        setup, calls = BENCHMARKS[name]
+        results[name] = measure(setup(), max(1, calls // 10) if args.quick else calls)
+
+    baselines = load_baselines(args.baseline)
+    comparison = compare(results, baselines, args.threshold)
+    print(f"{'benchmark':<18} {'best (us)':>12} {'median (us)':>12} {'baseline':>10} {'ratio':>7}")
+    for name, result in results.items():
+        compared = comparison.get(name)
+        baseline = f"{compared['baseline_us']:>10.2f} {compared['ratio']:>6.2f}x" if compared else f"{'-':>10} {'-':>7}"
+        flag = "  REGRESSION" if compared and compared['regression'] else ""
+        print(f"{name:<18} {result['best_us']:>12.2f} {result['median_us']:>12.2f} {baseline}{flag}")
+
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.platform(),
+        'threshold': args.threshold,
+        'results': results,
+        'comparison': comparison,
+    }
+    if args.output:
+        write_json(args.output, report)
+
+    if args.update_baseline:
+        baselines.update(results)
+        write_json(args.baseline, {'created_at': report['created_at'], 'python': report['python'],
+                                   'machine': report['machine'], 'results': baselines})
+        print(f"\nBaselines updated in {args.baseline}")
+        return
+
+    regressions = [name for name, compared in comparison.items() if compared['regression']]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
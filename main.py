@@ -2,6 +2,7 @@
 
 import os
 import sys
+import argparse
 from pathlib import Path
 from dotenv import load_dotenv, find_dotenv
 from src.presentation.cli import CLI
@@ -42,14 +43,37 @@ def setup_environment():
         return False
 
 
+def setup_parser():
+    """Configure l'analyseur d'arguments en ligne de commande"""
+    parser = argparse.ArgumentParser(description='Generate and post content to all social media platforms')
+
+    parser.add_argument('--concurrent',
+                        action='store_true',
+                        help='Generate and post for all platforms in parallel')
+
+    parser.add_argument('--pacing',
+                        type=float,
+                        default=0.0,
+                        help='Seconds to wait before each generation/posting stage (default: 0)')
+
+    parser.add_argument('--max-workers',
+                        type=int,
+                        default=3,
+                        help='Maximum number of parallel workers in concurrent mode (default: 3)')
+
+    return parser
+
+
 def main():
     try:
+        args = setup_parser().parse_args()
+
         # Configuration initiale
         logger.info("Starting Automator application")
         if not setup_environment():
             raise ConfigurationError("Failed to setup environment")
 
-        cli = CLI()
+        cli = CLI(concurrent=args.concurrent, pacing=args.pacing, max_workers=args.max_workers)
         cli.menu()
         logger.info("Automator application completed successfully")
     except ConfigurationError as e:
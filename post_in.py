@@ -5,12 +5,22 @@ import sys
 from dotenv import load_dotenv, find_dotenv
 from pathlib import Path
 import argparse
-from src.infrastructure.logging.logger import get_logger
-from src.domain.exceptions import ConfigurationError, AutomatorError
+import random
+import time
+from datetime import datetime
+from src.infrastructure.logging.logger import get_logger, configure_logging
+from src.domain.exceptions import ConfigurationError, AutomatorError, ValidationError
+from src.infrastructure.prompting.catalog import get_catalog
 from src.presentation.post_command import PostCommand
 
 logger = get_logger(__name__)
 
+PLATFORMS = ['facebook', 'linkedin', 'twitter']
+
+SUBCOMMANDS = ('schedule', 'queue', 'worker', 'outbox', 'campaign', 'loadtest')
+
+DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
 
 def setup_environment():
     """Configure l'environnement d'exécution"""
@@ -48,41 +58,528 @@ def setup_parser():
     parser = argparse.ArgumentParser(description='Post content to social media platforms')
 
     parser.add_argument('platform',
-                        choices=['facebook', 'linkedin', 'twitter'],
-                        help='The platform to post to')
+                        nargs='?',
+                        choices=PLATFORMS + ['all'],
+                        help="The platform to post to ('all' for every platform)")
+
+    parser.add_argument('--platform',
+                        dest='platforms',
+                        action='append',
+                        choices=PLATFORMS,
+                        default=[],
+                        help='Platform to post to (repeatable, platforms run concurrently)')
+
+    parser.add_argument('--single-request',
+                        action='store_true',
+                        help='Generate all selected platforms with one OpenAI request on a shared topic')
+
+    parser.add_argument('--tweet-candidates',
+                        type=int,
+                        default=1,
+                        metavar='N',
+                        help='Generate N tweets in one OpenAI request and keep the best one within 280 characters')
+
+    parser.add_argument('--stream',
+                        action='store_true',
+                        help='Stream OpenAI completions, stopping at the end of the post or once it is too long')
+
+    parser.add_argument('--max-workers',
+                        type=int,
+                        default=None,
+                        help='Maximum number of platforms processed in parallel (default: all)')
+
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument('--no-cache',
+                             action='store_true',
+                             help='Always call OpenAI, without reading or filling the response cache')
+    cache_group.add_argument('--cache-only',
+                             action='store_true',
+                             help='Only answer from the response cache, fail on a cache miss')
+
+    parser.add_argument('--seed',
+                        type=int,
+                        default=None,
+                        help='Draw topics and voices at random from this seed instead of the topic rotation, '
+                             'so that a run can be replayed from the cache')
 
     parser.add_argument('--debug',
                         action='store_true',
                         help='Enable debug logging')
 
+    parser.add_argument('--log-json',
+                        metavar='PATH',
+                        help='Also write logs as JSON lines to PATH (rotated and compressed)')
+
+    parser.add_argument('--no-outbox',
+                        action='store_true',
+                        help='Post without recording publications in the outbox (no resume, no duplicate check)')
+
+    parser.add_argument('--allow-duplicates',
+                        action='store_true',
+                        help='Post content even if it is nearly the same as an earlier publication')
+
+    parser.add_argument('--token-report',
+                        action='store_true',
+                        help='Print the estimated token cost of each prompt section and exit, without calling OpenAI')
+
     parser.add_argument('--dry-run',
                         action='store_true',
                         help='Generate content without posting')
 
     parser.add_argument('--topic',
-                        choices=['business', 'developer', 'slides'],
-                        help='Specify the topic category')
+                        type=parse_topic,
+                        help='Specify the topic category (one of the prompt catalog)')
 
     return parser
 
 
+def resolve_platforms(args):
+    """Détermine la liste des plateformes ciblées à partir des arguments"""
+    if args.platform == 'all':
+        return list(PLATFORMS)
+    platforms = ([args.platform] if args.platform else []) + args.platforms
+    return list(dict.fromkeys(platforms))
+
+
+def cache_mode(args):
+    """Traduit les options de cache en mode de cache de la passerelle OpenAI"""
+    if args.no_cache:
+        return 'off'
+    if args.cache_only:
+        return 'only'
+    return 'use'
+
+
+def print_summary(reports, dry_run):
+    """Affiche le résultat de chaque plateforme sous forme de tableau"""
+    print()
+    print(f"{'Platform':<10} {'Status':<8} {'Post ID':<28} {'Elapsed':>8}  Content")
+    print("-" * 100)
+    for platform, report in reports.items():
+        if report['status'] == 'success':
+            post_id = 'dry-run' if dry_run else str(report['post_id'] or '-')
+            content = (report['content'] or '').replace('\n', ' ')
+            detail = content[:40] + ('...' if len(content) > 40 else '')
+        else:
+            post_id = '-'
+            detail = f"ERROR: {str(report['error'])}"
+        print(f"{platform:<10} {report['status']:<8} {post_id:<28} {report['elapsed']:>7.2f}s  {detail}")
+    print("-" * 100)
+
+
+def log_repair_stats(command):
+    """Journalise les réparations locales, chacune ayant évité une nouvelle requête OpenAI"""
+    stats = command.repair_stats()
+    if stats and any(stats.values()):
+        details = ', '.join(f"{stage}={count}" for stage, count in stats.items())
+        logger.info(f"Output repairs: {details}")
+
+
+def print_token_report(platforms, topic=None):
+    """Affiche le coût estimé en tokens de chaque section du prompt, sans appel à OpenAI"""
+    from src.infrastructure.prompting.prompt_builder import PromptBuilder, render, random_topic, random_voice
+    from src.infrastructure.prompting.token_estimator import estimate_tokens, output_token_budget, section_costs
+    from src.use_cases.generate_multi_platform import GenerateMultiPlatformUseCase
+
+    for platform in platforms:
+        category = topic or random.choice(list(get_catalog().topics))
+        prompt = render(platform, random_topic(category), random_voice(),
+                        GenerateMultiPlatformUseCase.PLATFORM_INSTRUCTIONS[platform])
+        max_length = PromptBuilder.PLATFORM_GUIDELINES[platform]['max_length']
+        print()
+        print(f"{platform} ({category}): ~{estimate_tokens(prompt)} prompt tokens, "
+              f"max_tokens budget {output_token_budget(max_length)} for {max_length} characters")
+        print("-" * 60)
+        for section, tokens in section_costs(prompt).items():
+            print(f"{section[:50]:<50} {tokens:>8}")
+        print("-" * 60)
+
+
+def parse_duration(value):
+    """Convertit une durée ('90', '30m', '6h', '1d') en secondes"""
+    try:
+        if value[-1:].lower() in DURATION_UNITS:
+            return float(value[:-1]) * DURATION_UNITS[value[-1].lower()]
+        return float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid duration: {value!r} (e.g. 90, 30m, 6h, 1d)")
+
+
+def parse_topic(value):
+    """Vérifie qu'une catégorie de sujets existe dans le catalogue de prompts"""
+    categories = list(get_catalog().topics)
+    if value not in categories:
+        raise argparse.ArgumentTypeError(f"invalid topic category: {value!r} (choose from {', '.join(categories)})")
+    return value
+
+
+def parse_time(value):
+    """Convertit une date ISO 8601 (heure locale si sans fuseau) en timestamp"""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value!r} (e.g. 2025-01-31T09:00)")
+
+
+def setup_subcommand_parser():
+    """Configure les sous-commandes de la file de publications programmées, de l'outbox et des campagnes"""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--db', metavar='PATH',
+                        help='Job queue or outbox database (default: SCHEDULER_DB_PATH or OUTBOX_PATH)')
+    common.add_argument('--debug', action='store_true', help='Enable debug logging')
+
+    parser = argparse.ArgumentParser(prog='post_in.py', description='Scheduled posts, outbox and campaigns')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    schedule = subparsers.add_parser('schedule', parents=[common], help='Schedule posts')
+    schedule.add_argument('platform', choices=PLATFORMS + ['all'], help="The platform to post to ('all' for every platform)")
+    schedule.add_argument('--at', type=parse_time, default=None, help='Due time of the first post, ISO 8601 (default: now)')
+    schedule.add_argument('--in', dest='delay', type=parse_duration, default=0.0,
+                          help='Delay before the first post, e.g. 30m, 6h, 1d (added to --at)')
+    schedule.add_argument('--every', type=parse_duration, default=None, help='Interval between posts, e.g. 1d')
+    schedule.add_argument('--count', type=int, default=1, help='Number of posts per platform (with --every)')
+    schedule.add_argument('--topic', type=parse_topic, help='Specify the topic category (one of the prompt catalog)')
+    schedule.add_argument('--max-attempts', type=int, default=3, help='Runs allowed before a job is marked failed')
+
+    queue = subparsers.add_parser('queue', parents=[common], help='List or cancel scheduled posts')
+    queue.add_argument('--status', choices=['pending', 'running', 'done', 'failed', 'cancelled'],
+                       help='Only list jobs with this status')
+    queue.add_argument('--limit', type=int, default=50, help='Maximum number of jobs listed')
+    queue.add_argument('--cancel', type=int, metavar='ID', action='append', default=[], help='Cancel a pending job')
+
+    worker = subparsers.add_parser('worker', parents=[common], help='Run the due posts, then wait for the next ones')
+    worker.add_argument('--max-workers', type=int, default=None, help='Jobs run in parallel (default: SCHEDULER_MAX_WORKERS)')
+    worker.add_argument('--drain', action='store_true', help='Exit once no pending job is left')
+    worker.add_argument('--dry-run', action='store_true', help='Generate content without posting')
+    worker.add_argument('--stream', action='store_true', help='Stream OpenAI completions (see --stream)')
+    worker.add_argument('--tweet-candidates', type=int, default=1, metavar='N',
+                        help='Generate N tweets per OpenAI request and keep the best one')
+    worker.add_argument('--no-outbox', action='store_true', help='Post without recording publications in the outbox')
+    worker.add_argument('--allow-duplicates', action='store_true', help='Skip the near-duplicate check')
+
+    outbox = subparsers.add_parser('outbox', parents=[common], help='List, requeue or discard recorded publications')
+    outbox.add_argument('--status', choices=['pending', 'posting', 'published', 'unknown', 'failed', 'discarded'],
+                        help='Only list publications with this status')
+    outbox.add_argument('--limit', type=int, default=50, help='Maximum number of publications listed')
+    outbox.add_argument('--requeue', type=int, metavar='ID', action='append', default=[],
+                        help='Post again an interrupted publication, once checked that it was not published')
+    outbox.add_argument('--discard', type=int, metavar='ID', action='append', default=[],
+                        help='Never post a pending or interrupted publication')
+
+    campaign = subparsers.add_parser('campaign', help='Generate a batch of publications to a JSON Lines file, without posting')
+    campaign.add_argument('--count', type=int, required=True, help='Number of publications')
+    campaign.add_argument('--platform', dest='platforms', action='append', choices=PLATFORMS, default=[],
+                          help='Target platform (repeatable, default: all)')
+    campaign.add_argument('--category', dest='categories', action='append', type=parse_topic,
+                          default=[], help='Topic category, used in turn (repeatable, default: all)')
+    campaign.add_argument('--output', required=True, metavar='PATH',
+                          help='JSON Lines output; an interrupted campaign with the same output is resumed')
+    campaign.add_argument('--concurrency', type=int, default=4, help='Maximum number of OpenAI requests in flight')
+    campaign.add_argument('--seed', type=int, default=None, help='Seed the topic and voice selection')
+    campaign.add_argument('--fresh', action='store_true', help='Start again, deleting the output of a previous run')
+    campaign.add_argument('--no-cache', action='store_true', help='Always call OpenAI, without the response cache')
+    campaign.add_argument('--stream', action='store_true', help='Stream OpenAI completions (see --stream)')
+    campaign.add_argument('--debug', action='store_true', help='Enable debug logging')
+
+    loadtest = subparsers.add_parser('loadtest', help='Measure throughput and latencies against local API stubs')
+    loadtest.add_argument('--count', type=int, default=None,
+                          help='Number of generate-validate-post pipelines (default: 60, or no cap with --duration)')
+    loadtest.add_argument('--duration', type=parse_duration, default=None,
+                          help='Start pipelines for this long, e.g. 30s, 5m')
+    loadtest.add_argument('--concurrency', type=int, default=4, help='Pipelines in flight')
+    loadtest.add_argument('--mode', choices=['threads', 'async'], default='threads',
+                          help='Run the pipelines in threads or as coroutines of one event loop')
+    loadtest.add_argument('--platform', dest='platforms', action='append', choices=PLATFORMS, default=[],
+                          help='Target platform, used in turn (repeatable, default: all)')
+    loadtest.add_argument('--latency', type=float, default=0.05,
+                          help='Seconds added by the stubs before every answer (default: 0.05)')
+    loadtest.add_argument('--csv', metavar='PATH', help='Write one row per pipeline to this CSV file')
+    loadtest.add_argument('--external', action='store_true',
+                          help='Use the stubs at the base URLs of the environment (e.g. started with '
+                               'src.infrastructure.stubs.stub_servers) instead of in-process ones')
+    loadtest.add_argument('--debug', action='store_true', help='Enable debug logging')
+    return parser
+
+
+def print_jobs(jobs, counts):
+    """Affiche les publications programmées sous forme de tableau"""
+    print(f"{'ID':>6}  {'Platform':<10} {'Topic':<10} {'Due':<19} {'Status':<10} {'Tries':>5}  Detail")
+    print("-" * 100)
+    for job in jobs:
+        due = datetime.fromtimestamp(job['due_at']).strftime('%Y-%m-%d %H:%M:%S')
+        detail = job['post_id'] or (job['last_error'] or '')[:40]
+        print(f"{job['id']:>6}  {job['platform']:<10} {job['topic'] or '-':<10} {due:<19} {job['status']:<10} "
+              f"{job['attempts']:>3}/{job['max_attempts']}  {detail}")
+    print("-" * 100)
+    print(", ".join(f"{status}: {count}" for status, count in counts.items()))
+
+
+def print_outbox(items, counts):
+    """Affiche les publications de l'outbox sous forme de tableau"""
+    print(f"{'ID':>6}  {'Platform':<10} {'Status':<10} {'Post ID':<28} {'Tries':>5}  Content")
+    print("-" * 100)
+    for item in items:
+        content = item['content'].replace('\n', ' ')
+        print(f"{item['id']:>6}  {item['platform']:<10} {item['status']:<10} {item['post_id'] or '-':<28} "
+              f"{item['attempts']:>5}  {content[:40] + ('...' if len(content) > 40 else '')}")
+    print("-" * 100)
+    print(", ".join(f"{status}: {count}" for status, count in counts.items()))
+
+
+def outbox_main(args):
+    """Sous-commande outbox : consultation et reprise manuelle des publications"""
+    from src.infrastructure.config.environment_outbox import get_outbox_settings
+    from src.infrastructure.persistence.outbox_store import OutboxStore
+
+    store = OutboxStore(args.db or get_outbox_settings()['path'])
+    for item_id in args.requeue:
+        print(f"Publication {item_id} {'requeued' if store.requeue(item_id) else 'is neither interrupted nor failed'}")
+    for item_id in args.discard:
+        print(f"Publication {item_id} {'discarded' if store.discard(item_id) else 'cannot be discarded'}")
+    print_outbox(store.list(args.status, limit=args.limit), store.counts())
+
+
+def campaign_main(args):
+    """Sous-commande campaign : génération en masse, reprise là où une exécution interrompue s'est arrêtée"""
+    from src.infrastructure.container import get_container
+    from src.infrastructure.persistence.campaign_log import CampaignLog
+
+    if args.count < 1 or args.concurrency < 1:
+        raise ValidationError("--count and --concurrency must be at least 1")
+    if not setup_environment():
+        raise ConfigurationError("Failed to setup environment")
+    container = get_container()
+    container.configure(cache_mode='off' if args.no_cache else 'use', openai_stream=args.stream)
+    use_case = container.use_case('generate_campaign')
+
+    log = CampaignLog(args.output)
+    if args.fresh:
+        log.reset()
+    settings = {'count': args.count, 'platforms': list(dict.fromkeys(args.platforms or PLATFORMS)),
+                'categories': list(dict.fromkeys(args.categories or use_case.categories)), 'seed': args.seed}
+    checkpoint = log.load_plan()
+    if checkpoint is None:
+        plan = use_case.plan(settings['count'], settings['platforms'], settings['categories'], settings['seed'])
+        log.save_plan(settings, plan)
+    elif checkpoint['settings'] != settings:
+        raise ValidationError(f"{args.output} belongs to another campaign ({checkpoint['settings']}); "
+                              f"use --fresh or another --output")
+    else:
+        plan = checkpoint['plan']
+
+    summary = use_case.execute(plan, log, concurrency=args.concurrency)
+    print(f"Campaign {args.output}: {summary['success']} generated, {summary['failed']} failed, "
+          f"{summary['skipped']} already generated, of {summary['planned']} planned")
+    if summary['failed']:
+        print("Run the same command again to retry the failed publications")
+        sys.exit(1)
+
+
+def format_ms(value):
+    return f"{value:.2f}" if value is not None else '-'
+
+
+def print_load_report(summary):
+    """Affiche le débit et les percentiles de latence d'un test de charge"""
+    print(f"{'Platform':<10} {'Stage':<9} {'Count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'Mean ms':>9} {'Max ms':>9}")
+    print("-" * 78)
+    for platform, stages in summary['latencies'].items():
+        for stage, stats in stages.items():
+            print(f"{platform:<10} {stage:<9} {stats['count']:>6} {format_ms(stats['p50']):>9} "
+                  f"{format_ms(stats['p95']):>9} {format_ms(stats['p99']):>9} {format_ms(stats['mean']):>9} "
+                  f"{format_ms(stats['max']):>9}")
+    print("-" * 78)
+    print(f"{summary['succeeded']} of {summary['pipelines']} pipelines succeeded in {summary['wall_time']:.2f}s "
+          f"({summary['mode']}, concurrency {summary['concurrency']}): {summary['throughput']:.2f} posts/s, "
+          f"{summary['throughput'] * 60:.0f} posts/min")
+
+
+def loadtest_main(args):
+    """
+    Sous-commande loadtest : pipelines concurrents génération → validation → publication
+    contre des stubs locaux, jamais contre les API de production
+    """
+    import tempfile
+    from src.infrastructure.config.environment_endpoints import ENDPOINT_VARIABLES, get_endpoint_settings
+    from src.infrastructure.container import Container
+    from src.infrastructure.stubs.stub_servers import StubServers
+    from src.presentation.load_generator import LoadGenerator, summarize, write_csv
+
+    count = args.count if args.count is not None else (None if args.duration else 60)
+    if (count is not None and count < 1) or args.concurrency < 1:
+        raise ValidationError("--count and --concurrency must be at least 1")
+    if args.latency < 0:
+        raise ValidationError("--latency cannot be negative")
+    configure_logging(level='DEBUG' if args.debug else os.environ.get('LOG_LEVEL', 'WARNING'))
+    platforms = list(dict.fromkeys(args.platforms or PLATFORMS))
+
+    servers = None
+    if args.external:
+        if not setup_environment():
+            raise ConfigurationError("Failed to setup environment")
+        endpoints = get_endpoint_settings()
+        missing = [ENDPOINT_VARIABLES[name] for name in ['openai'] + platforms if not endpoints[name]]
+        if missing:
+            # Sans URL de base, les passerelles iraient vers les API de production
+            raise ConfigurationError(f"--external requires {', '.join(missing)} to point at the stubs")
+        environment = {}
+    else:
+        servers = StubServers(latency=args.latency).start()
+        environment = servers.environment()
+
+    previous = {}
+    with tempfile.TemporaryDirectory(prefix='loadtest-') as state_dir:
+        # Cache, historique de rotation et jetons dans un répertoire jetable : le test ne touche pas à .cache
+        for name in ('OPENAI_CACHE_PATH', 'OUTBOX_PATH', 'ROTATION_PATH', 'DEDUP_PATH', 'FACEBOOK_TOKEN_CACHE_PATH'):
+            environment[name] = os.path.join(state_dir, name.lower())
+        for name, value in environment.items():
+            previous[name] = os.environ.get(name)
+            os.environ[name] = value
+        try:
+            container = Container(cache_mode='off', outbox=False, dedup=False)
+            generator = LoadGenerator(container, platforms, concurrency=args.concurrency, mode=args.mode)
+            run = generator.run(count=count, duration=args.duration)
+        finally:
+            for name, value in previous.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            if servers is not None:
+                servers.stop()
+
+    summary = summarize(run)
+    print_load_report(summary)
+    if args.csv:
+        write_csv(args.csv, run)
+        print(f"Time series written to {args.csv}")
+    errors = [record['error'] for record in run['records'] if record['error']]
+    if errors:
+        print(f"First error: {errors[0]}")
+        sys.exit(1)
+
+
+def subcommand_main(argv):
+    """Point d'entrée des sous-commandes schedule, queue, worker, outbox, campaign et loadtest"""
+    from src.infrastructure.config.environment_scheduler import get_scheduler_settings
+    from src.infrastructure.persistence.job_store import JobStore
+
+    parser = setup_subcommand_parser()
+    args = parser.parse_args(argv)
+    configure_logging(level='DEBUG' if args.debug else os.environ.get('LOG_LEVEL', 'INFO'))
+    if args.command == 'outbox':
+        return outbox_main(args)
+    if args.command == 'campaign':
+        return campaign_main(args)
+    if args.command == 'loadtest':
+        return loadtest_main(args)
+    settings = get_scheduler_settings()
+    store = JobStore(args.db or settings['path'])
+
+    if args.command == 'schedule':
+        if args.count < 1:
+            parser.error("--count must be at least 1")
+        if args.count > 1 and not args.every:
+            parser.error("--count requires --every")
+        platforms = list(PLATFORMS) if args.platform == 'all' else [args.platform]
+        first = (args.at if args.at is not None else time.time()) + args.delay
+        for index in range(args.count):
+            due_at = first + index * (args.every or 0)
+            for platform in platforms:
+                job_id = store.add(platform, due_at, topic=args.topic, max_attempts=args.max_attempts)
+                print(f"Scheduled job {job_id}: {platform} at {datetime.fromtimestamp(due_at):%Y-%m-%d %H:%M:%S}")
+        return
+
+    if args.command == 'queue':
+        for job_id in args.cancel:
+            print(f"Job {job_id} {'cancelled' if store.cancel(job_id) else 'is not pending'}")
+        print_jobs(store.list(args.status, limit=args.limit), store.counts())
+        return
+
+    from src.presentation.worker import Worker
+    if not setup_environment():
+        raise ConfigurationError("Failed to setup environment")
+    command = PostCommand(tweet_candidates=args.tweet_candidates, stream=args.stream, outbox=not args.no_outbox,
+                          dedup=not args.allow_duplicates)
+    worker = Worker(store, command, max_workers=args.max_workers or settings['max_workers'],
+                    poll_interval=settings['poll_interval'], retry_delay=settings['retry_delay'],
+                    dry_run=args.dry_run, stale_after=settings['stale_after'])
+    try:
+        summary = worker.run(drain=args.drain)
+    except KeyboardInterrupt:
+        # Les tâches en cours restent 'running' et seront reprises une fois leur bail expiré
+        logger.info("Worker interrupted")
+        return
+    log_repair_stats(command)
+    if summary['failed']:
+        sys.exit(1)
+
+
 def main():
+    if sys.argv[1:2] and sys.argv[1] in SUBCOMMANDS:
+        try:
+            subcommand_main(sys.argv[1:])
+        except AutomatorError as e:
+            logger.error(f"Scheduler error: {str(e)}")
+            print(f"An error occurred: {str(e)}")
+            sys.exit(1)
+        return
+
     try:
         # Parser les arguments
         parser = setup_parser()
         args = parser.parse_args()
+        platforms = resolve_platforms(args)
+        if not platforms:
+            parser.error("a platform is required (facebook, linkedin, twitter or all)")
+        if args.tweet_candidates < 1:
+            parser.error("--tweet-candidates must be at least 1")
+
+        # Journalisation : DEBUG uniquement sur demande, écriture en arrière-plan
+        configure_logging(level='DEBUG' if args.debug else os.environ.get('LOG_LEVEL', 'INFO'),
+                          json_path=args.log_json)
 
         # Configuration de l'environnement
         if not setup_environment():
             raise ConfigurationError("Failed to setup environment")
 
+        # Une graine fixe reproduit les mêmes prompts, donc les mêmes entrées de cache : la rotation,
+        # dont l'ordre dépend de l'historique, est alors remplacée par le tirage aléatoire
+        if args.seed is not None:
+            random.seed(args.seed)
+
+        if args.token_report:
+            print_token_report(platforms, args.topic)
+            return
+
         # Exécuter la commande
-        command = PostCommand()
+        command = PostCommand(cache_mode=cache_mode(args), tweet_candidates=args.tweet_candidates,
+                              stream=args.stream, outbox=not args.no_outbox, dedup=not args.allow_duplicates,
+                              rotation=args.seed is None)
+
+        if len(platforms) > 1:
+            reports = command.execute_many(
+                platforms,
+                dry_run=args.dry_run,
+                topic=args.topic,
+                max_workers=args.max_workers,
+                single_request=args.single_request
+            )
+            log_repair_stats(command)
+            print_summary(reports, args.dry_run)
+            failed = [platform for platform, report in reports.items() if report['status'] != 'success']
+            if failed:
+                logger.error(f"Failed platforms: {', '.join(failed)}")
+                sys.exit(1)
+            return
+
         result = command.execute(
-            platform=args.platform,
+            platform=platforms[0],
             dry_run=args.dry_run,
             topic=args.topic
         )
+        log_repair_stats(command)
 
         # Afficher le résultat
         if args.dry_run:
@@ -91,7 +588,7 @@ def main():
             print(result)
             print("-" * 40)
         else:
-            print(f"Successfully posted to {args.platform}!")
+            print(f"Successfully posted to {platforms[0]}!")
 
     except ConfigurationError as e:
         logger.error(f"Configuration error: {str(e)}")
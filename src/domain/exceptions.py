@@ -6,9 +6,26 @@ It provides a hierarchy of exceptions to handle various error scenarios
 in a structured manner, allowing for more precise error handling and reporting.
 """
 
+from typing import Optional
+
 
 class AutomatorError(Exception):
-    """Base exception for the Automator application"""
+    """
+    Base exception for the Automator application
+
+    Attributes:
+        transient (bool): True if the same operation may succeed later (throttling,
+            temporary outage), False if retrying cannot help
+        retry_after (Optional[float]): Seconds to wait before retrying, when known
+        status_code (Optional[int]): HTTP status code of the failed call, if any
+    """
+
+    def __init__(self, *args, transient: bool = False, retry_after: Optional[float] = None,
+                 status_code: Optional[int] = None):
+        super().__init__(*args)
+        self.transient = transient
+        self.retry_after = retry_after
+        self.status_code = status_code
 
 
 class TwitterError(AutomatorError):
@@ -19,10 +36,18 @@ class OpenAIError(AutomatorError):
     """Raised when there's an error interacting with OpenAI API"""
 
 
+class ContentLengthError(OpenAIError):
+    """Raised when generated content exceeds the length limit of its platform"""
+
+
 class TweetGenerationError(OpenAIError):
     """Raised when there's an error generating a tweet using OpenAI"""
 
 
+class TweetLengthError(TweetGenerationError):
+    """Raised when no generated tweet fits the character limit within the allowed attempts"""
+
+
 class ConfigurationError(AutomatorError):
     """Raised when there's an error in the configuration"""
 
@@ -31,6 +56,21 @@ class ValidationError(AutomatorError):
     """Raised when there's a validation error"""
 
 
+class DuplicateContentError(ValidationError):
+    """
+    Raised when generated content is too similar to a publication already posted
+
+    Attributes:
+        similarity (Optional[float]): Estimated similarity with the closest publication
+        match_id (Optional[int]): Id of the closest publication in the duplicate index
+    """
+
+    def __init__(self, *args, similarity: Optional[float] = None, match_id: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.similarity = similarity
+        self.match_id = match_id
+
+
 # New exception for LinkedIn
 class LinkedInError(AutomatorError):
     """Raised when there's an error interacting with LinkedIn API"""
@@ -0,0 +1,129 @@
+# Location: src/infrastructure/caching/response_cache.py
+
+"""
+This module implements ResponseCache, a content-addressed on-disk cache of OpenAI
+completions. Entries are keyed by a hash of the model, the prompt and the sampling
+parameters, expire after a time-to-live and are evicted least recently used first
+once the cache holds more than ``max_entries`` responses.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Callable, Dict, Optional
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.persistence.sqlite_store import SQLiteStore
+
+
+class ResponseCache(SQLiteStore):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            content TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+    """
+
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600, max_entries: int = 1000,
+                 clock: Callable[[], float] = time.time):
+        """
+        Open the cache.
+
+        Args:
+            path (str): Path of the SQLite file, or ':memory:'
+            ttl (float): Lifetime of an entry in seconds (0 or less disables expiry)
+            max_entries (int): Maximum number of entries kept
+            clock (Callable[[], float]): Time source, in seconds
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        super().__init__(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Compute the cache key of a completion request.
+
+        Args:
+            model (str): The model name
+            prompt (str): The full prompt
+            params (Optional[Dict[str, Any]]): The sampling parameters sent with the request
+
+        Returns:
+            str: A SHA-256 hex digest identifying the request
+        """
+        payload = json.dumps({'model': model, 'prompt': prompt, 'params': params or {}},
+                             sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached response of a key, or None if it is missing or expired.
+        A hit refreshes the entry's position in the LRU order.
+        """
+        now = self._clock()
+        with self.transaction() as connection:
+            row = connection.execute(
+                "SELECT content, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if self.ttl > 0 and now - row['created_at'] > self.ttl:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                logger.debug(f"Cache entry {key[:12]} expired")
+                return None
+            connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        logger.debug(f"Cache hit for {key[:12]}")
+        return row['content']
+
+    def set(self, key: str, model: str, content: str) -> None:
+        """
+        Store a response, then evict the least recently used entries beyond ``max_entries``.
+        """
+        now = self._clock()
+        with self.transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, model, content, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, content, now, now)
+            )
+            evicted = connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            ).rowcount
+        if evicted:
+            logger.debug(f"Evicted {evicted} cache entries")
+
+    def delete(self, key: str) -> None:
+        """Remove an entry, if present."""
+        with self.transaction() as connection:
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired entry.
+
+        Returns:
+            int: The number of removed entries
+        """
+        if self.ttl <= 0:
+            return 0
+        with self.transaction() as connection:
+            return connection.execute(
+                "DELETE FROM responses WHERE created_at < ?", (self._clock() - self.ttl,)
+            ).rowcount
+
+    def __len__(self) -> int:
+        return self.query("SELECT COUNT(*) FROM responses")[0][0]
@@ -0,0 +1,36 @@
+# src/infrastructure/config/environment_cache.py
+
+import os
+from dotenv import load_dotenv
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+DEFAULT_CACHE_PATH = os.path.join('.cache', 'openai_responses.sqlite3')
+DEFAULT_CACHE_TTL = 7 * 24 * 3600
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+
+
+def get_cache_settings():
+    """
+    Read the OpenAI response cache settings.
+
+    Variables (all optional):
+        OPENAI_CACHE_PATH: SQLite file of the cache
+        OPENAI_CACHE_TTL: Lifetime of an entry, in seconds
+        OPENAI_CACHE_MAX_ENTRIES: Maximum number of cached responses
+    """
+    load_dotenv()
+
+    try:
+        settings = {
+            'path': os.getenv('OPENAI_CACHE_PATH') or DEFAULT_CACHE_PATH,
+            'ttl': float(os.getenv('OPENAI_CACHE_TTL') or DEFAULT_CACHE_TTL),
+            'max_entries': int(os.getenv('OPENAI_CACHE_MAX_ENTRIES') or DEFAULT_CACHE_MAX_ENTRIES),
+        }
+    except ValueError as e:
+        logger.error(f"Invalid cache setting: {str(e)}")
+        raise ConfigurationError(f"Invalid cache setting: {str(e)}")
+
+    if settings['max_entries'] < 1:
+        raise ConfigurationError("OPENAI_CACHE_MAX_ENTRIES must be at least 1")
+    return settings
@@ -0,0 +1,30 @@
+# src/infrastructure/config/environment_catalog.py
+
+import os
+from dotenv import load_dotenv
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+DEFAULT_CATALOG_CHECK_INTERVAL = 1.0
+
+
+def get_catalog_settings():
+    """
+    Read the settings of the prompt catalog.
+
+    Variables (all optional):
+        PROMPT_CATALOG_PATH: JSON file of the topics, platform guidelines and brand voice
+            elements (defaults to the catalog shipped with the application)
+        PROMPT_CATALOG_CHECK_INTERVAL: Minimum delay, in seconds, between two checks of
+            the catalog file for changes
+    """
+    load_dotenv()
+
+    try:
+        return {
+            'path': os.getenv('PROMPT_CATALOG_PATH') or None,
+            'check_interval': float(os.getenv('PROMPT_CATALOG_CHECK_INTERVAL') or DEFAULT_CATALOG_CHECK_INTERVAL),
+        }
+    except ValueError as e:
+        logger.error(f"Invalid prompt catalog setting: {str(e)}")
+        raise ConfigurationError(f"Invalid prompt catalog setting: {str(e)}")
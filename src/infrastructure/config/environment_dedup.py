@@ -0,0 +1,35 @@
+# src/infrastructure/config/environment_dedup.py
+
+import os
+from dotenv import load_dotenv
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+DEFAULT_DEDUP_PATH = os.path.join('.cache', 'dedup.sqlite3')
+DEFAULT_DEDUP_THRESHOLD = 0.8
+DEFAULT_DEDUP_MAX_REGENERATIONS = 2
+
+
+def get_dedup_settings():
+    """
+    Read the settings of the near-duplicate check of generated publications.
+
+    Variables (all optional):
+        DEDUP_PATH: SQLite file of the MinHash signatures of the published texts
+        DEDUP_THRESHOLD: Similarity (0 to 1) from which a publication is a duplicate
+        DEDUP_MAX_REGENERATIONS: New generations attempted for a duplicate before giving up
+    """
+    load_dotenv()
+
+    try:
+        settings = {
+            'path': os.getenv('DEDUP_PATH') or DEFAULT_DEDUP_PATH,
+            'threshold': float(os.getenv('DEDUP_THRESHOLD') or DEFAULT_DEDUP_THRESHOLD),
+            'max_regenerations': int(os.getenv('DEDUP_MAX_REGENERATIONS') or DEFAULT_DEDUP_MAX_REGENERATIONS),
+        }
+    except ValueError as e:
+        logger.error(f"Invalid dedup setting: {str(e)}")
+        raise ConfigurationError(f"Invalid dedup setting: {str(e)}")
+    if not 0 < settings['threshold'] <= 1 or settings['max_regenerations'] < 0:
+        raise ConfigurationError("DEDUP_THRESHOLD must be in ]0, 1] and DEDUP_MAX_REGENERATIONS at least 0")
+    return settings
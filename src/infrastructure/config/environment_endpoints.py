@@ -0,0 +1,46 @@
+# src/infrastructure/config/environment_endpoints.py
+
+import os
+from urllib.parse import urlsplit
+from dotenv import load_dotenv
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+ENDPOINT_VARIABLES = {
+    'openai': 'OPENAI_BASE_URL',
+    'facebook': 'FACEBOOK_GRAPH_URL',
+    'linkedin': 'LINKEDIN_API_URL',
+    'twitter': 'TWITTER_API_URL',
+}
+
+
+def get_endpoint_settings():
+    """
+    Read the base URLs of the APIs, e.g. to send the requests to local stub servers.
+
+    Variables (all optional):
+        OPENAI_BASE_URL: Base of the OpenAI API, e.g. http://127.0.0.1:8001/v1
+        FACEBOOK_GRAPH_URL: Base of the Graph API, version included
+        LINKEDIN_API_URL: Base of the LinkedIn API, ugcPosts being appended
+        TWITTER_API_URL: Base of the X API, tweets being appended
+
+    Returns:
+        dict: The base URL of each platform, without trailing slash, or None when unset
+            (the gateway then uses the production URL)
+
+    Raises:
+        ConfigurationError: If a URL is not an absolute http(s) URL
+    """
+    load_dotenv()
+
+    settings = {}
+    for platform, variable in ENDPOINT_VARIABLES.items():
+        url = (os.environ.get(variable) or '').strip() or None
+        if url is not None:
+            parts = urlsplit(url)
+            if parts.scheme not in ('http', 'https') or not parts.netloc:
+                logger.error(f"Invalid {variable}: {url}")
+                raise ConfigurationError(f"{variable} must be an absolute http(s) URL (got '{url}')")
+            url = url.rstrip('/')
+        settings[platform] = url
+    return settings
@@ -0,0 +1,44 @@
+# src/infrastructure/config/environment_http.py
+
+import os
+from dotenv import load_dotenv
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+DEFAULT_HTTP_SETTINGS = {
+    'pool_connections': 10,
+    'pool_maxsize': 20,
+    'connect_timeout': 5.0,
+    'read_timeout': 30.0,
+    'prewarm': False,
+}
+
+
+def get_http_settings():
+    """
+    Read the settings of the pooled HTTP clients used by the platform gateways.
+
+    Variables (all optional):
+        HTTP_POOL_CONNECTIONS: Number of hosts kept in the connection pool
+        HTTP_POOL_MAXSIZE: Maximum number of kept-alive connections per host
+        HTTP_CONNECT_TIMEOUT: Connection timeout, in seconds
+        HTTP_READ_TIMEOUT: Read timeout, in seconds
+        HTTP_PREWARM: 'true' to open the connection to the API hosts at startup
+    """
+    load_dotenv()
+
+    try:
+        settings = {
+            'pool_connections': int(os.environ.get('HTTP_POOL_CONNECTIONS') or DEFAULT_HTTP_SETTINGS['pool_connections']),
+            'pool_maxsize': int(os.environ.get('HTTP_POOL_MAXSIZE') or DEFAULT_HTTP_SETTINGS['pool_maxsize']),
+            'connect_timeout': float(os.environ.get('HTTP_CONNECT_TIMEOUT') or DEFAULT_HTTP_SETTINGS['connect_timeout']),
+            'read_timeout': float(os.environ.get('HTTP_READ_TIMEOUT') or DEFAULT_HTTP_SETTINGS['read_timeout']),
+            'prewarm': (os.environ.get('HTTP_PREWARM') or '').strip().lower() in ('1', 'true', 'yes'),
+        }
+    except ValueError as e:
+        logger.error(f"Invalid HTTP setting: {str(e)}")
+        raise ConfigurationError(f"Invalid HTTP setting: {str(e)}")
+
+    if settings['pool_connections'] < 1 or settings['pool_maxsize'] < 1:
+        raise ConfigurationError("HTTP pool sizes must be at least 1")
+    return settings
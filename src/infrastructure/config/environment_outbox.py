@@ -0,0 +1,31 @@
+# src/infrastructure/config/environment_outbox.py
+
+import os
+from dotenv import load_dotenv
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+DEFAULT_OUTBOX_PATH = os.path.join('.cache', 'outbox.sqlite3')
+DEFAULT_OUTBOX_STALE_AFTER = 3600.0
+
+
+def get_outbox_settings():
+    """
+    Read the settings of the outbox of generated publications.
+
+    Variables (all optional):
+        OUTBOX_PATH: SQLite file of the outbox
+        OUTBOX_STALE_AFTER: Age, in seconds, after which a publication still marked as
+            being posted is considered interrupted by a crash, and after which a pending
+            publication claimed by a process that never posted it can be claimed again
+    """
+    load_dotenv()
+
+    try:
+        return {
+            'path': os.getenv('OUTBOX_PATH') or DEFAULT_OUTBOX_PATH,
+            'stale_after': float(os.getenv('OUTBOX_STALE_AFTER') or DEFAULT_OUTBOX_STALE_AFTER),
+        }
+    except ValueError as e:
+        logger.error(f"Invalid outbox setting: {str(e)}")
+        raise ConfigurationError(f"Invalid outbox setting: {str(e)}")
@@ -0,0 +1,30 @@
+# src/infrastructure/config/environment_rotation.py
+
+import os
+from dotenv import load_dotenv
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+DEFAULT_ROTATION_PATH = os.path.join('.cache', 'rotation.sqlite3')
+ROTATION_POLICIES = ('lru', 'lfu', 'random')
+
+
+def get_rotation_settings():
+    """
+    Read the settings of the topic and brand voice rotation.
+
+    Variables (all optional):
+        ROTATION_PATH: SQLite file of the history of the combinations used
+        ROTATION_POLICY: 'lru' (least recently used first, the default), 'lfu' (least
+            used first) or 'random' (no rotation, no history)
+    """
+    load_dotenv()
+
+    policy = (os.getenv('ROTATION_POLICY') or 'lru').lower()
+    if policy not in ROTATION_POLICIES:
+        logger.error(f"Invalid rotation policy: {policy}")
+        raise ConfigurationError(f"Invalid ROTATION_POLICY '{policy}', expected one of {', '.join(ROTATION_POLICIES)}")
+    return {
+        'path': os.getenv('ROTATION_PATH') or DEFAULT_ROTATION_PATH,
+        'policy': policy,
+    }
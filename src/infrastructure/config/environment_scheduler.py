@@ -0,0 +1,51 @@
+# src/infrastructure/config/environment_scheduler.py
+
+import os
+from dotenv import load_dotenv
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+DEFAULT_SCHEDULER_SETTINGS = {
+    'path': os.path.join('.cache', 'scheduler.sqlite3'),
+    'max_workers': 4,
+    'poll_interval': 30.0,
+    'retry_delay': 300.0,
+    'stale_after': 3600.0,
+}
+
+
+def get_scheduler_settings():
+    """
+    Read the settings of the scheduled-post queue and its worker.
+
+    Variables (all optional):
+        SCHEDULER_DB_PATH: SQLite file of the job queue
+        SCHEDULER_MAX_WORKERS: Number of jobs run in parallel by a worker
+        SCHEDULER_POLL_INTERVAL: Longest sleep of an idle worker, in seconds, so that
+            jobs scheduled by another process are picked up
+        SCHEDULER_RETRY_DELAY: Delay before the first retry of a failed job, in seconds
+            (doubled on each further attempt)
+        SCHEDULER_STALE_AFTER: Age in seconds after which a running job is considered
+            interrupted by a stopped worker and run again (longer than any job)
+    """
+    load_dotenv()
+
+    try:
+        settings = {
+            'path': os.getenv('SCHEDULER_DB_PATH') or DEFAULT_SCHEDULER_SETTINGS['path'],
+            'max_workers': int(os.getenv('SCHEDULER_MAX_WORKERS') or DEFAULT_SCHEDULER_SETTINGS['max_workers']),
+            'poll_interval': float(os.getenv('SCHEDULER_POLL_INTERVAL') or DEFAULT_SCHEDULER_SETTINGS['poll_interval']),
+            'retry_delay': float(os.getenv('SCHEDULER_RETRY_DELAY') or DEFAULT_SCHEDULER_SETTINGS['retry_delay']),
+            'stale_after': float(os.getenv('SCHEDULER_STALE_AFTER') or DEFAULT_SCHEDULER_SETTINGS['stale_after']),
+        }
+    except ValueError as e:
+        logger.error(f"Invalid scheduler setting: {str(e)}")
+        raise ConfigurationError(f"Invalid scheduler setting: {str(e)}")
+
+    if settings['max_workers'] < 1:
+        raise ConfigurationError("SCHEDULER_MAX_WORKERS must be at least 1")
+    if settings['poll_interval'] <= 0:
+        raise ConfigurationError("SCHEDULER_POLL_INTERVAL must be positive")
+    if settings['stale_after'] <= 0:
+        raise ConfigurationError("SCHEDULER_STALE_AFTER must be positive")
+    return settings
@@ -0,0 +1,266 @@
+# Location: src/infrastructure/container.py
+
+"""
+This module implements the dependency container of the application. Gateways are
+built lazily, the first time they are resolved, and then kept for the lifetime of
+the process, so that a run only pays for the clients it actually uses (no OpenAI
+client, Twitter session or HTTP pool is created for a blog-only run).
+
+Use cases are cheap and hold per-request state (their prompt builder), so the
+container creates a new one on each request, wired to the cached gateways.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+from src.use_cases.generate_facebook_publication import GenerateFacebookPublicationUseCase
+from src.use_cases.generate_linkedin_post import GenerateLinkedInPostUseCase
+from src.use_cases.generate_tweet import GenerateTweetUseCase
+from src.use_cases.generate_multi_platform import GenerateMultiPlatformUseCase
+from src.use_cases.generate_campaign import GenerateCampaignUseCase
+from src.use_cases.post_facebook import PostFacebookUseCase
+from src.use_cases.post_linkedin import PostLinkedInUseCase
+from src.use_cases.post_tweet import PostTweetUseCase
+
+Provider = Callable[['Container'], Any]
+
+
+# Les passerelles sont importées à la demande : charger le SDK OpenAI ou requests_oauthlib
+# coûte du temps de démarrage, inutile lorsque la plateforme n'est pas utilisée.
+def _provide_response_cache(container: 'Container'):
+    if container.settings['cache_mode'] == 'off':
+        return None
+    from src.infrastructure.caching.response_cache import ResponseCache
+    from src.infrastructure.config.environment_cache import get_cache_settings
+    settings = get_cache_settings()
+    return ResponseCache(settings['path'], ttl=settings['ttl'], max_entries=settings['max_entries'])
+
+
+def _provide_openai_gateway(container: 'Container'):
+    from src.infrastructure.external.openai_api import OpenAIAPI
+    return OpenAIAPI(cache=container.resolve('response_cache'), cache_mode=container.settings['cache_mode'],
+                     stream=container.settings['openai_stream'])
+
+
+def _provide_duplicate_gate(container: 'Container'):
+    if not container.settings['dedup']:
+        return None
+    from src.infrastructure.persistence.duplicate_index import DuplicateIndex
+    from src.infrastructure.config.environment_dedup import get_dedup_settings
+    from src.use_cases.duplicate_gate import DuplicateGate
+    settings = get_dedup_settings()
+    return DuplicateGate(DuplicateIndex(settings['path']), threshold=settings['threshold'],
+                         max_regenerations=settings['max_regenerations'])
+
+
+def _provide_outbox_publisher(container: 'Container'):
+    from src.use_cases.outbox_publisher import OutboxPublisher
+    gate = container.resolve('duplicate_gate')
+    if not container.settings['outbox']:
+        return OutboxPublisher(None, gate=gate)
+    from src.infrastructure.persistence.outbox_store import OutboxStore
+    from src.infrastructure.config.environment_outbox import get_outbox_settings
+    settings = get_outbox_settings()
+    store = OutboxStore(settings['path'])
+    if gate is not None and gate.index.count() == 0:
+        # Premier démarrage du contrôle des doublons : indexer ce que l'outbox a déjà publié
+        gate.backfill((item['platform'], item['content']) for item in store.list('published', limit=-1))
+    return OutboxPublisher(store, stale_after=settings['stale_after'], gate=gate)
+
+
+def _provide_topic_rotation(container: 'Container'):
+    from src.infrastructure.config.environment_rotation import get_rotation_settings
+    settings = get_rotation_settings()
+    if not container.settings['rotation'] or settings['policy'] == 'random':
+        return None
+    from src.infrastructure.persistence.rotation_store import RotationStore
+    from src.infrastructure.prompting.topic_rotation import TopicRotation
+    return TopicRotation(RotationStore(settings['path']), policy=settings['policy'])
+
+
+def _provide_facebook_gateway(container: 'Container'):
+    from src.infrastructure.external.facebook_api import FacebookAPI
+    return FacebookAPI()
+
+
+def _provide_linkedin_gateway(container: 'Container'):
+    from src.infrastructure.external.linkedin_api import LinkedInAPI
+    return LinkedInAPI()
+
+
+def _provide_twitter_gateway(container: 'Container'):
+    from src.infrastructure.external.twitter_api import TwitterAPI
+    return TwitterAPI()
+
+
+def _close_instances(instances: Dict[str, Any]) -> None:
+    # Les connexions SQLite et sessions HTTP des instances abandonnées sont libérées tout de suite
+    for name, instance in instances.items():
+        close = getattr(instance, 'close', None)
+        if not callable(close):
+            continue
+        try:
+            close()
+        except Exception as e:
+            logger.warning(f"Failed to close {name}: {str(e)}")
+
+
+class Container:
+    DEFAULT_PROVIDERS: Dict[str, Provider] = {
+        'response_cache': _provide_response_cache,
+        'openai_gateway': _provide_openai_gateway,
+        'outbox_publisher': _provide_outbox_publisher,
+        'duplicate_gate': _provide_duplicate_gate,
+        'topic_rotation': _provide_topic_rotation,
+        'facebook_gateway': _provide_facebook_gateway,
+        'linkedin_gateway': _provide_linkedin_gateway,
+        'twitter_gateway': _provide_twitter_gateway,
+    }
+
+    # Cas d'utilisation : classe et passerelle injectée
+    USE_CASES = {
+        'generate_facebook': (GenerateFacebookPublicationUseCase, 'openai_gateway'),
+        'generate_linkedin': (GenerateLinkedInPostUseCase, 'openai_gateway'),
+        'generate_twitter': (GenerateTweetUseCase, 'openai_gateway'),
+        'generate_multi_platform': (GenerateMultiPlatformUseCase, 'openai_gateway'),
+        'generate_campaign': (GenerateCampaignUseCase, 'openai_gateway'),
+        'post_facebook': (PostFacebookUseCase, 'facebook_gateway'),
+        'post_linkedin': (PostLinkedInUseCase, 'linkedin_gateway'),
+        'post_twitter': (PostTweetUseCase, 'twitter_gateway'),
+    }
+
+    # Arguments des cas d'utilisation lus dans les réglages du conteneur
+    USE_CASE_SETTINGS = {
+        'generate_twitter': {'candidates': 'tweet_candidates'},
+    }
+
+    # Arguments des cas d'utilisation résolus dans le conteneur, en plus de leur passerelle
+    USE_CASE_DEPENDENCIES = {
+        'generate_facebook': {'rotation': 'topic_rotation'},
+        'generate_linkedin': {'rotation': 'topic_rotation'},
+        'generate_twitter': {'rotation': 'topic_rotation'},
+        'generate_multi_platform': {'rotation': 'topic_rotation'},
+    }
+
+    DEFAULT_SETTINGS = {
+        'cache_mode': 'use',
+        'tweet_candidates': 1,
+        'openai_stream': False,
+        'outbox': True,
+        'dedup': True,
+        'rotation': True,
+    }
+
+    def __init__(self, **settings):
+        """
+        Create an empty container; nothing is built until it is resolved.
+
+        Args:
+            **settings: Overrides of ``DEFAULT_SETTINGS`` read by the providers
+        """
+        self.settings = dict(self.DEFAULT_SETTINGS, **settings)
+        self._providers: Dict[str, Provider] = dict(self.DEFAULT_PROVIDERS)
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._name_locks: Dict[str, threading.Lock] = {}
+
+    def resolve(self, name: str) -> Any:
+        """
+        Return the instance registered under a name, building it on first use.
+
+        Concurrent first resolutions of the same name build a single instance.
+
+        Raises:
+            ConfigurationError: If no provider is registered under this name
+        """
+        if name in self._instances:
+            return self._instances[name]
+        if name not in self._providers:
+            raise ConfigurationError(f"No provider registered for '{name}'")
+
+        with self._name_lock(name):
+            if name not in self._instances:
+                logger.debug(f"Building {name}")
+                self._instances[name] = self._providers[name](self)
+            return self._instances[name]
+
+    def use_case(self, name: str) -> Any:
+        """
+        Create a new use case wired to the cached gateway it depends on.
+
+        Args:
+            name (str): One of ``USE_CASES`` (e.g. 'generate_twitter', 'post_facebook')
+        """
+        if name not in self.USE_CASES:
+            raise ConfigurationError(f"Unknown use case '{name}'")
+        use_case_class, gateway_name = self.USE_CASES[name]
+        options = {argument: self.settings[setting]
+                   for argument, setting in self.USE_CASE_SETTINGS.get(name, {}).items()}
+        options.update({argument: self.resolve(dependency)
+                        for argument, dependency in self.USE_CASE_DEPENDENCIES.get(name, {}).items()})
+        return use_case_class(self.resolve(gateway_name), **options)
+
+    def register(self, name: str, provider: Provider) -> None:
+        """Register (or replace) the provider of a name, dropping any instance already built."""
+        with self._lock:
+            self._providers[name] = provider
+            self._instances.pop(name, None)
+
+    def override(self, name: str, instance: Any) -> None:
+        """Use an existing instance for a name, e.g. a test double."""
+        with self._lock:
+            self._instances[name] = instance
+
+    def configure(self, **settings) -> None:
+        """
+        Change settings. If any value actually changes, the instances built so far are
+        closed and dropped so that they are rebuilt with the new settings.
+        """
+        changed = {key: value for key, value in settings.items() if self.settings.get(key) != value}
+        if not changed:
+            return
+        with self._lock:
+            self.settings.update(changed)
+            dropped, self._instances = self._instances, {}
+        _close_instances(dropped)
+
+    def differs(self, **settings) -> bool:
+        """Tell whether ``configure`` would change any of these settings."""
+        return any(self.settings.get(key) != value for key, value in settings.items())
+
+    def close(self) -> None:
+        """Close and drop every instance built so far (connections, sessions, stores)."""
+        with self._lock:
+            dropped, self._instances = self._instances, {}
+        _close_instances(dropped)
+
+    def is_resolved(self, name: str) -> bool:
+        """Tell whether the instance of a name has already been built."""
+        return name in self._instances
+
+    def _name_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._name_locks.setdefault(name, threading.Lock())
+
+
+_container: Optional[Container] = None
+_container_lock = threading.Lock()
+
+
+def get_container() -> Container:
+    """Return the process-wide container, created on first use."""
+    global _container
+    with _container_lock:
+        if _container is None:
+            _container = Container()
+        return _container
+
+
+def reset_container() -> None:
+    """Close the process-wide container and drop it with every instance it built."""
+    global _container
+    with _container_lock:
+        container, _container = _container, None
+    if container is not None:
+        container.close()
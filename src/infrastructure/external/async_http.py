@@ -0,0 +1,105 @@
+# Location: src/infrastructure/external/async_http.py
+
+"""
+This module manages the asynchronous HTTP client shared by the platform gateways.
+A single httpx.AsyncClient is kept per event loop, so that hundreds of concurrent
+requests reuse the same connection pool instead of opening one per request.
+
+Clients are kept in a LoopLocal, keyed by the loop object itself: a new loop never
+inherits the client of an earlier one, even if it gets the same id(), and the client of
+a loop that ended without ``close_async_http_client`` is dropped.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Callable, Generic, Optional, TypeVar
+import httpx
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.config.environment_http import get_http_settings
+
+T = TypeVar('T')
+
+
+class LoopLocal(Generic[T]):
+    """
+    One value per event loop, for the asynchronous clients whose connection pool is bound
+    to the loop that created it.
+
+    Loops are referenced weakly, and the values of closed loops are dropped at the next
+    access: a pooled connection refers to its loop, so weak keys alone would keep them.
+    """
+
+    def __init__(self):
+        self._values: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, factory: Callable[[], T], is_usable: Callable[[T], bool] = lambda value: True) -> T:
+        """
+        Return the value of the running loop, created with ``factory`` if there is none
+        or it is no longer usable.
+
+        Raises:
+            RuntimeError: If called outside of a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._prune()
+            value = self._values.get(loop)
+            if value is None or not is_usable(value):
+                value = factory()
+                self._values[loop] = value
+        return value
+
+    def pop(self) -> Optional[T]:
+        """Remove and return the value of the running loop, if any."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            return self._values.pop(loop, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._prune()
+            return len(self._values)
+
+    def _prune(self) -> None:
+        # Une boucle fermée ne peut plus fermer son client : il est simplement abandonné
+        for loop in [loop for loop in list(self._values.keys()) if loop.is_closed()]:
+            self._values.pop(loop, None)
+
+
+# Un client par boucle d'événements : un AsyncClient ne peut pas être partagé entre boucles
+_clients: LoopLocal[httpx.AsyncClient] = LoopLocal()
+
+
+def _create_client() -> httpx.AsyncClient:
+    logger.debug("Creating shared async HTTP client")
+    settings = get_http_settings()
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings['read_timeout'], connect=settings['connect_timeout']),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=settings['pool_maxsize'])
+    )
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client of the running event loop, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: The client bound to the current event loop
+
+    Raises:
+        RuntimeError: If called outside of a running event loop
+    """
+    return _clients.get(_create_client, lambda client: not client.is_closed)
+
+
+async def close_async_http_client() -> None:
+    """
+    Close the shared async HTTP client of the running event loop, if any.
+    Call it before the event loop ends to release pooled connections.
+    """
+    client = _clients.pop()
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.debug("Shared async HTTP client closed")
@@ -5,70 +5,150 @@ This module implements the FacebookAPI class with extensive debugging
 and token type verification.
 """
 
+import asyncio
 import os
+import time
+import httpx
 import requests
 from src.interfaces.facebook_gateway import FacebookGateway
 from src.domain.entities.facebook_publication import FacebookPublication
 from src.infrastructure.logging.logger import logger, log_method
 from src.domain.exceptions import FacebookError
 from src.infrastructure.config.environment_facebook import get_facebook_credentials
+from src.infrastructure.external.async_http import get_async_http_client
+from src.infrastructure.external.http_session import create_http_session, prewarm_session
+from src.infrastructure.config.environment_http import get_http_settings
+from src.infrastructure.config.environment_endpoints import get_endpoint_settings
+from src.infrastructure.external.facebook_token_cache import PageTokenCache, get_page_token_cache
+from src.infrastructure.external.retry_policy import RetryPolicy, classify_graph_error, is_transient_exception
 
 
 class FacebookAPI(FacebookGateway):
     BASE_URL = "https://graph.facebook.com/v19.0"
+    # Délai avant de retenter un échange de jeton qui a échoué (jeton utilisateur entre-temps)
+    EXCHANGE_RETRY_DELAY = 60.0
 
     @log_method(logger)
-    def __init__(self):
+    def __init__(self, async_http_client: httpx.AsyncClient = None,
+                 http_session: requests.Session = None,
+                 token_cache: PageTokenCache = None, retry_policy: RetryPolicy = None,
+                 base_url: str = None):
         """
-        Initialize the FacebookAPI with token verification.
+        Initialize the FacebookAPI. The page access token is not exchanged here but on
+        first use, and is shared with the other instances through the page token cache.
+
+        Args:
+            async_http_client (httpx.AsyncClient): Optional client for ``post_async``
+                (defaults to the shared client of the running event loop)
+            http_session (requests.Session): Optional session for the synchronous calls
+                (defaults to a pooled keep-alive session configured from the environment)
+            token_cache (PageTokenCache): Optional page token cache
+                (defaults to the process-wide cache)
+            retry_policy (RetryPolicy): Retry policy of the posts
+                (defaults to the policy configured from the environment)
+            base_url (str): Base URL of the Graph API, version included
+                (defaults to FACEBOOK_GRAPH_URL, else ``BASE_URL``)
         """
+        self._async_http_client = async_http_client
         try:
+            self.retry_policy = retry_policy or RetryPolicy.from_environment()
+            self.base_url = (base_url or get_endpoint_settings()['facebook'] or self.BASE_URL).rstrip('/')
+            settings = get_http_settings()
+            self.session = http_session or create_http_session(settings)
+            if settings['prewarm']:
+                prewarm_session(self.session, [self.base_url])
+
             logger.debug("Loading Facebook credentials")
             credentials = get_facebook_credentials()
-            self.access_token = credentials['access_token']
+            self.user_access_token = credentials['access_token']
             self.page_id = credentials['page_id']
             logger.debug("Facebook credentials loaded successfully")
 
-            # Verify the token and get page access token
-            self.access_token = self._get_page_access_token()
-            logger.debug("Facebook credentials verified successfully")
+            self._token_cache = token_cache or get_page_token_cache()
+            self._token_key = PageTokenCache.make_key(self.page_id, self.user_access_token)
+            self._exchange_retry_at = 0.0
         except Exception as e:
             error_msg = f"Failed to initialize Facebook API: {str(e)}"
             logger.error(error_msg)
             raise FacebookError(error_msg)
 
+    @property
+    def access_token(self) -> str:
+        """
+        The page access token, exchanged once per page and user token and then served
+        from the cache. Falls back to the user token if the exchange fails, and tries the
+        exchange again ``EXCHANGE_RETRY_DELAY`` seconds later.
+        """
+        if time.monotonic() < self._exchange_retry_at and self._token_cache.get(self._token_key) is None:
+            return self.user_access_token
+        token = self._token_cache.get_or_fetch(self._token_key, self._fetch_page_token)
+        if token is None:
+            self._exchange_retry_at = time.monotonic() + self.EXCHANGE_RETRY_DELAY
+            return self.user_access_token
+        return token
+
     def _get_page_access_token(self):
         """
         Get a page access token from the user access token.
         """
+        fetched = self._fetch_page_token()
+        return fetched[0] if fetched else self.user_access_token
+
+    def _fetch_page_token(self):
+        """
+        Exchange the user access token for a page access token.
+
+        Returns:
+            Optional[tuple]: The page token and its expiry timestamp (0 if it never
+                expires, None if unknown), or None if no page token could be obtained
+        """
         try:
             logger.debug("Attempting to get page access token")
-            url = f"{self.BASE_URL}/{self.page_id}"
+            url = f"{self.base_url}/{self.page_id}"
             params = {
                 'fields': 'access_token',
-                'access_token': self.access_token
+                'access_token': self.user_access_token
             }
 
             logger.debug(f"Making request to: {url}")
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             logger.debug(f"Token exchange response status: {response.status_code}")
-            logger.debug(f"Token exchange response: {response.text}")
 
             if response.status_code == 200:
                 data = response.json()
                 if 'access_token' in data:
                     logger.debug("Successfully retrieved page access token")
-                    return data['access_token']
+                    return data['access_token'], self._get_token_expiry(data['access_token'])
                 else:
                     logger.warning("No access_token in response, using user token")
-                    return self.access_token
+                    return None
             else:
                 logger.warning(f"Failed to get page token: {response.text}. Using user token.")
-                return self.access_token
+                return None
 
         except Exception as e:
             logger.warning(f"Error getting page token: {e}. Using user token.")
-            return self.access_token
+            return None
+
+    def _get_token_expiry(self, token: str):
+        """
+        Read the expiry of a token from Graph's debug_token endpoint.
+
+        Returns:
+            Optional[float]: The expiry timestamp, 0 if the token never expires, None if unknown
+        """
+        try:
+            response = self.session.get(
+                f"{self.base_url}/debug_token",
+                params={'input_token': token, 'access_token': self.user_access_token}
+            )
+            data = response.json().get('data') if response.status_code == 200 else None
+            expires_at = data.get('expires_at') if isinstance(data, dict) else None
+            if isinstance(expires_at, (int, float)):
+                return float(expires_at)
+        except Exception as e:
+            logger.warning(f"Could not read page token expiry: {e}")
+        return None
 
     @log_method(logger)
     def post(self, publication: FacebookPublication):
@@ -80,47 +160,139 @@ class FacebookAPI(FacebookGateway):
             publication.validate()
             logger.debug("Publication validation passed")
 
-            # First, verify page access
-            verify_url = f"{self.BASE_URL}/{self.page_id}/feed"
-            logger.debug(f"Verifying page access with URL: {verify_url}")
+            verify_url, payload = self._prepare_post(publication, self.access_token)
 
-            # Complete payload
-            payload = {
-                'message': publication.get_text(),
-                'access_token': self.access_token
-            }
+            def attempt():
+                logger.debug("Sending POST request to Facebook")
+                try:
+                    response = self.session.post(verify_url, data=payload)
+                except requests.exceptions.RequestException as e:
+                    raise self._network_error(e)
+                return self._handle_post_response(response)
 
-            logger.debug("Payload prepared (excluding access_token):")
-            logger.debug(f"message: {payload['message'][:50]}...")
+            return self.retry_policy.run(attempt, "Facebook post")
 
-            # Attempt to post
-            logger.debug("Sending POST request to Facebook")
-            response = requests.post(verify_url, data=payload)
-            logger.debug(f"Response Status Code: {response.status_code}")
-            logger.debug(f"Response Headers: {dict(response.headers)}")
-            logger.debug(f"Response Content: {response.text}")
+        except FacebookError:
+            raise
+        except Exception as e:
+            error_msg = f"Error posting to Facebook: {str(e)}"
+            logger.error(error_msg)
+            raise FacebookError(error_msg) from e
 
-            response_json = response.json()
+    @log_method(logger)
+    async def post_async(self, publication: FacebookPublication):
+        """
+        Post a publication to Facebook without blocking the event loop.
+        """
+        try:
+            logger.debug(f"Validating publication: {publication.get_text()[:20]}...")
+            publication.validate()
+            logger.debug("Publication validation passed")
 
-            if 'error' in response_json:
-                error_detail = response_json['error']
-                error_msg = (
-                    f"Facebook API error:\n"
-                    f"Code: {error_detail.get('code', 'N/A')}\n"
-                    f"Type: {error_detail.get('type', 'N/A')}\n"
-                    f"Message: {error_detail.get('message', 'N/A')}"
-                )
-                logger.error(error_msg)
-                raise FacebookError(error_msg)
-
-            logger.success(f"Successfully posted to Facebook. Post ID: {response_json.get('id')}")
-            return response_json
-
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Network error posting to Facebook: {str(e)}"
-            logger.error(error_msg)
-            raise FacebookError(error_msg)
+            verify_url, payload = self._prepare_post(publication, await self._access_token_async())
+            client = self._async_http_client or get_async_http_client()
+
+            async def attempt():
+                logger.debug("Sending asynchronous POST request to Facebook")
+                try:
+                    response = await client.post(verify_url, data=payload)
+                except httpx.HTTPError as e:
+                    raise self._network_error(e)
+                return self._handle_post_response(response)
+
+            return await self.retry_policy.run_async(attempt, "Facebook post")
+
+        except FacebookError:
+            raise
         except Exception as e:
             error_msg = f"Error posting to Facebook: {str(e)}"
             logger.error(error_msg)
-            raise FacebookError(error_msg) from e
\ No newline at end of file
+            raise FacebookError(error_msg) from e
+
+    async def _access_token_async(self) -> str:
+        """
+        Return ``access_token`` without blocking the event loop: a cached token is read
+        directly, while the exchange and its debug_token call run in a worker thread.
+        """
+        if self._token_cache.get(self._token_key) is not None:
+            return self.access_token
+        return await asyncio.to_thread(lambda: self.access_token)
+
+    def close(self) -> None:
+        """Close the pooled connections of the synchronous session."""
+        self.session.close()
+
+    @staticmethod
+    def _network_error(error: Exception) -> FacebookError:
+        """Wrap a network exception, flagging connection failures as transient."""
+        error_msg = f"Network error posting to Facebook: {str(error)}"
+        logger.error(error_msg)
+        return FacebookError(error_msg, transient=is_transient_exception(error))
+
+    def _prepare_post(self, publication: FacebookPublication, access_token: str):
+        """
+        Build the feed URL and the payload of a publication.
+
+        Args:
+            publication (FacebookPublication): The publication to post
+            access_token (str): The token to post with
+
+        Returns:
+            tuple: The feed URL and the form payload
+        """
+        # First, verify page access
+        verify_url = f"{self.base_url}/{self.page_id}/feed"
+        logger.debug(f"Verifying page access with URL: {verify_url}")
+
+        # Complete payload
+        payload = {
+            'message': publication.get_text(),
+            'access_token': access_token
+        }
+
+        logger.debug("Payload prepared (excluding access_token):")
+        logger.debug(f"message: {payload['message'][:50]}...")
+        return verify_url, payload
+
+    def _handle_post_response(self, response):
+        """
+        Check a feed POST response and return its JSON content.
+
+        Args:
+            response: A requests or httpx response
+
+        Returns:
+            dict: The response content, containing the post id
+
+        Raises:
+            FacebookError: If the Graph API returned an error
+        """
+        logger.debug(f"Response Status Code: {response.status_code}")
+        logger.debug(f"Response Headers: {dict(response.headers)}")
+        logger.debug(f"Response Content: {response.text}")
+
+        try:
+            response_json = response.json()
+        except ValueError:
+            # Réponse non JSON : typiquement une page d'erreur d'un proxy en amont
+            error_msg = f"Facebook API error: {response.status_code} - {response.text[:200]}"
+            logger.error(error_msg)
+            raise FacebookError(error_msg, **classify_graph_error({}, response, idempotent=False))
+
+        if 'error' in response_json:
+            error_detail = response_json['error']
+            if error_detail.get('code') == 190:
+                # Jeton invalide ou expiré : le prochain appel refera l'échange
+                self._token_cache.invalidate(self._token_key)
+                self._exchange_retry_at = 0.0
+            error_msg = (
+                f"Facebook API error:\n"
+                f"Code: {error_detail.get('code', 'N/A')}\n"
+                f"Type: {error_detail.get('type', 'N/A')}\n"
+                f"Message: {error_detail.get('message', 'N/A')}"
+            )
+            logger.error(error_msg)
+            raise FacebookError(error_msg, **classify_graph_error(error_detail, response, idempotent=False))
+
+        logger.success(f"Successfully posted to Facebook. Post ID: {response_json.get('id')}")
+        return response_json
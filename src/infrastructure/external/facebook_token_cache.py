@@ -0,0 +1,223 @@
+# Location: src/infrastructure/external/facebook_token_cache.py
+
+"""
+This module implements PageTokenCache, which keeps the Facebook page access tokens
+obtained from the user token, in memory and in a JSON file, so that the Graph API
+token exchange runs once per page and user token instead of once per FacebookAPI.
+
+Tokens are stored with their expiry (read from Graph's debug_token endpoint) and are
+refreshed in a background timer shortly before they expire. The timer is started by
+the first use of a token in the process, whether it was fetched or loaded from the file.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from src.infrastructure.logging.logger import logger
+
+DEFAULT_TOKEN_CACHE_PATH = os.path.join('.cache', 'facebook_page_tokens.json')
+
+# A fetch callback returns (token, expires_at) or None if no page token could be obtained
+TokenFetcher = Callable[[], Optional[Tuple[str, Optional[float]]]]
+
+
+class PageTokenCache:
+    # Durée retenue lorsque Graph ne communique pas l'expiration du jeton
+    UNKNOWN_EXPIRY_LIFETIME = 3600
+    # Le rafraîchissement a lieu cette durée (en secondes) avant l'expiration
+    REFRESH_MARGIN = 600
+
+    def __init__(self, path: Optional[str] = None, clock: Callable[[], float] = time.time):
+        """
+        Load the cache file, if it exists.
+
+        Args:
+            path (Optional[str]): JSON file of the cache, None to keep tokens in memory only
+            clock (Callable[[], float]): Time source, in seconds
+        """
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._entries: Dict[str, Dict] = self._load()
+
+    @staticmethod
+    def make_key(page_id: str, user_token: str) -> str:
+        """Build the key of a page, without storing the user token itself."""
+        return f"{page_id}:{hashlib.sha256(user_token.encode('utf-8')).hexdigest()[:16]}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached token of a key if it has not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or self._is_expired(entry):
+            return None
+        return entry['token']
+
+    def get_or_fetch(self, key: str, fetch: TokenFetcher) -> Optional[str]:
+        """
+        Return the cached token of a key, fetching and storing it on a miss. Either way,
+        the token is then refreshed in the background before it expires.
+
+        Concurrent callers of the same key wait for a single fetch.
+
+        Args:
+            key (str): The key built by ``make_key``
+            fetch (TokenFetcher): Exchanges the user token for a page token
+
+        Returns:
+            Optional[str]: The page token, or None if the fetch did not return one
+        """
+        token = self.get(key)
+        if token is not None:
+            self._ensure_refresh(key, fetch)
+            return token
+
+        with self._key_lock(key):
+            token = self.get(key)
+            if token is not None:
+                self._ensure_refresh(key, fetch)
+                return token
+            fetched = fetch()
+            if fetched is None:
+                return None
+            token, expires_at = fetched
+            self.set(key, token, expires_at)
+            self._schedule_refresh(key, fetch)
+            return token
+
+    def set(self, key: str, token: str, expires_at: Optional[float]) -> None:
+        """
+        Store a token.
+
+        Args:
+            key (str): The key built by ``make_key``
+            token (str): The page access token
+            expires_at (Optional[float]): Expiry timestamp, 0 if the token never expires,
+                None if unknown
+        """
+        now = self._clock()
+        if expires_at is None:
+            expires_at = now + self.UNKNOWN_EXPIRY_LIFETIME
+        with self._lock:
+            self._entries[key] = {'token': token, 'expires_at': expires_at, 'fetched_at': now}
+            self._save()
+
+    def invalidate(self, key: str) -> None:
+        """Forget the token of a key, e.g. after Graph rejected it."""
+        with self._lock:
+            timer = self._timers.pop(key, None)
+            if self._entries.pop(key, None) is not None:
+                self._save()
+        if timer is not None:
+            timer.cancel()
+
+    def close(self) -> None:
+        """Cancel the pending background refreshes."""
+        with self._lock:
+            timers, self._timers = list(self._timers.values()), {}
+        for timer in timers:
+            timer.cancel()
+
+    def _is_expired(self, entry: Dict) -> bool:
+        return bool(entry['expires_at']) and entry['expires_at'] <= self._clock()
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _ensure_refresh(self, key: str, fetch: TokenFetcher) -> None:
+        """Schedule the refresh of a token read from the cache, unless one is already pending."""
+        with self._lock:
+            if key in self._timers:
+                return
+        self._schedule_refresh(key, fetch)
+
+    def _schedule_refresh(self, key: str, fetch: TokenFetcher) -> None:
+        """
+        Refresh the token of a key in a background timer, ``REFRESH_MARGIN`` seconds
+        before it expires. Tokens that never expire are not refreshed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry['expires_at']:
+                return
+            delay = max(0.0, entry['expires_at'] - self.REFRESH_MARGIN - self._clock())
+            previous = self._timers.get(key)
+            timer = threading.Timer(delay, self._refresh, args=(key, fetch))
+            timer.daemon = True
+            self._timers[key] = timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+        logger.debug(f"Page token refresh scheduled in {delay:.0f}s")
+
+    def _refresh(self, key: str, fetch: TokenFetcher) -> None:
+        """Fetch a new token for a key and schedule the next refresh."""
+        try:
+            with self._key_lock(key):
+                fetched = fetch()
+            if fetched is None:
+                logger.warning("Background page token refresh returned no token")
+                return
+            self.set(key, *fetched)
+            logger.debug("Page access token refreshed in background")
+            self._schedule_refresh(key, fetch)
+        except Exception as e:
+            logger.warning(f"Background page token refresh failed: {str(e)}")
+
+    def _load(self) -> Dict[str, Dict]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            return {key: entry for key, entry in entries.items()
+                    if isinstance(entry, dict) and {'token', 'expires_at'} <= entry.keys()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable page token cache {self.path}: {str(e)}")
+            return {}
+
+    def _save(self) -> None:
+        """Write the entries atomically, readable by the owner only. Called under the lock."""
+        if not self.path:
+            return
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            temporary_path = f"{self.path}.tmp"
+            fd = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist page token cache: {str(e)}")
+
+
+_shared_cache: Optional[PageTokenCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_page_token_cache() -> PageTokenCache:
+    """
+    Return the process-wide page token cache, stored at FACEBOOK_TOKEN_CACHE_PATH
+    (defaults to .cache/facebook_page_tokens.json).
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = PageTokenCache(os.environ.get('FACEBOOK_TOKEN_CACHE_PATH') or DEFAULT_TOKEN_CACHE_PATH)
+        return _shared_cache
+
+
+def reset_page_token_cache() -> None:
+    """Drop the process-wide cache (its file is kept), e.g. after changing the path."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is not None:
+            _shared_cache.close()
+        _shared_cache = None
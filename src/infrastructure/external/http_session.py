@@ -0,0 +1,70 @@
+# Location: src/infrastructure/external/http_session.py
+
+"""
+This module builds the pooled HTTP sessions used by the synchronous platform gateways.
+A session keeps its connections alive between requests, so that posting many small
+JSON payloads does not pay a TCP and TLS handshake each time, and every request gets
+a connect and read timeout unless the caller passes its own.
+"""
+
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.config.environment_http import get_http_settings
+
+
+class PooledSession(requests.Session):
+    """
+    A requests.Session with a sized connection pool and default timeouts.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20,
+                 connect_timeout: float = 5.0, read_timeout: float = 30.0):
+        super().__init__()
+        self.timeout = (connect_timeout, read_timeout)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_http_session(settings: Optional[Dict] = None) -> PooledSession:
+    """
+    Create a pooled session from the HTTP settings.
+
+    Args:
+        settings (Optional[Dict]): Settings as returned by ``get_http_settings``
+            (read from the environment if omitted)
+
+    Returns:
+        PooledSession: The configured session
+    """
+    settings = settings or get_http_settings()
+    return PooledSession(
+        pool_connections=settings['pool_connections'],
+        pool_maxsize=settings['pool_maxsize'],
+        connect_timeout=settings['connect_timeout'],
+        read_timeout=settings['read_timeout'],
+    )
+
+
+def prewarm_session(session: requests.Session, urls: Iterable[str]) -> None:
+    """
+    Open a kept-alive connection to the host of each URL ahead of the first real request.
+    Failures are only logged: pre-warming is an optimization, never a requirement.
+
+    Args:
+        session (requests.Session): The session whose pool is warmed
+        urls (Iterable[str]): URLs whose hosts will be contacted
+    """
+    for origin in dict.fromkeys(f"{urlsplit(url).scheme}://{urlsplit(url).netloc}" for url in urls):
+        try:
+            session.head(origin, allow_redirects=False)
+            logger.debug(f"Connection to {origin} pre-warmed")
+        except requests.RequestException as e:
+            logger.warning(f"Could not pre-warm connection to {origin}: {str(e)}")
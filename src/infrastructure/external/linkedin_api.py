@@ -6,20 +6,42 @@ implementation of the LinkedInGateway interface. It handles the actual
 communication with the LinkedIn API, including authentication and publication creation.
 """
 
+import httpx
 import requests
 from src.interfaces.linkedin_gateway import LinkedInGateway
 from src.domain.entities.linkedin_publication import LinkedInPublication
 from src.infrastructure.logging.logger import logger, log_method
 from src.infrastructure.config.environment import get_linkedin_credentials
 from src.domain.exceptions import LinkedInError, ConfigurationError
+from src.infrastructure.external.async_http import get_async_http_client
+from src.infrastructure.external.http_session import create_http_session, prewarm_session
+from src.infrastructure.config.environment_http import get_http_settings
+from src.infrastructure.config.environment_endpoints import get_endpoint_settings
+from src.infrastructure.external.retry_policy import RetryPolicy, classify_http_response, is_transient_exception
 
 class LinkedInAPI(LinkedInGateway):
+    BASE_URL = 'https://api.linkedin.com/v2'
+    POSTS_PATH = '/ugcPosts'
+
     @log_method(logger)
-    def __init__(self):
+    def __init__(self, async_http_client: httpx.AsyncClient = None,
+                 http_session: requests.Session = None, retry_policy: RetryPolicy = None,
+                 base_url: str = None):
+        self._async_http_client = async_http_client
         try:
+            self.retry_policy = retry_policy or RetryPolicy.from_environment()
+            # Base de l'API (LINKEDIN_API_URL), par exemple un serveur de test local
+            base_url = base_url or get_endpoint_settings()['linkedin'] or self.BASE_URL
+            self.posts_url = base_url.rstrip('/') + self.POSTS_PATH
             logger.debug("Loading LinkedIn credentials")
             self.credentials = get_linkedin_credentials()
             logger.debug("LinkedIn credentials loaded successfully")
+
+            # Session à connexions persistantes, partagée par toutes les publications
+            settings = get_http_settings()
+            self.session = http_session or create_http_session(settings)
+            if settings['prewarm']:
+                prewarm_session(self.session, [self.posts_url])
         except ConfigurationError as e:
             logger.error(f"Failed to initialize LinkedIn API: {str(e)}")
             raise
@@ -31,38 +53,92 @@ class LinkedInAPI(LinkedInGateway):
             publication.validate()
             logger.debug("LinkedIn publication validation passed")
 
-            headers = {
-                'X-Restli-Protocol-Version': '2.0.0',
-                'Authorization': f'Bearer {self.credentials["access_token"]}',
-                'Content-Type': 'application/json',
-            }
+            headers = self._create_headers()
 
             payload = self._create_payload(publication)
             logger.debug(f"Prepared payload: {payload}")
 
-            logger.debug("Sending request to LinkedIn API")
-            response = requests.post(
-                'https://api.linkedin.com/v2/ugcPosts',
-                headers=headers,
-                json=payload
-            )
-            logger.debug(f"API response status code: {response.status_code}")
-
-            if response.status_code != 201:
-                logger.error(f"LinkedIn API error: {response.status_code} - {response.text}")
-                raise LinkedInError(f"LinkedIn API error: {response.status_code} - {response.text}")
-
-            response_json = response.json()
-            logger.debug(f"API response content: {response_json}")
-
-            return response_json
-        except requests.RequestException as e:
-            logger.error(f"Network error when posting to LinkedIn: {str(e)}")
-            raise LinkedInError(f"Network error when posting to LinkedIn: {str(e)}")
+            def attempt():
+                logger.debug("Sending request to LinkedIn API")
+                try:
+                    response = self.session.post(
+                        self.posts_url,
+                        headers=headers,
+                        json=payload
+                    )
+                except requests.RequestException as e:
+                    raise self._network_error(e)
+                return self._handle_response(response)
+
+            return self.retry_policy.run(attempt, "LinkedIn post")
+        except LinkedInError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error when posting to LinkedIn: {str(e)}")
             raise LinkedInError(f"Unexpected error when posting to LinkedIn: {str(e)}")
 
+    @log_method(logger)
+    async def post_async(self, publication: LinkedInPublication):
+        try:
+            logger.debug(f"Validating LinkedIn publication: {publication.get_text()[:20]}...")
+            publication.validate()
+            logger.debug("LinkedIn publication validation passed")
+
+            payload = self._create_payload(publication)
+            logger.debug(f"Prepared payload: {payload}")
+
+            client = self._async_http_client or get_async_http_client()
+
+            async def attempt():
+                logger.debug("Sending asynchronous request to LinkedIn API")
+                try:
+                    response = await client.post(
+                        self.posts_url,
+                        headers=self._create_headers(),
+                        json=payload
+                    )
+                except httpx.HTTPError as e:
+                    raise self._network_error(e)
+                return self._handle_response(response)
+
+            return await self.retry_policy.run_async(attempt, "LinkedIn post")
+        except LinkedInError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error when posting to LinkedIn: {str(e)}")
+            raise LinkedInError(f"Unexpected error when posting to LinkedIn: {str(e)}")
+
+    def close(self) -> None:
+        """Close the pooled connections of the synchronous session."""
+        self.session.close()
+
+    @staticmethod
+    def _network_error(error: Exception) -> LinkedInError:
+        """Wrap a network exception, flagging connection failures as transient."""
+        logger.error(f"Network error when posting to LinkedIn: {str(error)}")
+        return LinkedInError(f"Network error when posting to LinkedIn: {str(error)}",
+                             transient=is_transient_exception(error))
+
+    def _create_headers(self):
+        return {
+            'X-Restli-Protocol-Version': '2.0.0',
+            'Authorization': f'Bearer {self.credentials["access_token"]}',
+            'Content-Type': 'application/json',
+        }
+
+    def _handle_response(self, response):
+        logger.debug(f"API response status code: {response.status_code}")
+
+        if response.status_code != 201:
+            logger.error(f"LinkedIn API error: {response.status_code} - {response.text}")
+            raise LinkedInError(f"LinkedIn API error: {response.status_code} - {response.text}",
+                                **classify_http_response(response, idempotent=False))
+
+        response_json = response.json()
+        logger.debug(f"API response content: {response_json}")
+
+        return response_json
+
     def _create_payload(self, publication: LinkedInPublication):
 
         payload = {
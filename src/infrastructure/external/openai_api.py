@@ -16,30 +16,85 @@ Key features:
 - Robust error handling
 - Detailed logging
 - Content validation and cleanup
+- Optional content-addressed response cache (see ResponseCache)
+- Local repair of small output defects (see RepairPipeline)
+- Optional streaming mode, which stops reading as soon as the publication is complete
+  or already too long (see PostStreamParser)
+- Per-platform max_tokens budget, and logging of the estimated versus actual token usage
+  (see token_estimator)
 """
 
 import openai
+import json
 import re
 import random
 import os
-from openai import OpenAI
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+from openai import OpenAI, AsyncOpenAI
 from src.interfaces.openai_gateway import OpenAIGateway
 from src.infrastructure.logging.logger import logger, log_method
-from src.infrastructure.config.environment import initialize_environment, get_openai_credentials
-from src.domain.exceptions import OpenAIError, ConfigurationError, TweetGenerationError
-from src.infrastructure.prompting.prompt_builder import PromptBuilder
+from src.infrastructure.config.environment import get_openai_credentials
+from src.infrastructure.config.environment_endpoints import get_endpoint_settings
+from src.infrastructure.external.async_http import LoopLocal
+from src.domain.exceptions import OpenAIError, ConfigurationError, ContentLengthError, TweetGenerationError
+from src.infrastructure.caching.response_cache import ResponseCache
+from src.infrastructure.external.stream_parser import PostStreamParser
+from src.infrastructure.external.repair_pipeline import RepairPipeline
+from src.infrastructure.prompting.token_estimator import estimate_tokens, output_token_budget
 
 
 class OpenAIAPI(OpenAIGateway):
     # Définir le modèle comme constante de classe
     GPT_MODEL = "gpt-4-turbo"
+    # 'use' : lecture et écriture, 'off' : cache ignoré, 'only' : aucune requête vers l'API
+    CACHE_MODES = ('use', 'off', 'only')
+    # Nombre de mesures de streaming conservées
+    STREAM_METRICS_HISTORY = 100
+    # Limite de sortie du modèle, plafond de tout budget max_tokens
+    MAX_OUTPUT_TOKENS = 4096
+    # Nombre de relevés d'usage conservés
+    TOKEN_USAGE_HISTORY = 100
 
     @log_method(logger)
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None, cache_mode: str = 'use',
+                 stream: bool = False, stream_retries: int = 0,
+                 repair_pipeline: Optional[RepairPipeline] = None,
+                 max_output_tokens: int = MAX_OUTPUT_TOKENS, base_url: Optional[str] = None):
+        """
+        Initialize the OpenAI clients.
+
+        Args:
+            cache (Optional[ResponseCache]): Cache of raw completions, disabled if None
+            cache_mode (str): 'use' to read and fill the cache, 'off' to bypass it, 'only'
+                to answer from the cache without ever calling the API
+            stream (bool): Stream single completions, stopping at the closing tag or as soon
+                as the publication exceeds the requested ``max_length``
+            stream_retries (int): Number of new completions requested after a streamed
+                generation was aborted for being too long
+            repair_pipeline (Optional[RepairPipeline]): Post-processing of the publications
+                (defaults to every repair stage)
+            max_output_tokens (int): Upper bound of the max_tokens budget derived from the
+                platforms' length limits
+            base_url (Optional[str]): Base URL of the API, e.g. a local stub server
+                (defaults to OPENAI_BASE_URL, else the SDK default)
+        """
         try:
-            logger.debug("Initializing environment")
-            if not initialize_environment():
-                raise ConfigurationError("Failed to initialize environment")
+            self.repair_pipeline = repair_pipeline or RepairPipeline()
+            self.stream = stream
+            self.stream_retries = stream_retries
+            # Une entrée par complétion streamée : 'ttft', 'total', 'chunks', 'characters', 'outcome'
+            self.stream_metrics = deque(maxlen=self.STREAM_METRICS_HISTORY)
+            self.max_output_tokens = max_output_tokens
+            # Une entrée par complétion non streamée : 'estimated_prompt', 'prompt', 'completion'
+            self.token_usage = deque(maxlen=self.TOKEN_USAGE_HISTORY)
+            if cache_mode not in self.CACHE_MODES:
+                raise ConfigurationError(f"Invalid cache mode: {cache_mode}")
+            if cache_mode == 'only' and cache is None:
+                raise ConfigurationError("Cache-only mode requires a response cache")
+            self.cache = cache if cache_mode != 'off' else None
+            self.cache_mode = cache_mode
 
             logger.debug("Loading OpenAI credentials")
             credentials = get_openai_credentials()
@@ -48,15 +103,18 @@ class OpenAIAPI(OpenAIGateway):
             api_key = credentials['api_key']
             logger.debug(f"Received API key starting with: {api_key[:10]}...")
 
-            self.client = OpenAI(api_key=api_key)
-            self.prompt_builder = PromptBuilder()
+            self._base_url = base_url or get_endpoint_settings()['openai']
+            self.client = OpenAI(api_key=api_key, base_url=self._base_url)
+            self._api_key = api_key
+            # Un client asynchrone par boucle : son pool de connexions est lié à la boucle qui l'a créé
+            self._async_clients: LoopLocal[AsyncOpenAI] = LoopLocal()
             logger.debug("OpenAI client initialized successfully")
         except ConfigurationError as e:
             logger.error(f"Failed to initialize OpenAI API: {str(e)}")
             raise
 
     @log_method(logger)
-    def generate(self, prompt: str) -> str:
+    def generate(self, prompt: str, max_length: Optional[int] = None) -> str:
         """
         Generate content using OpenAI's API.
 
@@ -66,44 +124,566 @@ class OpenAIAPI(OpenAIGateway):
 
         Args:
             prompt (str): The generation prompt containing platform and context information
+            max_length (Optional[int]): Length limit of the platform; it bounds the output
+                tokens requested and, in streaming mode, generation is aborted as soon as the
+                publication exceeds it
 
         Returns:
             str: The generated content, cleaned and formatted
 
         Raises:
+            ContentLengthError: If a streamed publication exceeded ``max_length``, or the
+                completion was cut at its max_tokens budget
             OpenAIError: If content generation fails, response is empty, or content
                         format is invalid
         """
         try:
             logger.debug(f"Generating content with prompt")
-            response = self.client.chat.completions.create(
-                model=self.GPT_MODEL,  # Utiliser la constante de classe
-                messages=[
-                    {"role": "system", "content": prompt}
-                ]
-            )
-            generated_content = response.choices[0].message.content.strip()
+            return self._generate_cached(prompt, lambda raw: self._extract_content(raw, max_length),
+                                         max_length=max_length, max_tokens=self._token_budget(max_length))
+
+        except ContentLengthError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to generate content: {str(e)}")
+            raise OpenAIError(f"Content generation failed: {str(e)}")
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """
+        Get the asynchronous OpenAI client of the running event loop, created on first use.
+        It is dropped with its loop, so that a later ``asyncio.run`` gets a new one.
+        """
+        return self._async_clients.get(lambda: AsyncOpenAI(api_key=self._api_key, base_url=self._base_url))
+
+    @log_method(logger)
+    async def generate_async(self, prompt: str, max_length: Optional[int] = None) -> str:
+        """
+        Generate content using OpenAI's asynchronous API.
+
+        Same contract as ``generate``, but the request does not block the event loop,
+        so many generations can run concurrently from a single thread.
+
+        Args:
+            prompt (str): The generation prompt containing platform and context information
+            max_length (Optional[int]): Length limit of the platform (see ``generate``)
+
+        Returns:
+            str: The generated content, cleaned and formatted
+
+        Raises:
+            ContentLengthError: If a streamed publication exceeded ``max_length``, or the
+                completion was cut at its max_tokens budget
+            OpenAIError: If content generation fails, response is empty, or content
+                        format is invalid
+        """
+        try:
+            logger.debug(f"Generating content asynchronously with prompt")
+            return await self._generate_cached_async(prompt, lambda raw: self._extract_content(raw, max_length),
+                                                     max_length=max_length,
+                                                     max_tokens=self._token_budget(max_length))
+
+        except ContentLengthError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to generate content: {str(e)}")
+            raise OpenAIError(f"Content generation failed: {str(e)}")
+
+    @log_method(logger)
+    def generate_candidates(self, prompt: str, n: int, max_length: Optional[int] = None) -> List[str]:
+        """
+        Generate several alternative contents with a single completion request
+        (the ``n`` parameter of the chat completions API).
+
+        Args:
+            prompt (str): The generation prompt
+            n (int): The number of candidates requested
+            max_length (Optional[int]): Length limit of the platform, bounding the output
+                tokens of each choice
+
+        Returns:
+            List[str]: The cleaned candidates; choices without social_media_post tags, or cut
+                at their max_tokens budget, are skipped
+
+        Raises:
+            OpenAIError: If generation fails or no choice contains a valid publication
+        """
+        try:
+            logger.debug(f"Generating {n} candidates in a single request")
+            return self._generate_cached(prompt, lambda raw: self._extract_candidates(raw, max_length), n=n,
+                                         max_tokens=self._token_budget(max_length))
+
+        except Exception as e:
+            logger.error(f"Failed to generate candidates: {str(e)}")
+            raise OpenAIError(f"Candidate generation failed: {str(e)}")
+
+    @log_method(logger)
+    async def generate_candidates_async(self, prompt: str, n: int,
+                                        max_length: Optional[int] = None) -> List[str]:
+        """
+        Asynchronous counterpart of ``generate_candidates``.
+        """
+        try:
+            logger.debug(f"Generating {n} candidates in a single async request")
+            return await self._generate_cached_async(prompt, lambda raw: self._extract_candidates(raw, max_length),
+                                                     n=n, max_tokens=self._token_budget(max_length))
 
-            # Verify if content was generated
-            if not generated_content:
-                logger.error("Generated content is empty")
-                raise OpenAIError("Generated content is empty")
+        except Exception as e:
+            logger.error(f"Failed to generate candidates: {str(e)}")
+            raise OpenAIError(f"Candidate generation failed: {str(e)}")
+
+    @log_method(logger)
+    def generate_many(self, prompt: str, platform_specs: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        Generate the variants of several platforms with a single completion.
+
+        Args:
+            prompt (str): A multi-platform prompt (see ``PromptBuilder.build_many``)
+            platform_specs (Dict[str, Dict]): For each platform, its 'tag' and 'max_length'
+
+        Returns:
+            Dict[str, str]: The cleaned content of each platform
 
-            # Extract content from social_media_post tags
-            match = re.search(r"<social_media_post>(.*?)</social_media_post>",
-                            generated_content, re.DOTALL)
-            if not match:
-                logger.error("Could not find social_media_post tags in generated content")
-                raise OpenAIError("Generated content does not contain social_media_post tags")
+        Raises:
+            OpenAIError: If generation fails or a variant is missing, empty or too long
+        """
+        try:
+            logger.debug(f"Generating content for {', '.join(platform_specs)} in a single request")
+            return self._generate_cached(prompt, lambda raw: self._extract_many(raw, platform_specs),
+                                         max_tokens=self._many_budget(platform_specs))
 
-            # Clean up the content
-            final_content = match.group(1).strip()
-            final_content = re.sub(r"\*\*", "", final_content)
-            final_content = final_content.strip('.')
+        except Exception as e:
+            logger.error(f"Failed to generate content: {str(e)}")
+            raise OpenAIError(f"Multi-platform generation failed: {str(e)}")
 
-            logger.debug(f"Content generated successfully: {final_content[:100]}...")
-            return final_content
+    @log_method(logger)
+    async def generate_many_async(self, prompt: str, platform_specs: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        Asynchronous counterpart of ``generate_many``.
+        """
+        try:
+            logger.debug(f"Generating content for {', '.join(platform_specs)} in a single async request")
+            return await self._generate_cached_async(
+                prompt, lambda raw: self._extract_many(raw, platform_specs),
+                max_tokens=self._many_budget(platform_specs)
+            )
 
         except Exception as e:
             logger.error(f"Failed to generate content: {str(e)}")
-            raise OpenAIError(f"Content generation failed: {str(e)}")
\ No newline at end of file
+            raise OpenAIError(f"Multi-platform generation failed: {str(e)}")
+
+    def _generate_cached(self, prompt: str, extract: Callable[[str], Any], n: int = 1,
+                         max_length: Optional[int] = None, max_tokens: Optional[int] = None) -> Any:
+        """
+        Complete a prompt through the response cache and extract the result.
+
+        Only completions that extract successfully are stored, and a cached completion
+        that no longer extracts is dropped, so an invalid answer is never replayed.
+
+        Args:
+            prompt (str): The prompt to complete
+            extract (Callable[[str], Any]): Turns the raw completion into the result
+            n (int): Number of choices requested; when greater than 1, the raw completion
+                is the JSON list of the choices
+            max_length (Optional[int]): Length limit applied while streaming
+            max_tokens (Optional[int]): Output token budget of the request, if any
+
+        Returns:
+            Any: The extracted result
+
+        Raises:
+            OpenAIError: In cache-only mode, if the prompt is not cached
+        """
+        key = self._cached_key(prompt, n)
+        result = self._extract_cached(key, extract)
+        if result is not None:
+            return result
+
+        if n > 1:
+            raw_content = json.dumps(self._complete_choices(prompt, n, max_tokens))
+        elif self.stream:
+            raw_content = self._complete_streaming(prompt, max_length, max_tokens)
+        else:
+            raw_content = self._complete(prompt, max_tokens)
+        result = extract(raw_content)
+        if key is not None:
+            self.cache.set(key, self.GPT_MODEL, raw_content)
+        return result
+
+    async def _generate_cached_async(self, prompt: str, extract: Callable[[str], Any], n: int = 1,
+                                     max_length: Optional[int] = None, max_tokens: Optional[int] = None) -> Any:
+        """Asynchronous counterpart of ``_generate_cached``."""
+        key = self._cached_key(prompt, n)
+        result = self._extract_cached(key, extract)
+        if result is not None:
+            return result
+
+        if n > 1:
+            raw_content = json.dumps(await self._complete_choices_async(prompt, n, max_tokens))
+        elif self.stream:
+            raw_content = await self._complete_streaming_async(prompt, max_length, max_tokens)
+        else:
+            raw_content = await self._complete_async(prompt, max_tokens)
+        result = extract(raw_content)
+        if key is not None:
+            self.cache.set(key, self.GPT_MODEL, raw_content)
+        return result
+
+    def _token_budget(self, max_length: Optional[int]) -> Optional[int]:
+        """Return the max_tokens budget of a publication limited to ``max_length`` characters."""
+        if max_length is None:
+            return None
+        return output_token_budget(max_length, self.max_output_tokens)
+
+    def _many_budget(self, platform_specs: Dict[str, Dict]) -> int:
+        """Return the max_tokens budget of a multi-platform completion: the sum of its variants."""
+        budget = sum(output_token_budget(spec['max_length']) for spec in platform_specs.values())
+        return min(budget, self.max_output_tokens)
+
+    @staticmethod
+    def _request_options(max_tokens: Optional[int]) -> Dict[str, Any]:
+        # Sans limite connue, la requête reste celle d'avant le budget de tokens
+        return {'max_tokens': max_tokens} if max_tokens is not None else {}
+
+    def _cached_key(self, prompt: str, n: int = 1) -> Optional[str]:
+        """Return the cache key of a prompt, or None when caching is disabled."""
+        if self.cache is None:
+            return None
+        # Les clés des requêtes simples restent celles d'avant l'ajout du paramètre n
+        return ResponseCache.make_key(self.GPT_MODEL, prompt, {'n': n} if n > 1 else None)
+
+    def _extract_cached(self, key: Optional[str], extract: Callable[[str], Any]) -> Optional[Any]:
+        """
+        Extract the result of a cached completion, if any.
+
+        Returns:
+            Optional[Any]: The extracted result, or None on a cache miss
+        """
+        if key is None:
+            return None
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            try:
+                return extract(cached)
+            except OpenAIError as e:
+                logger.warning(f"Dropping invalid cached response: {str(e)}")
+                self.cache.delete(key)
+
+        if self.cache_mode == 'only':
+            raise OpenAIError("No cached response for this prompt (cache-only mode)")
+        return None
+
+    def _complete(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        """Send the prompt to the chat completions API and return the raw answer."""
+        response = self.client.chat.completions.create(
+            model=self.GPT_MODEL,  # Utiliser la constante de classe
+            messages=[
+                {"role": "system", "content": prompt}
+            ],
+            **self._request_options(max_tokens)
+        )
+        self._record_usage(prompt, response)
+        self._check_truncation(response.choices[0], max_tokens)
+        return response.choices[0].message.content
+
+    async def _complete_async(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        """Asynchronous counterpart of ``_complete``."""
+        response = await self.async_client.chat.completions.create(
+            model=self.GPT_MODEL,
+            messages=[
+                {"role": "system", "content": prompt}
+            ],
+            **self._request_options(max_tokens)
+        )
+        self._record_usage(prompt, response)
+        self._check_truncation(response.choices[0], max_tokens)
+        return response.choices[0].message.content
+
+    @staticmethod
+    def _check_truncation(choice, max_tokens: Optional[int]) -> None:
+        """
+        Reject a choice cut at its max_tokens budget: its publication is incomplete, and
+        must be neither repaired nor cached.
+
+        Raises:
+            ContentLengthError: If the choice stopped for lack of output tokens
+        """
+        if getattr(choice, 'finish_reason', None) == 'length':
+            logger.warning(f"Completion truncated at its budget of {max_tokens} output tokens")
+            raise ContentLengthError(f"Completion truncated at its budget of {max_tokens} output tokens")
+
+    def _record_usage(self, prompt: str, response) -> None:
+        """
+        Store the token usage reported for a completion next to the offline estimate of
+        its prompt, so that the estimator can be checked against the API.
+        """
+        usage = getattr(response, 'usage', None)
+        prompt_tokens = getattr(usage, 'prompt_tokens', None)
+        if not isinstance(prompt_tokens, int):
+            return
+        completion_tokens = getattr(usage, 'completion_tokens', None)
+        entry = {
+            'estimated_prompt': estimate_tokens(prompt),
+            'prompt': prompt_tokens,
+            'completion': completion_tokens if isinstance(completion_tokens, int) else None,
+        }
+        self.token_usage.append(entry)
+        logger.debug(f"Token usage: prompt {entry['prompt']} (estimated {entry['estimated_prompt']}), "
+                     f"completion {entry['completion']}")
+
+    def _complete_streaming(self, prompt: str, max_length: Optional[int],
+                            max_tokens: Optional[int] = None) -> str:
+        """
+        Stream a completion, requesting a new one up to ``stream_retries`` times when
+        the publication grows past ``max_length``.
+
+        Returns:
+            str: The raw answer, truncated after the closing social_media_post tag
+
+        Raises:
+            ContentLengthError: If the last attempt was also too long
+        """
+        for attempt in range(self.stream_retries + 1):
+            try:
+                return self._stream_once(prompt, max_length, max_tokens)
+            except ContentLengthError as e:
+                if attempt == self.stream_retries:
+                    raise
+                logger.warning(f"{str(e)}, requesting a new completion")
+
+    async def _complete_streaming_async(self, prompt: str, max_length: Optional[int],
+                                        max_tokens: Optional[int] = None) -> str:
+        """Asynchronous counterpart of ``_complete_streaming``."""
+        for attempt in range(self.stream_retries + 1):
+            try:
+                return await self._stream_once_async(prompt, max_length, max_tokens)
+            except ContentLengthError as e:
+                if attempt == self.stream_retries:
+                    raise
+                logger.warning(f"{str(e)}, requesting a new completion")
+
+    def _stream_once(self, prompt: str, max_length: Optional[int], max_tokens: Optional[int] = None) -> str:
+        """Read one streamed completion until the publication is complete or too long."""
+        parser = self._stream_parser(max_length)
+        metrics = {'ttft': None, 'chunks': 0}
+        started = time.perf_counter()
+        stream = self.client.chat.completions.create(
+            model=self.GPT_MODEL,
+            messages=[
+                {"role": "system", "content": prompt}
+            ],
+            stream=True,
+            **self._request_options(max_tokens)
+        )
+        try:
+            for chunk in stream:
+                if self._feed(parser, chunk, metrics, started):
+                    break
+        except ContentLengthError:
+            self._record_stream(metrics, started, parser, 'too_long')
+            raise
+        finally:
+            # Fermer la connexion arrête la génération côté serveur
+            stream.close()
+        self._record_stream(metrics, started, parser, 'closed' if parser.closed else 'finished')
+        return parser.text
+
+    async def _stream_once_async(self, prompt: str, max_length: Optional[int],
+                                 max_tokens: Optional[int] = None) -> str:
+        """Asynchronous counterpart of ``_stream_once``."""
+        parser = self._stream_parser(max_length)
+        metrics = {'ttft': None, 'chunks': 0}
+        started = time.perf_counter()
+        stream = await self.async_client.chat.completions.create(
+            model=self.GPT_MODEL,
+            messages=[
+                {"role": "system", "content": prompt}
+            ],
+            stream=True,
+            **self._request_options(max_tokens)
+        )
+        try:
+            async for chunk in stream:
+                if self._feed(parser, chunk, metrics, started):
+                    break
+        except ContentLengthError:
+            self._record_stream(metrics, started, parser, 'too_long')
+            raise
+        finally:
+            await stream.close()
+        self._record_stream(metrics, started, parser, 'closed' if parser.closed else 'finished')
+        return parser.text
+
+    def _stream_parser(self, max_length: Optional[int]) -> PostStreamParser:
+        # Un léger dépassement sera réparé localement : seul un dépassement au-delà interrompt le flux
+        return PostStreamParser(self.repair_pipeline.tolerated_length(max_length),
+                                measure=lambda content: len(self.repair_pipeline.clean(content, record=False)))
+
+    @staticmethod
+    def _feed(parser: PostStreamParser, chunk, metrics: Dict[str, Any], started: float) -> bool:
+        """Feed the text of a stream chunk to the parser; True when reading can stop."""
+        if not chunk.choices:
+            return False
+        if getattr(chunk.choices[0], 'finish_reason', None) == 'length':
+            raise ContentLengthError("Streamed completion truncated at its max_tokens budget")
+        text = chunk.choices[0].delta.content
+        if not text:
+            return False
+        if metrics['ttft'] is None:
+            metrics['ttft'] = time.perf_counter() - started
+        metrics['chunks'] += 1
+        return parser.feed(text)
+
+    def _record_stream(self, metrics: Dict[str, Any], started: float, parser: PostStreamParser,
+                       outcome: str) -> None:
+        """
+        Store the metrics of a streamed completion. The outcome is 'closed' (stopped at
+        the closing tag), 'finished' (stream ended first) or 'too_long' (aborted).
+        """
+        metrics.update(total=time.perf_counter() - started, characters=len(parser.text), outcome=outcome)
+        self.stream_metrics.append(metrics)
+        ttft = f"{metrics['ttft']:.3f}s" if metrics['ttft'] is not None else "-"
+        logger.debug(f"Streamed completion {outcome}: time to first token {ttft}, "
+                     f"total {metrics['total']:.3f}s, {metrics['chunks']} chunks")
+
+    def _complete_choices(self, prompt: str, n: int, max_tokens: Optional[int] = None) -> List[str]:
+        """
+        Request n choices for the prompt in one call and return their raw answers,
+        without the choices cut at their max_tokens budget.
+        """
+        response = self.client.chat.completions.create(
+            model=self.GPT_MODEL,
+            messages=[
+                {"role": "system", "content": prompt}
+            ],
+            n=n,
+            **self._request_options(max_tokens)
+        )
+        self._record_usage(prompt, response)
+        return self._complete_choice_contents(response, max_tokens)
+
+    async def _complete_choices_async(self, prompt: str, n: int, max_tokens: Optional[int] = None) -> List[str]:
+        """Asynchronous counterpart of ``_complete_choices``."""
+        response = await self.async_client.chat.completions.create(
+            model=self.GPT_MODEL,
+            messages=[
+                {"role": "system", "content": prompt}
+            ],
+            n=n,
+            **self._request_options(max_tokens)
+        )
+        self._record_usage(prompt, response)
+        return self._complete_choice_contents(response, max_tokens)
+
+    def _complete_choice_contents(self, response, max_tokens: Optional[int]) -> List[str]:
+        contents = []
+        for choice in response.choices:
+            try:
+                self._check_truncation(choice, max_tokens)
+            except ContentLengthError:
+                continue
+            contents.append(choice.message.content)
+        return contents
+
+    def _extract_candidates(self, raw_choices: str, max_length: Optional[int] = None) -> List[str]:
+        """
+        Extract the publication of every choice of a multi-choice completion.
+
+        Args:
+            raw_choices (str): The JSON list of the raw choices
+            max_length (Optional[int]): Length limit of the platform, for the 'trim' repair
+
+        Returns:
+            List[str]: The cleaned publications, in the order of the choices
+
+        Raises:
+            OpenAIError: If no choice contains a valid publication
+        """
+        candidates = []
+        for raw_content in json.loads(raw_choices):
+            try:
+                candidates.append(self._extract_content(raw_content, max_length))
+            except OpenAIError as e:
+                logger.warning(f"Skipping invalid candidate: {str(e)}")
+        if not candidates:
+            raise OpenAIError("No generated candidate contains social_media_post tags")
+        return candidates
+
+    def _extract_many(self, raw_content: str, platform_specs: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        Extract, clean and validate every platform variant of a raw completion in one pass.
+
+        Args:
+            raw_content (str): The raw text returned by the model
+            platform_specs (Dict[str, Dict]): For each platform, its 'tag' and 'max_length'
+
+        Returns:
+            Dict[str, str]: The cleaned content of each platform
+
+        Raises:
+            OpenAIError: If the content is empty or a variant is missing, empty or too long
+        """
+        generated_content = (raw_content or "").strip()
+        if not generated_content:
+            logger.error("Generated content is empty")
+            raise OpenAIError("Generated content is empty")
+
+        platforms_by_tag = {spec['tag']: platform for platform, spec in platform_specs.items()}
+        pattern = re.compile(
+            r"<(" + "|".join(re.escape(tag) for tag in platforms_by_tag) + r")>(.*?)</\1>",
+            re.DOTALL
+        )
+
+        variants = {}
+        for match in pattern.finditer(generated_content):
+            platform = platforms_by_tag[match.group(1)]
+            if platform not in variants:
+                variants[platform] = self.repair_pipeline.clean(match.group(2), platform_specs[platform]['max_length'])
+
+        results = {}
+        for platform, spec in platform_specs.items():
+            content = variants.get(platform)
+            if not content:
+                logger.error(f"Missing or empty <{spec['tag']}> variant in generated content")
+                raise OpenAIError(f"Generated content does not contain a {platform} variant")
+            if len(content) > spec['max_length']:
+                logger.error(f"{platform} variant too long ({len(content)} > {spec['max_length']})")
+                raise OpenAIError(
+                    f"Generated {platform} variant exceeds {spec['max_length']} characters (current: {len(content)})"
+                )
+            results[platform] = content
+
+        logger.debug(f"Variants generated successfully for: {', '.join(results)}")
+        return results
+
+    def _extract_content(self, raw_content: str, max_length: Optional[int] = None) -> str:
+        """
+        Extract and repair the publication from a raw completion.
+
+        Args:
+            raw_content (str): The raw text returned by the model
+            max_length (Optional[int]): Length limit of the platform, for the 'trim' repair
+
+        Returns:
+            str: The content found between the social_media_post tags, cleaned up
+
+        Raises:
+            OpenAIError: If the content is empty or has no social_media_post tags
+        """
+        generated_content = (raw_content or "").strip()
+
+        # Verify if content was generated
+        if not generated_content:
+            logger.error("Generated content is empty")
+            raise OpenAIError("Generated content is empty")
+
+        # Extract content from social_media_post tags
+        publication = self.repair_pipeline.extract(generated_content)
+        if publication is None:
+            logger.error("Could not find social_media_post tags in generated content")
+            raise OpenAIError("Generated content does not contain social_media_post tags")
+
+        final_content = self.repair_pipeline.clean(publication, max_length)
+        logger.debug(f"Content generated successfully: {final_content[:100]}...")
+        return final_content
@@ -0,0 +1,193 @@
+# Location: src/infrastructure/external/repair_pipeline.py
+
+"""
+This module implements RepairPipeline, the local post-processing applied to every
+completion before it is returned as a publication. Small defects that the prompt
+forbids but the model still produces are repaired here, instead of costing another
+OpenAI request or failing the run.
+
+Stages, in order:
+- tag recovery: a publication whose opening or closing social_media_post tag is
+  missing is recovered, but only when the other tag is present
+- markdown_links: ``[text](url)`` and ``<url>`` are rewritten as plain URLs
+- bold: Markdown bold markers are removed
+- whitespace: Unicode normalization (NFC), zero-width characters, repeated emoji
+  variation selectors, spaces and blank lines
+- trim: a publication slightly over its platform's limit is cut at the last sentence
+  boundary within the limit
+- dots: surrounding dots are removed
+
+Every stage counts the publications it changed, and ``saved`` counts those that would
+otherwise have been rejected (no tags, or too long).
+"""
+
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, Optional
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+POST_PATTERN = re.compile(r"<social_media_post>(.*?)</social_media_post>", re.DOTALL)
+# Balises tolérées pour la récupération : casse et espaces variables
+OPEN_TAG_PATTERN = re.compile(r"<\s*social_media_post\s*>", re.IGNORECASE)
+CLOSE_TAG_PATTERN = re.compile(r"<\s*/\s*social_media_post\s*>", re.IGNORECASE)
+
+MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]\n]+)\]\((https?://[^\s)]+)\)")
+AUTOLINK_PATTERN = re.compile(r"<(https?://[^\s>]+)>")
+BOLD_PATTERN = re.compile(r"\*\*")
+ZERO_WIDTH_PATTERN = re.compile("[\u200b\ufeff\u2060]")
+VARIATION_SELECTORS_PATTERN = re.compile("\ufe0f{2,}")
+SPACES_PATTERN = re.compile(r"[ \t]+")
+TRAILING_SPACES_PATTERN = re.compile(r"[ \t]+\n")
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?…])\s|\n")
+
+
+def rewrite_markdown_links(text: str) -> str:
+    """Rewrite Markdown links as plain URLs, keeping the link text when it differs."""
+    def plain(match):
+        label, url = match.group(1).strip(), match.group(2)
+        return url if label in (url, url.split('://', 1)[-1]) else f"{label} {url}"
+
+    return AUTOLINK_PATTERN.sub(r"\1", MARKDOWN_LINK_PATTERN.sub(plain, text))
+
+
+def remove_bold(text: str) -> str:
+    """Remove Markdown bold markers."""
+    return BOLD_PATTERN.sub("", text)
+
+
+def normalize_whitespace(text: str) -> str:
+    """Normalize Unicode, emoji variation selectors, spaces and blank lines."""
+    text = unicodedata.normalize('NFC', text.replace('\r\n', '\n'))
+    text = VARIATION_SELECTORS_PATTERN.sub('\ufe0f', ZERO_WIDTH_PATTERN.sub('', text))
+    text = TRAILING_SPACES_PATTERN.sub('\n', SPACES_PATTERN.sub(' ', text))
+    return BLANK_LINES_PATTERN.sub('\n\n', text).strip()
+
+
+def strip_dots(text: str) -> str:
+    """Remove surrounding dots."""
+    return text.strip('.')
+
+
+class RepairPipeline:
+    STAGES = ('markdown_links', 'bold', 'whitespace', 'trim', 'dots')
+
+    STAGE_FUNCTIONS = {
+        'markdown_links': rewrite_markdown_links,
+        'bold': remove_bold,
+        'whitespace': normalize_whitespace,
+        'dots': strip_dots,
+    }
+
+    def __init__(self, stages: Iterable[str] = STAGES, recover_tags: bool = True,
+                 max_overrun: float = 0.1, min_kept: float = 0.5):
+        """
+        Args:
+            stages (Iterable[str]): The stages to apply, among ``STAGES`` (applied in that order)
+            recover_tags (bool): Recover a publication missing one of its two tags
+            max_overrun (float): Largest overrun repaired by the 'trim' stage, as a fraction
+                of the limit; longer publications are left to fail validation
+            min_kept (float): Smallest fraction of the limit a trimmed publication must keep
+        """
+        unknown = set(stages) - set(self.STAGES)
+        if unknown:
+            raise ConfigurationError(f"Unknown repair stages: {', '.join(sorted(unknown))}")
+        self.stages = tuple(stage for stage in self.STAGES if stage in set(stages))
+        self.recover_tags = recover_tags
+        self.max_overrun = max_overrun
+        self.min_kept = min_kept
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(('tag_recovery',) + self.stages + ('saved',), 0)
+
+    def extract(self, raw_content: str) -> Optional[str]:
+        """
+        Return the text between the social_media_post tags of a completion.
+
+        When exactly one of the two tags is missing, the text on the other side of the
+        tag present is taken instead. Completions without any tag are not guessed at.
+
+        Returns:
+            Optional[str]: The raw publication, or None if it cannot be found
+        """
+        match = POST_PATTERN.search(raw_content)
+        if match:
+            return match.group(1)
+        if not self.recover_tags:
+            return None
+
+        opening = OPEN_TAG_PATTERN.search(raw_content)
+        closing = CLOSE_TAG_PATTERN.search(raw_content, opening.end() if opening else 0)
+        if opening and closing:
+            recovered = raw_content[opening.end():closing.start()]
+        elif opening and not CLOSE_TAG_PATTERN.search(raw_content):
+            recovered = raw_content[opening.end():]
+        elif closing and not opening:
+            recovered = raw_content[:closing.start()]
+        else:
+            return None
+
+        if not recovered.strip():
+            return None
+        self._count('tag_recovery', saved=True)
+        logger.debug("Recovered a publication with malformed social_media_post tags")
+        return recovered
+
+    def clean(self, content: str, max_length: Optional[int] = None, record: bool = True) -> str:
+        """
+        Apply the configured stages to a publication.
+
+        Args:
+            content (str): The raw publication, as returned by ``extract``
+            max_length (Optional[int]): The platform's limit, used by the 'trim' stage
+            record (bool): Update the stage counters (False for intermediate measures)
+
+        Returns:
+            str: The repaired publication
+        """
+        text = content.strip()
+        for stage in self.stages:
+            if stage == 'trim':
+                repaired = self.trim(text, max_length)
+            else:
+                repaired = self.STAGE_FUNCTIONS[stage](text)
+            if record and repaired != text:
+                self._count(stage, saved=stage == 'trim')
+            text = repaired
+        return text
+
+    def trim(self, text: str, max_length: Optional[int]) -> str:
+        """
+        Cut a publication slightly over ``max_length`` at its last sentence boundary
+        within the limit. Publications far over the limit, or that would lose too
+        much, are returned unchanged.
+        """
+        if max_length is None or len(text) <= max_length or len(text) > self.tolerated_length(max_length):
+            return text
+        cut = None
+        for boundary in SENTENCE_END_PATTERN.finditer(text, 0, max_length + 1):
+            cut = boundary.start()
+        if cut is None or cut < max_length * self.min_kept:
+            return text
+        return text[:cut].rstrip()
+
+    def tolerated_length(self, max_length: Optional[int]) -> Optional[int]:
+        """The longest publication the pipeline can still bring within ``max_length``."""
+        if max_length is None or 'trim' not in self.stages:
+            return max_length
+        return int(max_length * (1 + self.max_overrun))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the number of publications changed by each stage, 'tag_recovery'
+        included, and the number of 'saved' publications that would have been rejected.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def _count(self, stage: str, saved: bool = False) -> None:
+        with self._lock:
+            self._counters[stage] += 1
+            if saved:
+                self._counters['saved'] += 1
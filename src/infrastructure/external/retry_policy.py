@@ -0,0 +1,314 @@
+# Location: src/infrastructure/external/retry_policy.py
+
+"""
+This module implements the retry policy shared by the platform gateways.
+
+Gateways classify each failure as transient (throttling, temporary outage, connection
+failure) or permanent, and attach the delay advertised by the platform, if any, to the
+raised AutomatorError. Creating a post is not idempotent: after a 500, 502 or 504 the
+post may already exist, so these calls are only retried when the platform refused them
+(429, 503 with an advertised delay, Graph throttling) or could not be reached. RetryPolicy then retries transient failures with exponential
+backoff and jitter, or sleeps until the advertised reset time.
+
+Rate-limit signals understood:
+- ``Retry-After`` (seconds or HTTP date), on any platform
+- ``x-rate-limit-reset`` and ``x-user-limit-24hour-reset`` (epoch seconds), on X, only
+  for a 429 or when the matching ``*-remaining`` header is 0
+- Graph API throttling codes and the ``X-App-Usage`` / ``X-Page-Usage`` /
+  ``X-Business-Use-Case-Usage`` headers, on Facebook
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+import httpx
+import requests
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import AutomatorError, ConfigurationError
+
+T = TypeVar('T')
+
+# Statuts HTTP pour lesquels une nouvelle tentative a des chances d'aboutir
+TRANSIENT_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+# Codes d'erreur Graph : 1/2 indisponibilité temporaire, 4/17/32/341/613 limitation de débit
+GRAPH_THROTTLING_CODES = {4, 17, 32, 341, 613}
+GRAPH_TRANSIENT_CODES = {1, 2} | GRAPH_THROTTLING_CODES
+
+GRAPH_USAGE_HEADERS = ('x-app-usage', 'x-page-usage', 'x-ad-account-usage')
+
+
+def _header(headers, name: str) -> Optional[str]:
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    return value if isinstance(value, str) else None
+
+
+def parse_retry_after(headers, now: Optional[float] = None, status_code: Optional[int] = None) -> Optional[float]:
+    """
+    Read the delay advertised by the rate-limit headers of a response.
+
+    The X reset headers are sent with every response: they only advertise a delay for a
+    429, or when the calls left in their window (``*-remaining``) are exhausted.
+
+    Args:
+        headers: The response headers (case-insensitive mapping)
+        now (Optional[float]): Current epoch time (defaults to time.time())
+        status_code (Optional[int]): The status of the response
+
+    Returns:
+        Optional[float]: Seconds to wait before retrying, or None if not advertised
+    """
+    now = time.time() if now is None else now
+
+    retry_after = _header(headers, 'retry-after')
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - now)
+            except (TypeError, ValueError):
+                pass
+
+    # X : limite quotidienne épuisée, sinon fenêtre de 15 minutes de l'endpoint
+    if _header(headers, 'x-user-limit-24hour-remaining') == '0':
+        reset_header = 'x-user-limit-24hour-reset'
+    elif status_code == 429 or _header(headers, 'x-rate-limit-remaining') == '0':
+        reset_header = 'x-rate-limit-reset'
+    else:
+        return None
+    reset = _header(headers, reset_header)
+    if reset:
+        try:
+            return max(0.0, float(reset) - now)
+        except ValueError:
+            pass
+    return None
+
+
+def parse_graph_usage(headers) -> Tuple[bool, Optional[float]]:
+    """
+    Read the Graph API usage headers.
+
+    Returns:
+        Tuple[bool, Optional[float]]: Whether a usage quota is exhausted (100% or more),
+            and the advertised time to regain access in seconds, if any
+    """
+    exhausted = False
+    for name in GRAPH_USAGE_HEADERS:
+        value = _header(headers, name)
+        if not value:
+            continue
+        try:
+            usage = json.loads(value)
+            exhausted = exhausted or any(float(usage.get(key) or 0) >= 100
+                                         for key in ('call_count', 'total_time', 'total_cputime'))
+        except (ValueError, AttributeError, TypeError):
+            continue
+
+    regain_after = None
+    value = _header(headers, 'x-business-use-case-usage')
+    if value:
+        try:
+            for entries in json.loads(value).values():
+                for entry in entries:
+                    if any(float(entry.get(key) or 0) >= 100
+                           for key in ('call_count', 'total_time', 'total_cputime')):
+                        exhausted = True
+                    minutes = entry.get('estimated_time_to_regain_access')
+                    if minutes:
+                        regain_after = max(regain_after or 0.0, float(minutes) * 60)
+        except (ValueError, AttributeError, TypeError):
+            pass
+    return exhausted, regain_after
+
+
+def classify_http_response(response, idempotent: bool = True) -> Dict[str, Any]:
+    """
+    Classify a failed HTTP response.
+
+    Args:
+        response: The HTTP response
+        idempotent (bool): False for a request that creates something, e.g. a post: it
+            is then transient only if refused (429, or 503 with an advertised delay)
+
+    Returns:
+        Dict[str, Any]: The 'transient', 'retry_after' and 'status_code' arguments of the
+            AutomatorError to raise
+    """
+    status_code = response.status_code if isinstance(response.status_code, int) else None
+    retry_after = parse_retry_after(getattr(response, 'headers', {}), status_code=status_code)
+    if idempotent:
+        transient = status_code in TRANSIENT_STATUS_CODES
+    else:
+        transient = status_code == 429 or (status_code == 503 and retry_after is not None)
+    return {
+        'transient': transient,
+        'retry_after': retry_after,
+        'status_code': status_code,
+    }
+
+
+def classify_graph_error(error: Dict, response, idempotent: bool = True) -> Dict[str, Any]:
+    """
+    Classify a Graph API error, using both its error code and the usage headers.
+
+    Args:
+        error (Dict): The 'error' object of the Graph response
+        response: The HTTP response carrying it
+        idempotent (bool): False for a request that creates something: only throttling
+            is then transient, not a temporary outage after which the post may exist
+
+    Returns:
+        Dict[str, Any]: The 'transient', 'retry_after' and 'status_code' arguments of the
+            AutomatorError to raise
+    """
+    classification = classify_http_response(response, idempotent)
+    exhausted, regain_after = parse_graph_usage(getattr(response, 'headers', {}))
+    if idempotent:
+        refused = error.get('code') in GRAPH_TRANSIENT_CODES or error.get('is_transient') is True
+    else:
+        refused = error.get('code') in GRAPH_THROTTLING_CODES
+    transient = refused or exhausted or classification['transient']
+    retry_after = classification['retry_after']
+    if retry_after is None:
+        retry_after = regain_after
+    return dict(classification, transient=transient, retry_after=retry_after)
+
+
+def is_transient_exception(error: Exception) -> bool:
+    """
+    Tell whether a network exception may be retried safely.
+
+    Only failures to connect are retried: after a read timeout the post may already
+    have been published, and posting again would duplicate it.
+    """
+    if isinstance(error, requests.exceptions.ReadTimeout):
+        return False
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.ConnectTimeout)):
+        return True
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+class RetryPolicy:
+    """
+    Retry transient AutomatorErrors with exponential backoff and jitter, honouring the
+    delay advertised by the platform.
+    """
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 1.0, max_delay: float = 60.0,
+                 max_wait: float = 900.0, sleep: Callable[[float], None] = time.sleep,
+                 async_sleep: Callable[[float], Awaitable[None]] = None,
+                 rng: Callable[[], float] = random.random):
+        """
+        Args:
+            max_attempts (int): Total number of attempts, including the first one
+            base_delay (float): Backoff delay of the first retry, in seconds
+            max_delay (float): Upper bound of the exponential backoff, in seconds
+            max_wait (float): Longest advertised delay worth waiting for; beyond it the
+                error is raised immediately
+            sleep (Callable): Blocking sleep function
+            async_sleep (Callable): Asynchronous sleep function (defaults to asyncio.sleep)
+            rng (Callable): Random source in [0, 1) for the jitter
+        """
+        if max_attempts < 1:
+            raise ConfigurationError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_wait = max_wait
+        self._sleep = sleep
+        self._async_sleep = async_sleep or asyncio.sleep
+        self._rng = rng
+
+    @classmethod
+    def from_environment(cls) -> 'RetryPolicy':
+        """
+        Build the policy from RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY and
+        RETRY_MAX_WAIT (all optional).
+        """
+        try:
+            return cls(
+                max_attempts=int(os.environ.get('RETRY_MAX_ATTEMPTS') or 4),
+                base_delay=float(os.environ.get('RETRY_BASE_DELAY') or 1.0),
+                max_delay=float(os.environ.get('RETRY_MAX_DELAY') or 60.0),
+                max_wait=float(os.environ.get('RETRY_MAX_WAIT') or 900.0),
+            )
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid retry setting: {str(e)}")
+
+    def delay(self, attempt: int, error: AutomatorError) -> float:
+        """
+        Compute the wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the attempt that just failed (starting at 1)
+            error (AutomatorError): The failure
+
+        Returns:
+            float: Seconds to wait
+        """
+        if error.retry_after is not None:
+            # Petite dispersion pour que les workers ne repartent pas tous à l'instant du reset
+            return error.retry_after + self._rng() * self.base_delay
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return backoff / 2 + self._rng() * backoff / 2
+
+    def run(self, operation: Callable[[], T], description: str = "operation") -> T:
+        """
+        Run an operation, retrying it while it fails with a transient AutomatorError.
+
+        Args:
+            operation (Callable[[], T]): The operation, called without arguments
+            description (str): Label used in the log messages
+
+        Returns:
+            T: The result of the first successful attempt
+
+        Raises:
+            AutomatorError: The last error, if it is permanent, attempts are exhausted,
+                or the advertised delay exceeds ``max_wait``
+        """
+        attempt = 1
+        while True:
+            try:
+                return operation()
+            except AutomatorError as e:
+                wait = self._next_wait(attempt, e, description)
+            self._sleep(wait)
+            attempt += 1
+
+    async def run_async(self, operation: Callable[[], Awaitable[T]], description: str = "operation") -> T:
+        """
+        Asynchronous counterpart of ``run``; waits without blocking the event loop.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await operation()
+            except AutomatorError as e:
+                wait = self._next_wait(attempt, e, description)
+            await self._async_sleep(wait)
+            attempt += 1
+
+    def _next_wait(self, attempt: int, error: AutomatorError, description: str) -> float:
+        """
+        Return the wait before retrying, or re-raise the error if it must not be retried.
+        Called from an ``except`` block.
+        """
+        if not error.transient or attempt >= self.max_attempts:
+            raise error
+        wait = self.delay(attempt, error)
+        if wait > self.max_wait:
+            logger.warning(f"{description}: advertised wait of {wait:.0f}s exceeds {self.max_wait:.0f}s, giving up")
+            raise error
+        logger.warning(f"{description} failed ({str(error)}), attempt {attempt}/{self.max_attempts}, "
+                       f"retrying in {wait:.1f}s")
+        return wait
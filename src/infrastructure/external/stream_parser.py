@@ -0,0 +1,83 @@
+# Location: src/infrastructure/external/stream_parser.py
+
+"""
+This module implements PostStreamParser, which reads a streamed completion chunk by
+chunk and tells the caller when to stop reading: as soon as the closing
+social_media_post tag has arrived, or as soon as the text inside the tags is already
+longer than the platform allows.
+"""
+
+from typing import Callable, Optional
+from src.domain.exceptions import ContentLengthError
+
+
+class PostStreamParser:
+    OPEN_TAG = "<social_media_post>"
+    CLOSE_TAG = "</social_media_post>"
+
+    def __init__(self, max_length: Optional[int] = None, measure: Callable[[str], int] = len):
+        """
+        Args:
+            max_length (Optional[int]): Maximum length of the publication, None for no limit
+            measure (Callable[[str], int]): Length of a raw publication once cleaned up
+        """
+        self.max_length = max_length
+        self._measure = measure
+        self._text = ""
+        self._content_start: Optional[int] = None
+        self._end: Optional[int] = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether the closing tag has been read."""
+        return self._end is not None
+
+    @property
+    def text(self) -> str:
+        """The text read so far, up to the closing tag included."""
+        return self._text if self._end is None else self._text[:self._end]
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Append a chunk of the stream.
+
+        Args:
+            chunk (str): The next piece of text
+
+        Returns:
+            bool: True once the closing tag has been read, i.e. the rest can be dropped
+
+        Raises:
+            ContentLengthError: If the publication already exceeds ``max_length``
+        """
+        if self.closed or not chunk:
+            return self.closed
+
+        # Une balise peut être coupée entre deux fragments : on relit la fin du texte précédent
+        previous_length = len(self._text)
+        self._text += chunk
+
+        if self._content_start is None:
+            start = self._text.find(self.OPEN_TAG, max(0, previous_length - len(self.OPEN_TAG)))
+            if start < 0:
+                return False
+            self._content_start = start + len(self.OPEN_TAG)
+
+        scan_from = max(self._content_start, previous_length - len(self.CLOSE_TAG))
+        end = self._text.find(self.CLOSE_TAG, scan_from)
+        if end >= 0:
+            self._end = end + len(self.CLOSE_TAG)
+            return True
+
+        self._check_length()
+        return False
+
+    def _check_length(self) -> None:
+        if self.max_length is None:
+            return
+        # Les derniers caractères peuvent être le début de la balise fermante
+        content = self._text[self._content_start:len(self._text) - (len(self.CLOSE_TAG) - 1)]
+        if len(content) > self.max_length and self._measure(content) > self.max_length:
+            raise ContentLengthError(
+                f"Generated content exceeds {self.max_length} characters, generation aborted"
+            )
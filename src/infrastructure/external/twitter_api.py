@@ -7,12 +7,18 @@ communication with the Twitter API, including authentication and tweet posting.
 """
 
 
+import httpx
+import requests
+from oauthlib.oauth1 import Client as OAuth1Client
 from requests_oauthlib import OAuth1Session
 from src.interfaces.twitter_gateway import TwitterGateway
 from src.domain.entities.tweet import Tweet
 from src.infrastructure.logging.logger import logger, log_method
 from src.infrastructure.config.environment import get_twitter_credentials
+from src.infrastructure.config.environment_endpoints import get_endpoint_settings
 from src.domain.exceptions import TwitterError, ConfigurationError
+from src.infrastructure.external.async_http import get_async_http_client
+from src.infrastructure.external.retry_policy import RetryPolicy, classify_http_response, is_transient_exception
 
 
 class TwitterAPI(TwitterGateway):
@@ -23,18 +29,38 @@ class TwitterAPI(TwitterGateway):
     allowing the application to post tweets and perform other Twitter-related operations.
     """
 
+    BASE_URL = "https://api.twitter.com/2"
+    TWEETS_PATH = "/tweets"
+
     @log_method(logger)
-    def __init__(self):
+    def __init__(self, async_http_client: httpx.AsyncClient = None, retry_policy: RetryPolicy = None,
+                 base_url: str = None):
         """
         Initialize the TwitterAPI with the necessary credentials.
 
+        Args:
+            async_http_client (httpx.AsyncClient): Optional client for ``post_tweet_async``
+                (defaults to the shared client of the running event loop)
+            retry_policy (RetryPolicy): Retry policy of the posts
+                (defaults to the policy configured from the environment)
+            base_url (str): Base URL of the X API (defaults to TWITTER_API_URL, else ``BASE_URL``)
+
         Raises:
             ConfigurationError: If there's an error loading the Twitter credentials.
         """
+        self._async_http_client = async_http_client
         try:
+            self.retry_policy = retry_policy or RetryPolicy.from_environment()
+            self.tweets_url = (base_url or get_endpoint_settings()['twitter'] or self.BASE_URL).rstrip('/') + self.TWEETS_PATH
             logger.debug("Loading Twitter credentials")
             credentials = get_twitter_credentials()
             logger.debug(f"Credentials loaded: {', '.join(credentials.keys())}")
+            self._oauth_client = OAuth1Client(
+                credentials['consumer_key'],
+                client_secret=credentials['consumer_secret'],
+                resource_owner_key=credentials['access_token'],
+                resource_owner_secret=credentials['access_token_secret'],
+            )
             self.oauth_session = OAuth1Session(
                 credentials['consumer_key'],
                 client_secret=credentials['consumer_secret'],
@@ -68,18 +94,94 @@ class TwitterAPI(TwitterGateway):
             payload = {"text": tweet.text}
             logger.debug(f"Prepared payload: {payload}")
 
-            logger.debug("Sending request to Twitter API")
-            response = self.oauth_session.post(
-                "https://api.twitter.com/2/tweets",
-                json=payload,
-            )
-            logger.debug(f"API response status code: {response.status_code}")
+            def attempt():
+                logger.debug("Sending request to Twitter API")
+                try:
+                    response = self.oauth_session.post(
+                        self.tweets_url,
+                        json=payload,
+                    )
+                except requests.RequestException as e:
+                    raise self._network_error(e)
+                return self._handle_response(response)
+
+            return self.retry_policy.run(attempt, "X post")
+        except TwitterError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to post tweet: {str(e)}")
+            raise TwitterError(f"Failed to post tweet: {str(e)}")
 
-            response.raise_for_status()
-            response_json = response.json()
-            logger.debug(f"API response content: {response_json}")
+    @log_method(logger)
+    async def post_tweet_async(self, tweet: Tweet):
+        """
+        Post a tweet to Twitter without blocking the event loop.
+
+        The request is signed with OAuth 1.0a and sent through the shared async HTTP client.
+
+        Args:
+            tweet (Tweet): The Tweet entity to be posted.
+
+        Returns:
+            dict: The response from the Twitter API containing the posted tweet's data.
 
-            return response_json
+        Raises:
+            TwitterError: If there's an error posting the tweet to Twitter.
+        """
+        try:
+            logger.debug(f"Validating tweet: {tweet.text[:20]}...")
+            tweet.validate()
+            logger.debug("Tweet validation passed")
+
+            payload = {"text": tweet.text}
+            logger.debug(f"Prepared payload: {payload}")
+
+            client = self._async_http_client or get_async_http_client()
+
+            async def attempt():
+                # Le corps JSON ne fait pas partie de la signature OAuth 1.0a ;
+                # chaque tentative est signée avec un nonce et un horodatage neufs
+                _, headers, _ = self._oauth_client.sign(
+                    self.tweets_url,
+                    http_method="POST",
+                    headers={"Content-Type": "application/json"}
+                )
+
+                logger.debug("Sending asynchronous request to Twitter API")
+                try:
+                    response = await client.post(self.tweets_url, json=payload, headers=headers)
+                except httpx.HTTPError as e:
+                    raise self._network_error(e)
+                return self._handle_response(response)
+
+            return await self.retry_policy.run_async(attempt, "X post")
+        except TwitterError:
+            raise
         except Exception as e:
             logger.error(f"Failed to post tweet: {str(e)}")
-            raise TwitterError(f"Failed to post tweet: {str(e)}")
\ No newline at end of file
+            raise TwitterError(f"Failed to post tweet: {str(e)}")
+
+    @staticmethod
+    def _network_error(error: Exception) -> TwitterError:
+        """Wrap a network exception, flagging connection failures as transient."""
+        logger.error(f"Failed to post tweet: {str(error)}")
+        return TwitterError(f"Failed to post tweet: {str(error)}", transient=is_transient_exception(error))
+
+    @staticmethod
+    def _handle_response(response):
+        """
+        Check a tweet creation response and return its JSON content.
+
+        Raises:
+            TwitterError: If X returned an error status, classified from its rate-limit headers
+        """
+        logger.debug(f"API response status code: {response.status_code}")
+        try:
+            response.raise_for_status()
+        except (requests.HTTPError, httpx.HTTPStatusError) as e:
+            logger.error(f"Failed to post tweet: {str(e)}")
+            raise TwitterError(f"Failed to post tweet: {str(e)}", **classify_http_response(response, idempotent=False))
+
+        response_json = response.json()
+        logger.debug(f"API response content: {response_json}")
+        return response_json
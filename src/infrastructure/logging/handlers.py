@@ -0,0 +1,90 @@
+# src/infrastructure/logging/handlers.py
+
+"""
+This module provides the file sink of the logging pipeline: a formatter writing one
+JSON object per record, and a size-rotated file handler whose rotated files are
+gzip-compressed in a background thread.
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Format each record as a single JSON line, for log shipping and later analysis.
+    """
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': getattr(record, 'custom_level', record.levelname),
+            'logger': record.name,
+            'message': record.getMessage(),
+            'file': record.filename,
+            'function': record.funcName,
+            'line': record.lineno,
+            'thread': record.threadName,
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """
+    A RotatingFileHandler whose rotated files are gzip-compressed.
+
+    At rollover the active file is only renamed, which is immediate; the compression
+    runs in a background thread so that writing the next records does not wait for it.
+    """
+
+    def __init__(self, filename, max_bytes=10 * 1024 * 1024, backup_count=5, encoding='utf-8'):
+        directory = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self._rotate_and_compress
+        self._compression = None
+
+    def doRollover(self):
+        # Les sauvegardes sont décalées au prochain roulement : la compression précédente doit être terminée
+        self.wait_for_compression()
+        super().doRollover()
+
+    def wait_for_compression(self, timeout=None):
+        """Wait for the background compression of the last rotated file, if any."""
+        if self._compression is not None:
+            self._compression.join(timeout)
+
+    def close(self):
+        self.wait_for_compression()
+        super().close()
+
+    def _rotate_and_compress(self, source, dest):
+        if not os.path.exists(source):
+            return
+        pending = f"{dest}.pending"
+        os.replace(source, pending)
+        self._compression = threading.Thread(
+            target=self._compress, args=(pending, dest), name="log-compression", daemon=True
+        )
+        self._compression.start()
+
+    @staticmethod
+    def _compress(source, dest):
+        try:
+            with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            os.remove(source)
+        except OSError:
+            # Le fichier non compressé est conservé plutôt que perdu
+            pass
@@ -5,13 +5,31 @@ This module provides a custom logging setup for the application. It includes
 a ColoredFormatter for console output, a CustomLogger class with additional
 logging levels, and utility functions for creating loggers and decorating
 methods with logging capabilities.
+
+Records are handed to a queue and written by a single background listener, so that
+the calling threads never wait on terminal or file I/O. The pipeline is configured
+once, with ``configure_logging``, and every logger returned by ``get_logger`` shares it.
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+import random
+import reprlib
 from functools import wraps
 import inspect
 import os
+import traceback
+from src.infrastructure.logging.handlers import CompressingRotatingFileHandler, JsonLinesFormatter
+
+# Longueur maximale de la représentation des arguments journalisés par log_method
+DEFAULT_MAX_ARG_LENGTH = 200
+
+# Fichiers ignorés pour retrouver l'appelant d'un message : ce module et le module logging
+_SKIPPED_SOURCE_FILES = {os.path.normcase(__file__), logging._srcfile}
 
 class ColoredFormatter(logging.Formatter):
     COLORS = {
@@ -27,7 +45,7 @@ class ColoredFormatter(logging.Formatter):
     RESET = '\033[0m'
 
     def format(self, record):
-        caller = self.get_caller_info()
+        caller = self.get_caller_info(record)
         log_type = record.levelname
         prefix = ""
         if hasattr(record, 'custom_level'):
@@ -55,20 +73,17 @@ class ColoredFormatter(logging.Formatter):
 
         return colored_message
 
-    def get_caller_info(self):
-        frame = inspect.currentframe()
-        while frame and (frame.f_code.co_filename == __file__ or 'logging' in frame.f_code.co_filename):
-            frame = frame.f_back
-
-        if frame:
-            filename = os.path.basename(frame.f_code.co_filename)
-            return {
-                'file': filename,
-                'function': frame.f_code.co_name,
-                'line': frame.f_lineno
-            }
-        else:
-            return {'file': 'unknown', 'function': 'unknown', 'line': 0}
+    @staticmethod
+    def get_caller_info(record):
+        """
+        Get the caller of a record from the fields set when it was created
+        (see ``CustomLogger.findCaller``), without walking the stack again.
+        """
+        return {
+            'file': record.filename or 'unknown',
+            'function': record.funcName or 'unknown',
+            'line': record.lineno or 0
+        }
 
 class CustomLogger(logging.Logger):
     def __init__(self, name, level=logging.NOTSET):
@@ -77,6 +92,25 @@ class CustomLogger(logging.Logger):
         self.entering = self._entering
         self.exiting = self._exiting
 
+    def findCaller(self, stack_info=False, stacklevel=1):
+        """
+        Find the caller of the logging call, skipping the frames of this module
+        (custom levels, log_method wrappers) as well as those of the logging package.
+        """
+        frame = sys._getframe(1)
+        while frame is not None and os.path.normcase(frame.f_code.co_filename) in _SKIPPED_SOURCE_FILES:
+            frame = frame.f_back
+        while frame is not None and stacklevel > 1:
+            frame = frame.f_back
+            stacklevel -= 1
+        if frame is None:
+            return "(unknown file)", 0, "(unknown function)", None
+
+        sinfo = None
+        if stack_info:
+            sinfo = "Stack (most recent call last):\n" + "".join(traceback.format_stack(frame)).rstrip("\n")
+        return frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name, sinfo
+
     def _log_with_custom_level(self, level, msg, custom_level, *args, **kwargs):
         if self.isEnabledFor(level):
             extra = kwargs.get('extra', {})
@@ -93,43 +127,221 @@ class CustomLogger(logging.Logger):
     def _exiting(self, msg, *args, **kwargs):
         self._log_with_custom_level(logging.DEBUG, msg, 'EXITING', *args, **kwargs)
 
+class _LoggingPipeline:
+    """
+    The shared queue, its handler and the background listener of the application loggers.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.queue = queue.SimpleQueue()
+        self.queue_handler = QueueHandler(self.queue)
+        self.listener = None
+        self.level = logging.DEBUG
+        self.logger_names = set()
+
+
+_pipeline = _LoggingPipeline()
+
+
+def _env_level(default):
+    value = os.environ.get('LOG_LEVEL')
+    if not value:
+        return default
+    level = logging.getLevelName(value.strip().upper())
+    return level if isinstance(level, int) else default
+
+
+def _build_handlers(console, json_path, max_bytes, backup_count):
+    handlers = []
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.DEBUG)
+        console_handler.setFormatter(ColoredFormatter())
+        handlers.append(console_handler)
+
+        # Ajouter un handler non formaté pour les erreurs
+        error_handler = logging.StreamHandler(sys.stderr)
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s:\n%(pathname)s:%(lineno)d'))
+        handlers.append(error_handler)
+
+    if json_path:
+        file_handler = CompressingRotatingFileHandler(json_path, max_bytes=max_bytes, backup_count=backup_count)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(file_handler)
+    return handlers
+
+
+def configure_logging(level=None, json_path=None, max_bytes=None, backup_count=None, console=True):
+    """
+    Configure the logging pipeline of the application. Calling it again replaces the
+    previous configuration; the records already queued are written first.
+
+    Unset arguments are read from the environment:
+        LOG_LEVEL (default DEBUG), LOG_JSON_PATH (no file sink by default),
+        LOG_JSON_MAX_BYTES (default 10 MB), LOG_JSON_BACKUP_COUNT (default 5)
+
+    Args:
+        level: Level of the application loggers (name or number)
+        json_path (str): JSON-lines file sink, rotated by size and gzip-compressed
+        max_bytes (int): Size of the JSON file that triggers a rotation
+        backup_count (int): Number of rotated files kept
+        console (bool): If True, records are also written to stdout (and errors to stderr)
+    """
+    if level is None:
+        level = _env_level(logging.DEBUG)
+    elif isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level: {level}")
+    json_path = json_path or os.environ.get('LOG_JSON_PATH') or None
+    max_bytes = max_bytes or int(os.environ.get('LOG_JSON_MAX_BYTES') or 10 * 1024 * 1024)
+    backup_count = backup_count or int(os.environ.get('LOG_JSON_BACKUP_COUNT') or 5)
+
+    with _pipeline.lock:
+        _stop_listener()
+        handlers = _build_handlers(console, json_path, max_bytes, backup_count)
+        _pipeline.listener = QueueListener(_pipeline.queue, *handlers, respect_handler_level=True)
+        _pipeline.listener.start()
+
+        _pipeline.level = level
+        for name in _pipeline.logger_names:
+            logging.getLogger(name).setLevel(level)
+
+
+def shutdown_logging():
+    """Write the queued records and stop the background listener."""
+    with _pipeline.lock:
+        _stop_listener()
+
+
+def _stop_listener():
+    listener, _pipeline.listener = _pipeline.listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name):
-    logging.setLoggerClass(CustomLogger)
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)  # Set to DEBUG to capture all levels
+    """
+    Return the application logger of a name, attached once to the shared pipeline.
+    Calling it several times with the same name never duplicates the output.
+    """
+    with _pipeline.lock:
+        if _pipeline.listener is None:
+            configure_logging()
+
+        logging.setLoggerClass(CustomLogger)
+        logger = logging.getLogger(name)
+        logger.setLevel(_pipeline.level)
+        if _pipeline.queue_handler not in logger.handlers:
+            logger.addHandler(_pipeline.queue_handler)
+        _pipeline.logger_names.add(name)
+        return logger
+
 
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)  # Set handler to DEBUG as well
+def _argument_repr(max_length):
+    """
+    Build a function representing a value in at most ``max_length`` characters,
+    without computing the full repr of large values such as whole prompts.
+    """
+    limiter = reprlib.Repr()
+    limiter.maxstring = limiter.maxother = max_length
+    limiter.maxlist = limiter.maxtuple = limiter.maxdict = limiter.maxset = 10
 
-    formatter = ColoredFormatter()
-    console_handler.setFormatter(formatter)
+    def short_repr(value):
+        text = limiter.repr(value)
+        return text if len(text) <= max_length else text[:max_length - 3] + '...'
+    return short_repr
 
-    logger.addHandler(console_handler)
 
-    # Ajouter un handler non formaté pour les erreurs
-    error_handler = logging.StreamHandler(sys.stderr)
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s:\n%(pathname)s:%(lineno)d'))
-    logger.addHandler(error_handler)
+def log_method(logger, sample_rate=1.0, max_arg_length=DEFAULT_MAX_ARG_LENGTH):
+    """
+    Log the entry, arguments, success and exit of the decorated function.
 
-    return logger
+    Messages are only built when their level is enabled, so a decorated call costs
+    little more than the call itself when DEBUG and INFO are disabled. Exceptions are
+    always logged.
+
+    Args:
+        logger: The logger to write to
+        sample_rate (float): Fraction of the calls that are traced (1.0 traces every call)
+        max_arg_length (int): Maximum length of the logged representation of the arguments
+    """
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError("sample_rate must be between 0 and 1")
+    short_repr = _argument_repr(max_arg_length)
 
-def log_method(logger):
     def decorator(func):
+        name = func.__name__
+
+        def trace_levels():
+            """Return whether DEBUG and INFO messages must be emitted for this call."""
+            if sample_rate < 1.0 and random.random() >= sample_rate:
+                return False, False
+            return logger.isEnabledFor(logging.DEBUG), logger.isEnabledFor(logging.INFO)
+
+        def log_entry(debug, info, args, kwargs):
+            if debug:
+                logger.entering(f"Entering {name}")
+            if info:
+                logger.info(f"Executing {name}")
+            if debug:
+                logger.debug(f"Arguments: {short_repr(args)}, {short_repr(kwargs)}")
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                debug, info = trace_levels()
+                if not (debug or info):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        logger.error(f"Exception in {name}: {str(e)}")
+                        raise
+
+                log_entry(debug, info, args, kwargs)
+                try:
+                    result = await func(*args, **kwargs)
+                    if info:
+                        logger.success(f"Successfully executed {name}")
+                    return result
+                except Exception as e:
+                    logger.error(f"Exception in {name}: {str(e)}")
+                    raise
+                finally:
+                    if debug:
+                        logger.exiting(f"Exiting {name}")
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger.entering(f"Entering {func.__name__}")
-            logger.info(f"Executing {func.__name__}")
+            debug, info = trace_levels()
+            if not (debug or info):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Exception in {name}: {str(e)}")
+                    raise
+
+            log_entry(debug, info, args, kwargs)
             try:
-                logger.debug(f"Arguments: {args}, {kwargs}")
                 result = func(*args, **kwargs)
-                logger.success(f"Successfully executed {func.__name__}")
+                if info:
+                    logger.success(f"Successfully executed {name}")
                 return result
             except Exception as e:
-                logger.error(f"Exception in {func.__name__}: {str(e)}")
+                logger.error(f"Exception in {name}: {str(e)}")
                 raise
             finally:
-                logger.exiting(f"Exiting {func.__name__}")
+                if debug:
+                    logger.exiting(f"Exiting {name}")
         return wrapper
     return decorator
 
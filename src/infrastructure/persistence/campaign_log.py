@@ -0,0 +1,110 @@
+# Location: src/infrastructure/persistence/campaign_log.py
+
+"""
+This module implements CampaignLog, the files of a bulk campaign generation.
+
+A campaign writes two files:
+- its output, a JSON Lines file with one record per generated publication, appended
+  and flushed as soon as the publication completes; it doubles as the progress record
+- its checkpoint, ``<output>.checkpoint.json``, holding the settings and the plan of
+  the campaign, written once before the first generation
+
+An interrupted campaign is resumed by reloading the plan from the checkpoint and
+skipping the items the output already records as successful. A record cut short by
+the interruption is dropped when the output is reopened.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Set
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ValidationError
+
+
+class CampaignLog:
+    def __init__(self, path: str):
+        """
+        Open the files of a campaign; nothing is written until the plan is saved.
+
+        Args:
+            path (str): Path of the JSON Lines output
+        """
+        self.path = path
+        self.checkpoint_path = f"{path}.checkpoint.json"
+        self._file = None
+
+    def load_plan(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the checkpoint of the campaign, with its 'settings' and 'plan', or None
+        if the campaign was never started.
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        try:
+            with open(self.checkpoint_path, encoding='utf-8') as checkpoint:
+                return json.load(checkpoint)
+        except (OSError, ValueError) as e:
+            raise ValidationError(f"Unreadable campaign checkpoint {self.checkpoint_path}: {str(e)}")
+
+    def save_plan(self, settings: Dict[str, Any], plan: List[Dict[str, Any]]) -> None:
+        """Write the checkpoint of a new campaign, atomically."""
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self.checkpoint_path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as checkpoint:
+            json.dump({'settings': settings, 'plan': plan}, checkpoint, ensure_ascii=False)
+        os.replace(temporary_path, self.checkpoint_path)
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Return the records of the output, in the order they were written."""
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, encoding='utf-8') as output:
+            for line in output:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Dernier enregistrement tronqué par une interruption
+                    logger.warning(f"Ignoring an incomplete record in {self.path}")
+        return records
+
+    def completed(self) -> Set[int]:
+        """Return the plan indices already generated successfully."""
+        return {record['index'] for record in self.records() if record.get('status') == 'success'}
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a record to the output and flush it, so that it survives an interruption."""
+        if self._file is None:
+            self._open()
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def reset(self) -> None:
+        """Delete the output and the checkpoint, to start the campaign again."""
+        self.close()
+        for path in (self.path, self.checkpoint_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._truncate_incomplete_record()
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def _truncate_incomplete_record(self) -> None:
+        """Cut the output after its last complete line, so that new records start on their own line."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb+') as output:
+            data = output.read()
+            if data and not data.endswith(b"\n"):
+                output.truncate(data.rfind(b"\n") + 1)
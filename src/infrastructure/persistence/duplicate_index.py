@@ -0,0 +1,149 @@
+# Location: src/infrastructure/persistence/duplicate_index.py
+
+"""
+This module implements DuplicateIndex, the persisted MinHash index of the published
+texts of each platform (see utils/minhash.py).
+
+The signatures are stored in SQLite; the LSH buckets of a platform are rebuilt in
+memory from them the first time the platform is searched, in one pass. A search then
+hashes the text, looks its bands up in dictionaries and compares the signatures of the
+few candidates found, so its cost does not grow with the number of indexed posts.
+
+The fingerprint of the hasher is stored with the signatures: signatures computed by
+another scheme are not comparable, so they are dropped when the index is opened, and
+the outbox backfill (see the container) indexes the published texts again.
+"""
+
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.persistence.sqlite_store import SQLiteStore
+from src.infrastructure.utils.minhash import MinHasher, similarity
+
+
+class DuplicateIndex(SQLiteStore):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS signatures (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            platform TEXT NOT NULL,
+            excerpt TEXT NOT NULL,
+            signature BLOB NOT NULL,
+            created_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS signatures_platform ON signatures (platform, id);
+        CREATE TABLE IF NOT EXISTS settings (
+            name TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    EXCERPT_LENGTH = 80
+
+    def __init__(self, path: str, hasher: Optional[MinHasher] = None, clock: Callable[[], float] = time.time):
+        """
+        Open the index.
+
+        Args:
+            path (str): Path of the SQLite file, or ':memory:'
+            hasher (Optional[MinHasher]): Signature settings; they must not change once
+                signatures are stored
+            clock (Callable[[], float]): Time source, in epoch seconds
+        """
+        super().__init__(path)
+        self.hasher = hasher or MinHasher()
+        self._clock = clock
+        self._check_hasher()
+        self._memory_lock = threading.Lock()
+        # Par plateforme : signatures par id, et ids par (bande, valeurs de la bande)
+        self._signatures: Dict[str, Dict[int, array]] = {}
+        self._buckets: Dict[str, Dict[Tuple[int, Tuple[int, ...]], List[int]]] = {}
+
+    def add(self, platform: str, content: str) -> int:
+        """
+        Index a published text.
+
+        Returns:
+            int: The id of the indexed text
+        """
+        signature = self.hasher.signature(content)
+        with self.transaction() as connection:
+            signature_id = connection.execute(
+                "INSERT INTO signatures (platform, excerpt, signature, created_at) VALUES (?, ?, ?, ?)",
+                (platform, content[:self.EXCERPT_LENGTH], signature.tobytes(), self._clock())
+            ).lastrowid
+        with self._memory_lock:
+            if platform in self._signatures:
+                self._insert(platform, signature_id, signature)
+        return signature_id
+
+    def find(self, platform: str, content: str, threshold: float) -> Optional[Dict[str, Any]]:
+        """
+        Find the indexed text of a platform most similar to a text, if similar enough.
+
+        Args:
+            platform (str): The platform whose texts are searched
+            content (str): The text to look for
+            threshold (float): Minimum estimated Jaccard similarity, between 0 and 1
+
+        Returns:
+            Optional[Dict[str, Any]]: The 'id', 'similarity' and 'excerpt' of the best
+                match, or None if no indexed text reaches the threshold
+        """
+        return self.find_signature(platform, self.hasher.signature(content), threshold)
+
+    def find_signature(self, platform: str, signature: array, threshold: float) -> Optional[Dict[str, Any]]:
+        """Same as ``find``, for a signature computed beforehand."""
+        with self._memory_lock:
+            self._load(platform)
+            signatures, buckets = self._signatures[platform], self._buckets[platform]
+            candidates = set()
+            for key in self.hasher.band_keys(signature):
+                candidates.update(buckets.get(key, ()))
+            best_id, best = None, 0.0
+            for candidate in candidates:
+                score = similarity(signature, signatures[candidate])
+                if score > best:
+                    best_id, best = candidate, score
+        if best_id is None or best < threshold:
+            return None
+        rows = self.query("SELECT excerpt FROM signatures WHERE id = ?", (best_id,))
+        return {'id': best_id, 'similarity': best, 'excerpt': rows[0]['excerpt'] if rows else ''}
+
+    def count(self, platform: Optional[str] = None) -> int:
+        """Return the number of indexed texts, of one platform or of all."""
+        if platform is None:
+            return self.query("SELECT COUNT(*) FROM signatures")[0][0]
+        return self.query("SELECT COUNT(*) FROM signatures WHERE platform = ?", (platform,))[0][0]
+
+    def _check_hasher(self) -> None:
+        """Drop the signatures computed with other settings than those of the hasher."""
+        fingerprint = self.hasher.fingerprint
+        with self.transaction() as connection:
+            row = connection.execute("SELECT value FROM settings WHERE name = 'hasher'").fetchone()
+            if row is not None and row['value'] == fingerprint:
+                return
+            dropped = connection.execute("DELETE FROM signatures").rowcount
+            connection.execute("INSERT OR REPLACE INTO settings (name, value) VALUES ('hasher', ?)", (fingerprint,))
+        if dropped:
+            logger.warning(f"Dropped {dropped} duplicate-check signatures computed with other settings; "
+                           f"published texts are indexed again from the outbox")
+
+    def _load(self, platform: str) -> None:
+        """Rebuild the LSH buckets of a platform from its stored signatures, once."""
+        if platform in self._signatures:
+            return
+        self._signatures[platform], self._buckets[platform] = {}, {}
+        rows = self.query("SELECT id, signature FROM signatures WHERE platform = ? ORDER BY id", (platform,))
+        for row in rows:
+            signature = array('Q')
+            signature.frombytes(row['signature'])
+            if len(signature) == self.hasher.num_perm:
+                self._insert(platform, row['id'], signature)
+
+    def _insert(self, platform: str, signature_id: int, signature: array) -> None:
+        self._signatures[platform][signature_id] = signature
+        buckets = self._buckets[platform]
+        for key in self.hasher.band_keys(signature):
+            buckets.setdefault(key, []).append(signature_id)
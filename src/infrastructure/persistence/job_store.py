@@ -0,0 +1,201 @@
+# Location: src/infrastructure/persistence/job_store.py
+
+"""
+This module implements JobStore, the SQLite queue of scheduled posts.
+
+Each job targets one platform at a due time, optionally with a topic category. A job
+goes from 'pending' to 'running' when a worker claims it, then to 'done', back to
+'pending' (with a later due time) after a failure that may be retried, or to
+'failed' once its attempts are exhausted. Pending jobs can be 'cancelled'.
+
+Claiming is a single write transaction, so several workers sharing the database
+never run the same job twice. A claim is a lease: a job still 'running' long after its
+claim (``claimed_at``) belongs to a worker that stopped abruptly and is put back in the
+queue by ``recover``, while the jobs of the workers still running are left alone.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.persistence.sqlite_store import SQLiteStore
+from src.domain.exceptions import ValidationError
+
+JOB_STATUSES = ('pending', 'running', 'done', 'failed', 'cancelled')
+
+
+class JobStore(SQLiteStore):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            platform TEXT NOT NULL,
+            topic TEXT,
+            due_at REAL NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 3,
+            last_error TEXT,
+            post_id TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            claimed_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS jobs_status_due_at ON jobs (status, due_at);
+    """
+
+    COLUMNS = {'jobs': {'claimed_at': 'REAL'}}
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        """
+        Open the job store.
+
+        Args:
+            path (str): Path of the SQLite file, or ':memory:'
+            clock (Callable[[], float]): Time source, in epoch seconds
+        """
+        super().__init__(path)
+        self._clock = clock
+
+    def add(self, platform: str, due_at: float, topic: Optional[str] = None, max_attempts: int = 3) -> int:
+        """
+        Schedule a post.
+
+        Args:
+            platform (str): Target platform
+            due_at (float): Epoch time at which the post is due
+            topic (Optional[str]): Topic category (random if None)
+            max_attempts (int): Number of runs allowed before the job is marked 'failed'
+
+        Returns:
+            int: The id of the new job
+        """
+        if max_attempts < 1:
+            raise ValidationError("max_attempts must be at least 1")
+        now = self._clock()
+        with self.transaction() as connection:
+            job_id = connection.execute(
+                "INSERT INTO jobs (platform, topic, due_at, max_attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (platform, topic, due_at, max_attempts, now, now)
+            ).lastrowid
+        logger.debug(f"Scheduled job {job_id} ({platform}) at {due_at:.0f}")
+        return job_id
+
+    def claim_due(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Claim the oldest due pending jobs: they are marked 'running', with the time of
+        the claim, and their attempt counter is incremented.
+
+        Args:
+            limit (int): Maximum number of jobs claimed
+
+        Returns:
+            List[Dict[str, Any]]: The claimed jobs, oldest due first
+        """
+        now = self._clock()
+        with self.transaction() as connection:
+            rows = connection.execute(
+                "SELECT * FROM jobs WHERE status = 'pending' AND due_at <= ? ORDER BY due_at, id LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            connection.executemany(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, claimed_at = ?, updated_at = ? "
+                "WHERE id = ?",
+                [(now, now, row['id']) for row in rows]
+            )
+        return [dict(row, status='running', attempts=row['attempts'] + 1, claimed_at=now) for row in rows]
+
+    def complete(self, job_id: int, post_id: Optional[str] = None) -> None:
+        """Mark a running job as 'done', recording the id of the published post."""
+        with self.transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = 'done', post_id = ?, last_error = NULL, updated_at = ? WHERE id = ?",
+                (post_id, self._clock(), job_id)
+            )
+
+    def fail(self, job_id: int, error: str, retry_at: Optional[float] = None) -> str:
+        """
+        Record the failure of a running job. It is rescheduled at ``retry_at`` if given
+        and attempts remain, otherwise it is marked 'failed'.
+
+        Returns:
+            str: The new status of the job ('pending' or 'failed')
+        """
+        with self.transaction() as connection:
+            row = connection.execute("SELECT attempts, max_attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            retry = row is not None and retry_at is not None and row['attempts'] < row['max_attempts']
+            status = 'pending' if retry else 'failed'
+            connection.execute(
+                "UPDATE jobs SET status = ?, last_error = ?, due_at = COALESCE(?, due_at), updated_at = ? "
+                "WHERE id = ?",
+                (status, error, retry_at if retry else None, self._clock(), job_id)
+            )
+        return status
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancel a pending job.
+
+        Returns:
+            bool: False if the job does not exist or is no longer pending
+        """
+        with self.transaction() as connection:
+            return connection.execute(
+                "UPDATE jobs SET status = 'cancelled', updated_at = ? WHERE id = ? AND status = 'pending'",
+                (self._clock(), job_id)
+            ).rowcount == 1
+
+    def recover(self, stale_after: float = 3600.0) -> int:
+        """
+        Return the jobs left 'running' by a worker that stopped abruptly to 'pending',
+        so that they are claimed again.
+
+        Args:
+            stale_after (float): Age in seconds of a claim after which its job is
+                considered interrupted; it must exceed the longest job, retries included,
+                so that the jobs of the other running workers are left alone
+
+        Returns:
+            int: The number of recovered jobs
+        """
+        now = self._clock()
+        with self.transaction() as connection:
+            recovered = connection.execute(
+                "UPDATE jobs SET status = 'pending', updated_at = ? "
+                "WHERE status = 'running' AND COALESCE(claimed_at, updated_at) <= ?",
+                (now, now - stale_after)
+            ).rowcount
+        if recovered:
+            logger.warning(f"Recovered {recovered} interrupted jobs")
+        return recovered
+
+    def next_due(self) -> Optional[float]:
+        """Return the due time of the next pending job, or None if the queue is empty."""
+        return self.query("SELECT MIN(due_at) FROM jobs WHERE status = 'pending'")[0][0]
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Return a job, or None if it does not exist."""
+        rows = self.query("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        return dict(rows[0]) if rows else None
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List jobs by due time.
+
+        Args:
+            status (Optional[str]): Only jobs with this status (all statuses if None)
+            limit (int): Maximum number of jobs returned
+        """
+        if status is not None and status not in JOB_STATUSES:
+            raise ValidationError(f"Unknown job status: {status}")
+        if status is None:
+            rows = self.query("SELECT * FROM jobs ORDER BY due_at, id LIMIT ?", (limit,))
+        else:
+            rows = self.query("SELECT * FROM jobs WHERE status = ? ORDER BY due_at, id LIMIT ?", (status, limit))
+        return [dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of jobs in each status."""
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        for row in self.query("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+            counts[row[0]] = row[1]
+        return counts
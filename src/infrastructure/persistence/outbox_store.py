@@ -0,0 +1,268 @@
+# Location: src/infrastructure/persistence/outbox_store.py
+
+"""
+This module implements OutboxStore, the durable record of the generated publications.
+
+Each publication is written, with the hash of its platform and content, before it is
+posted, and goes through these states:
+- 'pending': generated, not posted yet (or its last post failed temporarily); the next
+  run posts it instead of generating a new one
+- 'posting': the post request is in flight
+- 'published': posted, with the post id returned by the platform
+- 'unknown': found 'posting' after a crash, so it may or may not have been published;
+  it is never posted again automatically (see ``requeue``)
+- 'failed': refused by the platform for good (invalid content, revoked credentials); it
+  is never posted again automatically, so it cannot block the next publications
+- 'discarded': dropped by the user
+
+A publication whose hash is already recorded is never recorded twice, so the same
+content cannot be published twice either.
+
+A pending publication is claimed by the process about to post it, in the same
+transaction as its lookup (see ``claim_pending``), so that concurrent posts of a
+platform never take the same publication. A claim is a lease: the publication of a
+process that stopped before posting it is claimed again once the claim is older than
+``stale_after``, while a process giving up a publication without posting it hands
+it back at once with ``unclaim``. Each publication records the topic category it was generated for,
+so that a run asking for a category only resumes publications of that category.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.persistence.sqlite_store import SQLiteStore
+from src.domain.exceptions import ValidationError
+
+OUTBOX_STATUSES = ('pending', 'posting', 'published', 'unknown', 'failed', 'discarded')
+
+
+class OutboxStore(SQLiteStore):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            platform TEXT NOT NULL,
+            content TEXT NOT NULL,
+            content_hash TEXT NOT NULL UNIQUE,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            post_id TEXT,
+            result TEXT,
+            last_error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            category TEXT,
+            claimed_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS outbox_platform_status ON outbox (platform, status, id);
+    """
+
+    COLUMNS = {'outbox': {'category': 'TEXT', 'claimed_at': 'REAL'}}
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        """
+        Open the outbox.
+
+        Args:
+            path (str): Path of the SQLite file, or ':memory:'
+            clock (Callable[[], float]): Time source, in epoch seconds
+        """
+        super().__init__(path)
+        self._clock = clock
+
+    @staticmethod
+    def content_hash(platform: str, content: str) -> str:
+        """Compute the SHA-256 identifying a publication of a platform."""
+        return hashlib.sha256(f"{platform}\n{content}".encode('utf-8')).hexdigest()
+
+    def add(self, platform: str, content: str, category: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Record a generated publication as 'pending', claimed by the caller who is about
+        to post it.
+
+        Args:
+            platform (str): Target platform
+            content (str): The generated content
+            category (Optional[str]): Topic category the content was generated for, if any
+
+        Returns:
+            Dict[str, Any]: The new item, or the item already recorded with the same
+                content (whatever its status)
+        """
+        now = self._clock()
+        content_hash = self.content_hash(platform, content)
+        with self.transaction() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO outbox (platform, content, content_hash, category, claimed_at, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (platform, content, content_hash, category, now, now, now)
+            )
+            row = connection.execute("SELECT * FROM outbox WHERE content_hash = ?", (content_hash,)).fetchone()
+        return dict(row)
+
+    def next_pending(self, platform: str) -> Optional[Dict[str, Any]]:
+        """Return the oldest pending publication of a platform, or None."""
+        rows = self.query(
+            "SELECT * FROM outbox WHERE platform = ? AND status = 'pending' ORDER BY id LIMIT 1", (platform,)
+        )
+        return dict(rows[0]) if rows else None
+
+    def claim_pending(self, platform: str, category: Optional[str] = None,
+                      stale_after: float = 3600.0) -> Optional[Dict[str, Any]]:
+        """
+        Claim the oldest pending publication of a platform that no other process holds.
+
+        Args:
+            platform (str): Target platform
+            category (Optional[str]): Only a publication generated for this topic category
+                (any publication if None)
+            stale_after (float): Age in seconds after which a claim is considered abandoned
+
+        Returns:
+            Optional[Dict[str, Any]]: The claimed item, or None if nothing is left to claim
+        """
+        now = self._clock()
+        conditions = "platform = ? AND status = 'pending' AND (claimed_at IS NULL OR claimed_at <= ?)"
+        parameters = [platform, now - stale_after]
+        if category is not None:
+            conditions += " AND category = ?"
+            parameters.append(category)
+        with self.transaction() as connection:
+            row = connection.execute(
+                f"SELECT * FROM outbox WHERE {conditions} ORDER BY id LIMIT 1", parameters
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE outbox SET claimed_at = ? WHERE id = ?", (now, row['id']))
+        return dict(row, claimed_at=now)
+
+    def unclaim(self, item_id: int) -> None:
+        """Hand back a claimed publication that will not be posted, so that the next run takes it."""
+        with self.transaction() as connection:
+            connection.execute(
+                "UPDATE outbox SET claimed_at = NULL, updated_at = ? WHERE id = ? AND status = 'pending'",
+                (self._clock(), item_id)
+            )
+
+    def begin_posting(self, item_id: int) -> bool:
+        """
+        Mark a pending publication as 'posting', just before its post request.
+
+        Returns:
+            bool: False if the publication is no longer pending (e.g. taken by another process)
+        """
+        with self.transaction() as connection:
+            return connection.execute(
+                "UPDATE outbox SET status = 'posting', attempts = attempts + 1, updated_at = ? "
+                "WHERE id = ? AND status = 'pending'",
+                (self._clock(), item_id)
+            ).rowcount == 1
+
+    def mark_published(self, item_id: int, post_id: Optional[str], result: Any = None) -> None:
+        """Record a successful post, with the post id and response returned by the platform."""
+        with self.transaction() as connection:
+            connection.execute(
+                "UPDATE outbox SET status = 'published', post_id = ?, result = ?, last_error = NULL, "
+                "updated_at = ? WHERE id = ?",
+                (post_id, json.dumps(result, default=str), self._clock(), item_id)
+            )
+
+    def release(self, item_id: int, error: str) -> None:
+        """Return a publication whose post request failed temporarily to 'pending', for the next run."""
+        with self.transaction() as connection:
+            connection.execute(
+                "UPDATE outbox SET status = 'pending', last_error = ?, claimed_at = NULL, updated_at = ? "
+                "WHERE id = ? AND status = 'posting'",
+                (error, self._clock(), item_id)
+            )
+
+    def mark_failed(self, item_id: int, error: str) -> None:
+        """Record a post refused for good: the publication is set aside as 'failed'."""
+        with self.transaction() as connection:
+            connection.execute(
+                "UPDATE outbox SET status = 'failed', last_error = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'posting'",
+                (error, self._clock(), item_id)
+            )
+
+    def recover(self, stale_after: float = 3600.0) -> int:
+        """
+        Mark the publications left 'posting' by a process that stopped abruptly as
+        'unknown'.
+
+        Args:
+            stale_after (float): Age in seconds after which a 'posting' publication is
+                considered interrupted; it must exceed the longest post request, retries
+                included, so that posts in flight in another process are left alone
+
+        Returns:
+            int: The number of publications whose outcome is unknown
+        """
+        now = self._clock()
+        with self.transaction() as connection:
+            recovered = connection.execute(
+                "UPDATE outbox SET status = 'unknown', updated_at = ? WHERE status = 'posting' AND updated_at <= ?",
+                (now, now - stale_after)
+            ).rowcount
+        if recovered:
+            logger.warning(f"{recovered} publications were interrupted while posting; check them "
+                           f"on the platform, then requeue or discard them")
+        return recovered
+
+    def requeue(self, item_id: int) -> bool:
+        """
+        Return an 'unknown' publication to 'pending', once checked that it was not
+        published, or a 'failed' one once the cause of its failure was fixed.
+
+        Returns:
+            bool: False if the publication does not exist or is neither 'unknown' nor 'failed'
+        """
+        with self.transaction() as connection:
+            return connection.execute(
+                "UPDATE outbox SET status = 'pending', claimed_at = NULL, updated_at = ? "
+                "WHERE id = ? AND status IN ('unknown', 'failed')",
+                (self._clock(), item_id)
+            ).rowcount == 1
+
+    def discard(self, item_id: int) -> bool:
+        """
+        Drop a 'pending', 'unknown' or 'failed' publication, so that it is never posted.
+
+        Returns:
+            bool: False if the publication does not exist or is in another state
+        """
+        with self.transaction() as connection:
+            return connection.execute(
+                "UPDATE outbox SET status = 'discarded', updated_at = ? "
+                "WHERE id = ? AND status IN ('pending', 'unknown', 'failed')",
+                (self._clock(), item_id)
+            ).rowcount == 1
+
+    def get(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Return a publication, or None if it does not exist."""
+        rows = self.query("SELECT * FROM outbox WHERE id = ?", (item_id,))
+        return dict(rows[0]) if rows else None
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List publications, most recent first.
+
+        Args:
+            status (Optional[str]): Only publications with this status (all if None)
+            limit (int): Maximum number of publications returned (-1 for all)
+        """
+        if status is not None and status not in OUTBOX_STATUSES:
+            raise ValidationError(f"Unknown outbox status: {status}")
+        if status is None:
+            rows = self.query("SELECT * FROM outbox ORDER BY id DESC LIMIT ?", (limit,))
+        else:
+            rows = self.query("SELECT * FROM outbox WHERE status = ? ORDER BY id DESC LIMIT ?", (status, limit))
+        return [dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of publications in each status."""
+        counts = dict.fromkeys(OUTBOX_STATUSES, 0)
+        for row in self.query("SELECT status, COUNT(*) FROM outbox GROUP BY status"):
+            counts[row[0]] = row[1]
+        return counts
@@ -0,0 +1,84 @@
+# Location: src/infrastructure/persistence/rotation_store.py
+
+"""
+This module implements RotationStore, the history of the topic and brand voice
+combinations used by each platform.
+
+Each combination (platform, category, subject, style, tone, personality) has one row
+with its number of uses and the time of its last use, which is all TopicRotation needs
+to rebuild its least recently used and least used orders when a process starts.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.infrastructure.persistence.sqlite_store import SQLiteStore
+
+# (category, subject, style, tone, personality)
+Combination = Tuple[str, str, str, str, str]
+
+
+class RotationStore(SQLiteStore):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rotation_history (
+            platform TEXT NOT NULL,
+            category TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            style TEXT NOT NULL,
+            tone TEXT NOT NULL,
+            personality TEXT NOT NULL,
+            uses INTEGER NOT NULL DEFAULT 0,
+            last_used_at REAL NOT NULL,
+            PRIMARY KEY (platform, category, subject, style, tone, personality)
+        );
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        """
+        Open the rotation history.
+
+        Args:
+            path (str): Path of the SQLite file, or ':memory:'
+            clock (Callable[[], float]): Time source, in epoch seconds
+        """
+        super().__init__(path)
+        self._clock = clock
+
+    def record(self, platform: str, combination: Combination) -> None:
+        """Record one use of a combination by a platform."""
+        with self.transaction() as connection:
+            connection.execute(
+                "INSERT INTO rotation_history (platform, category, subject, style, tone, personality, uses, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, 1, ?) "
+                "ON CONFLICT (platform, category, subject, style, tone, personality) "
+                "DO UPDATE SET uses = uses + 1, last_used_at = excluded.last_used_at",
+                (platform, *combination, self._clock())
+            )
+
+    def usage(self, platform: str) -> Dict[Combination, Dict[str, Any]]:
+        """Return the 'uses' and 'last_used_at' of each combination a platform has used."""
+        rows = self.query(
+            "SELECT category, subject, style, tone, personality, uses, last_used_at "
+            "FROM rotation_history WHERE platform = ?", (platform,)
+        )
+        return {tuple(row[:5]): {'uses': row['uses'], 'last_used_at': row['last_used_at']} for row in rows}
+
+    def recent(self, platform: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """List the most recently used combinations, of one platform or of all."""
+        if platform is None:
+            rows = self.query("SELECT * FROM rotation_history ORDER BY last_used_at DESC LIMIT ?", (limit,))
+        else:
+            rows = self.query("SELECT * FROM rotation_history WHERE platform = ? "
+                              "ORDER BY last_used_at DESC LIMIT ?", (platform, limit))
+        return [dict(row) for row in rows]
+
+    def clear(self, platform: Optional[str] = None) -> int:
+        """
+        Forget the history, of one platform or of all.
+
+        Returns:
+            int: The number of combinations forgotten
+        """
+        with self.transaction() as connection:
+            if platform is None:
+                return connection.execute("DELETE FROM rotation_history").rowcount
+            return connection.execute("DELETE FROM rotation_history WHERE platform = ?", (platform,)).rowcount
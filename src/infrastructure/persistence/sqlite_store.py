@@ -0,0 +1,90 @@
+# Location: src/infrastructure/persistence/sqlite_store.py
+
+"""
+This module provides SQLiteStore, a small base class for the local stores of the
+application. It owns one SQLite connection shared between threads, creates the schema
+on first use and serializes write transactions with a lock.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+from src.infrastructure.logging.logger import logger
+
+
+class SQLiteStore:
+    """
+    Base class of the SQLite backed stores.
+
+    Subclasses declare their tables in ``SCHEMA``; it is executed when the store is
+    opened, so every statement must be idempotent (``CREATE ... IF NOT EXISTS``).
+    Columns added to a table after its creation are also declared in ``COLUMNS``, so
+    that databases created by an earlier version gain them on opening.
+    """
+
+    SCHEMA = ""
+    # Colonnes ajoutées depuis la création du schéma, par table : {table: {colonne: définition}}
+    COLUMNS: Dict[str, Dict[str, str]] = {}
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the database file.
+
+        Args:
+            path (str): Path of the database file, or ':memory:' for a transient store
+        """
+        self.path = path
+        if path != ':memory:':
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        # Autocommit : les transactions sont ouvertes explicitement par transaction()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        if path != ':memory:':
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(self.SCHEMA)
+        self._add_columns()
+        logger.debug(f"{self.__class__.__name__} opened at {path}")
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run the enclosed statements in a single write transaction.
+
+        Yields:
+            sqlite3.Connection: The connection to execute statements on
+        """
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            else:
+                self._connection.execute("COMMIT")
+
+    def query(self, sql: str, parameters=()) -> list:
+        """Run a read-only statement and return all rows."""
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def _add_columns(self) -> None:
+        """Add the columns of ``COLUMNS`` missing from their table."""
+        for table, columns in self.COLUMNS.items():
+            existing = {row['name'] for row in self.query(f"PRAGMA table_info({table})")}
+            missing = [(name, definition) for name, definition in columns.items() if name not in existing]
+            if not missing:
+                continue
+            with self.transaction() as connection:
+                for name, definition in missing:
+                    connection.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,244 @@
+# src/infrastructure/prompting/catalog.py
+
+"""
+This module loads the prompt catalog: the topics by category, the platform guidelines
+and the brand styles, tones and personalities used to build the prompts.
+
+The catalog is a JSON data file (``catalog.json`` next to this module by default, or
+PROMPT_CATALOG_PATH), validated against ``CATALOG_SCHEMA`` when loaded. It is read on
+first use, then its modification time is checked at most once per check interval: a
+changed file is reloaded without restarting the process. A file that no longer passes
+validation is reported and the catalog already loaded is kept.
+
+The parsed catalog is immutable and shared by every PromptBuilder: lists become tuples,
+repeated strings are interned, and topics and voice elements are indexed by category,
+subject and name.
+"""
+
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.infrastructure.logging.logger import logger
+from src.domain.exceptions import ConfigurationError
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'catalog.json')
+
+# Champs obligatoires de chaque section, et leur type
+CATALOG_SCHEMA = {
+    'topics': {'subject': str, 'context': str, 'problem': str, 'solution': str, 'link': str},
+    'platform_guidelines': {'max_length': int, 'structure': str},
+    'brand_styles': {'name': str, 'description': str},
+    'brand_tones': {'name': str, 'description': str},
+    'brand_personalities': {'name': str, 'description': str},
+}
+
+# Numéro de version commun à tous les chargeurs, pour invalider les gabarits compilés
+_versions = itertools.count(1)
+
+
+def validate_catalog(data: Any) -> List[str]:
+    """
+    Check a parsed catalog file against ``CATALOG_SCHEMA``.
+
+    Returns:
+        List[str]: The problems found, empty if the catalog is valid
+    """
+    if not isinstance(data, dict):
+        return ["the catalog must be a JSON object"]
+    problems = [f"missing section '{section}'" for section in CATALOG_SCHEMA if section not in data]
+
+    def check_entry(where: str, entry: Any, fields: Dict[str, type]) -> None:
+        if not isinstance(entry, dict):
+            problems.append(f"{where} must be an object")
+            return
+        for field, expected in fields.items():
+            value = entry.get(field)
+            # bool est un int en Python, mais pas une longueur valide
+            if not isinstance(value, expected) or isinstance(value, bool) or value in ("", 0):
+                problems.append(f"{where}.{field} must be a non-empty {expected.__name__}")
+
+    for section in ('topics', 'platform_guidelines'):
+        mapping = data.get(section)
+        if section in data and (not isinstance(mapping, dict) or not mapping):
+            problems.append(f"'{section}' must be a non-empty object")
+            continue
+        for key, value in (mapping or {}).items():
+            if section == 'platform_guidelines':
+                check_entry(f"{section}.{key}", value, CATALOG_SCHEMA[section])
+                continue
+            if not isinstance(value, list) or not value:
+                problems.append(f"topics.{key} must be a non-empty list")
+                continue
+            subjects = set()
+            for position, topic in enumerate(value):
+                check_entry(f"topics.{key}[{position}]", topic, CATALOG_SCHEMA['topics'])
+                subject = topic.get('subject') if isinstance(topic, dict) else None
+                if subject in subjects:
+                    problems.append(f"topics.{key} has a duplicate subject '{subject}'")
+                subjects.add(subject)
+
+    for section in ('brand_styles', 'brand_tones', 'brand_personalities'):
+        entries = data.get(section)
+        if section in data and (not isinstance(entries, list) or not entries):
+            problems.append(f"'{section}' must be a non-empty list")
+            continue
+        names = set()
+        for position, entry in enumerate(entries or []):
+            check_entry(f"{section}[{position}]", entry, CATALOG_SCHEMA[section])
+            name = entry.get('name') if isinstance(entry, dict) else None
+            if name in names:
+                problems.append(f"{section} has a duplicate name '{name}'")
+            names.add(name)
+    return problems
+
+
+def _compact(value: Any) -> Any:
+    """Turn lists into tuples and intern strings, recursively."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(_compact(item) for item in value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _compact(item) for key, item in value.items()}
+    return value
+
+
+class Catalog:
+    """An immutable, validated catalog with its indexes."""
+
+    def __init__(self, data: Dict[str, Any], source: str = DEFAULT_CATALOG_PATH):
+        """
+        Index a catalog.
+
+        Args:
+            data (Dict[str, Any]): The parsed catalog file
+            source (str): Where the catalog was read, for error messages
+
+        Raises:
+            ConfigurationError: If the catalog does not match ``CATALOG_SCHEMA``
+        """
+        problems = validate_catalog(data)
+        if problems:
+            raise ConfigurationError(f"Invalid prompt catalog {source}: {'; '.join(problems[:5])}")
+        compact = _compact(data)
+        self.source = source
+        self.version = next(_versions)
+        self.topics: Dict[str, Tuple[Dict, ...]] = compact['topics']
+        self.platform_guidelines: Dict[str, Dict] = compact['platform_guidelines']
+        self.brand_styles: Tuple[Dict, ...] = compact['brand_styles']
+        self.brand_tones: Tuple[Dict, ...] = compact['brand_tones']
+        self.brand_personalities: Tuple[Dict, ...] = compact['brand_personalities']
+        self._topic_index = {(category, topic['subject']): topic
+                             for category, topics in self.topics.items() for topic in topics}
+        self._voice_index = {
+            section: {entry['name']: entry for entry in getattr(self, section)}
+            for section in ('brand_styles', 'brand_tones', 'brand_personalities')
+        }
+
+    def topic(self, category: str, subject: str) -> Optional[Dict]:
+        """Return the topic of a category with this subject, or None."""
+        return self._topic_index.get((category, subject))
+
+    def voice(self, style: str, tone: str, personality: str) -> Optional[Dict]:
+        """Return the brand voice made of these style, tone and personality names, or None."""
+        try:
+            return {'style': self._voice_index['brand_styles'][style],
+                    'tone': self._voice_index['brand_tones'][tone],
+                    'personality': self._voice_index['brand_personalities'][personality]}
+        except KeyError:
+            return None
+
+
+class CatalogLoader:
+    """Loads a catalog file on first use and reloads it when it changes."""
+
+    def __init__(self, path: str = DEFAULT_CATALOG_PATH, check_interval: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            path (str): Path of the JSON catalog file
+            check_interval (float): Minimum delay, in seconds, between two checks of the
+                modification time of the file (0 checks on every access)
+            clock (Callable[[], float]): Time source of the check interval
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._catalog: Optional[Catalog] = None
+        self._mtime: Optional[int] = None
+        self._next_check = float('-inf')
+
+    def get(self) -> Catalog:
+        """
+        Return the current catalog, loading or reloading it if needed.
+
+        Raises:
+            ConfigurationError: If the catalog cannot be loaded and none was loaded before
+        """
+        # Chemin rapide, sans verrou : une comparaison par accès entre deux vérifications
+        catalog = self._catalog
+        if catalog is not None and self._clock() < self._next_check:
+            return catalog
+        with self._lock:
+            self._next_check = self._clock() + self.check_interval
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError as e:
+                return self._keep_or_raise(f"Cannot read prompt catalog {self.path}: {str(e)}")
+            if self._catalog is None or mtime != self._mtime:
+                self._load(mtime)
+            return self._catalog
+
+    def _load(self, mtime: int) -> None:
+        try:
+            with open(self.path, encoding='utf-8') as catalog_file:
+                data = json.load(catalog_file)
+            catalog = Catalog(data, self.path)
+        except ValueError as e:
+            self._keep_or_raise(f"Invalid prompt catalog {self.path}: {str(e)}")
+            self._mtime = mtime  # ne pas réessayer avant la prochaine modification
+            return
+        except (OSError, ConfigurationError) as e:
+            self._keep_or_raise(str(e))
+            self._mtime = mtime
+            return
+        if self._catalog is not None:
+            logger.info(f"Prompt catalog reloaded from {self.path}")
+        self._catalog, self._mtime = catalog, mtime
+
+    def _keep_or_raise(self, message: str) -> Catalog:
+        if self._catalog is None:
+            logger.error(message)
+            raise ConfigurationError(message)
+        logger.error(f"{message}; keeping the catalog loaded before")
+        return self._catalog
+
+
+_loader: Optional[CatalogLoader] = None
+_loader_lock = threading.Lock()
+
+
+def get_catalog() -> Catalog:
+    """Return the process-wide catalog, shared by every PromptBuilder."""
+    global _loader
+    loader = _loader
+    if loader is None:
+        from src.infrastructure.config.environment_catalog import get_catalog_settings
+        with _loader_lock:
+            if _loader is None:
+                settings = get_catalog_settings()
+                _loader = CatalogLoader(settings['path'] or DEFAULT_CATALOG_PATH, settings['check_interval'])
+            loader = _loader
+    return loader.get()
+
+
+def reset_catalog() -> None:
+    """Drop the process-wide catalog, so that the next access reads the settings and the file again."""
+    global _loader
+    with _loader_lock:
+        _loader = None
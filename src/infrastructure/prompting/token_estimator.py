@@ -0,0 +1,107 @@
+# src/infrastructure/prompting/token_estimator.py
+
+"""
+This module estimates token counts offline, without a tokenizer dependency or an API
+call. Text is split the way GPT tokenizers pre-split it (words with their leading
+space, short digit groups, punctuation runs, whitespace), and each piece is costed
+from its UTF-8 length, so that accented French words and emojis weigh more than
+plain ASCII.
+
+The estimate is meant for budgeting and for comparing prompt sections, not for exact
+billing; OpenAIAPI logs it next to the usage reported by the API, so that drift can
+be spotted.
+"""
+
+import math
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Découpage inspiré du pré-découpage des tokenizers GPT
+PIECE_PATTERN = re.compile(r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+")
+
+# Octets UTF-8 couverts en moyenne par un token, selon la nature du fragment
+BYTES_PER_WORD_TOKEN = 5
+BYTES_PER_SYMBOL_TOKEN = 2
+
+# Caractères de sortie par token retenus pour le budget : prudent pour du français avec emojis
+OUTPUT_CHARS_PER_TOKEN = 2.5
+# Balises de réponse et marge de fin de génération
+OUTPUT_TOKEN_OVERHEAD = 32
+
+SECTION_HEADING = re.compile(r"^\S[^\n]*:$")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens of a text.
+
+    Args:
+        text (str): The text to estimate
+
+    Returns:
+        int: The estimated token count
+    """
+    tokens = 0
+    for piece in PIECE_PATTERN.findall(text or ""):
+        if piece.isspace():
+            tokens += 1
+            continue
+        # L'espace de tête fait partie du token du mot qui suit
+        size = len(piece.lstrip(' ').encode('utf-8'))
+        if piece.strip().isalnum():
+            tokens += math.ceil(size / BYTES_PER_WORD_TOKEN)
+        else:
+            tokens += math.ceil(size / BYTES_PER_SYMBOL_TOKEN)
+    return tokens
+
+
+def output_token_budget(max_length: int, cap: Optional[int] = None) -> int:
+    """
+    Compute the max_tokens budget of a completion whose publication is limited to
+    ``max_length`` characters.
+
+    Args:
+        max_length (int): The platform's character limit
+        cap (Optional[int]): Upper bound of the budget (e.g. the model's output limit)
+
+    Returns:
+        int: The max_tokens to request
+    """
+    budget = math.ceil(max_length / OUTPUT_CHARS_PER_TOKEN) + OUTPUT_TOKEN_OVERHEAD
+    return min(budget, cap) if cap else budget
+
+
+def prompt_sections(prompt: str) -> List[Tuple[str, str]]:
+    """
+    Split a prompt into its sections. A section starts at a non-indented line ending
+    with ':' that follows an empty line (e.g. "Consignes importantes:"); the text
+    before the first heading is the 'Introduction'.
+
+    Returns:
+        List[Tuple[str, str]]: The (heading, text) of each section, in order
+    """
+    sections = []
+    heading, lines = "Introduction", []
+    previous_blank = False
+    for line in prompt.split("\n"):
+        if previous_blank and SECTION_HEADING.match(line) and lines:
+            sections.append((heading, "\n".join(lines)))
+            heading, lines = line[:-1], []
+        lines.append(line)
+        previous_blank = not line.strip()
+    sections.append((heading, "\n".join(lines)))
+    return sections
+
+
+def section_costs(prompt: str) -> Dict[str, int]:
+    """
+    Estimate the tokens of each section of a prompt, to see what is worth trimming.
+
+    Returns:
+        Dict[str, int]: Estimated tokens per section heading, in prompt order (headings
+            appearing several times, as in multi-platform prompts, are summed)
+    """
+    costs: Dict[str, int] = {}
+    for heading, text in prompt_sections(prompt):
+        costs[heading] = costs.get(heading, 0) + estimate_tokens(text)
+    return costs
@@ -0,0 +1,225 @@
+# src/infrastructure/prompting/topic_rotation.py
+
+"""
+This module implements TopicRotation, which picks the topic and brand voice of each
+publication instead of drawing them at random.
+
+A combination is a topic (category and subject) with a brand voice (style, tone and
+personality). For each platform, the rotation keeps the combinations in an index
+ordered by policy:
+- 'lru': the least recently used combination comes first
+- 'lfu': the least used combination comes first, the least recently used one among
+  combinations used as often
+
+Picking the first combination and moving it after a use are constant-time operations.
+Combinations never used come first, ordered so that both the subject and the voice
+change at every pick: all subjects are used once before any comes back, each with
+another voice, and the style, tone and personality of the voice change as well.
+
+A pick moves the combination in memory only, so that the next picks of the process
+differ. Its use is recorded in a RotationStore by ``record``, once the publication was
+actually posted: dry runs and discarded generations leave the history untouched. The
+history lets the order survive restarts, and the indexes are rebuilt from the uses
+when the prompt catalog is reloaded.
+"""
+
+import random
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.persistence.rotation_store import Combination, RotationStore
+from src.infrastructure.prompting.catalog import Catalog, get_catalog
+from src.domain.exceptions import ValidationError
+
+ROTATION_POLICIES = ('lru', 'lfu')
+
+# (category, topic, voice) returned by a pick
+Selection = Tuple[str, Dict, Dict]
+
+
+def _interleave(first: Sequence, second: Sequence) -> List[Tuple]:
+    """
+    Enumerate every pair of two sequences, moving in both at each step: the i-th pair
+    takes the (i mod n)-th element of the first, and the second shifts by one more
+    on each pass through the first.
+    """
+    n, m = len(first), len(second)
+    return [(first[i % n], second[(i // n + i % n) % m]) for i in range(n * m)]
+
+
+class _LRUIndex:
+    """Combinations ordered from the least to the most recently used."""
+
+    def __init__(self, ordered: Iterable[Combination], uses: Dict[Combination, int]):
+        self._order = OrderedDict.fromkeys(ordered)
+
+    def first(self) -> Combination:
+        return next(iter(self._order))
+
+    def touch(self, key: Combination) -> None:
+        self._order.move_to_end(key)
+
+
+class _LFUIndex:
+    """Combinations grouped by number of uses, each group ordered by recency."""
+
+    def __init__(self, ordered: Iterable[Combination], uses: Dict[Combination, int]):
+        self._uses: Dict[Combination, int] = {}
+        self._buckets: Dict[int, OrderedDict] = {}
+        for key in ordered:
+            count = uses.get(key, 0)
+            self._uses[key] = count
+            self._buckets.setdefault(count, OrderedDict())[key] = None
+        self._min_uses = min(self._buckets)
+
+    def first(self) -> Combination:
+        return next(iter(self._buckets[self._min_uses]))
+
+    def touch(self, key: Combination) -> None:
+        count = self._uses[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_uses == count:
+                self._min_uses = count + 1
+        self._uses[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+
+class TopicRotation:
+    INDEXES = {'lru': _LRUIndex, 'lfu': _LFUIndex}
+
+    def __init__(self, store: Optional[RotationStore] = None, policy: str = 'lru', seed: Optional[int] = None):
+        """
+        Create the rotation; the index of a platform is built on its first pick.
+
+        Args:
+            store (Optional[RotationStore]): Persisted history (in memory only if None)
+            policy (str): 'lru' or 'lfu' (see the module documentation)
+            seed (Optional[int]): Seed of the order of the combinations never used
+
+        Raises:
+            ValidationError: If the policy is unknown
+        """
+        if policy not in ROTATION_POLICIES:
+            raise ValidationError(f"Unknown rotation policy: {policy}")
+        self.store = store
+        self.policy = policy
+        self._seed = seed
+        self._lock = threading.Lock()
+        # Index par (plateforme, catégorie), la catégorie None couvrant toutes les catégories
+        self._indexes: Dict[Tuple[str, Optional[str]], object] = {}
+        # Utilisations de chaque plateforme : nombre et rang de la dernière utilisation
+        self._usage: Dict[str, Dict[Combination, List[int]]] = {}
+        self._sequence = 0
+        self._catalog_version: Optional[int] = None
+
+    def select(self, platform: str, category: Optional[str] = None) -> Selection:
+        """
+        Pick the next combination of a platform; ``record`` its use once posted.
+
+        Args:
+            platform (str): The target platform
+            category (Optional[str]): Restrict the pick to a topic category (any if None)
+
+        Returns:
+            Tuple[str, Dict, Dict]: The category, the topic and the brand voice
+
+        Raises:
+            ValidationError: If the category is invalid
+        """
+        return self.select_many([platform], category)
+
+    def select_many(self, platforms: Sequence[str], category: Optional[str] = None) -> Selection:
+        """
+        Pick the combination shared by the publications of several platforms, following
+        the order of the first one, and move it in the order of each of them.
+        """
+        catalog = get_catalog()
+        if category is not None and category not in catalog.topics:
+            raise ValidationError(f"Invalid topic category: {category}")
+        with self._lock:
+            if catalog.version != self._catalog_version:
+                # Catalogue rechargé : les index sont reconstruits à partir des utilisations
+                self._indexes.clear()
+                self._catalog_version = catalog.version
+            key = self._index(platforms[0], category, catalog).first()
+            for platform in platforms:
+                self._touch(platform, key)
+        logger.debug(f"Rotation picked '{key[1]}' ({key[0]}) with voice {key[2]}, {key[3]}, {key[4]}")
+        category, subject, style, tone, personality = key
+        return category, catalog.topic(category, subject), catalog.voice(style, tone, personality)
+
+    def record(self, platform: str, selection: Selection) -> None:
+        """
+        Record in the history the use of a pick by a publication actually posted.
+
+        Args:
+            platform (str): The platform the publication was posted on
+            selection (Selection): The pick returned by ``select`` or ``select_many``
+        """
+        if self.store is None:
+            return
+        category, topic, voice = selection
+        self.store.record(platform, (category, topic['subject'], voice['style']['name'],
+                                     voice['tone']['name'], voice['personality']['name']))
+
+    def close(self) -> None:
+        """Close the persisted history, if any."""
+        if self.store is not None:
+            self.store.close()
+
+    def _touch(self, platform: str, key: Combination) -> None:
+        """Record a use, and move the combination in every index of the platform already built."""
+        self._sequence += 1
+        uses, _ = self._platform_usage(platform).get(key, (0, 0))
+        self._usage[platform][key] = [uses + 1, self._sequence]
+        for scope in ((platform, None), (platform, key[0])):
+            if scope in self._indexes:
+                self._indexes[scope].touch(key)
+
+    def _platform_usage(self, platform: str) -> Dict[Combination, List[int]]:
+        """Load the uses of a platform from the history, ranked by last use, on first access."""
+        if platform not in self._usage:
+            history = self.store.usage(platform) if self.store is not None else {}
+            usage = {}
+            for key in sorted(history, key=lambda key: history[key]['last_used_at']):
+                self._sequence += 1
+                usage[key] = [history[key]['uses'], self._sequence]
+            self._usage[platform] = usage
+        return self._usage[platform]
+
+    def _index(self, platform: str, category: Optional[str], catalog: Catalog):
+        scope = (platform, category)
+        if scope not in self._indexes:
+            usage = self._platform_usage(platform)
+            keys = self._combinations(category, catalog)
+            never_used = [key for key in keys if key not in usage]
+            used = sorted((key for key in keys if key in usage), key=lambda key: usage[key][1])
+            uses = {key: usage[key][0] for key in used}
+            self._indexes[scope] = self.INDEXES[self.policy](never_used + used, uses)
+        return self._indexes[scope]
+
+    def _combinations(self, category: Optional[str], catalog: Catalog) -> List[Combination]:
+        """
+        Enumerate the combinations of a category (or of all): the subject and the
+        voice change at every step, categories taken in turn, and every subject comes
+        once before any is repeated.
+        """
+        rng = random.Random(self._seed)
+        categories = [category] if category is not None else list(catalog.topics)
+        queues = {name: rng.sample([topic['subject'] for topic in catalog.topics[name]], len(catalog.topics[name]))
+                  for name in categories}
+        topics = []
+        while any(queues.values()):
+            for name in categories:
+                if queues[name]:
+                    topics.append((name, queues[name].pop()))
+        styles, tones, personalities = ([item['name'] for item in rng.sample(items, len(items))]
+                                        for items in (catalog.brand_styles, catalog.brand_tones,
+                                                      catalog.brand_personalities))
+        voices = [(style, *tone_personality) for style, tone_personality in
+                  _interleave(styles, _interleave(tones, personalities))]
+        return [topic + voice for topic, voice in _interleave(topics, voices)]
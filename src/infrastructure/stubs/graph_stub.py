@@ -0,0 +1,50 @@
+# src/infrastructure/stubs/graph_stub.py
+
+"""
+This module implements GraphStub, a local stand-in for the parts of the Facebook Graph
+API used by FacebookAPI:
+- GET /<version>/<page id>?fields=access_token: exchange of the user token for a page token
+- GET /<version>/debug_token: expiry of a token (never, for the stub)
+- POST /<version>/<page id>/feed: a post on the page, answered with its id and the
+  x-app-usage header
+
+Errors use the Graph format ({'error': {'message', 'type', 'code'}}), e.g. code 190 for
+a missing access token.
+"""
+
+import json
+import re
+from src.infrastructure.stubs.stub_server import StubRequest, StubResponse, StubServer, json_response
+
+_PATH_PATTERN = re.compile(r'^/v\d+(?:\.\d+)?/(?P<node>[^/]+)(?:/(?P<edge>[^/]+))?$')
+
+
+def graph_error(status: int, message: str, code: int, error_type: str = 'OAuthException') -> StubResponse:
+    return json_response(status, {'error': {'message': message, 'type': error_type, 'code': code,
+                                            'fbtrace_id': 'stub'}})
+
+
+class GraphStub(StubServer):
+    NAME = 'graph'
+    BASE_PATH = '/v19.0'
+    PAGE_TOKEN = 'stub-page-token'
+
+    def handle(self, request: StubRequest) -> StubResponse:
+        match = _PATH_PATTERN.match(request.path)
+        if match is None:
+            return self.not_found(request)
+        node, edge = match.group('node'), match.group('edge')
+        params = dict(request.query, **(request.form() if request.method == 'POST' else {}))
+        if not params.get('access_token'):
+            return graph_error(400, "An active access token must be used", 190)
+
+        if request.method == 'GET' and node == 'debug_token' and edge is None:
+            return json_response(200, {'data': {'is_valid': True, 'expires_at': 0, 'type': 'PAGE'}})
+        if request.method == 'GET' and edge is None:
+            return json_response(200, {'id': node, 'access_token': self.PAGE_TOKEN})
+        if request.method == 'POST' and edge == 'feed':
+            if not params.get('message'):
+                return graph_error(400, "(#100) The message parameter is required", 100, 'GraphMethodException')
+            usage = {'call_count': 1, 'total_cputime': 1, 'total_time': 1}
+            return json_response(200, {'id': f"{node}_{self.next_id()}"}, {'x-app-usage': json.dumps(usage)})
+        return self.not_found(request)
@@ -0,0 +1,29 @@
+# src/infrastructure/stubs/linkedin_stub.py
+
+"""
+This module implements LinkedInStub, a local stand-in for the UGC posts endpoint of the
+LinkedIn API (POST /v2/ugcPosts), which answers a created post with the 201 status, its
+URN in the body and in the x-restli-id header.
+"""
+
+from src.infrastructure.stubs.stub_server import StubRequest, StubResponse, StubServer, json_response
+
+
+def linkedin_error(status: int, message: str) -> StubResponse:
+    return json_response(status, {'message': message, 'status': status, 'serviceErrorCode': 0})
+
+
+class LinkedInStub(StubServer):
+    NAME = 'linkedin'
+    BASE_PATH = '/v2'
+
+    def handle(self, request: StubRequest) -> StubResponse:
+        if request.method != 'POST' or request.path != f"{self.BASE_PATH}/ugcPosts":
+            return self.not_found(request)
+        if not request.headers.get('authorization', '').startswith('Bearer '):
+            return linkedin_error(401, "Empty oauth2 access token")
+        body = request.json()
+        if not isinstance(body, dict) or not body.get('author') or 'specificContent' not in body:
+            return linkedin_error(422, "ERROR :: /author :: field is required but not found and has no default value")
+        urn = f"urn:li:share:{self.next_id()}"
+        return json_response(201, {'id': urn}, {'x-restli-id': urn})
@@ -0,0 +1,106 @@
+# src/infrastructure/stubs/openai_stub.py
+
+"""
+This module implements OpenAIStub, a local stand-in for the chat completions endpoint
+of the OpenAI API (POST /v1/chat/completions).
+
+Each choice answers the prompt in the format the application asks for: the publication
+inside social_media_post tags, or one variant per platform tag for a multi-platform
+prompt. Publications are drawn from a fixed vocabulary, so that two answers are never
+near-duplicates of each other. Streamed requests get server-sent events, ended by
+``data: [DONE]``.
+"""
+
+import json
+import random
+import time
+from typing import Callable, Iterator, List, Optional
+from src.infrastructure.prompting.prompt_builder import PromptBuilder
+from src.infrastructure.stubs.stub_server import StubRequest, StubResponse, StubServer, json_response
+
+VOCABULARY = (
+    "développeurs juniors mentorat projets digitaux qualité code seniors accompagnement "
+    "entreprises budget innovation équipe confiance carrière formation agilité produit "
+    "clients réussite talents avenir expertise application plateforme sur-mesure délais "
+    "méthode transparence apprentissage croissance solutions impact communauté"
+).split()
+POST_WORDS = 18
+STREAM_WORDS_PER_CHUNK = 4
+
+
+def stub_publication(seed: int) -> str:
+    """Return a short publication (under 280 characters), different for each seed."""
+    rng = random.Random(seed)
+    words = rng.sample(VOCABULARY, POST_WORDS)
+    return f"{' '.join(words).capitalize()} https://www.techaware.net #TechAware"
+
+
+class OpenAIStub(StubServer):
+    NAME = 'openai'
+    BASE_PATH = '/v1'
+
+    def __init__(self, content: Optional[Callable[[str, int], str]] = None, **options):
+        """
+        Args:
+            content (Optional[Callable[[str, int], str]]): Builds the raw answer of a choice
+                from the prompt and a sequence number (defaults to ``answer``)
+            **options: Options of StubServer (host, port, latency)
+        """
+        super().__init__(**options)
+        self.content = content or self.answer
+
+    @staticmethod
+    def answer(prompt: str, seed: int) -> str:
+        """Answer a prompt in the tag format of the application."""
+        tags = [tag for tag in PromptBuilder.PLATFORM_TAGS.values() if f"<{tag}>" in prompt]
+        if tags:
+            return "\n".join(f"<{tag}>{stub_publication(seed * 10 + offset)}</{tag}>"
+                             for offset, tag in enumerate(tags))
+        return f"<social_media_post>{stub_publication(seed)}</social_media_post>"
+
+    def handle(self, request: StubRequest) -> StubResponse:
+        if request.method != 'POST' or request.path != f"{self.BASE_PATH}/chat/completions":
+            return self.not_found(request)
+        if not request.headers.get('authorization', '').startswith('Bearer '):
+            return json_response(401, {'error': {'message': "Missing API key", 'type': 'invalid_request_error'}})
+        body = request.json()
+        if not isinstance(body, dict) or not body.get('messages'):
+            return json_response(400, {'error': {'message': "'messages' is required", 'type': 'invalid_request_error'}})
+
+        prompt = "\n".join(str(message.get('content', '')) for message in body['messages'])
+        contents = [self.content(prompt, self.next_id()) for _ in range(int(body.get('n') or 1))]
+        model = body.get('model', 'gpt-4-turbo')
+        if body.get('stream'):
+            return 200, self._stream(model, contents[0]), {'Content-Type': 'text/event-stream'}
+
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = sum(len(content) // 4 for content in contents)
+        return json_response(200, {
+            'id': f"chatcmpl-stub-{self.request_count}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': model,
+            'choices': [{'index': index, 'message': {'role': 'assistant', 'content': content},
+                         'logprobs': None, 'finish_reason': 'stop'}
+                        for index, content in enumerate(contents)],
+            'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                      'total_tokens': prompt_tokens + completion_tokens},
+        })
+
+    def _stream(self, model: str, content: str) -> Iterator[str]:
+        words = content.split(' ')
+        pieces: List[str] = [' '.join(words[i:i + STREAM_WORDS_PER_CHUNK]) + ' '
+                             for i in range(0, len(words), STREAM_WORDS_PER_CHUNK)]
+        created = int(time.time())
+        deltas = [{'role': 'assistant', 'content': ''}] + [{'content': piece} for piece in pieces] + [{}]
+        for position, delta in enumerate(deltas):
+            chunk = {
+                'id': f"chatcmpl-stub-{self.request_count}",
+                'object': 'chat.completion.chunk',
+                'created': created,
+                'model': model,
+                'choices': [{'index': 0, 'delta': delta, 'logprobs': None,
+                             'finish_reason': 'stop' if position == len(deltas) - 1 else None}],
+            }
+            yield f"data: {json.dumps(chunk)}\n\n"
+        yield "data: [DONE]\n\n"
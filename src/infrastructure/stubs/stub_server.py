@@ -0,0 +1,196 @@
+# src/infrastructure/stubs/stub_server.py
+
+"""
+This module provides StubServer, the base class of the local HTTP servers standing in
+for the OpenAI, Graph, LinkedIn and X APIs, so that the real networking code of the
+gateways can be run, load-tested and profiled without outside access.
+
+A stub listens on 127.0.0.1 (on a free port by default) in a background thread and
+answers each request from its ``handle`` method. Connections are kept alive (HTTP/1.1
+with a Content-Length on every response), like those of the production APIs, and an
+optional latency is added to every answer.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+from src.infrastructure.logging.logger import logger
+
+# Statut, corps (JSON, ou itérable de morceaux envoyés au fil de l'eau) et en-têtes
+StubResponse = Tuple[int, Union[Dict, Iterable[str]], Dict[str, str]]
+
+
+class StubRequest:
+    """A request received by a stub."""
+
+    __slots__ = ('method', 'path', 'query', 'headers', 'body')
+
+    def __init__(self, method: str, path: str, query: Dict[str, str], headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        """Return the JSON body, or None if it is not JSON."""
+        try:
+            return json.loads(self.body or b'null')
+        except ValueError:
+            return None
+
+    def form(self) -> Dict[str, str]:
+        """Return the fields of a form-encoded body."""
+        return {key: values[-1] for key, values in parse_qs(self.body.decode('utf-8', 'replace')).items()}
+
+
+def json_response(status: int, data: Dict, headers: Optional[Dict[str, str]] = None) -> StubResponse:
+    return status, data, headers or {}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def do_DELETE(self):
+        self._dispatch()
+
+    def log_message(self, format, *args):
+        # Une ligne par requête noierait les journaux d'un test de charge
+        pass
+
+    def _dispatch(self):
+        stub: StubServer = self.server.stub
+        parts = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        request = StubRequest(
+            self.command, parts.path,
+            {key: values[-1] for key, values in parse_qs(parts.query).items()},
+            {key.lower(): value for key, value in self.headers.items()},
+            self.rfile.read(length) if length else b''
+        )
+        try:
+            status, body, headers = stub.record_and_handle(request)
+        except Exception as e:
+            logger.error(f"{stub.NAME} stub failed on {request.method} {request.path}: {str(e)}")
+            status, body, headers = json_response(500, {'error': {'message': str(e)}})
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if isinstance(body, dict):
+            payload = json.dumps(body).encode('utf-8')
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+        # Flux (server-sent events) : pas de longueur connue, la connexion est fermée à la fin
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+        for chunk in body:
+            self.wfile.write(chunk.encode('utf-8'))
+            self.wfile.flush()
+
+
+class StubServer:
+    """Base class of the stubs: subclasses implement ``handle``."""
+
+    NAME = 'stub'
+    # Préfixe des chemins de l'API imitée, ajouté à l'URL du serveur par ``base_url``
+    BASE_PATH = ''
+    REQUEST_HISTORY = 1000
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0):
+        """
+        Args:
+            host (str): Listening address
+            port (int): Listening port (0 picks a free one)
+            latency (float): Seconds added before every answer
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        # Dernières requêtes reçues, pour les assertions des tests
+        self.requests = deque(maxlen=self.REQUEST_HISTORY)
+        self.request_count = 0
+        self._sequence = 0
+        self._count_lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The root URL of the server, e.g. http://127.0.0.1:54321."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def base_url(self) -> str:
+        """The base URL to configure in the gateway in place of the production one."""
+        return self.url + self.BASE_PATH
+
+    def start(self) -> 'StubServer':
+        """Start serving in a background thread; return the stub, started."""
+        if self._server is not None:
+            return self
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name=f"{self.NAME}-stub", daemon=True)
+        self._thread.start()
+        logger.debug(f"{self.NAME} stub listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def record_and_handle(self, request: StubRequest) -> StubResponse:
+        with self._count_lock:
+            self.request_count += 1
+            self.requests.append(request)
+        return self.handle(request)
+
+    def handle(self, request: StubRequest) -> StubResponse:
+        """
+        Answer a request.
+
+        Returns:
+            StubResponse: The status, the body (a JSON object, or the chunks of a stream)
+                and the headers
+        """
+        raise NotImplementedError
+
+    def next_id(self) -> int:
+        """Return a sequence number, e.g. for the ids of the created posts."""
+        with self._count_lock:
+            self._sequence += 1
+            return self._sequence
+
+    @staticmethod
+    def not_found(request: StubRequest) -> StubResponse:
+        return json_response(404, {'error': {'message': f"No route for {request.method} {request.path}"}})
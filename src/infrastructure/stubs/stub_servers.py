@@ -0,0 +1,103 @@
+# src/infrastructure/stubs/stub_servers.py
+
+"""
+This module implements StubServers, which runs the four API stubs together and gives the
+environment variables pointing the gateways at them (base URLs and placeholder
+credentials).
+
+It can also be run on its own, e.g. to load-test a separate process::
+
+    python -m src.infrastructure.stubs.stub_servers --base-port 8701 --latency 0.05
+
+The variables are printed in the .env format, then the stubs serve until interrupted.
+"""
+
+import argparse
+import time
+from typing import Dict, Optional
+from src.infrastructure.stubs.graph_stub import GraphStub
+from src.infrastructure.stubs.linkedin_stub import LinkedInStub
+from src.infrastructure.stubs.openai_stub import OpenAIStub
+from src.infrastructure.stubs.twitter_stub import TwitterStub
+
+# Identifiants factices : les stubs ne vérifient que leur présence
+STUB_CREDENTIALS = {
+    'OPENAI_API_KEY': 'sk-stub',
+    'FACEBOOK_APP_ID': 'stub-app',
+    'FACEBOOK_APP_SECRET': 'stub-secret',
+    'FACEBOOK_ACCESS_TOKEN': 'stub-user-token',
+    'FACEBOOK_PAGE_ID': '1000',
+    'LINKEDIN_CLIENT_ID': 'stub-client',
+    'LINKEDIN_CLIENT_SECRET': 'stub-secret',
+    'LINKEDIN_ACCESS_TOKEN': 'stub-token',
+    'LINKEDIN_USER_ID': '2000',
+    'CONSUMER_KEY': 'stub-consumer-key',
+    'CONSUMER_SECRET': 'stub-consumer-secret',
+    'ACCESS_TOKEN': 'stub-access-token',
+    'ACCESS_TOKEN_SECRET': 'stub-access-token-secret',
+}
+
+
+class StubServers:
+    def __init__(self, latency: float = 0.0, base_port: Optional[int] = None, host: str = '127.0.0.1',
+                 twitter_rate_limit: int = 10000):
+        """
+        Args:
+            latency (float): Seconds added before every answer of every stub
+            base_port (Optional[int]): Port of the OpenAI stub, the Graph, LinkedIn and X
+                stubs taking the next three (free ports if None)
+            host (str): Listening address
+            twitter_rate_limit (int): Tweets accepted per 15-minute window
+        """
+        ports = [base_port + offset if base_port else 0 for offset in range(4)]
+        self.openai = OpenAIStub(host=host, port=ports[0], latency=latency)
+        self.graph = GraphStub(host=host, port=ports[1], latency=latency)
+        self.linkedin = LinkedInStub(host=host, port=ports[2], latency=latency)
+        self.twitter = TwitterStub(rate_limit=twitter_rate_limit, host=host, port=ports[3], latency=latency)
+        self.stubs = (self.openai, self.graph, self.linkedin, self.twitter)
+
+    def start(self) -> 'StubServers':
+        for stub in self.stubs:
+            stub.start()
+        return self
+
+    def stop(self) -> None:
+        for stub in self.stubs:
+            stub.stop()
+
+    def __enter__(self) -> 'StubServers':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def environment(self) -> Dict[str, str]:
+        """Return the variables sending every gateway to the stubs, with placeholder credentials."""
+        return dict(STUB_CREDENTIALS,
+                    OPENAI_BASE_URL=self.openai.base_url,
+                    FACEBOOK_GRAPH_URL=self.graph.base_url,
+                    LINKEDIN_API_URL=self.linkedin.base_url,
+                    TWITTER_API_URL=self.twitter.base_url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve local stubs of the OpenAI, Graph, LinkedIn and X APIs')
+    parser.add_argument('--base-port', type=int, default=8701,
+                        help='Port of the OpenAI stub, the others taking the next three (default: 8701)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added before every answer')
+    parser.add_argument('--twitter-rate-limit', type=int, default=10000, help='Tweets accepted per 15 minutes')
+    args = parser.parse_args()
+
+    with StubServers(latency=args.latency, base_port=args.base_port,
+                     twitter_rate_limit=args.twitter_rate_limit) as servers:
+        for name, value in servers.environment().items():
+            print(f"{name}={value}", flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# src/infrastructure/stubs/twitter_stub.py
+
+"""
+This module implements TwitterStub, a local stand-in for the tweet creation endpoint of
+the X API (POST /2/tweets).
+
+Every answer carries the x-rate-limit-limit, x-rate-limit-remaining and
+x-rate-limit-reset headers of a fixed window; once ``rate_limit`` tweets were posted in
+the window, requests are refused with 429 until it resets, as X does.
+"""
+
+import threading
+import time
+from typing import Callable, Dict
+from src.infrastructure.stubs.stub_server import StubRequest, StubResponse, StubServer, json_response
+
+MAX_TWEET_LENGTH = 280
+
+
+def twitter_error(status: int, title: str, detail: str, headers: Dict[str, str] = None) -> StubResponse:
+    return json_response(status, {'title': title, 'detail': detail, 'status': status,
+                                  'type': 'about:blank'}, headers)
+
+
+class TwitterStub(StubServer):
+    NAME = 'twitter'
+    BASE_PATH = '/2'
+
+    def __init__(self, rate_limit: int = 10000, window: float = 900.0,
+                 clock: Callable[[], float] = time.time, **options):
+        """
+        Args:
+            rate_limit (int): Tweets accepted per window, high enough by default not to
+                interfere with a load test
+            window (float): Length of the rate limit window, in seconds
+            clock (Callable[[], float]): Time source, in epoch seconds
+            **options: Options of StubServer (host, port, latency)
+        """
+        super().__init__(**options)
+        self.rate_limit = rate_limit
+        self.window = window
+        self._clock = clock
+        self._window_lock = threading.Lock()
+        self._window_reset = 0.0
+        self._window_count = 0
+
+    def handle(self, request: StubRequest) -> StubResponse:
+        if request.method != 'POST' or request.path != f"{self.BASE_PATH}/tweets":
+            return self.not_found(request)
+        if not request.headers.get('authorization', '').startswith('OAuth '):
+            return twitter_error(401, 'Unauthorized', 'Unauthorized')
+
+        headers, allowed = self._consume()
+        if not allowed:
+            return twitter_error(429, 'Too Many Requests', 'Too Many Requests', headers)
+
+        body = request.json()
+        text = body.get('text') if isinstance(body, dict) else None
+        if not isinstance(text, str) or not text.strip():
+            return twitter_error(400, 'Invalid Request', 'One or more parameters to your request was invalid.', headers)
+        if len(text) > MAX_TWEET_LENGTH:
+            return twitter_error(403, 'Forbidden', 'You are not allowed to create a Tweet with this length.', headers)
+        return json_response(201, {'data': {'id': str(10 ** 18 + self.next_id()), 'text': text,
+                                            'edit_history_tweet_ids': []}}, headers)
+
+    def _consume(self):
+        """Count a request in the current window; return the rate limit headers and whether it is allowed."""
+        with self._window_lock:
+            now = self._clock()
+            if now >= self._window_reset:
+                self._window_reset = now + self.window
+                self._window_count = 0
+            allowed = self._window_count < self.rate_limit
+            if allowed:
+                self._window_count += 1
+            headers = {
+                'x-rate-limit-limit': str(self.rate_limit),
+                'x-rate-limit-remaining': str(self.rate_limit - self._window_count),
+                'x-rate-limit-reset': str(int(self._window_reset)),
+            }
+        return headers, allowed
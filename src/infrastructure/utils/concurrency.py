@@ -0,0 +1,76 @@
+# src/infrastructure/utils/concurrency.py
+
+"""
+This module provides small helpers to run independent units of work concurrently,
+either on a bounded thread pool or in a single asyncio event loop. Each unit of work
+is reported separately, so that the failure of one unit never aborts the others.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from src.infrastructure.logging.logger import logger
+
+
+def run_concurrently(tasks: Dict[str, Callable[[], Any]],
+                     max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the given tasks concurrently and collect one outcome per task.
+
+    Args:
+        tasks (Dict[str, Callable]): Mapping of task key to a callable without arguments
+        max_workers (Optional[int]): Upper bound of worker threads (defaults to the number of tasks)
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each key, in the order of ``tasks``, a dict with
+            'status' ('success' or 'failed'), 'result', 'error' and 'elapsed' (seconds)
+    """
+    if not tasks:
+        return {}
+
+    workers = max(1, min(max_workers or len(tasks), len(tasks)))
+    outcomes: Dict[str, Dict[str, Any]] = {}
+
+    def timed(key: str, task: Callable[[], Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            result = task()
+            return {'status': 'success', 'result': result, 'error': None,
+                    'elapsed': time.perf_counter() - started}
+        except Exception as e:
+            logger.error(f"Task {key} failed: {str(e)}")
+            return {'status': 'failed', 'result': None, 'error': e,
+                    'elapsed': time.perf_counter() - started}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="automator") as executor:
+        futures = {executor.submit(timed, key, task): key for key, task in tasks.items()}
+        for future in as_completed(futures):
+            outcomes[futures[future]] = future.result()
+
+    return {key: outcomes[key] for key in tasks}
+
+
+async def gather_bounded(awaitables: Iterable[Awaitable[Any]], limit: int,
+                         return_exceptions: bool = False) -> List[Any]:
+    """
+    Await many coroutines in the running event loop with at most ``limit`` in flight.
+
+    Args:
+        awaitables (Iterable[Awaitable]): The coroutines to run
+        limit (int): Maximum number of coroutines awaited at the same time
+        return_exceptions (bool): If True, exceptions are returned in place of results
+            instead of being raised (same meaning as in ``asyncio.gather``)
+
+    Returns:
+        List[Any]: The results, in the order of ``awaitables``
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(awaitable: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*(bounded(a) for a in awaitables), return_exceptions=return_exceptions)
@@ -9,7 +9,9 @@ The interface defines the required methods for Facebook operations,
 ensuring consistency across different implementations.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from functools import partial
 from src.domain.entities.facebook_publication import FacebookPublication
 
 
@@ -34,4 +36,23 @@ class FacebookGateway(ABC):
         Raises:
             FacebookError: If there's an error posting the publication to Facebook
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def post_async(self, publication: FacebookPublication):
+        """
+        Asynchronous counterpart of ``post``.
+
+        The default implementation runs ``post`` in the event loop's executor;
+        implementations with a native async client should override it.
+
+        Args:
+            publication (FacebookPublication): The Facebook publication entity to be posted
+
+        Returns:
+            dict: The response from the Facebook API containing the posted publication's data
+
+        Raises:
+            FacebookError: If there's an error posting the publication to Facebook
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.post, publication))
@@ -6,7 +6,9 @@ an interface for interacting with the LinkedIn API. It provides a contract
 for implementing concrete LinkedIn API interaction classes.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from functools import partial
 from src.domain.entities.linkedin_publication import LinkedInPublication
 
 
@@ -25,4 +27,23 @@ class LinkedInGateway(ABC):
         Raises:
             LinkedInError: If there's an error posting the publication to LinkedIn.
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def post_async(self, publication: LinkedInPublication):
+        """
+        Asynchronous counterpart of ``post``.
+
+        The default implementation runs ``post`` in the event loop's executor;
+        implementations with a native async client should override it.
+
+        Args:
+            publication (LinkedInPublication): The LinkedIn publication entity to be posted
+
+        Returns:
+            dict: The response from the LinkedIn API containing the posted publication's data
+
+        Raises:
+            LinkedInError: If there's an error posting the publication to LinkedIn
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.post, publication))
@@ -4,20 +4,25 @@
 This module defines the OpenAIGateway abstract base class, which serves as
 an interface for interacting with the OpenAI API. It provides a contract
 for implementing concrete OpenAI API interaction classes, specifically
-for generating tweet content.
+for generating tweet content and the variants of several platforms at once.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from functools import partial
+from typing import Dict, List, Optional
 
 
 class OpenAIGateway(ABC):
     @abstractmethod
-    def generate(self, prompt: str) -> str:
+    def generate(self, prompt: str, max_length: Optional[int] = None) -> str:
         """
         Generate tweet content based on the given prompt using OpenAI's API.
 
         Args:
             prompt (str): The input prompt for tweet generation.
+            max_length (Optional[int]): Length limit of the target platform; implementations
+                may use it to stop a generation that is already too long.
 
         Returns:
             str: The generated tweet content.
@@ -25,4 +30,85 @@ class OpenAIGateway(ABC):
         Raises:
             OpenAIError: If there's an error during tweet generation.
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def generate_async(self, prompt: str, max_length: Optional[int] = None) -> str:
+        """
+        Asynchronous counterpart of ``generate``.
+
+        The default implementation runs ``generate`` in the event loop's executor;
+        implementations with a native async client should override it.
+
+        Args:
+            prompt (str): The input prompt for content generation.
+            max_length (Optional[int]): Length limit of the target platform.
+
+        Returns:
+            str: The generated content.
+
+        Raises:
+            OpenAIError: If there's an error during generation.
+        """
+        loop = asyncio.get_running_loop()
+        # Les implémentations antérieures à max_length n'acceptent que le prompt
+        call = partial(self.generate, prompt) if max_length is None else partial(self.generate, prompt, max_length)
+        return await loop.run_in_executor(None, call)
+
+    def generate_candidates(self, prompt: str, n: int, max_length: Optional[int] = None) -> List[str]:
+        """
+        Generate several alternative contents for the same prompt.
+
+        The default implementation calls ``generate`` n times; implementations able to
+        return several completions from one request should override it.
+
+        Args:
+            prompt (str): The input prompt for content generation.
+            n (int): The number of candidates requested.
+            max_length (Optional[int]): Length limit of the target platform.
+
+        Returns:
+            List[str]: The generated candidates (possibly fewer than n if some were invalid).
+
+        Raises:
+            OpenAIError: If no candidate could be generated.
+        """
+        call = partial(self.generate, prompt) if max_length is None else partial(self.generate, prompt, max_length)
+        return [call() for _ in range(n)]
+
+    async def generate_candidates_async(self, prompt: str, n: int, max_length: Optional[int] = None) -> List[str]:
+        """
+        Asynchronous counterpart of ``generate_candidates``.
+
+        The default implementation runs n ``generate_async`` calls concurrently.
+        """
+        return list(await asyncio.gather(*(self.generate_async(prompt, max_length) for _ in range(n))))
+
+    @abstractmethod
+    def generate_many(self, prompt: str, platform_specs: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        Generate the variants of several platforms with a single completion.
+
+        There is no default implementation: the prompt asks for every variant at once,
+        each inside its own tag, so it cannot be answered by ``generate`` calls.
+
+        Args:
+            prompt (str): A multi-platform prompt asking for one tagged variant per platform.
+            platform_specs (Dict[str, Dict]): For each platform, the 'tag' delimiting its
+                variant and its 'max_length'.
+
+        Returns:
+            Dict[str, str]: The generated content of each platform.
+
+        Raises:
+            OpenAIError: If a variant is missing, empty or too long.
+        """
+        pass
+
+    async def generate_many_async(self, prompt: str, platform_specs: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        Asynchronous counterpart of ``generate_many``.
+
+        The default implementation runs ``generate_many`` in the event loop's executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.generate_many, prompt, platform_specs))
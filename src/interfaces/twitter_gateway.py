@@ -6,10 +6,31 @@ an interface for interacting with the Twitter API. It provides a contract
 for implementing concrete Twitter API interaction classes.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from functools import partial
 from src.domain.entities.tweet import Tweet
 
 class TwitterGateway(ABC):
     @abstractmethod
     def post_tweet(self, tweet: Tweet):
-        pass
\ No newline at end of file
+        pass
+
+    async def post_tweet_async(self, tweet: Tweet):
+        """
+        Asynchronous counterpart of ``post_tweet``.
+
+        The default implementation runs ``post_tweet`` in the event loop's executor;
+        implementations with a native async client should override it.
+
+        Args:
+            tweet (Tweet): The Tweet entity to be posted.
+
+        Returns:
+            dict: The response from the Twitter API containing the posted tweet's data.
+
+        Raises:
+            TwitterError: If there's an error posting the tweet to Twitter.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.post_tweet, tweet))
@@ -7,18 +7,11 @@ posting content to different social media platforms (Twitter, Facebook, LinkedIn
 """
 
 import time
-from src.use_cases.post_tweet import PostTweetUseCase
-from src.use_cases.post_facebook import PostFacebookUseCase
-from src.use_cases.post_linkedin import PostLinkedInUseCase
-from src.use_cases.generate_tweet import GenerateTweetUseCase
-from src.use_cases.generate_facebook_publication import GenerateFacebookPublicationUseCase
-from src.use_cases.generate_linkedin_post import GenerateLinkedInPostUseCase
+from typing import Any, Dict
 from src.infrastructure.config.environment import initialize_environment
-from src.infrastructure.external.twitter_api import TwitterAPI
-from src.infrastructure.external.facebook_api import FacebookAPI
-from src.infrastructure.external.linkedin_api import LinkedInAPI
-from src.infrastructure.external.openai_api import OpenAIAPI
+from src.infrastructure.container import Container, get_container
 from src.infrastructure.logging.logger import logger, log_method
+from src.infrastructure.utils.concurrency import run_concurrently
 from src.domain.exceptions import (
     AutomatorError, TwitterError, FacebookError, LinkedInError,
     ConfigurationError, ValidationError, OpenAIError,
@@ -27,15 +20,38 @@ from src.domain.exceptions import (
 
 
 class CLI:
+    # Libellés d'affichage par plateforme
+    PLATFORM_LABELS = {
+        'facebook': 'Facebook',
+        'linkedin': 'LinkedIn',
+        'twitter': 'X'
+    }
+
     @log_method(logger)
-    def __init__(self):
+    def __init__(self, concurrent: bool = False, pacing: float = 0.0, max_workers: int = 3,
+                 container: Container = None):
         """
-        Initialize the CLI with necessary use cases and gateways for all platforms.
+        Initialize the CLI. Use cases and gateways are resolved through the container
+        on first use, so nothing is built for a run that does not post.
+
+        Args:
+            concurrent (bool): If True, platforms are generated and posted in parallel
+            pacing (float): Seconds to wait before each generation/posting stage (0 disables waiting)
+            max_workers (int): Maximum number of worker threads used in concurrent mode
+            container (Container): Dependency container (defaults to the process-wide one)
 
         Raises:
             AutomatorError: If initialization of any component fails
         """
         try:
+            if pacing < 0:
+                raise ConfigurationError("Pacing cannot be negative")
+            if max_workers < 1:
+                raise ConfigurationError("max_workers must be at least 1")
+            self.concurrent = concurrent
+            self.pacing = pacing
+            self.max_workers = max_workers
+
             # Initialiser l'environnement avant toute autre chose
             logger.info("Initializing environment")
             if not initialize_environment():
@@ -43,23 +59,8 @@ class CLI:
 
             logger.info("Environment initialized successfully")
 
-            # Initialize gateways
-            logger.debug("Creating API instances")
-            twitter_gateway = TwitterAPI()
-            facebook_gateway = FacebookAPI()
-            linkedin_gateway = LinkedInAPI()
-            openai_gateway = OpenAIAPI()
-            logger.debug("All API instances created")
-
-            # Initialize use cases
-            logger.debug("Creating use case instances")
-            self.post_tweet_use_case = PostTweetUseCase(twitter_gateway)
-            self.post_facebook_use_case = PostFacebookUseCase(facebook_gateway)
-            self.post_linkedin_use_case = PostLinkedInUseCase(linkedin_gateway)
-            self.generate_tweet_use_case = GenerateTweetUseCase(openai_gateway)
-            self.generate_facebook_use_case = GenerateFacebookPublicationUseCase(openai_gateway)
-            self.generate_linkedin_use_case = GenerateLinkedInPostUseCase(openai_gateway)
-            logger.debug("All use case instances created")
+            self.container = container or get_container()
+            self._use_cases: Dict[str, Any] = {}
 
         except ConfigurationError as e:
             error_msg = f"Failed to initialize CLI due to configuration error: {str(e)}"
@@ -70,6 +71,43 @@ class CLI:
             logger.error(error_msg)
             raise AutomatorError(error_msg) from e
 
+    @property
+    def generate_facebook_use_case(self):
+        return self._use_case('generate_facebook')
+
+    @property
+    def generate_linkedin_use_case(self):
+        return self._use_case('generate_linkedin')
+
+    @property
+    def generate_tweet_use_case(self):
+        return self._use_case('generate_twitter')
+
+    @property
+    def post_facebook_use_case(self):
+        return self._use_case('post_facebook')
+
+    @property
+    def post_linkedin_use_case(self):
+        return self._use_case('post_linkedin')
+
+    @property
+    def post_tweet_use_case(self):
+        return self._use_case('post_twitter')
+
+    @property
+    def outbox(self):
+        """The outbox publisher: generated posts are recorded before posting and resumed after a failure."""
+        return self.container.resolve('outbox_publisher')
+
+    def _use_case(self, name: str):
+        """
+        Get a use case of this CLI, created through the container on first access.
+        """
+        if name not in self._use_cases:
+            self._use_cases[name] = self.container.use_case(name)
+        return self._use_cases[name]
+
     @log_method(logger)
     def menu(self):
         """Display the menu and handle user input."""
@@ -85,83 +123,55 @@ class CLI:
         Run the CLI, handling platform-specific content generation and posting.
         This method handles the entire workflow of generating and posting content
         to multiple social media platforms.
+
+        When the CLI was created with ``concurrent=True`` the platforms are processed
+        in parallel (see ``run_concurrent``), otherwise one after another.
         """
-        try:
-            # Generate and post content for each platform
-            counter = 3
-            time.sleep(1)
-            print("Waiting for facebook generation")
-            while counter != 0:
-                print("...")
-                time.sleep(1)
-                counter -= 1
+        if self.concurrent:
+            return self.run_concurrent()
 
+        facebook_item = linkedin_item = x_item = None
+        try:
             # Facebook
+            self._pause("Waiting for facebook generation")
             logger.debug("Generating Facebook post")
-            facebook_text = self.generate_facebook_use_case.execute()
+            facebook_item = self.outbox.prepare('facebook', self.generate_facebook_use_case.execute)
+            facebook_text = facebook_item['content']
             logger.success("Facebook publication created successfully")
             print(f"Generated Facebook post successfully: {facebook_text[0:50]}")
-            counter = 3
-            time.sleep(1)
-            print("Waiting for linkedin generation")
-            while counter != 0:
-                print("...")
-                time.sleep(1)
-                counter -= 1
 
             # LinkedIn
+            self._pause("Waiting for linkedin generation")
             logger.debug("Generating Linkedin post")
-            linkedin_text = self.generate_linkedin_use_case.execute()
+            linkedin_item = self.outbox.prepare('linkedin', self.generate_linkedin_use_case.execute)
+            linkedin_text = linkedin_item['content']
             logger.success("Linkedin publication created successfully")
             print(f"Generated Linkedin post successfully: {linkedin_text[0:50]}")
-            counter = 3
-            time.sleep(1)
-            print("Waiting for X tweet generation")
-            while counter != 0:
-                print("...")
-                time.sleep(1)
-                counter -= 1
 
             # X
+            self._pause("Waiting for X tweet generation")
             logger.debug("Generating x post")
-            x_text = self.generate_tweet_use_case.execute()
+            x_item = self.outbox.prepare('twitter', self.generate_tweet_use_case.execute)
+            x_text = x_item['content']
             logger.success("X publication created successfully")
             print(f"Generated x post successfully: {x_text[0:50]}")
-            counter = 3
-            time.sleep(1)
-            print("Posting in facebook")
-            while counter != 0:
-                print("...")
-                time.sleep(1)
-                counter -= 1
 
             # Post to platforms
+            self._pause("Posting in facebook")
             logger.debug("Posting to Facebook")
-            facebook_result = self.post_facebook_use_case.execute(facebook_text)
+            facebook_result = self.outbox.post(facebook_item, self.post_facebook_use_case.execute)
             logger.success(f"Facebook post published successfully. Post ID: {facebook_result['id']}")
             print(f"Facebook post published successfully. Post ID: {facebook_result['id']}")
-            counter = 3
-            time.sleep(1)
-            print("Posting in LinkedIn")
-            while counter != 0:
-                print("...")
-                time.sleep(1)
-                counter -= 1
 
+            self._pause("Posting in LinkedIn")
             logger.debug("Posting to LinkedIn")
-            linkedin_result = self.post_linkedin_use_case.execute(linkedin_text)
+            linkedin_result = self.outbox.post(linkedin_item, self.post_linkedin_use_case.execute)
             logger.success("Linkedin post published successfully")
             print(f"Linkedin post published successfully. {linkedin_result}")
-            counter = 3
-            time.sleep(1)
-            print("Posting in X")
-            while counter != 0:
-                print("...")
-                time.sleep(1)
-                counter -= 1
 
+            self._pause("Posting in X")
             logger.debug("Posting to X")
-            x_result = self.post_tweet_use_case.execute(x_text)
+            x_result = self.outbox.post(x_item, self.post_tweet_use_case.execute)
             logger.success(f"X post published successfully.")
             print(f"X post published successfully")
 
@@ -203,4 +213,77 @@ class CLI:
             error_msg = f"An unexpected error occurred: {str(e)}"
             logger.error(error_msg, exc_info=True)
             print(error_msg)
-            raise AutomatorError(error_msg) from e
\ No newline at end of file
+            raise AutomatorError(error_msg) from e
+        finally:
+            # Les publications préparées mais non postées après un échec reviennent à la prochaine exécution
+            for item in (facebook_item, linkedin_item, x_item):
+                if item is not None:
+                    self.outbox.unclaim(item)
+
+    @log_method(logger)
+    def run_concurrent(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate and post content for all platforms in parallel.
+
+        Each platform runs its own generate-then-post pipeline on a bounded thread pool,
+        so a post starts as soon as its own content is ready. A failure on one platform
+        does not abort the others; every platform gets its own report.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per-platform report with 'status', 'content',
+                'result', 'error' and 'elapsed'
+
+        Raises:
+            AutomatorError: If at least one platform failed, once all platforms are done
+        """
+        pipelines = {
+            'facebook': (self.generate_facebook_use_case, self.post_facebook_use_case),
+            'linkedin': (self.generate_linkedin_use_case, self.post_linkedin_use_case),
+            'twitter': (self.generate_tweet_use_case, self.post_tweet_use_case),
+        }
+        contents: Dict[str, str] = {}
+
+        def pipeline(platform: str):
+            generate_use_case, post_use_case = pipelines[platform]
+            label = self.PLATFORM_LABELS[platform]
+
+            logger.debug(f"Generating {label} post")
+            item = self.outbox.prepare(platform, generate_use_case.execute)
+            contents[platform] = item['content']
+            print(f"Generated {label} post successfully: {item['content'][0:50]}")
+
+            self._pause(f"Posting in {label}")
+            logger.debug(f"Posting to {label}")
+            return self.outbox.post(item, post_use_case.execute)
+
+        outcomes = run_concurrently(
+            {platform: (lambda platform=platform: pipeline(platform)) for platform in pipelines},
+            max_workers=self.max_workers
+        )
+
+        reports = {}
+        for platform, outcome in outcomes.items():
+            label = self.PLATFORM_LABELS[platform]
+            reports[platform] = dict(outcome, content=contents.get(platform))
+            if outcome['status'] == 'success':
+                logger.success(f"{label} post published successfully in {outcome['elapsed']:.2f}s")
+                print(f"{label} post published successfully. {outcome['result']}")
+            else:
+                logger.error(f"{label} failed: {str(outcome['error'])}")
+                print(f"{label} failed: {str(outcome['error'])}")
+
+        failed = [self.PLATFORM_LABELS[p] for p, report in reports.items() if report['status'] != 'success']
+        if failed:
+            raise AutomatorError(f"Publication failed for: {', '.join(failed)}")
+        return reports
+
+    def _pause(self, message: str) -> None:
+        """
+        Announce the next stage and wait for the configured pacing delay.
+
+        Args:
+            message (str): The message announcing the next stage
+        """
+        print(message)
+        if self.pacing > 0:
+            time.sleep(self.pacing)
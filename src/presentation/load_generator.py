@@ -0,0 +1,252 @@
+# src/presentation/load_generator.py
+
+"""
+This module implements LoadGenerator, which measures how many publications the stack
+can push and where the time goes.
+
+N workers run generate → validate → post pipelines back to back through the real use
+cases (GenerateTweetUseCase then PostTweetUseCase, and so on) and gateways, the
+platforms being taken in turn. The workers are threads sharing the synchronous clients,
+or coroutines of one event loop using the asynchronous ones, so that both concurrency
+modes can be compared. It is meant to run against local stand-in endpoints (see
+src/infrastructure/stubs), never against the production APIs.
+
+Each pipeline is recorded with the duration of its stages; ``summarize`` turns the
+records into the throughput and the p50/p95/p99 latencies of each stage, per platform
+and overall, and ``write_csv`` writes them as a time series.
+"""
+
+import asyncio
+import csv
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from src.infrastructure.container import Container
+from src.infrastructure.logging.logger import logger
+from src.domain.entities.facebook_publication import FacebookPublication
+from src.domain.entities.linkedin_publication import LinkedInPublication
+from src.domain.entities.tweet import Tweet
+from src.domain.exceptions import ConfigurationError
+
+STAGES = ('generate', 'validate', 'post')
+MODES = ('threads', 'async')
+PERCENTILES = (50, 95, 99)
+
+# Entité validée entre la génération et la publication
+ENTITIES = {
+    'facebook': FacebookPublication,
+    'linkedin': LinkedInPublication,
+    'twitter': Tweet,
+}
+
+CSV_FIELDS = ('index', 'worker', 'platform', 'status', 'started', 'finished',
+              'generate_ms', 'validate_ms', 'post_ms', 'total_ms', 'failed_stage', 'error')
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """
+    Return the ``q``-th percentile of the values (nearest rank), or None if there are none.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LoadGenerator:
+    def __init__(self, container: Container, platforms: Sequence[str] = tuple(ENTITIES),
+                 concurrency: int = 4, mode: str = 'threads',
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            container (Container): Provides the use cases and gateways under test
+            platforms (Sequence[str]): Platforms of the pipelines, taken in turn
+            concurrency (int): Number of pipelines in flight
+            mode (str): 'threads' or 'async' (see the module documentation)
+            clock (Callable[[], float]): Monotonic time source, in seconds
+
+        Raises:
+            ConfigurationError: If a setting is invalid
+        """
+        if concurrency < 1:
+            raise ConfigurationError("concurrency must be at least 1")
+        if mode not in MODES:
+            raise ConfigurationError(f"Unknown load mode: {mode}")
+        unknown = [platform for platform in platforms if platform not in ENTITIES]
+        if not platforms or unknown:
+            raise ConfigurationError(f"Invalid platforms: {', '.join(unknown) or 'none'}")
+        self.container = container
+        self.platforms = list(platforms)
+        self.concurrency = concurrency
+        self.mode = mode
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_index = 0
+
+    def run(self, count: Optional[int] = None, duration: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run pipelines until ``count`` were started or ``duration`` seconds elapsed.
+
+        Returns:
+            Dict[str, Any]: The 'records' of the pipelines, in the order they finished, the
+                'wall_time' in seconds, the 'mode' and the 'concurrency'
+
+        Raises:
+            ConfigurationError: If neither a count nor a duration is given
+        """
+        if not count and not duration:
+            raise ConfigurationError("A pipeline count or a duration is required")
+        # Les cas d'utilisation et passerelles sont construits avant la mesure
+        for platform in self.platforms:
+            self.container.use_case(f'generate_{platform}')
+            self.container.use_case(f'post_{platform}')
+
+        self._next_index = 0
+        started = self._clock()
+        deadline = started + duration if duration else None
+        records: List[Dict[str, Any]] = []
+        if self.mode == 'threads':
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="load") as executor:
+                for worker in range(self.concurrency):
+                    executor.submit(self._thread_worker, worker, count, deadline, started, records)
+        else:
+            asyncio.run(self._async_workers(count, deadline, started, records))
+        wall_time = self._clock() - started
+        logger.info(f"Load test finished: {len(records)} pipelines in {wall_time:.2f}s")
+        return {'records': records, 'wall_time': wall_time, 'mode': self.mode, 'concurrency': self.concurrency}
+
+    def _claim(self, count: Optional[int], deadline: Optional[float]) -> Optional[int]:
+        """Return the index of the next pipeline, or None once the run is over."""
+        with self._lock:
+            if (count and self._next_index >= count) or (deadline is not None and self._clock() >= deadline):
+                return None
+            self._next_index += 1
+            return self._next_index - 1
+
+    def _thread_worker(self, worker: int, count, deadline, started: float, records: list) -> None:
+        while (index := self._claim(count, deadline)) is not None:
+            platform = self.platforms[index % len(self.platforms)]
+            record = self._new_record(index, worker, platform, started)
+            try:
+                content = self._timed(record, 'generate', self.container.use_case(f'generate_{platform}').execute)
+                self._timed(record, 'validate', lambda: ENTITIES[platform](content).validate())
+                self._timed(record, 'post', lambda: self.container.use_case(f'post_{platform}').execute(content))
+            except Exception as e:
+                self._fail(record, e)
+            self._finish(record, started, records)
+
+    async def _async_workers(self, count, deadline, started: float, records: list) -> None:
+        from src.infrastructure.external.async_http import close_async_http_client
+
+        async def worker(number: int) -> None:
+            while (index := self._claim(count, deadline)) is not None:
+                platform = self.platforms[index % len(self.platforms)]
+                record = self._new_record(index, number, platform, started)
+                try:
+                    generate = self.container.use_case(f'generate_{platform}')
+                    content = await self._timed_async(record, 'generate', generate.execute_async())
+                    self._timed(record, 'validate', lambda: ENTITIES[platform](content).validate())
+                    post = self.container.use_case(f'post_{platform}')
+                    await self._timed_async(record, 'post', post.execute_async(content))
+                except Exception as e:
+                    self._fail(record, e)
+                self._finish(record, started, records)
+
+        try:
+            await asyncio.gather(*(worker(number) for number in range(self.concurrency)))
+        finally:
+            await close_async_http_client()
+
+    def _new_record(self, index: int, worker: int, platform: str, started: float) -> Dict[str, Any]:
+        record = {'index': index, 'worker': worker, 'platform': platform, 'status': 'success',
+                  'started': self._clock() - started, 'finished': None, 'failed_stage': None, 'error': None}
+        record.update({f'{stage}_ms': None for stage in STAGES})
+        return record
+
+    def _timed(self, record: Dict[str, Any], stage: str, func: Callable[[], Any]) -> Any:
+        record['failed_stage'] = stage
+        begin = self._clock()
+        result = func()
+        record[f'{stage}_ms'] = (self._clock() - begin) * 1000
+        record['failed_stage'] = None
+        return result
+
+    async def _timed_async(self, record: Dict[str, Any], stage: str, awaitable) -> Any:
+        record['failed_stage'] = stage
+        begin = self._clock()
+        result = await awaitable
+        record[f'{stage}_ms'] = (self._clock() - begin) * 1000
+        record['failed_stage'] = None
+        return result
+
+    @staticmethod
+    def _fail(record: Dict[str, Any], error: Exception) -> None:
+        record['status'] = 'failed'
+        record['error'] = f"{type(error).__name__}: {str(error)}"[:200]
+        logger.warning(f"Pipeline {record['index']} ({record['platform']}) failed at {record['failed_stage']}: "
+                       f"{str(error)}")
+
+    def _finish(self, record: Dict[str, Any], started: float, records: list) -> None:
+        record['finished'] = self._clock() - started
+        record['total_ms'] = (record['finished'] - record['started']) * 1000
+        with self._lock:
+            records.append(record)
+
+
+def summarize(run: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the throughput and the latency percentiles of a run.
+
+    Args:
+        run (Dict[str, Any]): The result of ``LoadGenerator.run``
+
+    Returns:
+        Dict[str, Any]: 'pipelines', 'succeeded', 'failed', 'wall_time', 'throughput'
+            (successful pipelines per second) and 'latencies': for each platform and
+            'all', for each stage and 'total', the 'count', 'mean', 'p50', 'p95', 'p99'
+            and 'max' in milliseconds, over the stages that completed
+    """
+    records = run['records']
+    succeeded = sum(1 for record in records if record['status'] == 'success')
+    wall_time = run['wall_time']
+    latencies: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+    for platform in sorted({record['platform'] for record in records}) + ['all']:
+        selected = [record for record in records if platform == 'all' or record['platform'] == platform]
+        latencies[platform] = {}
+        for stage in STAGES + ('total',):
+            if stage == 'total':
+                values = [record['total_ms'] for record in selected if record['status'] == 'success']
+            else:
+                values = [record[f'{stage}_ms'] for record in selected if record[f'{stage}_ms'] is not None]
+            stats = {'count': len(values), 'mean': sum(values) / len(values) if values else None,
+                     'max': max(values) if values else None}
+            stats.update({f'p{q}': percentile(values, q) for q in PERCENTILES})
+            latencies[platform][stage] = stats
+    return {
+        'mode': run['mode'],
+        'concurrency': run['concurrency'],
+        'pipelines': len(records),
+        'succeeded': succeeded,
+        'failed': len(records) - succeeded,
+        'wall_time': wall_time,
+        'throughput': succeeded / wall_time if wall_time > 0 else 0.0,
+        'latencies': latencies,
+    }
+
+
+def write_csv(path: str, run: Dict[str, Any]) -> None:
+    """Write one row per pipeline, ordered by start time (seconds since the start of the run)."""
+    with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for record in sorted(run['records'], key=lambda record: record['started']):
+            row = dict(record)
+            for field in ('started', 'finished'):
+                row[field] = f"{row[field]:.4f}"
+            for stage in STAGES + ('total',):
+                value = row[f'{stage}_ms']
+                row[f'{stage}_ms'] = f"{value:.3f}" if value is not None else ''
+            writer.writerow({field: '' if row.get(field) is None else row[field] for field in CSV_FIELDS})
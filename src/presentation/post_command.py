@@ -1,31 +1,74 @@
 # src/presentation/post_command.py
 
 import argparse
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 from src.infrastructure.logging.logger import logger, log_method
+from src.infrastructure.utils.concurrency import run_concurrently
 from src.domain.exceptions import ConfigurationError, AutomatorError
-from src.use_cases.generate_facebook_publication import GenerateFacebookPublicationUseCase
-from src.use_cases.generate_linkedin_post import GenerateLinkedInPostUseCase
-from src.use_cases.generate_tweet import GenerateTweetUseCase
-from src.use_cases.post_facebook import PostFacebookUseCase
-from src.use_cases.post_linkedin import PostLinkedInUseCase
-from src.use_cases.post_tweet import PostTweetUseCase
-from src.infrastructure.external.facebook_api import FacebookAPI
-from src.infrastructure.external.linkedin_api import LinkedInAPI
-from src.infrastructure.external.twitter_api import TwitterAPI
-from src.infrastructure.external.openai_api import OpenAIAPI
+from src.infrastructure.container import Container, get_container
+from src.use_cases.outbox_publisher import extract_post_id
 
 
 class PostCommand:
+    PLATFORMS = ('facebook', 'linkedin', 'twitter')
+
     @log_method(logger)
-    def __init__(self):
-        """Initialize command dependencies"""
+    def __init__(self, cache_mode: str = 'use', container: Container = None, tweet_candidates: int = 1,
+                 stream: bool = False, outbox: bool = True, dedup: bool = True, rotation: bool = True):
+        """
+        Initialize command dependencies. Gateways are resolved through the container
+        when first needed, e.g. no posting gateway is built for a dry run.
+
+        Args:
+            cache_mode (str): OpenAI response cache mode ('use', 'off' or 'only')
+            container (Container): Dependency container, configured with these settings
+                (defaults to the process-wide one, or to a new container if its settings
+                differ, so that other holders of the process-wide one are not rewired)
+            tweet_candidates (int): Number of tweets generated per request, the best one
+                within the length limit being kept
+            stream (bool): Stream OpenAI completions and stop them early (see OpenAIAPI)
+            outbox (bool): Record each publication in the outbox before posting it, and
+                resume the publications a previous run failed to post (see OutboxPublisher)
+            dedup (bool): Generate again, then reject, content too similar to an earlier
+                publication of its platform (see DuplicateGate)
+            rotation (bool): Pick topics and voices with the topic rotation, recording the
+                uses of the posted publications; if False (or with the 'random' policy), they
+                are drawn from ``random`` so that a seed makes the run replayable
+        """
         try:
-            self.openai_gateway = OpenAIAPI()
-            logger.debug("OpenAI gateway initialized")
+            settings = dict(cache_mode=cache_mode, tweet_candidates=tweet_candidates,
+                            openai_stream=stream, outbox=outbox, dedup=dedup, rotation=rotation)
+            if container is None:
+                container = get_container()
+                if container.differs(**settings):
+                    container = Container(**settings)
+            self.container = container
+            self.container.configure(**settings)
         except Exception as e:
             logger.error(f"Failed to initialize post command: {str(e)}")
             raise
 
+    @property
+    def openai_gateway(self):
+        """The OpenAI gateway shared by every generation of this command."""
+        return self.container.resolve('openai_gateway')
+
+    @property
+    def outbox(self):
+        """The outbox publisher through which every publication of this command is posted."""
+        return self.container.resolve('outbox_publisher')
+
+    def repair_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Return the counters of the OpenAI output repair stages, or None if no content
+        was generated by this process.
+        """
+        if not self.container.is_resolved('openai_gateway'):
+            return None
+        repair_pipeline = getattr(self.openai_gateway, 'repair_pipeline', None)
+        return repair_pipeline.stats() if repair_pipeline is not None else None
+
     @log_method(logger)
     def execute(self, platform: str, dry_run: bool = False, topic: str = None):
         """
@@ -50,23 +93,76 @@ class PostCommand:
             raise
 
     @log_method(logger)
-    def _handle_facebook(self, dry_run: bool, topic: str = None):
-        """Handle Facebook posting"""
-        try:
-            generate_use_case = GenerateFacebookPublicationUseCase(self.openai_gateway)
-            logger.info("Generating Facebook content")
-            content = generate_use_case.execute()
+    def execute_many(self, platforms: List[str], dry_run: bool = False, topic: str = None,
+                     max_workers: Optional[int] = None,
+                     single_request: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute the posting command for several platforms concurrently.
 
-            if dry_run:
-                logger.info("Dry run - content generated but not posted")
-                return content
+        The platforms share this command's OpenAI gateway. A failure on one platform
+        does not abort the others.
 
-            facebook_gateway = FacebookAPI()
-            post_use_case = PostFacebookUseCase(facebook_gateway)
-            logger.info("Posting to Facebook")
-            result = post_use_case.execute(content)
-            return result
+        Args:
+            platforms (List[str]): Target platforms (duplicates are ignored)
+            dry_run (bool): If True, only generate content without posting
+            topic (str): Optional topic category to use
+            max_workers (Optional[int]): Maximum number of parallel workers (defaults to one per platform)
+            single_request (bool): If True, all variants are generated with one OpenAI request
+                on a shared topic, then posted concurrently
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per-platform report with 'status', 'content', 'post_id',
+                'result', 'error' and 'elapsed'
+        """
+        selected = list(dict.fromkeys(platforms))
+        unsupported = [platform for platform in selected if platform not in self.PLATFORMS]
+        if unsupported:
+            raise ValueError(f"Unsupported platform: {', '.join(unsupported)}")
+
+        if single_request:
+            tasks = self._single_request_tasks(selected, dry_run, topic)
+        else:
+            tasks = {platform: (lambda platform=platform: self._generate_and_post(platform, dry_run, topic))
+                     for platform in selected}
+        outcomes = run_concurrently(tasks, max_workers=max_workers)
+
+        reports = {}
+        for platform, outcome in outcomes.items():
+            content, result = outcome['result'] if outcome['status'] == 'success' else (None, None)
+            reports[platform] = {
+                'status': outcome['status'],
+                'content': content,
+                'result': result,
+                'post_id': extract_post_id(result),
+                'error': outcome['error'],
+                'elapsed': outcome['elapsed']
+            }
+            if outcome['status'] == 'success':
+                logger.success(f"{platform} done in {outcome['elapsed']:.2f}s")
+        return reports
+
+    def publish(self, platform: str, dry_run: bool = False, topic: str = None) -> Dict[str, Any]:
+        """
+        Generate and post the content of one platform, e.g. for a scheduled job.
+
+        Returns:
+            Dict[str, Any]: The 'content', the platform 'result' and its 'post_id'
+                (both None in dry-run mode)
 
+        Raises:
+            ValueError: If the platform is not supported
+        """
+        if platform not in self.PLATFORMS:
+            raise ValueError(f"Unsupported platform: {platform}")
+        content, result = self._generate_and_post(platform, dry_run, topic)
+        return {'content': content, 'result': result, 'post_id': extract_post_id(result)}
+
+    @log_method(logger)
+    def _handle_facebook(self, dry_run: bool, topic: str = None):
+        """Handle Facebook posting"""
+        try:
+            content, result = self._generate_and_post('facebook', dry_run, topic)
+            return content if dry_run else result
         except Exception as e:
             logger.error(f"Error handling Facebook: {str(e)}")
             raise
@@ -75,20 +171,8 @@ class PostCommand:
     def _handle_linkedin(self, dry_run: bool, topic: str = None):
         """Handle LinkedIn posting"""
         try:
-            generate_use_case = GenerateLinkedInPostUseCase(self.openai_gateway)
-            logger.info("Generating LinkedIn content")
-            content = generate_use_case.execute()
-
-            if dry_run:
-                logger.info("Dry run - content generated but not posted")
-                return content
-
-            linkedin_gateway = LinkedInAPI()
-            post_use_case = PostLinkedInUseCase(linkedin_gateway)
-            logger.info("Posting to LinkedIn")
-            result = post_use_case.execute(content)
-            return result
-
+            content, result = self._generate_and_post('linkedin', dry_run, topic)
+            return content if dry_run else result
         except Exception as e:
             logger.error(f"Error handling LinkedIn: {str(e)}")
             raise
@@ -97,20 +181,113 @@ class PostCommand:
     def _handle_twitter(self, dry_run: bool, topic: str = None):
         """Handle Twitter posting"""
         try:
-            generate_use_case = GenerateTweetUseCase(self.openai_gateway)
-            logger.info("Generating tweet")
-            content = generate_use_case.execute()
+            content, result = self._generate_and_post('twitter', dry_run, topic)
+            return content if dry_run else result
+        except Exception as e:
+            logger.error(f"Error handling Twitter: {str(e)}")
+            raise
+
+    def _generate_and_post(self, platform: str, dry_run: bool, topic: str = None) -> Tuple[str, Any]:
+        """
+        Generate content for a platform and post it unless in dry-run mode. A publication
+        left pending in the outbox by a previous run is posted instead of a new one.
 
-            if dry_run:
-                logger.info("Dry run - content generated but not posted")
-                return content
+        Returns:
+            Tuple[str, Any]: The generated content and the platform response (None in dry-run mode)
+        """
+        selections = []
 
-            twitter_gateway = TwitterAPI()
-            post_use_case = PostTweetUseCase(twitter_gateway)
-            logger.info("Posting to Twitter")
-            result = post_use_case.execute(content)
-            return result
+        def generate():
+            content, selection = self._generate(platform, topic)
+            selections.append(selection)
+            return content
 
+        if dry_run:
+            return self._post_content(platform, generate(), dry_run)
+        content, result = self._post_item(platform, self.outbox.prepare(platform, generate, topic))
+        # Une publication reprise de l'outbox n'a pas de choix de rotation à enregistrer
+        self._record_use(platform, selections[-1] if selections else None)
+        return content, result
+
+    def _generate(self, platform: str, topic: str = None) -> Tuple[str, Any]:
+        """
+        Generate new content for a platform, on a topic of the given category if any.
+
+        Returns:
+            Tuple[str, Any]: The content and the pick of the topic rotation (None without rotation)
+        """
+        generate_use_case = self.container.use_case(f'generate_{platform}')
+        logger.info(f"Generating {platform} content")
+        content = generate_use_case.execute(topic)
+        return content, getattr(generate_use_case, 'selection', None)
+
+    def _record_use(self, platform: str, selection: Any) -> None:
+        """Record in the rotation history the topic and voice of a posted publication."""
+        if selection is None:
+            return
+        rotation = self.container.resolve('topic_rotation')
+        if rotation is None:
+            return
+        try:
+            rotation.record(platform, selection)
         except Exception as e:
-            logger.error(f"Error handling Twitter: {str(e)}")
-            raise
\ No newline at end of file
+            # La publication est en ligne : l'historique de rotation ne doit pas la faire échouer
+            logger.warning(f"Failed to record the rotation use of {platform}: {str(e)}")
+
+    def _post_content(self, platform: str, content: str, dry_run: bool, topic: str = None) -> Tuple[str, Any]:
+        """
+        Post already generated content, on a topic of the given category if any, unless
+        in dry-run mode.
+
+        Returns:
+            Tuple[str, Any]: The content and the platform response (None in dry-run mode)
+        """
+        if dry_run:
+            logger.info("Dry run - content generated but not posted")
+            return content, None
+        return self._post_item(platform, self.outbox.record(platform, content, topic))
+
+    def _post_item(self, platform: str, item: Dict[str, Any]) -> Tuple[str, Any]:
+        """Post an outbox item, recording its outcome."""
+        try:
+            post_use_case = self.container.use_case(f'post_{platform}')
+        except Exception:
+            self.outbox.unclaim(item)
+            raise
+        logger.info(f"Posting to {platform}")
+        return item['content'], self.outbox.post(item, post_use_case.execute)
+
+    def _single_request_tasks(self, platforms: List[str], dry_run: bool, topic: str = None):
+        """
+        Generate all variants with one request and return one posting task per platform.
+
+        If the shared generation fails, every platform task fails with the same error.
+        Platforms with a publication pending in the outbox post it and are left out of
+        the generation.
+        """
+        pending = {} if dry_run else {platform: self.outbox.claim_pending(platform, topic) for platform in platforms}
+        resumed = {platform: item for platform, item in pending.items() if item is not None}
+        tasks = {platform: (lambda item=item, platform=platform: self._post_item(platform, item))
+                 for platform, item in resumed.items()}
+
+        to_generate = [platform for platform in platforms if platform not in resumed]
+        if to_generate:
+            try:
+                generate_use_case = self.container.use_case('generate_multi_platform')
+                contents = generate_use_case.execute(to_generate, topic)
+            except Exception as e:
+                logger.error(f"Multi-platform generation failed: {str(e)}")
+
+                def failed(error=e):
+                    raise error
+                tasks.update({platform: failed for platform in to_generate})
+            else:
+                selection = generate_use_case.selection
+
+                def post(platform):
+                    content, result = self._post_content(platform, contents[platform], dry_run, topic)
+                    if not dry_run:
+                        self._record_use(platform, selection)
+                    return content, result
+                tasks.update({platform: partial(post, platform) for platform in to_generate})
+        return {platform: tasks[platform] for platform in platforms}
@@ -0,0 +1,140 @@
+# src/presentation/worker.py
+
+"""
+This module implements the Worker that drains the scheduled-post queue (see JobStore).
+
+The worker claims the due jobs in batches, runs each batch on a bounded thread pool
+through a single PostCommand, so that the OpenAI client, the HTTP pools and the
+platform sessions stay warm for the whole run, and records each outcome. Between
+batches it sleeps until the next job is due, so a week of posts costs one wake-up
+per due time instead of one per polling tick.
+
+Several workers may share the queue: each batch first requeues the jobs whose claim
+is older than ``stale_after`` (see ``JobStore.recover``). A failure is retried only if
+it is transient; content refused by a platform or by the duplicate check fails the
+job at once.
+"""
+
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.persistence.job_store import JobStore
+from src.infrastructure.utils.concurrency import run_concurrently
+from src.domain.exceptions import ConfigurationError
+from src.presentation.post_command import PostCommand
+
+
+class Worker:
+    def __init__(self, store: JobStore, command: PostCommand, max_workers: int = 4,
+                 poll_interval: float = 30.0, retry_delay: float = 300.0, dry_run: bool = False,
+                 stale_after: float = 3600.0, clock: Callable[[], float] = time.time,
+                 sleep: Optional[Callable[[float], Any]] = None):
+        """
+        Args:
+            store (JobStore): The job queue
+            command (PostCommand): The command generating and posting each job
+            max_workers (int): Number of jobs claimed and run in parallel
+            poll_interval (float): Longest sleep while waiting for the next due job, so that
+                jobs added by another process are noticed
+            retry_delay (float): Delay before retrying a failed job, doubled on each attempt
+                (a delay advertised by the platform takes precedence)
+            dry_run (bool): Generate the content without posting it
+            stale_after (float): Age of a claim after which its job is considered
+                interrupted and run again; it must exceed the longest job
+            clock (Callable[[], float]): Time source, in epoch seconds
+            sleep (Optional[Callable[[float], Any]]): Sleep function (defaults to a sleep
+                interrupted by ``stop``)
+        """
+        if max_workers < 1:
+            raise ConfigurationError("max_workers must be at least 1")
+        self.store = store
+        self.command = command
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.dry_run = dry_run
+        self.stale_after = stale_after
+        self._clock = clock
+        self._stop = threading.Event()
+        self._sleep = sleep or self._stop.wait
+
+    def run_once(self) -> Dict[int, str]:
+        """
+        Requeue the interrupted jobs, claim the due jobs (at most ``max_workers``), run
+        them concurrently and record their outcomes.
+
+        Returns:
+            Dict[int, str]: The new status of each job run ('done', 'pending' or 'failed')
+        """
+        recovered = self.store.recover(self.stale_after)
+        if recovered:
+            logger.info(f"Requeued {recovered} jobs interrupted by a stopped worker")
+        jobs = self.store.claim_due(self.max_workers)
+        if not jobs:
+            return {}
+
+        tasks = {job['id']: partial(self.command.publish, job['platform'], self.dry_run, job['topic'])
+                 for job in jobs}
+        outcomes = run_concurrently(tasks, max_workers=self.max_workers)
+
+        statuses = {}
+        for job in jobs:
+            outcome = outcomes[job['id']]
+            if outcome['status'] == 'success':
+                self.store.complete(job['id'], outcome['result']['post_id'])
+                statuses[job['id']] = 'done'
+                logger.success(f"Job {job['id']} ({job['platform']}) done in {outcome['elapsed']:.2f}s")
+            else:
+                statuses[job['id']] = self.store.fail(job['id'], str(outcome['error']),
+                                                      retry_at=self._retry_at(job, outcome['error']))
+                logger.warning(f"Job {job['id']} ({job['platform']}) failed on attempt {job['attempts']}, "
+                               f"now {statuses[job['id']]}: {str(outcome['error'])}")
+        return statuses
+
+    def run(self, drain: bool = False, max_jobs: Optional[int] = None) -> Dict[str, int]:
+        """
+        Run jobs until stopped.
+
+        Args:
+            drain (bool): Return once no pending job is left (future jobs are waited for)
+            max_jobs (Optional[int]): Return after running this number of jobs
+
+        Returns:
+            Dict[str, int]: The number of jobs run by outcome ('done', 'pending', 'failed')
+        """
+        summary = {'done': 0, 'pending': 0, 'failed': 0}
+        while not self._stop.is_set():
+            statuses = self.run_once()
+            for status in statuses.values():
+                summary[status] += 1
+            if max_jobs is not None and sum(summary.values()) >= max_jobs:
+                break
+            if statuses:
+                continue
+
+            next_due = self.store.next_due()
+            if next_due is None and drain:
+                break
+            wait = self.poll_interval if next_due is None else max(0.0, next_due - self._clock())
+            if not drain:
+                wait = min(wait, self.poll_interval)
+            logger.debug(f"No due job, sleeping {wait:.1f}s")
+            self._sleep(wait)
+        logger.info(f"Worker finished: {summary['done']} done, {summary['pending']} rescheduled, "
+                    f"{summary['failed']} failed")
+        return summary
+
+    def stop(self) -> None:
+        """Ask ``run`` to return after the current batch (thread-safe)."""
+        self._stop.set()
+
+    def _retry_at(self, job: Dict[str, Any], error: Exception) -> Optional[float]:
+        """Return when to run a failed job again, or None if its failure is permanent."""
+        if not getattr(error, 'transient', False):
+            return None
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is None:
+            retry_after = self.retry_delay * 2 ** (job['attempts'] - 1)
+        return self._clock() + retry_after
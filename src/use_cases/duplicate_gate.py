@@ -0,0 +1,87 @@
+# src/use_cases/duplicate_gate.py
+
+"""
+This module implements DuplicateGate, which keeps near-duplicates of published texts
+from being posted again on the same platform (see DuplicateIndex).
+
+Generated content is compared with the published texts of its platform; above the
+similarity threshold it is generated again, up to ``max_regenerations`` times, then
+rejected with DuplicateContentError. Content posted successfully is added to the index.
+"""
+
+from typing import Callable, Iterable, Tuple
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.persistence.duplicate_index import DuplicateIndex
+from src.domain.exceptions import DuplicateContentError
+
+
+class DuplicateGate:
+    def __init__(self, index: DuplicateIndex, threshold: float = 0.8, max_regenerations: int = 2):
+        """
+        Args:
+            index (DuplicateIndex): The signatures of the published texts
+            threshold (float): Estimated Jaccard similarity from which content is a duplicate
+            max_regenerations (int): New generations attempted before rejecting a duplicate
+        """
+        self.index = index
+        self.threshold = threshold
+        self.max_regenerations = max_regenerations
+
+    def check(self, platform: str, content: str) -> None:
+        """
+        Reject content too similar to a text already published on the platform.
+
+        Raises:
+            DuplicateContentError: If the content is a near-duplicate
+        """
+        match = self.index.find(platform, content, self.threshold)
+        if match is not None:
+            logger.warning(f"{platform} content is {match['similarity']:.0%} similar to publication "
+                           f"{match['id']} ('{match['excerpt'][:40]}...')")
+            raise DuplicateContentError(
+                f"{platform} content is {match['similarity']:.0%} similar to an earlier publication",
+                similarity=match['similarity'], match_id=match['id']
+            )
+
+    def generate(self, platform: str, generate: Callable[[], str]) -> str:
+        """
+        Generate content that is not a near-duplicate, generating again if needed.
+
+        Raises:
+            DuplicateContentError: If every attempt produced a near-duplicate
+        """
+        for attempt in range(self.max_regenerations + 1):
+            content = generate()
+            try:
+                self.check(platform, content)
+                return content
+            except DuplicateContentError:
+                if attempt == self.max_regenerations:
+                    raise
+                logger.info(f"Generating {platform} content again ({attempt + 1}/{self.max_regenerations})")
+
+    def remember(self, platform: str, content: str) -> None:
+        """Index content that was just published."""
+        self.index.add(platform, content)
+
+    def backfill(self, publications: Iterable[Tuple[str, str]]) -> int:
+        """
+        Index publications posted before the gate existed, e.g. those of the outbox.
+
+        Args:
+            publications (Iterable[Tuple[str, str]]): (platform, content) pairs
+
+        Returns:
+            int: The number of publications indexed
+        """
+        count = 0
+        for platform, content in publications:
+            self.index.add(platform, content)
+            count += 1
+        if count:
+            logger.info(f"Indexed {count} earlier publications for the duplicate check")
+        return count
+
+    def close(self) -> None:
+        """Close the duplicate index."""
+        self.index.close()
@@ -0,0 +1,167 @@
+# Location: src/use_cases/generate_campaign.py
+
+"""
+This module implements the GenerateCampaignUseCase class, which generates a batch of
+publications from the topics of ``PromptBuilder.TOPICS_DATABASE``.
+
+A campaign is first planned: each topic, taken in turn from the selected categories,
+is adapted to every selected platform, so that N posts cover the categories evenly
+and no topic of a category is reused before all of them were. The plan is then
+generated with a bounded number of concurrent OpenAI requests, each publication being
+written to the campaign log as soon as it completes.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from src.interfaces.openai_gateway import OpenAIGateway
+from src.infrastructure.persistence.campaign_log import CampaignLog
+from src.infrastructure.prompting.prompt_builder import PromptBuilder, render
+from src.infrastructure.utils.concurrency import gather_bounded
+from src.infrastructure.logging.logger import logger, log_method
+from src.domain.exceptions import ContentLengthError, ValidationError
+from src.use_cases.generate_multi_platform import GenerateMultiPlatformUseCase
+
+
+class GenerateCampaignUseCase:
+    PLATFORMS = ('facebook', 'linkedin', 'twitter')
+    DEFAULT_CONCURRENCY = 4
+
+    @property
+    def categories(self) -> tuple:
+        """Topic categories of the catalog, read at each call so that reloads apply."""
+        return tuple(PromptBuilder.TOPICS_DATABASE)
+
+    @log_method(logger)
+    def __init__(self, openai_gateway: OpenAIGateway):
+        """
+        Initialize the use case with the OpenAI gateway.
+
+        Args:
+            openai_gateway (OpenAIGateway): The gateway to interact with OpenAI
+        """
+        self.openai_gateway = openai_gateway
+        logger.debug(f"GenerateCampaignUseCase initialized with {openai_gateway.__class__.__name__}")
+
+    def plan(self, count: int, platforms: Optional[List[str]] = None,
+             categories: Optional[List[str]] = None, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Plan the publications of a campaign.
+
+        Args:
+            count (int): Number of publications
+            platforms (Optional[List[str]]): Target platforms (defaults to all platforms)
+            categories (Optional[List[str]]): Topic categories, used in turn (defaults to all)
+            seed (Optional[int]): Seed of the topic and brand voice draws, for a reproducible plan
+
+        Returns:
+            List[Dict[str, Any]]: The planned items, with their 'index', 'platform',
+                'category', 'topic' and 'voice'
+
+        Raises:
+            ValidationError: If the count, a platform or a category is invalid
+        """
+        platforms = list(dict.fromkeys(platforms or self.PLATFORMS))
+        categories = list(dict.fromkeys(categories or self.categories))
+        if count < 1:
+            raise ValidationError("A campaign needs at least one publication")
+        unsupported = [p for p in platforms if p not in self.PLATFORMS]
+        unsupported += [c for c in categories if c not in self.categories]
+        if unsupported:
+            raise ValidationError(f"Unsupported platform or category: {', '.join(unsupported)}")
+
+        rng = random.Random(seed)
+        remaining = {category: [] for category in categories}
+        plan = []
+        for index in range(count):
+            block, position = divmod(index, len(platforms))
+            category = categories[block % len(categories)]
+            if position == 0:
+                # Chaque sujet est décliné sur toutes les plateformes ; une catégorie
+                # n'en réutilise aucun avant de les avoir tous épuisés
+                if not remaining[category]:
+                    remaining[category] = rng.sample(PromptBuilder.TOPICS_DATABASE[category],
+                                                     len(PromptBuilder.TOPICS_DATABASE[category]))
+                topic = remaining[category].pop()
+            plan.append({
+                'index': index,
+                'platform': platforms[position],
+                'category': category,
+                'topic': topic,
+                'voice': self._draw_voice(rng),
+            })
+        return plan
+
+    @log_method(logger)
+    def execute(self, plan: List[Dict[str, Any]], log: CampaignLog,
+                concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, int]:
+        """
+        Generate the items of a plan not yet recorded in the campaign log.
+
+        Args:
+            plan (List[Dict[str, Any]]): The planned items (see ``plan``)
+            log (CampaignLog): Where each publication is written as soon as it completes
+            concurrency (int): Maximum number of OpenAI requests in flight
+
+        Returns:
+            Dict[str, int]: The number of items 'planned', 'skipped' (generated by a
+                previous run), 'success' and 'failed'
+        """
+        return asyncio.run(self.execute_async(plan, log, concurrency))
+
+    async def execute_async(self, plan: List[Dict[str, Any]], log: CampaignLog,
+                            concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, int]:
+        """
+        Asynchronous counterpart of ``execute``, generating through ``generate_async``.
+        """
+        done = log.completed()
+        todo = [item for item in plan if item['index'] not in done]
+        if done:
+            logger.info(f"Resuming campaign: {len(plan) - len(todo)} of {len(plan)} publications already generated")
+
+        try:
+            statuses = await gather_bounded((self._generate_item(item, log) for item in todo), concurrency)
+        finally:
+            log.close()
+        summary = {
+            'planned': len(plan),
+            'skipped': len(plan) - len(todo),
+            'success': statuses.count('success'),
+            'failed': statuses.count('failed'),
+        }
+        logger.info(f"Campaign finished: {summary['success']} generated, {summary['failed']} failed, "
+                    f"{summary['skipped']} skipped")
+        return summary
+
+    async def _generate_item(self, item: Dict[str, Any], log: CampaignLog) -> str:
+        """Generate one planned item and write its record; a failure is recorded, not raised."""
+        platform = item['platform']
+        max_length = PromptBuilder.PLATFORM_GUIDELINES[platform]['max_length']
+        prompt = render(platform, item['topic'], item['voice'],
+                        GenerateMultiPlatformUseCase.PLATFORM_INSTRUCTIONS[platform])
+        record = {'index': item['index'], 'platform': platform, 'category': item['category'],
+                  'subject': item['topic']['subject']}
+        start = time.perf_counter()
+        try:
+            content = await self.openai_gateway.generate_async(prompt, max_length=max_length)
+            if len(content) > max_length:
+                raise ContentLengthError(f"{platform} publication exceeds {max_length} characters ({len(content)})")
+            record.update(status='success', content=content, error=None)
+        except Exception as e:
+            logger.error(f"Campaign item {item['index']} ({platform}) failed: {str(e)}")
+            record.update(status='failed', content=None, error=str(e))
+        record['elapsed'] = round(time.perf_counter() - start, 3)
+        # Les coroutines s'exécutent dans une seule boucle : les écritures ne s'entrelacent pas
+        log.append(record)
+        return record['status']
+
+    @staticmethod
+    def _draw_voice(rng: random.Random) -> Dict:
+        # Même tirage que random_voice, mais reproductible avec la graine de la campagne
+        return {
+            'style': rng.choice(PromptBuilder.BRAND_STYLES),
+            'tone': rng.choice(PromptBuilder.BRAND_TONES),
+            'personality': rng.choice(PromptBuilder.BRAND_PERSONALITIES),
+        }
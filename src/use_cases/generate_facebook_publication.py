@@ -6,35 +6,54 @@ the business logic for generating Facebook publications using OpenAI. It handles
 the coordination between the OpenAI gateway and publication generation process.
 """
 import random
+from typing import Optional
 
 from src.interfaces.openai_gateway import OpenAIGateway
-from src.infrastructure.prompting.prompt_builder import PromptBuilder
+from src.infrastructure.prompting.prompt_builder import PromptBuilder, random_topic, random_voice, render
+from src.infrastructure.prompting.topic_rotation import TopicRotation
 from src.infrastructure.logging.logger import logger, log_method
 from src.domain.exceptions import AutomatorError, OpenAIError, FacebookGenerationError
 
 
 class GenerateFacebookPublicationUseCase:
+    CUSTOM_INSTRUCTIONS = (
+        "Ensure the content is engaging and suited for Facebook's algorithm. "
+        "Include a mix of storytelling and business value."
+    )
+
+    @property
+    def max_length(self) -> int:
+        """Length limit of the platform, read from the catalog at each call so that reloads apply."""
+        return PromptBuilder.PLATFORM_GUIDELINES['facebook']['max_length']
+
     @log_method(logger)
-    def __init__(self, openai_gateway: OpenAIGateway):
+    def __init__(self, openai_gateway: OpenAIGateway, rotation: Optional[TopicRotation] = None):
         """
-        Initialize the use case with OpenAI gateway and PromptBuilder.
+        Initialize the use case with the OpenAI gateway.
 
         Args:
             openai_gateway (OpenAIGateway): The gateway to interact with OpenAI
+            rotation (Optional[TopicRotation]): Picks the topic and brand voice of each prompt
+                (drawn at random if None)
         """
         try:
             self.openai_gateway = openai_gateway
-            self.prompt_builder = PromptBuilder()
+            self.rotation = rotation
+            # Dernier choix de la rotation, à enregistrer une fois la publication postée
+            self.selection = None
             logger.debug(f"GenerateFacebookPublicationUseCase initialized with {openai_gateway.__class__.__name__}")
         except Exception as e:
             logger.error(f"Failed to initialize Facebook publication generator: {str(e)}")
             raise FacebookGenerationError(f"Initialization failed: {str(e)}")
 
     @log_method(logger)
-    def execute(self) -> str:
+    def execute(self, topic_category: Optional[str] = None) -> str:
         """
         Execute the use case to generate Facebook publication content.
 
+        Args:
+            topic_category (Optional[str]): Topic category of the prompt (any if None)
+
         Returns:
             str: The generated Facebook publication content
 
@@ -42,25 +61,11 @@ class GenerateFacebookPublicationUseCase:
             FacebookGenerationError: If publication generation fails
         """
         try:
-            # define topics to choice
-            topic_category = ['business', 'developer', 'slides']
-            random_topic = random.choice(topic_category)
-            # Reset any previous configuration
-            self.prompt_builder.reset()
-
-            # Configure and build the prompt
-            prompt = (self.prompt_builder
-                      .set_platform_and_topic_category('facebook', random_topic)
-                      .add_custom_instructions(
-                "Ensure the content is engaging and suited for Facebook's algorithm. "
-                "Include a mix of storytelling and business value."
-            )
-                      .build())
-
+            prompt = self._build_prompt(topic_category)
             logger.debug("Prompt built successfully, generating Facebook publication")
 
             # Generate the publication using OpenAI
-            generated_publication = self.openai_gateway.generate(prompt)
+            generated_publication = self.openai_gateway.generate(prompt, max_length=self.max_length)
             logger.debug(f"Facebook publication generated successfully: {generated_publication[:100]}...")
 
             return generated_publication
@@ -70,4 +75,50 @@ class GenerateFacebookPublicationUseCase:
             raise FacebookGenerationError(f"Error generating Facebook publication: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in GenerateFacebookPublicationUseCase: {str(e)}")
-            raise FacebookGenerationError(f"Unexpected error generating Facebook publication: {str(e)}")
\ No newline at end of file
+            raise FacebookGenerationError(f"Unexpected error generating Facebook publication: {str(e)}")
+
+    @log_method(logger)
+    async def execute_async(self, topic_category: Optional[str] = None) -> str:
+        """
+        Asynchronous counterpart of ``execute``, generating through ``generate_async``.
+
+        Args:
+            topic_category (Optional[str]): Topic category of the prompt (any if None)
+
+        Returns:
+            str: The generated Facebook publication content
+
+        Raises:
+            FacebookGenerationError: If publication generation fails
+        """
+        try:
+            prompt = self._build_prompt(topic_category)
+            logger.debug("Prompt built successfully, generating Facebook publication asynchronously")
+
+            generated_publication = await self.openai_gateway.generate_async(prompt, max_length=self.max_length)
+            logger.debug(f"Facebook publication generated successfully: {generated_publication[:100]}...")
+
+            return generated_publication
+
+        except OpenAIError as e:
+            logger.error(f"OpenAI error in GenerateFacebookPublicationUseCase: {str(e)}")
+            raise FacebookGenerationError(f"Error generating Facebook publication: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error in GenerateFacebookPublicationUseCase: {str(e)}")
+            raise FacebookGenerationError(f"Unexpected error generating Facebook publication: {str(e)}")
+
+    def _build_prompt(self, topic_category: Optional[str] = None) -> str:
+        """
+        Build the Facebook prompt for the next topic and voice of the rotation,
+        or for a random topic and voice without rotation, in the given category if any.
+
+        Returns:
+            str: The prompt to send to the OpenAI gateway
+        """
+        # Rendu direct du gabarit précompilé, sans passer par le builder et ses journaux
+        if self.rotation is not None:
+            self.selection = self.rotation.select('facebook', topic_category)
+            _, topic, voice = self.selection
+            return render('facebook', topic, voice, self.CUSTOM_INSTRUCTIONS)
+        topic_category = topic_category or random.choice(list(PromptBuilder.TOPICS_DATABASE))
+        return render('facebook', random_topic(topic_category), random_voice(), self.CUSTOM_INSTRUCTIONS)
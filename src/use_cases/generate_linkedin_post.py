@@ -1,33 +1,53 @@
 import random
+from typing import Optional
 
 from src.interfaces.openai_gateway import OpenAIGateway
-from src.infrastructure.prompting.prompt_builder import PromptBuilder
+from src.infrastructure.prompting.prompt_builder import PromptBuilder, random_topic, random_voice, render
+from src.infrastructure.prompting.topic_rotation import TopicRotation
 from src.infrastructure.logging.logger import logger, log_method
 from src.domain.exceptions import AutomatorError, OpenAIError, LinkedInGenerationError
 
 
 class GenerateLinkedInPostUseCase:
+    CUSTOM_INSTRUCTIONS = (
+        "Focus on professional insights and industry expertise. "
+        "Include specific achievements or metrics when possible. "
+        "Maintain a thought leadership tone suitable for LinkedIn's professional audience."
+    )
+
+    @property
+    def max_length(self) -> int:
+        """Length limit of the platform, read from the catalog at each call so that reloads apply."""
+        return PromptBuilder.PLATFORM_GUIDELINES['linkedin']['max_length']
+
     @log_method(logger)
-    def __init__(self, openai_gateway: OpenAIGateway):
+    def __init__(self, openai_gateway: OpenAIGateway, rotation: Optional[TopicRotation] = None):
         """
-        Initialize the use case with OpenAI gateway and PromptBuilder.
+        Initialize the use case with the OpenAI gateway.
 
         Args:
             openai_gateway (OpenAIGateway): The gateway to interact with OpenAI
+            rotation (Optional[TopicRotation]): Picks the topic and brand voice of each prompt
+                (drawn at random if None)
         """
         try:
             self.openai_gateway = openai_gateway
-            self.prompt_builder = PromptBuilder()
+            self.rotation = rotation
+            # Dernier choix de la rotation, à enregistrer une fois la publication postée
+            self.selection = None
             logger.debug(f"GenerateLinkedInPostUseCase initialized with {openai_gateway.__class__.__name__}")
         except Exception as e:
             logger.error(f"Failed to initialize LinkedIn post generator: {str(e)}")
             raise LinkedInGenerationError(f"Initialization failed: {str(e)}")
 
     @log_method(logger)
-    def execute(self) -> str:
+    def execute(self, topic_category: Optional[str] = None) -> str:
         """
         Execute the use case to generate LinkedIn post content.
 
+        Args:
+            topic_category (Optional[str]): Topic category of the prompt (any if None)
+
         Returns:
             str: The generated LinkedIn post content
 
@@ -35,27 +55,48 @@ class GenerateLinkedInPostUseCase:
             LinkedInGenerationError: If post generation fails
         """
         try:
-            topic_category = ['business', 'developer', 'slides']
-            random_topic = random.choice(topic_category)
-            self.prompt_builder.reset()
-
-            # Configure and build the prompt
-            prompt = (self.prompt_builder
-                      .set_platform_and_topic_category('linkedin', random_topic)
-                      .add_custom_instructions(
-                "Focus on professional insights and industry expertise. "
-                "Include specific achievements or metrics when possible. "
-                "Maintain a thought leadership tone suitable for LinkedIn's professional audience."
-            )
-                      .build())
+            prompt = self._build_prompt(topic_category)
 
             # Log the prompt for debugging
             logger.debug(f"Generated prompt: {prompt}")
 
             # Generate the post using the OpenAI gateway
-            post_content = self.openai_gateway.generate(prompt)
+            post_content = self.openai_gateway.generate(prompt, max_length=self.max_length)
             return post_content
         except OpenAIError as e:
             raise LinkedInGenerationError(f"Error generating LinkedIn post: {str(e)}")
         except Exception as e:
-            raise LinkedInGenerationError(f"Unexpected error generating LinkedIn post: {str(e)}")
\ No newline at end of file
+            raise LinkedInGenerationError(f"Unexpected error generating LinkedIn post: {str(e)}")
+
+    @log_method(logger)
+    async def execute_async(self, topic_category: Optional[str] = None) -> str:
+        """
+        Asynchronous counterpart of ``execute``, generating through ``generate_async``.
+
+        Args:
+            topic_category (Optional[str]): Topic category of the prompt (any if None)
+
+        Returns:
+            str: The generated LinkedIn post content
+
+        Raises:
+            LinkedInGenerationError: If post generation fails
+        """
+        try:
+            prompt = self._build_prompt(topic_category)
+            logger.debug(f"Generated prompt: {prompt}")
+
+            return await self.openai_gateway.generate_async(prompt, max_length=self.max_length)
+        except OpenAIError as e:
+            raise LinkedInGenerationError(f"Error generating LinkedIn post: {str(e)}")
+        except Exception as e:
+            raise LinkedInGenerationError(f"Unexpected error generating LinkedIn post: {str(e)}")
+
+    def _build_prompt(self, topic_category: Optional[str] = None) -> str:
+        # Rendu direct du gabarit précompilé, sans passer par le builder et ses journaux
+        if self.rotation is not None:
+            self.selection = self.rotation.select('linkedin', topic_category)
+            _, topic, voice = self.selection
+            return render('linkedin', topic, voice, self.CUSTOM_INSTRUCTIONS)
+        topic_category = topic_category or random.choice(list(PromptBuilder.TOPICS_DATABASE))
+        return render('linkedin', random_topic(topic_category), random_voice(), self.CUSTOM_INSTRUCTIONS)
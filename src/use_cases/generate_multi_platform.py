@@ -0,0 +1,104 @@
+# Location: src/use_cases/generate_multi_platform.py
+
+"""
+This module implements the GenerateMultiPlatformUseCase class, which generates the
+publications of several platforms with a single OpenAI request. The topic, brand voice
+and formatting rules are shared, and each platform keeps its own structure, length
+limit and custom instructions.
+"""
+
+import random
+from typing import Dict, List, Optional
+
+from src.interfaces.openai_gateway import OpenAIGateway
+from src.infrastructure.prompting.prompt_builder import PromptBuilder
+from src.infrastructure.prompting.topic_rotation import TopicRotation
+from src.infrastructure.logging.logger import logger, log_method
+from src.domain.exceptions import OpenAIError
+from src.use_cases.generate_facebook_publication import GenerateFacebookPublicationUseCase
+from src.use_cases.generate_linkedin_post import GenerateLinkedInPostUseCase
+from src.use_cases.generate_tweet import GenerateTweetUseCase
+
+
+class GenerateMultiPlatformUseCase:
+    # Consignes propres à chaque plateforme, identiques à celles des générations unitaires
+    PLATFORM_INSTRUCTIONS = {
+        'facebook': GenerateFacebookPublicationUseCase.CUSTOM_INSTRUCTIONS,
+        'linkedin': GenerateLinkedInPostUseCase.CUSTOM_INSTRUCTIONS,
+        'twitter': GenerateTweetUseCase.CUSTOM_INSTRUCTIONS,
+    }
+
+    @log_method(logger)
+    def __init__(self, openai_gateway: OpenAIGateway, rotation: Optional[TopicRotation] = None):
+        """
+        Initialize the use case with OpenAI gateway and PromptBuilder.
+
+        Args:
+            openai_gateway (OpenAIGateway): The gateway to interact with OpenAI
+            rotation (Optional[TopicRotation]): Picks the shared topic and brand voice
+                (drawn at random if None)
+        """
+        try:
+            self.openai_gateway = openai_gateway
+            self.prompt_builder = PromptBuilder(rotation)
+            logger.debug(f"GenerateMultiPlatformUseCase initialized with {openai_gateway.__class__.__name__}")
+        except Exception as e:
+            logger.error(f"Failed to initialize multi-platform generator: {str(e)}")
+            raise OpenAIError(f"Initialization failed: {str(e)}")
+
+    @property
+    def selection(self):
+        """The last pick of the rotation, to record once the publications are posted (None without rotation)."""
+        return self.prompt_builder.selection
+
+    @log_method(logger)
+    def execute(self, platforms: Optional[List[str]] = None, topic_category: Optional[str] = None) -> Dict[str, str]:
+        """
+        Generate one publication per platform on a shared topic in a single request.
+
+        Args:
+            platforms (Optional[List[str]]): Target platforms (defaults to all platforms)
+            topic_category (Optional[str]): Topic category (defaults to a random one)
+
+        Returns:
+            Dict[str, str]: The generated content of each platform
+
+        Raises:
+            OpenAIError: If generation fails or a variant is missing or too long
+        """
+        try:
+            prompt, specs = self._build_prompt(platforms, topic_category)
+            logger.debug("Multi-platform prompt built successfully, generating publications")
+            return self.openai_gateway.generate_many(prompt, specs)
+        except OpenAIError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in GenerateMultiPlatformUseCase: {str(e)}")
+            raise OpenAIError(f"Unexpected error generating multi-platform publications: {str(e)}")
+
+    @log_method(logger)
+    async def execute_async(self, platforms: Optional[List[str]] = None,
+                            topic_category: Optional[str] = None) -> Dict[str, str]:
+        """
+        Asynchronous counterpart of ``execute``, generating through ``generate_many_async``.
+        """
+        try:
+            prompt, specs = self._build_prompt(platforms, topic_category)
+            return await self.openai_gateway.generate_many_async(prompt, specs)
+        except OpenAIError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in GenerateMultiPlatformUseCase: {str(e)}")
+            raise OpenAIError(f"Unexpected error generating multi-platform publications: {str(e)}")
+
+    def _build_prompt(self, platforms: Optional[List[str]], topic_category: Optional[str]):
+        """
+        Build the shared prompt and the per-platform output specifications.
+        """
+        platforms = list(dict.fromkeys(platforms or self.PLATFORM_INSTRUCTIONS))
+        if self.prompt_builder.rotation is None:
+            topic_category = topic_category or random.choice(list(PromptBuilder.TOPICS_DATABASE))
+        instructions = {platform: self.PLATFORM_INSTRUCTIONS.get(platform, "") for platform in platforms}
+
+        prompt = self.prompt_builder.build_many(instructions, topic_category)
+        return prompt, self.prompt_builder.platform_specs(platforms)
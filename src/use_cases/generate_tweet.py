@@ -1,74 +1,200 @@
 # src/use_cases/generate_tweet.py
 
 import random
+from typing import List, Optional
 
 from src.interfaces.openai_gateway import OpenAIGateway
-from src.infrastructure.prompting.prompt_builder import PromptBuilder
+from src.infrastructure.prompting.prompt_builder import PromptBuilder, random_topic, random_voice, render
+from src.infrastructure.prompting.topic_rotation import TopicRotation
 from src.infrastructure.logging.logger import logger, log_method
-from src.domain.exceptions import AutomatorError, OpenAIError, TweetGenerationError
+from src.domain.exceptions import AutomatorError, OpenAIError, ContentLengthError, TweetGenerationError, TweetLengthError
 
 
 class GenerateTweetUseCase:
+    # Longueur visée par les instructions du prompt ; la limite imposée par X (max_length) vient du catalogue
+    TARGET_LENGTH = 250
+    DEFAULT_MAX_ATTEMPTS = 3
+
+    CUSTOM_INSTRUCTIONS = (
+        "Ensure the tweet is attention-grabbing and concise. "
+        "Maximum 250 characters including hashtags. "
+        "Include 2-3 relevant hashtags and make every word count. "
+        "Focus on immediate value and shareability."
+    )
+
+    @property
+    def max_length(self) -> int:
+        """Length limit of the platform, read from the catalog at each call so that reloads apply."""
+        return PromptBuilder.PLATFORM_GUIDELINES['twitter']['max_length']
+
     @log_method(logger)
-    def __init__(self, openai_gateway: OpenAIGateway):
+    def __init__(self, openai_gateway: OpenAIGateway, candidates: int = 1,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, rotation: Optional[TopicRotation] = None):
         """
-        Initialize the use case with OpenAI gateway and PromptBuilder.
+        Initialize the use case with the OpenAI gateway.
 
         Args:
             openai_gateway (OpenAIGateway): The gateway to interact with OpenAI
+            candidates (int): Number of tweets requested per attempt; above 1, they are
+                generated with one request and the best one within the limit is kept
+            max_attempts (int): Maximum number of generation requests before giving up
+            rotation (Optional[TopicRotation]): Picks the topic and brand voice of each prompt
+                (drawn at random if None)
         """
+        if candidates < 1 or max_attempts < 1:
+            raise TweetGenerationError("candidates and max_attempts must be at least 1")
         try:
             self.openai_gateway = openai_gateway
-            self.prompt_builder = PromptBuilder()
+            self.rotation = rotation
+            # Dernier choix de la rotation, à enregistrer une fois la publication postée
+            self.selection = None
+            self.candidates = candidates
+            self.max_attempts = max_attempts
             logger.debug(f"GenerateTweetUseCase initialized with {openai_gateway.__class__.__name__}")
         except Exception as e:
             logger.error(f"Failed to initialize tweet generator: {str(e)}")
             raise TweetGenerationError(f"Initialization failed: {str(e)}")
 
     @log_method(logger)
-    def execute(self) -> str:
+    def execute(self, topic_category: Optional[str] = None) -> str:
         """
         Execute the use case to generate tweet content.
 
+        Args:
+            topic_category (Optional[str]): Topic category of the prompt (any if None)
+
+        Returns:
+            str: The generated tweet content
+
+        Raises:
+            TweetLengthError: If no tweet fits the limit after ``max_attempts`` requests
+            TweetGenerationError: If tweet generation fails
+        """
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                prompt = self._build_prompt(topic_category)
+                logger.debug("Prompt built successfully, generating tweet")
+
+                if self.candidates == 1:
+                    candidates = self._generate_single(prompt)
+                else:
+                    candidates = self.openai_gateway.generate_candidates(prompt, self.candidates,
+                                                                       max_length=self.max_length)
+
+                tweet = self._select_candidate(candidates, attempt)
+                if tweet is not None:
+                    return tweet
+            raise self._length_error()
+
+        except TweetGenerationError:
+            raise
+        except OpenAIError as e:
+            logger.error(f"OpenAI error in GenerateTweetUseCase: {str(e)}")
+            raise TweetGenerationError(f"Error generating tweet: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error in GenerateTweetUseCase: {str(e)}")
+            raise TweetGenerationError(f"Unexpected error generating tweet: {str(e)}")
+
+    @log_method(logger)
+    async def execute_async(self, topic_category: Optional[str] = None) -> str:
+        """
+        Asynchronous counterpart of ``execute``, generating through ``generate_async``.
+
+        Args:
+            topic_category (Optional[str]): Topic category of the prompt (any if None)
+
         Returns:
             str: The generated tweet content
 
         Raises:
+            TweetLengthError: If no tweet fits the limit after ``max_attempts`` requests
             TweetGenerationError: If tweet generation fails
         """
         try:
-            topic_category = ['business', 'developer', 'slides']
-            random_topic = random.choice(topic_category)
-            # Reset any previous configuration
-            self.prompt_builder.reset()
-
-            # Configure and build the prompt
-            prompt = (self.prompt_builder
-                      .set_platform_and_topic_category('twitter', random_topic)
-                      .add_custom_instructions(
-                "Ensure the tweet is attention-grabbing and concise. "
-                "Maximum 250 characters including hashtags. "
-                "Include 2-3 relevant hashtags and make every word count. "
-                "Focus on immediate value and shareability."
-            )
-                      .build())
-
-            logger.debug("Prompt built successfully, generating tweet")
-
-            # Generate the tweet using OpenAI
-            generated_tweet = self.openai_gateway.generate(prompt)
-            logger.debug(f"Tweet generated successfully: {generated_tweet}")
-
-            # Vérifier la longueur du tweet
-            if len(generated_tweet) > 280:
-                logger.warning(f"Generated tweet exceeds 250 characters ({len(generated_tweet)}), retrying...")
-                return self.execute()  # Recursive retry
-
-            return generated_tweet
+            for attempt in range(1, self.max_attempts + 1):
+                prompt = self._build_prompt(topic_category)
+                logger.debug("Prompt built successfully, generating tweet asynchronously")
 
+                if self.candidates == 1:
+                    candidates = await self._generate_single_async(prompt)
+                else:
+                    candidates = await self.openai_gateway.generate_candidates_async(
+                        prompt, self.candidates, max_length=self.max_length
+                    )
+
+                tweet = self._select_candidate(candidates, attempt)
+                if tweet is not None:
+                    return tweet
+            raise self._length_error()
+
+        except TweetGenerationError:
+            raise
         except OpenAIError as e:
             logger.error(f"OpenAI error in GenerateTweetUseCase: {str(e)}")
             raise TweetGenerationError(f"Error generating tweet: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in GenerateTweetUseCase: {str(e)}")
             raise TweetGenerationError(f"Unexpected error generating tweet: {str(e)}")
+
+    def _generate_single(self, prompt: str) -> List[str]:
+        """
+        Generate one tweet; a streamed generation aborted for its length yields no candidate.
+        """
+        try:
+            return [self.openai_gateway.generate(prompt, max_length=self.max_length)]
+        except ContentLengthError as e:
+            logger.warning(str(e))
+            return []
+
+    async def _generate_single_async(self, prompt: str) -> List[str]:
+        """Asynchronous counterpart of ``_generate_single``."""
+        try:
+            return [await self.openai_gateway.generate_async(prompt, max_length=self.max_length)]
+        except ContentLengthError as e:
+            logger.warning(str(e))
+            return []
+
+    def _select_candidate(self, candidates: List[str], attempt: int) -> Optional[str]:
+        """
+        Pick the best candidate within the character limit.
+
+        Candidates within the length targeted by the prompt are preferred, and among
+        them the longest, which carries the most content; otherwise the shortest one
+        within the limit is kept.
+
+        Returns:
+            Optional[str]: The selected tweet, or None if every candidate is too long
+        """
+        fitting = [tweet for tweet in candidates if tweet and len(tweet) <= self.max_length]
+        if not fitting:
+            lengths = ', '.join(str(len(tweet or '')) for tweet in candidates) or 'aborted'
+            logger.warning(f"Generated tweets exceed {self.max_length} characters ({lengths}), "
+                           f"attempt {attempt}/{self.max_attempts}")
+            return None
+
+        within_target = [tweet for tweet in fitting if len(tweet) <= self.TARGET_LENGTH]
+        tweet = max(within_target, key=len) if within_target else min(fitting, key=len)
+        logger.debug(f"Tweet generated successfully: {tweet}")
+        return tweet
+
+    def _length_error(self) -> TweetLengthError:
+        logger.error(f"No tweet within {self.max_length} characters after {self.max_attempts} attempts")
+        return TweetLengthError(
+            f"No tweet within {self.max_length} characters after {self.max_attempts} attempts"
+        )
+
+    def _build_prompt(self, topic_category: Optional[str] = None) -> str:
+        """
+        Build the tweet prompt for the next topic and voice of the rotation,
+        or for a random topic and voice without rotation, in the given category if any.
+
+        Returns:
+            str: The prompt to send to the OpenAI gateway
+        """
+        # Rendu direct du gabarit précompilé, sans passer par le builder et ses journaux
+        if self.rotation is not None:
+            self.selection = self.rotation.select('twitter', topic_category)
+            _, topic, voice = self.selection
+            return render('twitter', topic, voice, self.CUSTOM_INSTRUCTIONS)
+        topic_category = topic_category or random.choice(list(PromptBuilder.TOPICS_DATABASE))
+        return render('twitter', random_topic(topic_category), random_voice(), self.CUSTOM_INSTRUCTIONS)
@@ -0,0 +1,173 @@
+# src/use_cases/outbox_publisher.py
+
+"""
+This module implements OutboxPublisher, which routes every generation and post of the
+presentation layer through the outbox (see OutboxStore):
+
+- before generating, a publication left pending by a previous run is claimed and
+  reused, so a rerun after a failed or interrupted post does not pay for a new OpenAI
+  request; concurrent posts of a platform never claim the same one, and a run asking
+  for a topic category only reuses a publication of that category
+- a generated publication is recorded, with its category, before it is posted
+- a publication is marked 'posting' just before the request and 'published' with the
+  returned post id right after it; content already published is not posted again
+- a post that failed temporarily (throttling, outage) is left pending for the next run,
+  one refused for good is marked 'failed', so that it does not block the platform
+
+With a DuplicateGate, generated content too similar to an earlier publication of its
+platform is generated again or rejected before it is recorded, and published content
+is added to the duplicate index. Without a store, the publisher simply generates and
+posts.
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.persistence.outbox_store import OutboxStore
+from src.use_cases.duplicate_gate import DuplicateGate
+from src.domain.exceptions import AutomatorError
+
+
+def extract_post_id(result: Any) -> Optional[str]:
+    """
+    Extract the post id from a platform response.
+
+    Facebook and LinkedIn return ``{"id": ...}``, X returns ``{"data": {"id": ...}}``.
+    """
+    if not isinstance(result, dict):
+        return None
+    if 'id' in result:
+        return result['id']
+    data = result.get('data')
+    return data.get('id') if isinstance(data, dict) else None
+
+
+class OutboxPublisher:
+    def __init__(self, store: Optional[OutboxStore] = None, stale_after: float = 3600.0,
+                 gate: Optional[DuplicateGate] = None):
+        """
+        Open the publisher; publications interrupted while posting by a previous
+        process are marked 'unknown' (see ``OutboxStore.recover``).
+
+        Args:
+            store (Optional[OutboxStore]): The outbox; None to post without recording
+            stale_after (float): Age after which a publication being posted is considered interrupted
+            gate (Optional[DuplicateGate]): Near-duplicate check; None to post any content
+        """
+        self.store = store
+        self.gate = gate
+        self.stale_after = stale_after
+        if store is not None:
+            store.recover(stale_after)
+
+    def prepare(self, platform: str, generate: Callable[[], str], category: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return the publication to post on a platform: the oldest pending one, claimed,
+        or a new one generated and recorded.
+
+        Args:
+            platform (str): Target platform
+            generate (Callable[[], str]): Generates the content when nothing is pending
+            category (Optional[str]): Topic category of the publication (any if None)
+
+        Returns:
+            Dict[str, Any]: The outbox item ('id' is None without a store)
+
+        Raises:
+            DuplicateContentError: If every generation was a near-duplicate (see DuplicateGate)
+        """
+        item = self.claim_pending(platform, category)
+        if item is not None:
+            logger.info(f"Resuming {platform} publication {item['id']} from the outbox, "
+                        f"without generating a new one")
+            return item
+        content = self.gate.generate(platform, generate) if self.gate is not None else generate()
+        return self._add(platform, content, category)
+
+    def claim_pending(self, platform: str, category: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Claim the oldest publication of a platform waiting to be posted, if any, so that
+        no concurrent post takes it (see ``OutboxStore.claim_pending``).
+        """
+        if self.store is None:
+            return None
+        return self.store.claim_pending(platform, category, self.stale_after)
+
+    def unclaim(self, item: Dict[str, Any]) -> None:
+        """Hand back a publication that will not be posted after all; posted ones are left alone."""
+        if self.store is not None and item['id'] is not None:
+            self.store.unclaim(item['id'])
+
+    def record(self, platform: str, content: str, category: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Record already generated content, returning its outbox item.
+
+        Raises:
+            DuplicateContentError: If the content is a near-duplicate (see DuplicateGate)
+        """
+        if self.gate is not None:
+            self.gate.check(platform, content)
+        return self._add(platform, content, category)
+
+    def _add(self, platform: str, content: str, category: Optional[str] = None) -> Dict[str, Any]:
+        if self.store is None:
+            return {'id': None, 'platform': platform, 'content': content, 'status': 'pending'}
+        return self.store.add(platform, content, category)
+
+    def post(self, item: Dict[str, Any], post: Callable[[str], Any]) -> Any:
+        """
+        Post a publication once.
+
+        Args:
+            item (Dict[str, Any]): The outbox item returned by ``prepare`` or ``record``
+            post (Callable[[str], Any]): Posts the content and returns the platform response
+
+        Returns:
+            Any: The platform response (the recorded one if the content was already published)
+
+        Raises:
+            AutomatorError: If the publication is being posted by another process, or its
+                previous post was interrupted and its outcome is unknown
+        """
+        if item['id'] is None:
+            result = post(item['content'])
+            self._remember(item)
+            return result
+
+        if item['status'] == 'published':
+            logger.warning(f"{item['platform']} publication {item['id']} was already published "
+                           f"(post {item['post_id']}), not posting it again")
+            return json.loads(item['result']) if item['result'] else None
+        if not self.store.begin_posting(item['id']):
+            current = self.store.get(item['id'])
+            raise AutomatorError(f"{item['platform']} publication {item['id']} cannot be posted "
+                                 f"(status: {current['status'] if current else 'missing'})")
+
+        try:
+            result = post(item['content'])
+        except Exception as e:
+            if getattr(e, 'transient', False):
+                self.store.release(item['id'], str(e))
+            else:
+                # Une erreur définitive se répéterait à chaque exécution : la publication est écartée
+                self.store.mark_failed(item['id'], str(e))
+                logger.error(f"{item['platform']} publication {item['id']} was refused and marked failed; "
+                             f"fix the cause then requeue it, or discard it")
+            raise
+        self.store.mark_published(item['id'], extract_post_id(result), result)
+        self._remember(item)
+        return result
+
+    def close(self) -> None:
+        """Close the outbox; the duplicate gate is left to its owner."""
+        if self.store is not None:
+            self.store.close()
+
+    def _remember(self, item: Dict[str, Any]) -> None:
+        """Add published content to the duplicate index; a failure there must not fail the post."""
+        if self.gate is None:
+            return
+        try:
+            self.gate.remember(item['platform'], item['content'])
+        except Exception as e:
+            logger.error(f"Failed to index {item['platform']} publication for the duplicate check: {str(e)}")
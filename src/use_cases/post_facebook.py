@@ -50,4 +50,38 @@ class PostFacebookUseCase:
             return result
         except Exception as e:
             logger.error(f"Error in PostFacebookUseCase: {str(e)}")
-            raise AutomatorError(f"Failed to post to Facebook: {str(e)}")
\ No newline at end of file
+            # Le caractère temporaire de l'erreur décide si l'outbox retente la publication
+            raise AutomatorError(f"Failed to post to Facebook: {str(e)}", transient=getattr(e, 'transient', False),
+                                 retry_after=getattr(e, 'retry_after', None),
+                                 status_code=getattr(e, 'status_code', None)) from e
+
+    @log_method(logger)
+    async def execute_async(self, publication_text: str, privacy: str = "PUBLIC"):
+        """
+        Asynchronous counterpart of ``execute``, posting through ``post_async``.
+
+        Args:
+            publication_text (str): The text content to post
+            privacy (str): Privacy setting for the post ("PUBLIC", "FRIENDS", "ONLY_ME")
+
+        Returns:
+            dict: Response from the Facebook API containing the post data
+
+        Raises:
+            AutomatorError: If there's an error during execution
+        """
+        try:
+            publication = FacebookPublication(publication_text, privacy)
+            logger.debug("FacebookPublication entity created")
+
+            logger.debug("Posting to Facebook via FacebookGateway (async)")
+            result = await self.facebook_gateway.post_async(publication)
+            logger.debug(f"Facebook post created, result: {result}")
+
+            return result
+        except Exception as e:
+            logger.error(f"Error in PostFacebookUseCase: {str(e)}")
+            # Le caractère temporaire de l'erreur décide si l'outbox retente la publication
+            raise AutomatorError(f"Failed to post to Facebook: {str(e)}", transient=getattr(e, 'transient', False),
+                                 retry_after=getattr(e, 'retry_after', None),
+                                 status_code=getattr(e, 'status_code', None)) from e
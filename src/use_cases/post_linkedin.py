@@ -35,4 +35,22 @@ class PostLinkedInUseCase:
             raise
         except Exception as e:
             logger.error(f"Unexpected error in PostLinkedInUseCase: {str(e)}")
-            raise AutomatorError(f"Unexpected error: {str(e)}")
\ No newline at end of file
+            raise AutomatorError(f"Unexpected error: {str(e)}")
+
+    @log_method(logger)
+    async def execute_async(self, post_text: str):
+        try:
+            linkedin_post = LinkedInPublication(post_text)
+            logger.debug("LinkedInPost entity created")
+
+            logger.debug("Posting to LinkedIn via LinkedInGateway (async)")
+            result = await self.linkedin_gateway.post_async(linkedin_post)
+            logger.debug(f"LinkedIn post created, result: {result}")
+
+            return result
+        except AutomatorError as e:
+            logger.error(f"Error in PostLinkedInUseCase: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in PostLinkedInUseCase: {str(e)}")
+            raise AutomatorError(f"Unexpected error: {str(e)}")
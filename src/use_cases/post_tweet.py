@@ -36,4 +36,23 @@ class PostTweetUseCase:
             raise
         except Exception as e:
             logger.error(f"Unexpected error in PostTweetUseCase: {str(e)}")
-            raise AutomatorError(f"Unexpected error: {str(e)}")
\ No newline at end of file
+            raise AutomatorError(f"Unexpected error: {str(e)}")
+
+    @log_method(logger)
+    async def execute_async(self, tweet_text: str):
+        try:
+            tweet = Tweet(tweet_text)
+            tweet.validate()
+            logger.debug("Tweet entity created")
+
+            logger.debug("Posting tweet via TwitterGateway (async)")
+            result = await self.twitter_gateway.post_tweet_async(tweet)
+            logger.debug(f"Tweet posted, result: {result}")
+
+            return result
+        except AutomatorError as e:
+            logger.error(f"Error in PostTweetUseCase: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in PostTweetUseCase: {str(e)}")
+            raise AutomatorError(f"Unexpected error: {str(e)}")
@@ -0,0 +1,45 @@
+# tests/conftest.py
+
+"""
+Shared fixtures of the test suite.
+"""
+
+import pytest
+from src.infrastructure.external.facebook_token_cache import reset_page_token_cache
+from src.infrastructure.container import reset_container
+from src.infrastructure.prompting.catalog import reset_catalog
+
+
+@pytest.fixture(autouse=True)
+def isolated_page_token_cache(tmp_path, monkeypatch):
+    """
+    Keep the Facebook page token cache of each test in memory and in a temporary file,
+    so that tests neither share tokens nor write to the working directory.
+    """
+    monkeypatch.setenv('FACEBOOK_TOKEN_CACHE_PATH', str(tmp_path / 'facebook_page_tokens.json'))
+    reset_page_token_cache()
+    yield
+    reset_page_token_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_container(tmp_path, monkeypatch):
+    """
+    Give each test a fresh process-wide container, with its response cache, its outbox,
+    its rotation history and its duplicate index in temporary files, so that gateways
+    built (or mocked) by one test never leak into another.
+    """
+    monkeypatch.setenv('OPENAI_CACHE_PATH', str(tmp_path / 'openai_responses.sqlite3'))
+    monkeypatch.setenv('OUTBOX_PATH', str(tmp_path / 'outbox.sqlite3'))
+    monkeypatch.setenv('ROTATION_PATH', str(tmp_path / 'rotation.sqlite3'))
+    monkeypatch.setenv('DEDUP_PATH', str(tmp_path / 'dedup.sqlite3'))
+    reset_container()
+    yield
+    reset_container()
+
+
+@pytest.fixture(autouse=True)
+def isolated_catalog():
+    """Reload the prompt catalog after each test, so that a test catalog never leaks into another."""
+    yield
+    reset_catalog()
@@ -114,5 +114,20 @@ def test_error_inheritance():
     assert issubclass(OdooPublicationError, OdooError)
 
 
+def test_error_classification_defaults():
+    error = TwitterError("Test TwitterError")
+    assert error.transient is False
+    assert error.retry_after is None
+    assert error.status_code is None
+    assert str(error) == "Test TwitterError"
+
+
+def test_error_classification():
+    error = FacebookError("Throttled", transient=True, retry_after=30.0, status_code=429)
+    assert error.transient is True
+    assert error.retry_after == 30.0
+    assert error.status_code == 429
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -0,0 +1,108 @@
+# tests/infrastructure/caching/test_response_cache.py
+
+"""
+This module contains unit tests for the ResponseCache class. It tests key derivation,
+time-to-live expiry, LRU eviction and persistence on disk.
+"""
+
+import pytest
+from src.infrastructure.caching.response_cache import ResponseCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    response_cache = ResponseCache(':memory:', ttl=60, max_entries=2, clock=clock)
+    yield response_cache
+    response_cache.close()
+
+
+def test_make_key_depends_on_model_prompt_and_params():
+    """Test that the key changes with any input and is stable for equal inputs."""
+    key = ResponseCache.make_key('gpt', 'prompt', {'temperature': 1, 'n': 2})
+
+    assert key == ResponseCache.make_key('gpt', 'prompt', {'n': 2, 'temperature': 1})
+    assert key != ResponseCache.make_key('other', 'prompt', {'temperature': 1, 'n': 2})
+    assert key != ResponseCache.make_key('gpt', 'prompt!', {'temperature': 1, 'n': 2})
+    assert key != ResponseCache.make_key('gpt', 'prompt', {'temperature': 0, 'n': 2})
+
+
+def test_get_and_set(cache):
+    """Test a miss followed by a hit."""
+    assert cache.get('k') is None
+    cache.set('k', 'gpt', 'content')
+
+    assert cache.get('k') == 'content'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    """Test that an entry older than the TTL is a miss and is removed."""
+    cache.set('k', 'gpt', 'content')
+    clock.now += 61
+
+    assert cache.get('k') is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    """Test that the size bound evicts the entry accessed least recently."""
+    cache.set('a', 'gpt', 'A')
+    clock.now += 1
+    cache.set('b', 'gpt', 'B')
+    clock.now += 1
+    cache.get('a')
+    clock.now += 1
+    cache.set('c', 'gpt', 'C')
+
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a') == 'A'
+    assert cache.get('c') == 'C'
+
+
+def test_purge_expired(cache, clock):
+    """Test that purge_expired removes only expired entries."""
+    cache.set('old', 'gpt', 'O')
+    clock.now += 50
+    cache.set('new', 'gpt', 'N')
+    clock.now += 20
+
+    assert cache.purge_expired() == 1
+    assert cache.get('new') == 'N'
+
+
+def test_cache_persists_on_disk(tmp_path):
+    """Test that entries survive reopening the cache file."""
+    path = str(tmp_path / 'nested' / 'cache.sqlite3')
+    first = ResponseCache(path)
+    first.set('k', 'gpt', 'content')
+    first.close()
+
+    second = ResponseCache(path)
+    assert second.get('k') == 'content'
+    second.close()
+
+
+def test_invalid_max_entries():
+    """Test that the size bound must be positive."""
+    with pytest.raises(ValueError):
+        ResponseCache(':memory:', max_entries=0)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,37 @@
+# tests/infrastructure/config/test_environment_endpoints.py
+
+"""
+This module contains unit tests for the base URL settings of the APIs.
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+from src.infrastructure.config.environment_endpoints import get_endpoint_settings
+from src.domain.exceptions import ConfigurationError
+
+
+@patch.dict(os.environ, {}, clear=True)
+def test_endpoints_default_to_none():
+    """Test that unset URLs leave the production ones to the gateways."""
+    assert get_endpoint_settings() == {'openai': None, 'facebook': None, 'linkedin': None, 'twitter': None}
+
+
+@patch.dict(os.environ, {'LINKEDIN_API_URL': 'http://127.0.0.1:8703/v2/', 'OPENAI_BASE_URL': ' '}, clear=True)
+def test_endpoint_trailing_slash_is_removed():
+    """Test that a configured URL is normalized and a blank one ignored."""
+    settings = get_endpoint_settings()
+
+    assert settings['linkedin'] == 'http://127.0.0.1:8703/v2'
+    assert settings['openai'] is None
+
+
+@patch.dict(os.environ, {'TWITTER_API_URL': 'api.twitter.com/2'}, clear=True)
+def test_relative_endpoint_is_rejected():
+    """Test that a URL without scheme is a configuration error."""
+    with pytest.raises(ConfigurationError):
+        get_endpoint_settings()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
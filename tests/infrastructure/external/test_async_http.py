@@ -0,0 +1,77 @@
+# tests/infrastructure/external/test_async_http.py
+
+"""
+This module contains unit tests for the shared asynchronous HTTP client
+defined in src.infrastructure.external.async_http.
+"""
+
+import asyncio
+import pytest
+
+from src.infrastructure.external import async_http
+from src.infrastructure.external.async_http import LoopLocal, get_async_http_client, close_async_http_client
+
+
+def test_client_is_shared_within_event_loop():
+    """Test that the same client is returned for the whole event loop."""
+    async def scenario():
+        first = get_async_http_client()
+        second = get_async_http_client()
+        await close_async_http_client()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first is second
+    assert first.is_closed
+
+
+def test_client_is_recreated_after_close():
+    """Test that a closed client is replaced by a fresh one."""
+    async def scenario():
+        first = get_async_http_client()
+        await close_async_http_client()
+        second = get_async_http_client()
+        await close_async_http_client()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first is not second
+
+
+def test_client_requires_running_loop():
+    """Test that the client cannot be obtained outside of an event loop."""
+    with pytest.raises(RuntimeError):
+        get_async_http_client()
+
+
+
+def test_each_event_loop_gets_its_own_client():
+    """Test that a later loop never reuses the client of an ended one, which is dropped."""
+    async def scenario():
+        return get_async_http_client()
+
+    first = asyncio.run(scenario())
+    second = asyncio.run(scenario())
+
+    assert first is not second
+    assert len(async_http._clients) == 0
+
+
+def test_loop_local_values_follow_their_loop():
+    """Test one value per loop, kept until its loop is closed."""
+    values = LoopLocal()
+    counter = iter(range(10))
+
+    async def scenario():
+        return values.get(lambda: next(counter)), values.get(lambda: next(counter))
+
+    loop = asyncio.new_event_loop()
+    assert loop.run_until_complete(scenario()) == (0, 0)
+    assert asyncio.run(scenario()) == (1, 1)
+    assert len(values) == 1
+    loop.close()
+    assert len(values) == 0
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -8,6 +8,10 @@ including error handling and successful post scenarios.
 
 import sys
 import os
+import asyncio
+import threading
+import time
+import httpx
 import pytest
 import requests
 from unittest.mock import patch, MagicMock
@@ -18,6 +22,7 @@ sys.path.insert(0, project_root)
 
 from src.infrastructure.external.facebook_api import FacebookAPI
 from src.domain.entities.facebook_publication import FacebookPublication
+from src.infrastructure.external.retry_policy import RetryPolicy
 from src.domain.exceptions import ConfigurationError, FacebookError, ValidationError
 
 
@@ -75,8 +80,8 @@ def test_post_facebook_publication_success(mock_getenv):
     mock_post_response.json.return_value = {"id": "123_456"}
     mock_post = MagicMock(return_value=mock_post_response)
 
-    with patch('requests.get', mock_get), \
-            patch('requests.post', mock_post), \
+    with patch('requests.Session.get', mock_get), \
+            patch('requests.Session.post', mock_post), \
             patch('src.infrastructure.external.facebook_api.get_facebook_credentials',
                   return_value={'access_token': 'fake_access_token', 'page_id': 'fake_page_id'}):
         # Create API instance and test
@@ -88,7 +93,7 @@ def test_post_facebook_publication_success(mock_getenv):
 
 
 @patch('src.infrastructure.external.facebook_api.get_facebook_credentials')
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_post_facebook_publication_request_error(mock_post, mock_get_credentials):
     """
     Test handling of request errors when posting to Facebook.
@@ -117,5 +122,206 @@ def test_post_facebook_publication_validation_error():
     assert "Facebook publication text cannot be empty" in str(exc_info.value)
 
 
+@patch('src.infrastructure.external.facebook_api.get_facebook_credentials')
+def test_post_facebook_publication_async(mock_get_credentials):
+    """
+    Test asynchronous posting through an injected async HTTP client.
+    """
+    mock_get_credentials.return_value = {
+        'access_token': 'fake_access_token',
+        'page_id': 'fake_page_id'
+    }
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={"id": "123_456"})
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with patch('requests.Session.get', side_effect=requests.exceptions.ConnectionError("offline")):
+                api = FacebookAPI(async_http_client=client)
+            return await api.post_async(FacebookPublication("Test Facebook post"))
+
+    result = asyncio.run(scenario())
+
+    assert result == {"id": "123_456"}
+    assert str(requests_seen[0].url) == "https://graph.facebook.com/v19.0/fake_page_id/feed"
+    assert b"message=Test+Facebook+post" in requests_seen[0].content
+
+
+@patch('src.infrastructure.external.facebook_api.get_facebook_credentials')
+def test_post_async_exchanges_the_token_off_the_event_loop(mock_get_credentials):
+    """
+    Test that the blocking token exchange of an asynchronous post runs in a worker
+    thread, while the other coroutines keep running.
+    """
+    mock_get_credentials.return_value = {'access_token': 'user_token', 'page_id': 'page_id'}
+    exchange_threads = []
+
+    def get(url, params=None, **kwargs):
+        exchange_threads.append(threading.current_thread())
+        time.sleep(0.1)
+        if url.endswith('/debug_token'):
+            return MagicMock(status_code=200, json=MagicMock(return_value={'data': {'expires_at': 0}}))
+        return MagicMock(status_code=200, json=MagicMock(return_value={'access_token': 'page_token'}))
+
+    session = MagicMock()
+    session.get.side_effect = get
+    posted = []
+
+    def handler(request):
+        posted.append(request)
+        return httpx.Response(200, json={"id": "1_2"})
+
+    async def ticker(ticks):
+        for _ in range(10):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def scenario():
+        ticks = []
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = FacebookAPI(async_http_client=client, http_session=session)
+            await asyncio.gather(api.post_async(FacebookPublication("Test Facebook post")), ticker(ticks))
+        return ticks
+
+    ticks = asyncio.run(scenario())
+
+    assert exchange_threads and threading.main_thread() not in exchange_threads
+    assert b"access_token=page_token" in posted[0].content
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.09
+
+
+@patch('src.infrastructure.external.facebook_api.get_facebook_credentials')
+def test_post_facebook_publication_async_api_error(mock_get_credentials):
+    """
+    Test that Graph API errors are raised as FacebookError in asynchronous mode.
+    """
+    mock_get_credentials.return_value = {
+        'access_token': 'fake_access_token',
+        'page_id': 'fake_page_id'
+    }
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(400, json={"error": {"code": 200, "message": "Permissions error"}})
+    )
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch('requests.Session.get', side_effect=requests.exceptions.ConnectionError("offline")):
+                api = FacebookAPI(async_http_client=client)
+            return await api.post_async(FacebookPublication("Test Facebook post"))
+
+    with pytest.raises(FacebookError) as exc_info:
+        asyncio.run(scenario())
+    assert "Permissions error" in str(exc_info.value)
+
+
+@patch('src.infrastructure.external.facebook_api.get_facebook_credentials')
+def test_page_token_exchanged_once_for_many_instances(mock_get_credentials):
+    """
+    Test that construction makes no request and that several gateways share one exchange.
+    """
+    mock_get_credentials.return_value = {'access_token': 'user_token', 'page_id': 'page_id'}
+
+    def get(url, params=None, **kwargs):
+        if url.endswith('/debug_token'):
+            return MagicMock(status_code=200, json=MagicMock(return_value={'data': {'expires_at': 0}}))
+        return MagicMock(status_code=200, json=MagicMock(return_value={'access_token': 'page_token'}))
+
+    session = MagicMock()
+    session.get.side_effect = get
+    session.post.return_value = MagicMock(status_code=200, json=MagicMock(return_value={'id': '1_2'}))
+
+    first = FacebookAPI(http_session=session)
+    second = FacebookAPI(http_session=session)
+    session.get.assert_not_called()
+
+    first.post(FacebookPublication("First post"))
+    second.post(FacebookPublication("Second post"))
+
+    exchanges = [call for call in session.get.call_args_list if call.args[0].endswith('/page_id')]
+    assert len(exchanges) == 1
+    assert session.post.call_args.kwargs['data']['access_token'] == 'page_token'
+
+
+@patch('src.infrastructure.external.facebook_api.get_facebook_credentials')
+def test_failed_exchange_falls_back_to_user_token(mock_get_credentials):
+    """
+    Test that the user token is used, and not cached, when the exchange fails.
+    """
+    mock_get_credentials.return_value = {'access_token': 'user_token', 'page_id': 'page_id'}
+    session = MagicMock()
+    session.get.return_value = MagicMock(status_code=400, text='Bad token')
+
+    api = FacebookAPI(http_session=session)
+
+    assert api.access_token == 'user_token'
+    assert api.access_token == 'user_token'
+    session.get.assert_called_once()
+
+
+@patch('src.infrastructure.external.facebook_api.get_facebook_credentials')
+def test_failed_exchange_is_tried_again(mock_get_credentials):
+    """
+    Test that a failed exchange is not pinned: it is tried again after the delay, or at
+    once after Graph rejected the token in use.
+    """
+    mock_get_credentials.return_value = {'access_token': 'user_token', 'page_id': 'page_id'}
+    session = MagicMock()
+    session.get.side_effect = [
+        requests.exceptions.ConnectionError("network blip"),
+        MagicMock(status_code=200, json=MagicMock(return_value={'access_token': 'page_token'})),
+        MagicMock(status_code=200, json=MagicMock(return_value={'data': {'expires_at': 0}})),
+    ]
+
+    api = FacebookAPI(http_session=session)
+    assert api.access_token == 'user_token'
+    # Délai écoulé : l'échange est retenté
+    api._exchange_retry_at = 0.0
+    assert api.access_token == 'page_token'
+
+    # Jeton refusé (code 190), puis nouvel échange en échec : jeton utilisateur pendant le délai
+    session.get.side_effect = [MagicMock(status_code=500, text='Unavailable'),
+                               MagicMock(status_code=200, json=MagicMock(return_value={'access_token': 'new_token'})),
+                               MagicMock(status_code=200, json=MagicMock(return_value={'data': {}}))]
+    session.post.return_value = httpx.Response(400, json={"error": {"code": 190, "message": "Expired"}})
+    with pytest.raises(FacebookError):
+        api.post(FacebookPublication("Test Facebook post"))
+    assert api.access_token == 'user_token'
+    assert session.get.call_count == 4
+
+    # Le jeton utilisateur refusé à son tour : l'échange est retenté sans attendre
+    with pytest.raises(FacebookError):
+        api.post(FacebookPublication("Test Facebook post"))
+    assert api.access_token == 'new_token'
+
+
+
+@patch('src.infrastructure.external.facebook_api.get_facebook_credentials')
+def test_post_facebook_publication_retries_throttling(mock_get_credentials):
+    """
+    Test that a Graph throttling error is retried and that other errors are not.
+    """
+    mock_get_credentials.return_value = {'access_token': 'user_token', 'page_id': 'page_id'}
+    session = MagicMock()
+    session.get.return_value = MagicMock(status_code=400, text='Bad token')
+    session.post.side_effect = [
+        httpx.Response(400, json={"error": {"code": 4, "message": "Application request limit reached"}}),
+        httpx.Response(200, json={"id": "1_2"}),
+        httpx.Response(400, json={"error": {"code": 200, "message": "Permissions error"}}),
+    ]
+    sleeps = []
+
+    api = FacebookAPI(http_session=session, retry_policy=RetryPolicy(sleep=sleeps.append))
+
+    assert api.post(FacebookPublication("Test Facebook post")) == {"id": "1_2"}
+    assert len(sleeps) == 1
+    with pytest.raises(FacebookError) as exc_info:
+        api.post(FacebookPublication("Test Facebook post"))
+    assert exc_info.value.transient is False
+    assert len(sleeps) == 1
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
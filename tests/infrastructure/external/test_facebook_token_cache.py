@@ -0,0 +1,185 @@
+# tests/infrastructure/external/test_facebook_token_cache.py
+
+"""
+This module contains unit tests for the PageTokenCache class. It tests in-memory and
+on-disk caching, expiry, single-flight fetching and the background refresh.
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from src.infrastructure.external.facebook_token_cache import PageTokenCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_make_key_hides_user_token():
+    """Test that the key identifies page and user token without containing the token."""
+    key = PageTokenCache.make_key('page', 'secret-user-token')
+
+    assert key.startswith('page:')
+    assert 'secret-user-token' not in key
+    assert key != PageTokenCache.make_key('page', 'other-user-token')
+
+
+def test_get_or_fetch_fetches_once():
+    """Test that the token is fetched on the first call only."""
+    cache = PageTokenCache()
+    fetch = MagicMock(return_value=('page-token', 0))
+
+    assert cache.get_or_fetch('k', fetch) == 'page-token'
+    assert cache.get_or_fetch('k', fetch) == 'page-token'
+    fetch.assert_called_once()
+
+
+def test_concurrent_callers_share_one_fetch():
+    """Test that concurrent misses on the same key trigger a single exchange."""
+    cache = PageTokenCache()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return 'page-token', 0
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch('k', fetch)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ['page-token'] * 5
+    assert len(calls) == 1
+
+
+def test_failed_fetch_is_not_cached():
+    """Test that a fetch without token is not stored."""
+    cache = PageTokenCache()
+
+    assert cache.get_or_fetch('k', lambda: None) is None
+    assert cache.get('k') is None
+
+
+def test_expired_token_is_fetched_again():
+    """Test that an expired token is a miss."""
+    clock = FakeClock()
+    cache = PageTokenCache(clock=clock)
+    cache.set('k', 'old-token', clock.now + 10)
+    clock.now += 11
+
+    assert cache.get('k') is None
+    assert cache.get_or_fetch('k', lambda: ('new-token', 0)) == 'new-token'
+
+
+def test_unknown_expiry_uses_default_lifetime():
+    """Test that a token without known expiry is kept for UNKNOWN_EXPIRY_LIFETIME."""
+    clock = FakeClock()
+    cache = PageTokenCache(clock=clock)
+    cache.set('k', 'token', None)
+
+    clock.now += PageTokenCache.UNKNOWN_EXPIRY_LIFETIME - 1
+    assert cache.get('k') == 'token'
+    clock.now += 2
+    assert cache.get('k') is None
+
+
+def test_tokens_persist_on_disk(tmp_path):
+    """Test that another cache instance reads the stored token from the file."""
+    path = str(tmp_path / 'tokens.json')
+    PageTokenCache(path).set('k', 'page-token', 0)
+
+    assert PageTokenCache(path).get('k') == 'page-token'
+
+
+def test_unreadable_file_is_ignored(tmp_path):
+    """Test that a corrupted cache file does not prevent startup."""
+    path = tmp_path / 'tokens.json'
+    path.write_text('{not json')
+
+    assert PageTokenCache(str(path)).get('k') is None
+
+
+def test_invalidate_removes_token(tmp_path):
+    """Test that an invalidated token is removed from memory and disk."""
+    path = str(tmp_path / 'tokens.json')
+    cache = PageTokenCache(path)
+    cache.set('k', 'page-token', 0)
+    cache.invalidate('k')
+
+    assert cache.get('k') is None
+    assert PageTokenCache(path).get('k') is None
+
+
+def test_token_is_refreshed_before_expiry():
+    """Test that a background refresh replaces the token ahead of its expiry."""
+    cache = PageTokenCache()
+    cache.REFRESH_MARGIN = 3600
+    refreshed = threading.Event()
+    tokens = iter([('first-token', time.time() + 3600), ('second-token', 0)])
+
+    def fetch():
+        token = next(tokens)
+        if token[0] == 'second-token':
+            refreshed.set()
+        return token
+
+    assert cache.get_or_fetch('k', fetch) == 'first-token'
+    assert refreshed.wait(2)
+    for _ in range(100):
+        if cache.get('k') == 'second-token':
+            break
+        time.sleep(0.01)
+    assert cache.get('k') == 'second-token'
+    cache.close()
+
+
+def test_token_loaded_from_disk_is_refreshed(tmp_path):
+    """Test that a token read from the file is refreshed as well, from its first use."""
+    path = str(tmp_path / 'tokens.json')
+    PageTokenCache(path).set('k', 'stored-token', time.time() + 3600)
+    cache = PageTokenCache(path)
+    cache.REFRESH_MARGIN = 3600
+    refreshed = threading.Event()
+
+    def fetch():
+        refreshed.set()
+        return 'new-token', 0
+
+    assert cache.get_or_fetch('k', fetch) == 'stored-token'
+    assert refreshed.wait(2)
+    for _ in range(100):
+        if cache.get('k') == 'new-token':
+            break
+        time.sleep(0.01)
+    assert cache.get('k') == 'new-token'
+    cache.close()
+
+
+def test_cache_hits_schedule_a_single_refresh(tmp_path):
+    """Test that only the first hit of a token schedules its refresh."""
+    cache = PageTokenCache()
+    cache.set('k', 'token', time.time() + 7200)
+    fetch = MagicMock(return_value=('new-token', 0))
+
+    for _ in range(3):
+        assert cache.get_or_fetch('k', fetch) == 'token'
+
+    assert list(cache._timers) == ['k']
+    fetch.assert_not_called()
+    cache.close()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,75 @@
+# tests/infrastructure/external/test_http_session.py
+
+"""
+This module contains unit tests for the pooled HTTP session helpers defined in
+src.infrastructure.external.http_session.
+"""
+
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+
+from src.infrastructure.external.http_session import PooledSession, create_http_session, prewarm_session
+from src.infrastructure.config.environment_http import get_http_settings
+from src.domain.exceptions import ConfigurationError
+
+
+def test_pooled_session_configures_pool():
+    """Test that the adapters are sized from the arguments."""
+    session = PooledSession(pool_connections=3, pool_maxsize=7, connect_timeout=1, read_timeout=2)
+
+    adapter = session.get_adapter('https://graph.facebook.com')
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert session.timeout == (1, 2)
+
+
+def test_pooled_session_applies_default_timeout():
+    """Test that requests get the default timeout unless one is given."""
+    session = PooledSession(connect_timeout=1, read_timeout=2)
+
+    with patch('requests.Session.request', return_value=MagicMock()) as mock_request:
+        session.get('https://example.com')
+        session.post('https://example.com', timeout=9)
+
+    assert mock_request.call_args_list[0].kwargs['timeout'] == (1, 2)
+    assert mock_request.call_args_list[1].kwargs['timeout'] == 9
+
+
+def test_create_http_session_from_environment(monkeypatch):
+    """Test that the environment settings are applied."""
+    monkeypatch.setenv('HTTP_POOL_MAXSIZE', '4')
+    monkeypatch.setenv('HTTP_READ_TIMEOUT', '12.5')
+
+    session = create_http_session()
+
+    assert session.get_adapter('https://api.linkedin.com')._pool_maxsize == 4
+    assert session.timeout[1] == 12.5
+
+
+def test_invalid_http_setting(monkeypatch):
+    """Test that a malformed setting is reported as a configuration error."""
+    monkeypatch.setenv('HTTP_CONNECT_TIMEOUT', 'soon')
+
+    with pytest.raises(ConfigurationError):
+        get_http_settings()
+
+
+def test_prewarm_contacts_each_host_once():
+    """Test that pre-warming sends one HEAD per origin and tolerates failures."""
+    session = MagicMock()
+    session.head.side_effect = [None, requests.ConnectionError("offline")]
+
+    prewarm_session(session, [
+        'https://graph.facebook.com/v19.0',
+        'https://graph.facebook.com/v19.0/page/feed',
+        'https://api.linkedin.com/v2/ugcPosts',
+    ])
+
+    assert [call.args[0] for call in session.head.call_args_list] == [
+        'https://graph.facebook.com', 'https://api.linkedin.com'
+    ]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -8,7 +8,10 @@ including error handling and successful post scenarios.
 
 import sys
 import os
+import asyncio
+import httpx
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
 
 # Add the project root directory to the Python path
@@ -17,6 +20,7 @@ sys.path.insert(0, project_root)
 
 from src.infrastructure.external.linkedin_api import LinkedInAPI
 from src.domain.entities.linkedin_publication import LinkedInPublication
+from src.infrastructure.external.retry_policy import RetryPolicy
 from src.domain.exceptions import ConfigurationError, LinkedInError
 
 
@@ -46,7 +50,7 @@ def test_linkedin_api_initialization_error(mock_get_credentials):
 
 
 @patch('src.infrastructure.external.linkedin_api.get_linkedin_credentials')
-@patch('src.infrastructure.external.linkedin_api.requests.post')
+@patch('src.infrastructure.external.linkedin_api.requests.Session.post')
 def test_post_linkedin_publication(mock_post, mock_get_credentials):
     """
     Test the successful posting of a LinkedIn publication.
@@ -105,7 +109,7 @@ def test_post_linkedin_publication(mock_post, mock_get_credentials):
 
 
 @patch('src.infrastructure.external.linkedin_api.get_linkedin_credentials')
-@patch('src.infrastructure.external.linkedin_api.requests.post')
+@patch('src.infrastructure.external.linkedin_api.requests.Session.post')
 def test_post_linkedin_publication_error(mock_post, mock_get_credentials):
     """
     Test the handling of errors when posting a LinkedIn publication.
@@ -131,5 +135,123 @@ def test_post_linkedin_publication_error(mock_post, mock_get_credentials):
     assert "LinkedIn API error: 400 - Bad Request" in str(exc_info.value)
 
 
+@patch('src.infrastructure.external.linkedin_api.get_linkedin_credentials')
+def test_post_linkedin_publication_async(mock_get_credentials):
+    """
+    Test the asynchronous posting of a LinkedIn publication.
+    """
+    mock_get_credentials.return_value = {
+        'client_id': 'fake_client_id',
+        'client_secret': 'fake_client_secret',
+        'access_token': 'fake_access_token',
+        'user_id': 'fake_user_id'
+    }
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(201, json={"id": "fake_post_id"})
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = LinkedInAPI(async_http_client=client)
+            return await api.post_async(LinkedInPublication("Test LinkedIn post"))
+
+    result = asyncio.run(scenario())
+
+    assert result == {"id": "fake_post_id"}
+    assert str(requests_seen[0].url) == 'https://api.linkedin.com/v2/ugcPosts'
+    assert requests_seen[0].headers['Authorization'] == 'Bearer fake_access_token'
+
+
+@patch('src.infrastructure.external.linkedin_api.get_linkedin_credentials')
+def test_post_linkedin_publication_async_error(mock_get_credentials):
+    """
+    Test the handling of API errors in asynchronous mode.
+    """
+    mock_get_credentials.return_value = {
+        'client_id': 'fake_client_id',
+        'client_secret': 'fake_client_secret',
+        'access_token': 'fake_access_token',
+        'user_id': 'fake_user_id'
+    }
+    transport = httpx.MockTransport(lambda request: httpx.Response(400, text="Bad Request"))
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = LinkedInAPI(async_http_client=client)
+            return await api.post_async(LinkedInPublication("Test LinkedIn post"))
+
+    with pytest.raises(LinkedInError) as exc_info:
+        asyncio.run(scenario())
+    assert "LinkedIn API error: 400 - Bad Request" in str(exc_info.value)
+
+
+@patch('src.infrastructure.external.linkedin_api.get_linkedin_credentials')
+def test_linkedin_api_reuses_injected_session(mock_get_credentials):
+    """
+    Test that every publication goes through the same pooled session.
+    """
+    mock_get_credentials.return_value = {
+        'access_token': 'fake_access_token',
+        'user_id': 'fake_user_id'
+    }
+    session = MagicMock()
+    session.post.return_value = MagicMock(status_code=201, json=MagicMock(return_value={"id": "1"}))
+
+    api = LinkedInAPI(http_session=session)
+    api.post(LinkedInPublication("First post"))
+    api.post(LinkedInPublication("Second post"))
+
+    assert session.post.call_count == 2
+    api.close()
+    session.close.assert_called_once()
+
+
+
+@patch('src.infrastructure.external.linkedin_api.get_linkedin_credentials')
+def test_post_linkedin_publication_retries_server_error(mock_get_credentials):
+    """
+    Test that a temporary LinkedIn outage is retried after the advertised delay.
+    """
+    mock_get_credentials.return_value = {
+        'access_token': 'fake_access_token',
+        'user_id': 'fake_user_id'
+    }
+    session = MagicMock()
+    session.post.side_effect = [
+        httpx.Response(503, headers={'Retry-After': '7'}, text="Service Unavailable"),
+        httpx.Response(201, json={"id": "fake_post_id"}),
+    ]
+    sleeps = []
+
+    api = LinkedInAPI(http_session=session, retry_policy=RetryPolicy(sleep=sleeps.append, rng=lambda: 0.0))
+    result = api.post(LinkedInPublication("Test LinkedIn post"))
+
+    assert result == {"id": "fake_post_id"}
+    assert session.post.call_count == 2
+    assert sleeps == [7.0]
+
+
+@patch('src.infrastructure.external.linkedin_api.get_linkedin_credentials')
+def test_post_linkedin_publication_does_not_retry_read_timeout(mock_get_credentials):
+    """
+    Test that a read timeout is not retried, since the post may already be published.
+    """
+    mock_get_credentials.return_value = {
+        'access_token': 'fake_access_token',
+        'user_id': 'fake_user_id'
+    }
+    session = MagicMock()
+    session.post.side_effect = requests.exceptions.ReadTimeout("timed out")
+
+    api = LinkedInAPI(http_session=session, retry_policy=RetryPolicy(sleep=lambda seconds: None))
+    with pytest.raises(LinkedInError) as exc_info:
+        api.post(LinkedInPublication("Test LinkedIn post"))
+
+    assert exc_info.value.transient is False
+    assert session.post.call_count == 1
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
\ No newline at end of file
@@ -8,15 +8,18 @@ functionality, including error handling and response validation.
 
 import sys
 import os
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 # Add the project root directory to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 sys.path.insert(0, project_root)
 
 from src.infrastructure.external.openai_api import OpenAIAPI
-from src.domain.exceptions import ConfigurationError, OpenAIError
+from src.infrastructure.caching.response_cache import ResponseCache
+from src.infrastructure.prompting.token_estimator import estimate_tokens
+from src.domain.exceptions import ConfigurationError, ContentLengthError, OpenAIError
 
 
 @patch('src.infrastructure.external.openai_api.get_openai_credentials')
@@ -121,5 +124,468 @@ def test_response_cleanup(mock_openai):
     assert not result.endswith(".")
 
 
+@patch('src.infrastructure.external.openai_api.AsyncOpenAI')
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_async_success(mock_openai, mock_async_openai):
+    """Test successful asynchronous content generation."""
+    mock_async_client = MagicMock()
+    mock_async_openai.return_value = mock_async_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "<social_media_post>**Async** content.</social_media_post>"
+    mock_async_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    api = OpenAIAPI()
+    result = asyncio.run(api.generate_async("Test prompt"))
+
+    assert result == "Async content"
+    mock_async_client.chat.completions.create.assert_awaited_once_with(
+        model="gpt-4-turbo",
+        messages=[
+            {"role": "system", "content": "Test prompt"}
+        ]
+    )
+
+
+@patch('src.infrastructure.external.openai_api.AsyncOpenAI')
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_async_error(mock_openai, mock_async_openai):
+    """Test handling of API errors during asynchronous generation."""
+    mock_async_client = MagicMock()
+    mock_async_openai.return_value = mock_async_client
+    mock_async_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
+
+    api = OpenAIAPI()
+    with pytest.raises(OpenAIError) as exc_info:
+        asyncio.run(api.generate_async("Test prompt"))
+    assert "Content generation failed: API Error" in str(exc_info.value)
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_repairs_output_locally(mock_openai):
+    """Test that a missing closing tag and a Markdown link are repaired without a new request."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = (
+        "<social_media_post>Discover [our offer](https://tech-aware.fr)  today."
+    )
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI()
+    result = api.generate("Test prompt")
+
+    assert result == "Discover our offer https://tech-aware.fr today"
+    mock_client.chat.completions.create.assert_called_once()
+    stats = api.repair_pipeline.stats()
+    assert stats['tag_recovery'] == 1
+    assert stats['markdown_links'] == 1
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_trims_slight_overrun(mock_openai):
+    """Test that a publication slightly over max_length is trimmed at a sentence boundary."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = (
+        f"<social_media_post>{'a' * 250}. {'b' * 40}.</social_media_post>"
+    )
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI()
+
+    assert api.generate("Test prompt", max_length=280) == "a" * 250
+    assert api.repair_pipeline.stats()['saved'] == 1
+
+
+SPECS = {
+    'facebook': {'tag': 'facebook_post', 'max_length': 63206},
+    'twitter': {'tag': 'x_post', 'max_length': 280}
+}
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_many_single_request(mock_openai):
+    """Test that all platform variants are generated and parsed from one completion."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = """
+    <facebook_post>**Long** Facebook post.</facebook_post>
+    <x_post>Short tweet</x_post>
+    """
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI()
+    result = api.generate_many("Test prompt", SPECS)
+
+    assert result == {'facebook': "Long Facebook post", 'twitter': "Short tweet"}
+    mock_client.chat.completions.create.assert_called_once()
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_many_missing_variant(mock_openai):
+    """Test that a missing platform variant is reported."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "<facebook_post>Facebook post</facebook_post>"
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI()
+    with pytest.raises(OpenAIError) as exc_info:
+        api.generate_many("Test prompt", SPECS)
+    assert "does not contain a twitter variant" in str(exc_info.value)
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_many_variant_too_long(mock_openai):
+    """Test that each variant is validated against its platform's maximum length."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = (
+        f"<facebook_post>Facebook post</facebook_post><x_post>{'x' * 281}</x_post>"
+    )
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI()
+    with pytest.raises(OpenAIError) as exc_info:
+        api.generate_many("Test prompt", SPECS)
+    assert "twitter variant exceeds 280 characters" in str(exc_info.value)
+
+
+@pytest.fixture
+def cache():
+    """Fixture providing an in-memory response cache."""
+    response_cache = ResponseCache(':memory:')
+    yield response_cache
+    response_cache.close()
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_uses_response_cache(mock_openai, cache):
+    """Test that a repeated prompt is answered from the cache without a second API call."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "<social_media_post>Cached post</social_media_post>"
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI(cache=cache)
+    assert api.generate("Test prompt") == "Cached post"
+    assert api.generate("Test prompt") == "Cached post"
+
+    mock_client.chat.completions.create.assert_called_once()
+    assert cache.hits == 1
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_does_not_cache_invalid_response(mock_openai, cache):
+    """Test that a completion that fails extraction is not stored."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "No tags here"
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI(cache=cache)
+    with pytest.raises(OpenAIError):
+        api.generate("Test prompt")
+    assert len(cache) == 0
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_cache_only_miss(mock_openai, cache):
+    """Test that cache-only mode fails on a miss without calling the API."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+
+    api = OpenAIAPI(cache=cache, cache_mode='only')
+    with pytest.raises(OpenAIError) as exc_info:
+        api.generate("Test prompt")
+
+    assert "cache-only mode" in str(exc_info.value)
+    mock_client.chat.completions.create.assert_not_called()
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_cache_off_bypasses_cache(mock_openai, cache):
+    """Test that the 'off' mode neither reads nor fills the cache."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "<social_media_post>Fresh post</social_media_post>"
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI(cache=cache, cache_mode='off')
+    api.generate("Test prompt")
+    api.generate("Test prompt")
+
+    assert mock_client.chat.completions.create.call_count == 2
+    assert len(cache) == 0
+
+
+def test_cache_only_requires_cache():
+    """Test that cache-only mode cannot be used without a cache."""
+    with pytest.raises(ConfigurationError):
+        OpenAIAPI(cache_mode='only')
+
+
+
+def make_choices(*contents):
+    """Build a completion response with one choice per content."""
+    response = MagicMock()
+    response.choices = [MagicMock() for _ in contents]
+    for choice, content in zip(response.choices, contents):
+        choice.message.content = content
+    return response
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_candidates_single_request(mock_openai, cache):
+    """Test that candidates come from one request with n choices, invalid ones skipped, and are cached."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_client.chat.completions.create.return_value = make_choices(
+        "<social_media_post>First</social_media_post>",
+        "No tags here",
+        "<social_media_post>**Second**.</social_media_post>",
+    )
+
+    api = OpenAIAPI(cache=cache)
+    assert api.generate_candidates("Test prompt", 3) == ["First", "Second"]
+    assert api.generate_candidates("Test prompt", 3) == ["First", "Second"]
+
+    mock_client.chat.completions.create.assert_called_once()
+    assert mock_client.chat.completions.create.call_args.kwargs['n'] == 3
+    # Une génération simple du même prompt ne partage pas l'entrée des candidats
+    assert cache.get(ResponseCache.make_key(OpenAIAPI.GPT_MODEL, "Test prompt")) is None
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_candidates_all_invalid(mock_openai):
+    """Test that an error is raised when no choice contains a publication."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_client.chat.completions.create.return_value = make_choices("No tags", "")
+
+    api = OpenAIAPI()
+    with pytest.raises(OpenAIError) as exc_info:
+        api.generate_candidates("Test prompt", 2)
+    assert "Candidate generation failed" in str(exc_info.value)
+
+
+@patch('src.infrastructure.external.openai_api.AsyncOpenAI')
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_candidates_async(mock_openai, mock_async_openai):
+    """Test asynchronous candidate generation with a single request."""
+    mock_async_client = MagicMock()
+    mock_async_openai.return_value = mock_async_client
+    mock_async_client.chat.completions.create = AsyncMock(return_value=make_choices(
+        "<social_media_post>One</social_media_post>",
+        "<social_media_post>Two</social_media_post>",
+    ))
+
+    api = OpenAIAPI()
+    result = asyncio.run(api.generate_candidates_async("Test prompt", 2))
+
+    assert result == ["One", "Two"]
+    mock_async_client.chat.completions.create.assert_awaited_once()
+
+
+
+class FakeStream:
+    """A completion stream yielding text chunks and recording how many were read."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.read = 0
+        self.closed = False
+
+    def _chunk(self, text):
+        chunk = MagicMock()
+        chunk.choices[0].delta.content = text
+        return chunk
+
+    def __iter__(self):
+        for text in self.texts:
+            self.read += 1
+            yield self._chunk(text)
+
+    async def __aiter__(self):
+        for text in self.texts:
+            self.read += 1
+            yield self._chunk(text)
+
+    def close(self):
+        self.closed = True
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_stream_stops_at_closing_tag(mock_openai, cache):
+    """Test that streaming stops reading after the closing tag and records its metrics."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    stream = FakeStream(["<social_media_post>**Streamed**", " post.</social_media_post>", "Notes", " ignored"])
+    mock_client.chat.completions.create.return_value = stream
+
+    api = OpenAIAPI(cache=cache, stream=True)
+    assert api.generate("Test prompt") == "Streamed post"
+    assert api.generate("Test prompt") == "Streamed post"
+
+    assert stream.read == 2
+    assert stream.closed
+    mock_client.chat.completions.create.assert_called_once()
+    assert mock_client.chat.completions.create.call_args.kwargs['stream'] is True
+    metrics = api.stream_metrics[-1]
+    assert metrics['outcome'] == 'closed'
+    assert metrics['chunks'] == 2
+    assert 0 <= metrics['ttft'] <= metrics['total']
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_stream_aborts_when_too_long(mock_openai):
+    """Test that a streamed publication is aborted, then re-issued, once it exceeds max_length."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    too_long = FakeStream(["<social_media_post>"] + ["x" * 50] * 20 + ["</social_media_post>"])
+    valid = FakeStream(["<social_media_post>Short</social_media_post>"])
+    mock_client.chat.completions.create.side_effect = [too_long, valid]
+
+    api = OpenAIAPI(stream=True, stream_retries=1)
+    assert api.generate("Test prompt", max_length=100) == "Short"
+
+    assert too_long.read < 10
+    assert too_long.closed
+    assert [metrics['outcome'] for metrics in api.stream_metrics] == ['too_long', 'closed']
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_stream_too_long_raises(mock_openai):
+    """Test that ContentLengthError is raised once the retries are exhausted."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_client.chat.completions.create.side_effect = lambda **kwargs: FakeStream(
+        ["<social_media_post>"] + ["x" * 50] * 20
+    )
+
+    api = OpenAIAPI(stream=True)
+    with pytest.raises(ContentLengthError):
+        api.generate("Test prompt", max_length=100)
+    mock_client.chat.completions.create.assert_called_once()
+
+
+@patch('src.infrastructure.external.openai_api.AsyncOpenAI')
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_async_stream(mock_openai, mock_async_openai):
+    """Test asynchronous streaming with early termination."""
+    mock_async_client = MagicMock()
+    mock_async_openai.return_value = mock_async_client
+    stream = FakeStream(["<social_media_post>Async", " stream</social_media_post>", "ignored"])
+    stream.close = AsyncMock()
+    mock_async_client.chat.completions.create = AsyncMock(return_value=stream)
+
+    api = OpenAIAPI(stream=True)
+    result = asyncio.run(api.generate_async("Test prompt", max_length=280))
+
+    assert result == "Async stream"
+    assert stream.read == 2
+    stream.close.assert_awaited_once()
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_requests_token_budget(mock_openai):
+    """Test that max_tokens is derived from the platform limit and the usage is recorded."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "<social_media_post>Short tweet</social_media_post>"
+    mock_response.choices[0].finish_reason = 'stop'
+    mock_response.usage.prompt_tokens = 12
+    mock_response.usage.completion_tokens = 7
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI()
+    assert api.generate("Test prompt", max_length=280) == "Short tweet"
+
+    assert mock_client.chat.completions.create.call_args.kwargs['max_tokens'] == 144
+    assert api.token_usage[-1] == {'estimated_prompt': estimate_tokens("Test prompt"), 'prompt': 12, 'completion': 7}
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_token_budget_capped(mock_openai):
+    """Test that the budget never exceeds max_output_tokens, including for several platforms."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = (
+        "<facebook_post>Facebook post</facebook_post><x_post>Short tweet</x_post>"
+    )
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI(max_output_tokens=100)
+    api.generate_many("Test prompt", SPECS)
+
+    assert mock_client.chat.completions.create.call_args.kwargs['max_tokens'] == 100
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_truncated_completion_not_cached(mock_openai, cache):
+    """Test that a completion cut at its max_tokens budget raises and is not cached."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "<social_media_post>A post cut in the mid"
+    mock_response.choices[0].finish_reason = 'length'
+    mock_client.chat.completions.create.return_value = mock_response
+
+    api = OpenAIAPI(cache=cache)
+    with pytest.raises(ContentLengthError):
+        api.generate("Test prompt", max_length=280)
+
+    assert cache.get(ResponseCache.make_key(OpenAIAPI.GPT_MODEL, "Test prompt")) is None
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_candidates_skips_truncated_choices(mock_openai):
+    """Test that choices cut at their max_tokens budget are not returned as candidates."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    response = make_choices(
+        "<social_media_post>Cut in the mid",
+        "<social_media_post>Complete</social_media_post>",
+    )
+    response.choices[0].finish_reason = 'length'
+    mock_client.chat.completions.create.return_value = response
+
+    api = OpenAIAPI()
+    assert api.generate_candidates("Test prompt", 2, max_length=280) == ["Complete"]
+    assert mock_client.chat.completions.create.call_args.kwargs['max_tokens'] == 144
+
+
+@patch('src.infrastructure.external.openai_api.OpenAI')
+def test_generate_stream_truncated_raises(mock_openai):
+    """Test that a stream ending on the max_tokens budget raises ContentLengthError."""
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+    stream = FakeStream(["<social_media_post>Cut", " in the mid"])
+    original_chunk = stream._chunk
+
+    def chunk(text):
+        result = original_chunk(text)
+        result.choices[0].finish_reason = 'length' if text == " in the mid" else None
+        return result
+
+    stream._chunk = chunk
+    mock_client.chat.completions.create.return_value = stream
+
+    api = OpenAIAPI(stream=True)
+    with pytest.raises(ContentLengthError):
+        api.generate("Test prompt", max_length=280)
+    assert mock_client.chat.completions.create.call_args.kwargs['max_tokens'] == 144
+    assert stream.closed
+
+
 if __name__ == "__main__":
-    pytest.main(["-v", __file__])
\ No newline at end of file
+    pytest.main(["-v", __file__])
@@ -0,0 +1,120 @@
+# tests/infrastructure/external/test_repair_pipeline.py
+
+"""
+Ce module contient les tests unitaires de RepairPipeline, défini dans
+src.infrastructure.external.repair_pipeline.
+"""
+
+import sys
+import os
+import pytest
+
+# Ajoute le répertoire racine du projet au sys.path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+sys.path.insert(0, project_root)
+
+from src.infrastructure.external.repair_pipeline import (
+    RepairPipeline, rewrite_markdown_links, normalize_whitespace
+)
+from src.domain.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def pipeline():
+    return RepairPipeline()
+
+
+def test_extract_well_formed(pipeline):
+    assert pipeline.extract("Intro <social_media_post>Post</social_media_post> notes") == "Post"
+    assert pipeline.stats()['tag_recovery'] == 0
+
+
+def test_extract_recovers_missing_closing_tag(pipeline):
+    assert pipeline.extract("<social_media_post>Post without end") == "Post without end"
+    assert pipeline.stats()['tag_recovery'] == 1
+    assert pipeline.stats()['saved'] == 1
+
+
+def test_extract_recovers_missing_opening_tag(pipeline):
+    assert pipeline.extract("Post without start</social_media_post>") == "Post without start"
+
+
+def test_extract_recovers_malformed_tags(pipeline):
+    assert pipeline.extract("< Social_Media_Post >Post</ social_media_post >") == "Post"
+
+
+def test_extract_is_conservative(pipeline):
+    # Aucune balise : on ne devine pas où commence la publication
+    assert pipeline.extract("Here is a post about Tech Aware") is None
+    # Balise fermante avant la balise ouvrante : réponse incohérente
+    assert pipeline.extract("</social_media_post>text<social_media_post>") is None
+    assert pipeline.extract("<social_media_post>   ") is None
+    assert pipeline.stats()['tag_recovery'] == 0
+
+
+def test_extract_without_recovery():
+    assert RepairPipeline(recover_tags=False).extract("<social_media_post>Post") is None
+
+
+def test_rewrite_markdown_links():
+    assert rewrite_markdown_links("See [our site](https://tech-aware.fr) now") == \
+        "See our site https://tech-aware.fr now"
+    assert rewrite_markdown_links("[https://tech-aware.fr](https://tech-aware.fr)") == "https://tech-aware.fr"
+    assert rewrite_markdown_links("[tech-aware.fr](https://tech-aware.fr)") == "https://tech-aware.fr"
+    assert rewrite_markdown_links("Visit <https://tech-aware.fr>") == "Visit https://tech-aware.fr"
+
+
+def test_normalize_whitespace():
+    text = "Hello\u200b  world \u2728\ufe0f\ufe0f\r\n\r\n\r\n\r\nNext   line  \n"
+    assert normalize_whitespace(text) == "Hello world \u2728\ufe0f\n\nNext line"
+    # Les séquences d'emoji à jointure sont conservées
+    assert normalize_whitespace("\U0001F468\u200d\U0001F4BB") == "\U0001F468\u200d\U0001F4BB"
+
+
+def test_clean_matches_previous_cleanup(pipeline):
+    assert pipeline.clean(" **Bold Text**. ") == "Bold Text"
+    stats = pipeline.stats()
+    assert stats['bold'] == 1
+    assert stats['dots'] == 1
+    assert stats['saved'] == 0
+
+
+def test_trim_slight_overrun_at_sentence_boundary(pipeline):
+    text = "First sentence here. " + "x" * 60 + "! Last words"
+    result = pipeline.clean(text, max_length=85)
+
+    assert result == "First sentence here. " + "x" * 60 + "!"
+    assert pipeline.stats()['trim'] == 1
+    assert pipeline.stats()['saved'] == 1
+
+
+def test_trim_leaves_large_overrun(pipeline):
+    text = "Short. " + "x" * 200
+    assert pipeline.clean(text, max_length=100) == text
+
+
+def test_trim_keeps_enough_content(pipeline):
+    # Couper à la seule limite de phrase perdrait plus de la moitié du texte
+    text = "Hi. " + "x" * 100
+    assert pipeline.clean(text, max_length=100) == text
+
+
+def test_configured_stages():
+    pipeline = RepairPipeline(stages=('dots',))
+    assert pipeline.clean("**Bold**.") == "**Bold**"
+    assert pipeline.tolerated_length(100) == 100
+    assert RepairPipeline().tolerated_length(100) == 110
+
+
+def test_unknown_stage():
+    with pytest.raises(ConfigurationError):
+        RepairPipeline(stages=('bold', 'spelling'))
+
+
+def test_clean_without_recording(pipeline):
+    pipeline.clean("**Bold**", record=False)
+    assert pipeline.stats()['bold'] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,235 @@
+# tests/infrastructure/external/test_retry_policy.py
+
+"""
+Ce module contient les tests unitaires de RetryPolicy et des fonctions de
+classification des erreurs définies dans src.infrastructure.external.retry_policy.
+"""
+
+import sys
+import os
+import asyncio
+import json
+import httpx
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+# Ajoute le répertoire racine du projet au sys.path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+sys.path.insert(0, project_root)
+
+from src.infrastructure.external.retry_policy import (
+    RetryPolicy, parse_retry_after, parse_graph_usage, classify_http_response,
+    classify_graph_error, is_transient_exception
+)
+from src.domain.exceptions import AutomatorError, ConfigurationError, TwitterError
+
+
+def make_policy(**kwargs):
+    sleeps = []
+    policy = RetryPolicy(sleep=sleeps.append, rng=lambda: 0.5, **kwargs)
+    return policy, sleeps
+
+
+def failing_then(result, errors):
+    calls = []
+
+    def operation():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+    return operation, calls
+
+
+def test_parse_retry_after_seconds_and_date():
+    assert parse_retry_after(httpx.Headers({'Retry-After': '30'}), now=0) == 30
+    headers = httpx.Headers({'Retry-After': 'Thu, 01 Jan 1970 00:01:40 GMT'})
+    assert parse_retry_after(headers, now=40) == 60
+    assert parse_retry_after(httpx.Headers({'Retry-After': 'soon'}), now=0) is None
+    assert parse_retry_after(httpx.Headers({}), now=0) is None
+
+
+def test_parse_retry_after_x_rate_limit_headers():
+    headers = httpx.Headers({'x-rate-limit-reset': '1090'})
+    assert parse_retry_after(headers, now=1000, status_code=429) == 90
+    headers = httpx.Headers({'x-rate-limit-remaining': '0', 'x-rate-limit-reset': '1090'})
+    assert parse_retry_after(headers, now=1000) == 90
+
+    # Limite quotidienne épuisée : c'est son reset qui compte
+    headers = httpx.Headers({
+        'x-rate-limit-reset': '1090',
+        'x-user-limit-24hour-remaining': '0',
+        'x-user-limit-24hour-reset': '5000',
+    })
+    assert parse_retry_after(headers, now=1000) == 4000
+
+    # Reset déjà passé
+    assert parse_retry_after(httpx.Headers({'x-rate-limit-reset': '900'}), now=1000, status_code=429) == 0
+
+
+def test_parse_retry_after_ignores_windows_with_calls_left():
+    """The reset of a window that still has calls left is not a delay to wait for."""
+    headers = httpx.Headers({'x-rate-limit-remaining': '299', 'x-rate-limit-reset': '1840'})
+    assert parse_retry_after(headers, now=1000, status_code=503) is None
+    assert parse_retry_after(httpx.Headers({'x-rate-limit-reset': '1840'}), now=1000) is None
+
+
+def test_parse_graph_usage():
+    headers = httpx.Headers({'X-App-Usage': json.dumps({'call_count': 100, 'total_time': 12})})
+    assert parse_graph_usage(headers) == (True, None)
+
+    headers = httpx.Headers({'X-App-Usage': json.dumps({'call_count': 20})})
+    assert parse_graph_usage(headers) == (False, None)
+
+    business = {'123': [{'type': 'pages', 'call_count': 100, 'estimated_time_to_regain_access': 5}]}
+    headers = httpx.Headers({'X-Business-Use-Case-Usage': json.dumps(business)})
+    assert parse_graph_usage(headers) == (True, 300)
+
+    assert parse_graph_usage(httpx.Headers({'X-App-Usage': 'not json'})) == (False, None)
+
+
+def test_classify_http_response():
+    response = httpx.Response(429, headers={'Retry-After': '12'})
+    assert classify_http_response(response) == {'transient': True, 'retry_after': 12, 'status_code': 429}
+
+    response = httpx.Response(403)
+    assert classify_http_response(response) == {'transient': False, 'retry_after': None, 'status_code': 403}
+
+    # Réponses simulées sans statut entier
+    assert classify_http_response(MagicMock())['status_code'] is None
+
+
+def test_classify_http_response_of_a_post():
+    """A post may exist after a 500, 502 or 504: only refusals are retried."""
+    for status in (500, 502, 504):
+        assert classify_http_response(httpx.Response(status))['transient'] is True
+        assert classify_http_response(httpx.Response(status), idempotent=False)['transient'] is False
+    assert classify_http_response(httpx.Response(429), idempotent=False)['transient'] is True
+    assert classify_http_response(httpx.Response(503), idempotent=False)['transient'] is False
+    response = httpx.Response(503, headers={'Retry-After': '7'})
+    assert classify_http_response(response, idempotent=False) == {
+        'transient': True, 'retry_after': 7, 'status_code': 503
+    }
+
+
+def test_classify_graph_error():
+    response = httpx.Response(400)
+    assert classify_graph_error({'code': 4}, response)['transient'] is True
+    assert classify_graph_error({'code': 100, 'is_transient': True}, response)['transient'] is True
+    assert classify_graph_error({'code': 100}, response)['transient'] is False
+
+    # Création d'un post : seule la limitation de débit est réessayée
+    assert classify_graph_error({'code': 4}, response, idempotent=False)['transient'] is True
+    assert classify_graph_error({'code': 2}, httpx.Response(500), idempotent=False)['transient'] is False
+    assert classify_graph_error({'code': 1, 'is_transient': True}, response, idempotent=False)['transient'] is False
+
+    business = {'123': [{'call_count': 100, 'estimated_time_to_regain_access': 2}]}
+    response = httpx.Response(400, headers={'X-Business-Use-Case-Usage': json.dumps(business)})
+    classification = classify_graph_error({'code': 80001}, response)
+    assert classification['transient'] is True
+    assert classification['retry_after'] == 120
+
+
+def test_is_transient_exception():
+    assert is_transient_exception(requests.exceptions.ConnectionError()) is True
+    assert is_transient_exception(requests.exceptions.ConnectTimeout()) is True
+    # Après un timeout de lecture, le post a peut-être été publié
+    assert is_transient_exception(requests.exceptions.ReadTimeout()) is False
+    assert is_transient_exception(httpx.ConnectError("refused")) is True
+    assert is_transient_exception(httpx.ReadTimeout("slow")) is False
+    assert is_transient_exception(ValueError()) is False
+
+
+def test_run_retries_transient_errors_with_backoff():
+    policy, sleeps = make_policy(base_delay=2.0)
+    operation, calls = failing_then("ok", [TwitterError("busy", transient=True)] * 3)
+
+    assert policy.run(operation) == "ok"
+    assert len(calls) == 4
+    # Demi-délai fixe plus demi-délai aléatoire (rng = 0.5)
+    assert sleeps == [1.5, 3.0, 6.0]
+
+
+def test_backoff_is_capped():
+    policy, _ = make_policy(base_delay=1.0, max_delay=8.0)
+    error = AutomatorError("busy", transient=True)
+    assert policy.delay(10, error) == 6.0
+
+
+def test_run_honours_advertised_delay():
+    policy, sleeps = make_policy(base_delay=1.0)
+    operation, _ = failing_then("ok", [TwitterError("rate limited", transient=True, retry_after=42)])
+
+    assert policy.run(operation) == "ok"
+    assert sleeps == [42.5]
+
+
+def test_run_does_not_retry_permanent_errors():
+    policy, sleeps = make_policy()
+    operation, calls = failing_then("ok", [TwitterError("forbidden", status_code=403)])
+
+    with pytest.raises(TwitterError):
+        policy.run(operation)
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_run_gives_up_after_max_attempts():
+    policy, sleeps = make_policy(max_attempts=3)
+    operation, calls = failing_then("ok", [TwitterError("busy", transient=True)] * 5)
+
+    with pytest.raises(TwitterError):
+        policy.run(operation)
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_run_gives_up_when_advertised_delay_exceeds_max_wait():
+    policy, sleeps = make_policy(max_wait=60)
+    operation, calls = failing_then("ok", [TwitterError("daily cap", transient=True, retry_after=3600)])
+
+    with pytest.raises(TwitterError):
+        policy.run(operation)
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_run_async_retries_without_blocking():
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    policy = RetryPolicy(async_sleep=fake_sleep, rng=lambda: 0.0)
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        if len(calls) == 1:
+            raise TwitterError("busy", transient=True, retry_after=5)
+        return "ok"
+
+    assert asyncio.run(policy.run_async(operation)) == "ok"
+    assert sleeps == [5.0]
+
+
+def test_from_environment(monkeypatch):
+    monkeypatch.setenv('RETRY_MAX_ATTEMPTS', '2')
+    monkeypatch.setenv('RETRY_MAX_WAIT', '30')
+    policy = RetryPolicy.from_environment()
+    assert policy.max_attempts == 2
+    assert policy.max_wait == 30
+
+    monkeypatch.setenv('RETRY_MAX_ATTEMPTS', 'many')
+    with pytest.raises(ConfigurationError):
+        RetryPolicy.from_environment()
+
+
+def test_invalid_max_attempts():
+    with pytest.raises(ConfigurationError):
+        RetryPolicy(max_attempts=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
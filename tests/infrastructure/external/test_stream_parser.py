@@ -0,0 +1,75 @@
+# tests/infrastructure/external/test_stream_parser.py
+
+"""
+Ce module contient les tests unitaires de PostStreamParser, défini dans
+src.infrastructure.external.stream_parser.
+"""
+
+import sys
+import os
+import pytest
+
+# Ajoute le répertoire racine du projet au sys.path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+sys.path.insert(0, project_root)
+
+from src.infrastructure.external.stream_parser import PostStreamParser
+from src.domain.exceptions import ContentLengthError
+
+
+def feed_all(parser, chunks):
+    """Feed chunks until the parser asks to stop; return the number of chunks read."""
+    for count, chunk in enumerate(chunks, start=1):
+        if parser.feed(chunk):
+            return count
+    return len(chunks)
+
+
+def test_stops_at_closing_tag():
+    parser = PostStreamParser()
+    chunks = ["Voici : <social_", "media_post>Hello", " world</social_media_post>", " trailing", " text"]
+
+    assert feed_all(parser, chunks) == 3
+    assert parser.closed
+    assert parser.text == "Voici : <social_media_post>Hello world</social_media_post>"
+
+
+def test_closing_tag_split_across_chunks():
+    parser = PostStreamParser()
+    chunks = ["<social_media_post>Hi", "</social", "_media", "_post>", "ignored"]
+
+    assert feed_all(parser, chunks) == 4
+    assert parser.text.endswith("Hi</social_media_post>")
+
+
+def test_stream_without_tags_is_read_entirely():
+    parser = PostStreamParser(max_length=5)
+    chunks = ["No tags ", "in this long answer"]
+
+    assert feed_all(parser, chunks) == 2
+    assert not parser.closed
+    assert parser.text == "No tags in this long answer"
+
+
+def test_aborts_once_content_is_too_long():
+    parser = PostStreamParser(max_length=10)
+    parser.feed("<social_media_post>")
+    # La fin du texte peut être le début de la balise fermante : pas encore d'abandon
+    parser.feed("x" * 25)
+
+    with pytest.raises(ContentLengthError):
+        parser.feed("x" * 10)
+
+
+def test_length_is_measured_after_cleanup():
+    # Les marqueurs gras sont retirés au nettoyage : ils ne comptent pas
+    parser = PostStreamParser(max_length=10, measure=lambda text: len(text.replace("**", "")))
+    parser.feed("<social_media_post>")
+    parser.feed("**" * 20 + "short")
+    parser.feed("</social_media_post>")
+
+    assert parser.closed
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -7,6 +7,8 @@ définie dans src.infrastructure.external.twitter_api.
 
 import sys
 import os
+import asyncio
+import httpx
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -16,6 +18,7 @@ sys.path.insert(0, project_root)
 
 from src.infrastructure.external.twitter_api import TwitterAPI
 from src.domain.entities.tweet import Tweet
+from src.infrastructure.external.retry_policy import RetryPolicy
 from src.domain.exceptions import ConfigurationError, TwitterError
 
 
@@ -85,5 +88,127 @@ def test_post_tweet_error(mock_oauth, mock_get_credentials):
     with pytest.raises(TwitterError):
         api.post_tweet(tweet)
 
+@patch('src.infrastructure.external.twitter_api.get_twitter_credentials')
+def test_post_tweet_async(mock_get_credentials):
+    mock_get_credentials.return_value = {
+        'consumer_key': 'fake_key',
+        'consumer_secret': 'fake_secret',
+        'access_token': 'fake_token',
+        'access_token_secret': 'fake_token_secret'
+    }
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(201, json={"data": {"id": "12345"}})
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = TwitterAPI(async_http_client=client)
+            return await api.post_tweet_async(Tweet("Test tweet"))
+
+    result = asyncio.run(scenario())
+
+    assert result == {"data": {"id": "12345"}}
+    assert str(requests_seen[0].url) == "https://api.twitter.com/2/tweets"
+    assert requests_seen[0].headers['Authorization'].startswith('OAuth ')
+    assert 'oauth_consumer_key="fake_key"' in requests_seen[0].headers['Authorization']
+
+@patch('src.infrastructure.external.twitter_api.get_twitter_credentials')
+def test_post_tweet_async_error(mock_get_credentials):
+    mock_get_credentials.return_value = {
+        'consumer_key': 'fake_key',
+        'consumer_secret': 'fake_secret',
+        'access_token': 'fake_token',
+        'access_token_secret': 'fake_token_secret'
+    }
+    transport = httpx.MockTransport(lambda request: httpx.Response(403, json={"detail": "Forbidden"}))
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = TwitterAPI(async_http_client=client)
+            return await api.post_tweet_async(Tweet("Test tweet"))
+
+    with pytest.raises(TwitterError):
+        asyncio.run(scenario())
+
+@patch('src.infrastructure.external.twitter_api.get_twitter_credentials')
+def test_post_tweet_async_retries_rate_limit(mock_get_credentials):
+    mock_get_credentials.return_value = {
+        'consumer_key': 'fake_key',
+        'consumer_secret': 'fake_secret',
+        'access_token': 'fake_token',
+        'access_token_secret': 'fake_token_secret'
+    }
+    responses = [
+        httpx.Response(429, headers={'x-rate-limit-reset': '0'}, json={"title": "Too Many Requests"}),
+        httpx.Response(201, json={"data": {"id": "12345"}}),
+    ]
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    async def scenario():
+        transport = httpx.MockTransport(lambda request: responses.pop(0))
+        async with httpx.AsyncClient(transport=transport) as client:
+            api = TwitterAPI(async_http_client=client, retry_policy=RetryPolicy(async_sleep=fake_sleep))
+            return await api.post_tweet_async(Tweet("Test tweet"))
+
+    assert asyncio.run(scenario()) == {"data": {"id": "12345"}}
+    assert len(sleeps) == 1
+
+@patch('src.infrastructure.external.twitter_api.get_twitter_credentials')
+def test_post_tweet_does_not_retry_permanent_error(mock_get_credentials):
+    mock_get_credentials.return_value = {
+        'consumer_key': 'fake_key',
+        'consumer_secret': 'fake_secret',
+        'access_token': 'fake_token',
+        'access_token_secret': 'fake_token_secret'
+    }
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(403, json={"detail": "Forbidden"})
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = TwitterAPI(async_http_client=client, retry_policy=RetryPolicy(async_sleep=None))
+            return await api.post_tweet_async(Tweet("Test tweet"))
+
+    with pytest.raises(TwitterError) as exc_info:
+        asyncio.run(scenario())
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.transient is False
+    assert len(calls) == 1
+
+@patch('src.infrastructure.external.twitter_api.get_twitter_credentials')
+def test_post_tweet_does_not_retry_after_gateway_error(mock_get_credentials):
+    mock_get_credentials.return_value = {
+        'consumer_key': 'fake_key',
+        'consumer_secret': 'fake_secret',
+        'access_token': 'fake_token',
+        'access_token_secret': 'fake_token_secret'
+    }
+    calls = []
+
+    def handler(request):
+        # Le tweet a peut-être été créé : le reposter risquerait un doublon
+        calls.append(request)
+        return httpx.Response(502, headers={'x-rate-limit-remaining': '299', 'x-rate-limit-reset': '9999999999'},
+                              text="Bad Gateway")
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = TwitterAPI(async_http_client=client, retry_policy=RetryPolicy(async_sleep=None))
+            return await api.post_tweet_async(Tweet("Test tweet"))
+
+    with pytest.raises(TwitterError) as exc_info:
+        asyncio.run(scenario())
+    assert exc_info.value.transient is False
+    assert exc_info.value.retry_after is None
+    assert len(calls) == 1
+
 if __name__ == "__main__":
     pytest.main([__file__, '-v'])
@@ -0,0 +1,61 @@
+# tests/infrastructure/logging/test_handlers.py
+
+"""
+Ce module contient les tests unitaires du formateur JSON et du handler
+de fichier avec rotation et compression définis dans src.infrastructure.logging.handlers.
+"""
+
+import gzip
+import json
+import logging
+import pytest
+
+from src.infrastructure.logging.handlers import CompressingRotatingFileHandler, JsonLinesFormatter
+
+
+def make_record(message, level=logging.INFO, **extra):
+    record = logging.LogRecord("test_logger", level, "/app/test.py", 10, message, (), None, func="test_func")
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_json_lines_formatter():
+    line = JsonLinesFormatter().format(make_record("Posted é", custom_level='SUCCESS'))
+    entry = json.loads(line)
+
+    assert "\n" not in line
+    assert entry['message'] == "Posted é"
+    assert entry['level'] == 'SUCCESS'
+    assert entry['file'] == 'test.py'
+    assert entry['function'] == 'test_func'
+    assert entry['line'] == 10
+
+
+def test_json_lines_formatter_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("test_logger", logging.ERROR, "test.py", 1, "Failed", (), __import__('sys').exc_info())
+
+    entry = json.loads(JsonLinesFormatter().format(record))
+    assert "ValueError: boom" in entry['exception']
+
+
+def test_rotated_files_are_compressed(tmp_path):
+    path = tmp_path / 'logs' / 'app.jsonl'
+    handler = CompressingRotatingFileHandler(str(path), max_bytes=200, backup_count=2)
+    handler.setFormatter(JsonLinesFormatter())
+
+    for i in range(20):
+        handler.emit(make_record(f"message {i} " + "x" * 50))
+    handler.close()
+
+    rotated = sorted(p.name for p in path.parent.iterdir())
+    assert rotated == ['app.jsonl', 'app.jsonl.1.gz', 'app.jsonl.2.gz']
+    with gzip.open(path.parent / 'app.jsonl.1.gz', 'rt', encoding='utf-8') as f:
+        assert all(json.loads(line)['logger'] == 'test_logger' for line in f)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
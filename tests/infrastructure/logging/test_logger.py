@@ -17,7 +17,12 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 sys.path.insert(0, project_root)
 
 
-from src.infrastructure.logging.logger import CustomLogger, ColoredFormatter, get_logger, log_method
+import json
+import threading
+from src.infrastructure.logging import logger as logger_module
+from src.infrastructure.logging.logger import (
+    CustomLogger, ColoredFormatter, get_logger, log_method, configure_logging, shutdown_logging
+)
 
 
 def test_custom_logger_creation():
@@ -87,5 +92,121 @@ def test_log_method_decorator_exception(mock_logger):
     mock_logger_instance.exiting.assert_called_once()
 
 
+def test_log_method_skips_formatting_when_disabled():
+    mock_logger_instance = MagicMock()
+    mock_logger_instance.isEnabledFor.return_value = False
+
+    @log_method(mock_logger_instance)
+    def test_function(arg):
+        return arg
+
+    assert test_function(1) == 1
+    mock_logger_instance.entering.assert_not_called()
+    mock_logger_instance.info.assert_not_called()
+    mock_logger_instance.debug.assert_not_called()
+    mock_logger_instance.exiting.assert_not_called()
+
+
+def test_log_method_still_logs_errors_when_disabled():
+    mock_logger_instance = MagicMock()
+    mock_logger_instance.isEnabledFor.return_value = False
+
+    @log_method(mock_logger_instance)
+    def test_function():
+        raise ValueError("Test exception")
+
+    with pytest.raises(ValueError):
+        test_function()
+    mock_logger_instance.error.assert_called_once_with("Exception in test_function: Test exception")
+
+
+def test_log_method_truncates_arguments():
+    mock_logger_instance = MagicMock()
+
+    @log_method(mock_logger_instance, max_arg_length=50)
+    def test_function(prompt):
+        return len(prompt)
+
+    test_function("x" * 10000)
+
+    message = mock_logger_instance.debug.call_args[0][0]
+    assert len(message) < 150
+    assert "..." in message
+
+
+def test_log_method_sampling():
+    mock_logger_instance = MagicMock()
+
+    @log_method(mock_logger_instance, sample_rate=0.0)
+    def test_function():
+        return 1
+
+    for _ in range(10):
+        test_function()
+    mock_logger_instance.entering.assert_not_called()
+
+    with pytest.raises(ValueError):
+        log_method(mock_logger_instance, sample_rate=1.5)
+
+
+def test_record_caller_skips_logger_frames():
+    logger = CustomLogger("caller_test")
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
+    @log_method(logger)
+    def test_function():
+        return 1
+
+    test_function()
+    logger.success("Done")
+
+    assert records
+    assert all(record.filename == os.path.basename(__file__) for record in records)
+    assert records[-1].funcName == "test_record_caller_skips_logger_frames"
+    formatted = ColoredFormatter().format(records[-1])
+    assert "TEST_LOGGER.PY - test_record_caller_skips_logger_frames" in formatted
+
+
+def test_get_logger_does_not_duplicate_handlers():
+    first = get_logger("dedup_test")
+    handlers = list(first.handlers)
+    second = get_logger("dedup_test")
+
+    assert first is second
+    assert second.handlers == handlers
+    assert len(handlers) == 1
+
+
+def test_pipeline_writes_from_background_thread(tmp_path):
+    json_path = tmp_path / 'app.jsonl'
+    threads = []
+
+    class RecordingHandler(logging.Handler):
+        def emit(self, record):
+            threads.append(threading.current_thread())
+
+    try:
+        configure_logging(level='INFO', json_path=str(json_path), console=False)
+        logger = get_logger("pipeline_test")
+        listener = logger_module._pipeline.listener
+        listener.handlers = listener.handlers + (RecordingHandler(),)
+
+        logger.debug("Hidden")
+        logger.success("Posted")
+        shutdown_logging()
+
+        entries = [json.loads(line) for line in json_path.read_text(encoding='utf-8').splitlines()]
+        assert [entry['message'] for entry in entries] == ["Posted"]
+        assert entries[0]['level'] == 'SUCCESS'
+        assert entries[0]['function'] == 'test_pipeline_writes_from_background_thread'
+        assert threads and all(thread is not threading.current_thread() for thread in threads)
+    finally:
+        configure_logging()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, '-v'])
@@ -0,0 +1,70 @@
+# tests/infrastructure/persistence/test_campaign_log.py
+
+"""
+This module contains unit tests for CampaignLog: the campaign checkpoint, the JSON
+Lines output and the recovery of a record cut short by an interruption.
+"""
+
+import pytest
+from src.infrastructure.persistence.campaign_log import CampaignLog
+from src.domain.exceptions import ValidationError
+
+
+@pytest.fixture
+def log(tmp_path):
+    return CampaignLog(str(tmp_path / 'campaign.jsonl'))
+
+
+def test_plan_round_trip(log):
+    """Test that the saved plan and settings are reloaded as written."""
+    assert log.load_plan() is None
+
+    log.save_plan({'count': 1}, [{'index': 0, 'platform': 'twitter'}])
+
+    assert log.load_plan() == {'settings': {'count': 1}, 'plan': [{'index': 0, 'platform': 'twitter'}]}
+
+
+def test_completed_only_counts_successes(log):
+    """Test that failed records are retried by the next run."""
+    log.append({'index': 0, 'status': 'success'})
+    log.append({'index': 1, 'status': 'failed'})
+    log.close()
+
+    assert log.completed() == {0}
+    assert [record['index'] for record in log.records()] == [0, 1]
+
+
+def test_incomplete_record_is_dropped(log):
+    """Test that a record cut short by a crash is ignored, then overwritten."""
+    with open(log.path, 'w', encoding='utf-8') as output:
+        output.write('{"index": 0, "status": "success"}\n{"index": 1, "sta')
+
+    assert log.completed() == {0}
+
+    log.append({'index': 1, 'status': 'success'})
+    log.close()
+    assert [record['index'] for record in log.records()] == [0, 1]
+
+
+def test_reset_deletes_both_files(log, tmp_path):
+    """Test that a fresh start removes the output and the checkpoint."""
+    log.save_plan({}, [])
+    log.append({'index': 0, 'status': 'success'})
+
+    log.reset()
+
+    assert log.load_plan() is None
+    assert log.records() == []
+
+
+def test_unreadable_checkpoint(log):
+    """Test that a corrupted checkpoint is reported."""
+    with open(log.checkpoint_path, 'w', encoding='utf-8') as checkpoint:
+        checkpoint.write('{')
+
+    with pytest.raises(ValidationError):
+        log.load_plan()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
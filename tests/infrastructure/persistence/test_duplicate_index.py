@@ -0,0 +1,96 @@
+# tests/infrastructure/persistence/test_duplicate_index.py
+
+"""
+This module contains unit tests for DuplicateIndex: finding near-duplicates of the
+indexed texts of a platform, and keeping them across restarts.
+"""
+
+import time
+import pytest
+from src.infrastructure.persistence.duplicate_index import DuplicateIndex
+from src.infrastructure.utils.minhash import MinHasher
+
+POST = ("Chez TechAware, nos développeurs juniors encadrés par des seniors livrent vos projets "
+        "digitaux à moindre coût, sans compromis sur la qualité du code.")
+
+
+@pytest.fixture
+def index():
+    return DuplicateIndex(':memory:')
+
+
+def test_find_near_duplicate(index):
+    """Test that a lightly edited text is found with its similarity and excerpt."""
+    post_id = index.add('linkedin', POST)
+
+    match = index.find('linkedin', POST.replace("sans compromis", "sans aucun compromis"), 0.5)
+
+    assert match['id'] == post_id
+    assert 0.5 <= match['similarity'] < 1.0
+    assert match['excerpt'] == POST[:DuplicateIndex.EXCERPT_LENGTH]
+
+
+def test_distinct_text_is_not_found(index):
+    """Test that an unrelated text or a low similarity does not match."""
+    index.add('linkedin', POST)
+
+    assert index.find('linkedin', "Le mentorat donne confiance aux développeurs qui débutent leur carrière", 0.5) is None
+    assert index.find('linkedin', POST + " Contactez-nous dès aujourd'hui pour en parler ensemble.", 0.99) is None
+
+
+def test_platforms_are_separate(index):
+    """Test that a text only matches the texts of its own platform."""
+    index.add('twitter', POST)
+
+    assert index.find('linkedin', POST, 0.8) is None
+    assert index.count('twitter') == 1
+    assert index.count() == 1
+
+
+def test_texts_added_after_loading_are_found(index):
+    """Test that the in-memory buckets follow the texts added after the first search."""
+    assert index.find('facebook', POST, 0.8) is None
+    index.add('facebook', POST)
+
+    assert index.find('facebook', POST, 0.8)['similarity'] == 1.0
+
+
+def test_index_survives_reopening(tmp_path):
+    """Test that the signatures are persisted and reloaded by a new index."""
+    path = str(tmp_path / 'dedup.sqlite3')
+    first = DuplicateIndex(path)
+    first.add('facebook', POST)
+    first.close()
+
+    assert DuplicateIndex(path).find('facebook', POST, 0.8) is not None
+
+
+def test_signatures_of_other_settings_are_dropped(tmp_path):
+    """Test that reopening the index with another hasher drops the incomparable signatures."""
+    path = str(tmp_path / 'dedup.sqlite3')
+    first = DuplicateIndex(path)
+    first.add('facebook', POST)
+    first.close()
+
+    reopened = DuplicateIndex(path, hasher=MinHasher(seed=2))
+
+    assert reopened.count() == 0
+    reopened.add('facebook', POST)
+    reopened.close()
+    assert DuplicateIndex(path, hasher=MinHasher(seed=2)).find('facebook', POST, 0.8) is not None
+
+
+def test_lookup_does_not_scan_every_text(index):
+    """Test that a search among many indexed texts stays fast."""
+    for number in range(2000):
+        index.add('twitter', f"Publication numéro {number} sur le sujet {number * 7} avec le mot clé {number % 13}")
+    index.find('twitter', POST, 0.8)  # construction des buckets
+
+    start = time.perf_counter()
+    for _ in range(20):
+        assert index.find('twitter', POST, 0.8) is None
+    assert (time.perf_counter() - start) / 20 < 0.05
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
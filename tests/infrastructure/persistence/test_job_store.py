@@ -0,0 +1,177 @@
+# tests/infrastructure/persistence/test_job_store.py
+
+"""
+This module contains unit tests for JobStore, the queue of scheduled posts: claiming
+due jobs, completion, retries, cancellation and recovery of interrupted jobs.
+"""
+
+import sqlite3
+import pytest
+from src.infrastructure.persistence.job_store import JobStore
+from src.domain.exceptions import ValidationError
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(clock):
+    return JobStore(':memory:', clock=clock)
+
+
+def test_claim_due_only_returns_due_jobs(store, clock):
+    """Test that only due pending jobs are claimed, oldest first, and marked running."""
+    later = store.add('twitter', clock.now + 60)
+    second = store.add('linkedin', clock.now - 10)
+    first = store.add('facebook', clock.now - 20, topic='business')
+
+    claimed = store.claim_due(10)
+
+    assert [job['id'] for job in claimed] == [first, second]
+    assert claimed[0]['topic'] == 'business'
+    assert claimed[0]['status'] == 'running' and claimed[0]['attempts'] == 1
+    assert store.get(first)['status'] == 'running'
+    assert store.get(later)['status'] == 'pending'
+    assert store.claim_due(10) == []
+
+
+def test_claim_due_respects_limit(store, clock):
+    """Test that at most ``limit`` jobs are claimed at once."""
+    for _ in range(5):
+        store.add('twitter', clock.now)
+
+    assert len(store.claim_due(2)) == 2
+    assert store.counts()['pending'] == 3
+
+
+def test_complete_records_post_id(store, clock):
+    """Test that a completed job keeps the id of its post."""
+    job_id = store.add('twitter', clock.now)
+    store.claim_due(1)
+    store.complete(job_id, "123")
+
+    job = store.get(job_id)
+    assert job['status'] == 'done'
+    assert job['post_id'] == "123"
+
+
+def test_fail_reschedules_until_attempts_exhausted(store, clock):
+    """Test that a failed job is retried at ``retry_at`` until its last attempt."""
+    job_id = store.add('twitter', clock.now, max_attempts=2)
+
+    store.claim_due(1)
+    assert store.fail(job_id, "boom", retry_at=clock.now + 300) == 'pending'
+    assert store.get(job_id)['due_at'] == clock.now + 300
+    assert store.claim_due(1) == []
+
+    clock.now += 300
+    store.claim_due(1)
+    assert store.fail(job_id, "boom again", retry_at=clock.now + 600) == 'failed'
+    job = store.get(job_id)
+    assert job['attempts'] == 2
+    assert job['last_error'] == "boom again"
+
+
+def test_fail_without_retry_time_is_final(store, clock):
+    """Test that a failure without retry time marks the job failed."""
+    job_id = store.add('twitter', clock.now)
+    store.claim_due(1)
+
+    assert store.fail(job_id, "permanent") == 'failed'
+
+
+def test_cancel_only_pending_jobs(store, clock):
+    """Test that pending jobs can be cancelled, running ones cannot."""
+    pending = store.add('twitter', clock.now + 60)
+    running = store.add('facebook', clock.now)
+    store.claim_due(1)
+
+    assert store.cancel(pending)
+    assert not store.cancel(running)
+    assert not store.cancel(999)
+    assert store.get(pending)['status'] == 'cancelled'
+
+
+def test_recover_requeues_running_jobs(store, clock):
+    """Test that jobs left running by a stopped worker are claimed again once their claim is stale."""
+    job_id = store.add('twitter', clock.now)
+    store.claim_due(1)
+    clock.now += 3600
+
+    assert store.recover(stale_after=3600) == 1
+    claimed = store.claim_due(1)
+    assert [job['id'] for job in claimed] == [job_id]
+    assert claimed[0]['claimed_at'] == clock.now
+
+
+def test_recover_leaves_jobs_of_running_workers_alone(store, clock):
+    """Test that a worker starting next to another one does not take over its jobs."""
+    job_id = store.add('twitter', clock.now)
+    store.claim_due(1)
+    clock.now += 60
+
+    assert store.recover(stale_after=3600) == 0
+    assert store.claim_due(1) == []
+    assert store.get(job_id)['status'] == 'running'
+    assert store.get(job_id)['attempts'] == 1
+
+
+def test_existing_queue_gains_the_claim_column(tmp_path, clock):
+    """Test that a queue created before claims were timed is upgraded on opening."""
+    path = str(tmp_path / 'scheduler.sqlite3')
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, platform TEXT NOT NULL, "
+                       "topic TEXT, due_at REAL NOT NULL, status TEXT NOT NULL DEFAULT 'pending', "
+                       "attempts INTEGER NOT NULL DEFAULT 0, max_attempts INTEGER NOT NULL DEFAULT 3, "
+                       "last_error TEXT, post_id TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL)")
+    connection.execute("INSERT INTO jobs (platform, due_at, status, created_at, updated_at) "
+                       "VALUES ('twitter', 0, 'running', 0, ?)", (clock.now - 7200,))
+    connection.commit()
+    connection.close()
+
+    store = JobStore(path, clock=clock)
+
+    assert store.recover(stale_after=3600) == 1
+    assert store.claim_due(1)[0]['claimed_at'] == clock.now
+    store.close()
+
+
+def test_next_due_and_listing(store, clock):
+    """Test the next due time, the listing by status and the counts."""
+    assert store.next_due() is None
+    store.add('twitter', clock.now + 60)
+    cancelled = store.add('facebook', clock.now + 30)
+    store.cancel(cancelled)
+
+    assert store.next_due() == clock.now + 60
+    assert [job['platform'] for job in store.list()] == ['facebook', 'twitter']
+    assert [job['platform'] for job in store.list('pending')] == ['twitter']
+    assert store.counts() == {'pending': 1, 'running': 0, 'done': 0, 'failed': 0, 'cancelled': 1}
+    with pytest.raises(ValidationError):
+        store.list('unknown')
+
+
+def test_jobs_persist_across_instances(tmp_path, clock):
+    """Test that scheduled jobs survive a restart."""
+    path = str(tmp_path / 'scheduler.sqlite3')
+    store = JobStore(path, clock=clock)
+    job_id = store.add('linkedin', clock.now, topic='slides')
+    store.close()
+
+    reopened = JobStore(path, clock=clock)
+    assert reopened.get(job_id)['topic'] == 'slides'
+    reopened.close()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,189 @@
+# tests/infrastructure/persistence/test_outbox_store.py
+
+"""
+This module contains unit tests for OutboxStore: recording publications by content
+hash, the posting states and the recovery of interrupted posts.
+"""
+
+import sqlite3
+import pytest
+from src.infrastructure.persistence.outbox_store import OutboxStore
+from src.domain.exceptions import ValidationError
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(clock):
+    return OutboxStore(':memory:', clock=clock)
+
+
+def test_add_is_idempotent_per_content(store):
+    """Test that the same content of a platform is recorded once."""
+    first = store.add('twitter', "Hello")
+    again = store.add('twitter', "Hello")
+    other_platform = store.add('linkedin', "Hello")
+
+    assert first['id'] == again['id']
+    assert first['status'] == 'pending'
+    assert other_platform['id'] != first['id']
+    assert first['content_hash'] == OutboxStore.content_hash('twitter', "Hello")
+
+
+def test_next_pending_is_oldest_of_platform(store):
+    """Test that the oldest pending publication of the platform is returned."""
+    first = store.add('twitter', "First")
+    store.add('twitter', "Second")
+    store.add('facebook', "Other")
+
+    assert store.next_pending('twitter')['id'] == first['id']
+    assert store.next_pending('linkedin') is None
+
+
+def test_claim_pending_is_exclusive(store, clock):
+    """Test that a pending publication is claimed once, until its claim is abandoned."""
+    item = store.add('twitter', "Claimed by its author")
+    assert store.claim_pending('twitter') is None
+
+    store.unclaim(item['id'])
+    assert store.claim_pending('twitter')['id'] == item['id']
+    assert store.claim_pending('twitter') is None
+
+    clock.now += 7200
+    assert store.claim_pending('twitter', stale_after=3600)['id'] == item['id']
+
+
+def test_claim_pending_filters_on_category(store):
+    """Test that a claim for a category only takes a publication of that category."""
+    business = store.add('linkedin', "Business post", category='business')
+    store.unclaim(business['id'])
+
+    assert store.claim_pending('linkedin', 'developer') is None
+    claimed = store.claim_pending('linkedin', 'business')
+    assert claimed['id'] == business['id']
+    assert claimed['category'] == 'business'
+
+
+def test_released_publication_can_be_claimed_again(store):
+    """Test that a publication whose post failed temporarily is claimed by the next run."""
+    item = store.add('facebook', "Post")
+    store.begin_posting(item['id'])
+    store.release(item['id'], "Facebook API error")
+
+    assert store.claim_pending('facebook')['id'] == item['id']
+
+
+def test_existing_outbox_gains_the_new_columns(tmp_path):
+    """Test that an outbox created before categories and claims were recorded is upgraded on opening."""
+    path = str(tmp_path / 'outbox.sqlite3')
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE outbox (id INTEGER PRIMARY KEY AUTOINCREMENT, platform TEXT NOT NULL, "
+                       "content TEXT NOT NULL, content_hash TEXT NOT NULL UNIQUE, "
+                       "status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+                       "post_id TEXT, result TEXT, last_error TEXT, created_at REAL NOT NULL, "
+                       "updated_at REAL NOT NULL)")
+    connection.execute("INSERT INTO outbox (platform, content, content_hash, created_at, updated_at) "
+                       "VALUES ('twitter', 'Old tweet', 'hash', 0, 0)")
+    connection.commit()
+    connection.close()
+
+    store = OutboxStore(path)
+
+    assert store.claim_pending('twitter')['content'] == "Old tweet"
+    assert store.add('twitter', "New tweet", category='slides')['category'] == 'slides'
+    store.close()
+
+
+def test_posting_lifecycle(store):
+    """Test the pending, posting and published states."""
+    item = store.add('facebook', "Post")
+
+    assert store.begin_posting(item['id'])
+    assert not store.begin_posting(item['id'])
+    assert store.next_pending('facebook') is None
+
+    store.mark_published(item['id'], "1_2", {"id": "1_2"})
+    published = store.get(item['id'])
+    assert published['status'] == 'published'
+    assert published['post_id'] == "1_2"
+    assert published['attempts'] == 1
+    assert store.add('facebook', "Post")['status'] == 'published'
+
+
+def test_release_returns_to_pending(store):
+    """Test that a failed post leaves the publication pending with its error."""
+    item = store.add('facebook', "Post")
+    store.begin_posting(item['id'])
+    store.release(item['id'], "Facebook API error")
+
+    pending = store.next_pending('facebook')
+    assert pending['id'] == item['id']
+    assert pending['last_error'] == "Facebook API error"
+
+
+def test_mark_failed_sets_the_publication_aside(store):
+    """Test that a publication refused for good is no longer pending, until requeued."""
+    item = store.add('twitter', "Refused")
+    store.begin_posting(item['id'])
+    store.mark_failed(item['id'], "Forbidden")
+
+    assert store.next_pending('twitter') is None
+    assert store.get(item['id'])['last_error'] == "Forbidden"
+    assert store.counts()['failed'] == 1
+    assert store.requeue(item['id'])
+    assert store.next_pending('twitter')['id'] == item['id']
+
+
+def test_recover_marks_stale_posts_unknown(store, clock):
+    """Test that only posts interrupted long enough ago are marked unknown."""
+    stale = store.add('twitter', "Stale")
+    store.begin_posting(stale['id'])
+    clock.now += 7200
+    in_flight = store.add('twitter', "In flight")
+    store.begin_posting(in_flight['id'])
+
+    assert store.recover(stale_after=3600) == 1
+    assert store.get(stale['id'])['status'] == 'unknown'
+    assert store.get(in_flight['id'])['status'] == 'posting'
+
+
+def test_requeue_and_discard(store, clock):
+    """Test that unknown publications are requeued or discarded explicitly."""
+    item = store.add('twitter', "Interrupted")
+    store.begin_posting(item['id'])
+    clock.now += 7200
+    store.recover()
+
+    assert store.next_pending('twitter') is None
+    assert store.requeue(item['id'])
+    assert store.next_pending('twitter')['id'] == item['id']
+    assert store.discard(item['id'])
+    assert not store.requeue(item['id'])
+    assert store.counts()['discarded'] == 1
+
+
+def test_list_by_status(store):
+    """Test listing, most recent first, and status validation."""
+    store.add('twitter', "First")
+    second = store.add('twitter', "Second")
+    store.begin_posting(second['id'])
+
+    assert [item['content'] for item in store.list()] == ["Second", "First"]
+    assert [item['content'] for item in store.list('pending')] == ["First"]
+    with pytest.raises(ValidationError):
+        store.list('lost')
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
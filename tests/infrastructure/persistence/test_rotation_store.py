@@ -0,0 +1,66 @@
+# tests/infrastructure/persistence/test_rotation_store.py
+
+"""
+This module contains unit tests for RotationStore: recording the uses of each
+combination per platform, and reading them back.
+"""
+
+import pytest
+from src.infrastructure.persistence.rotation_store import RotationStore
+
+COMBINATION = ('business', 'Support et mentorat', 'Pédagogique', 'Enthousiaste', 'Le mentor')
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(clock):
+    return RotationStore(':memory:', clock=clock)
+
+
+def test_record_counts_uses_per_platform(store, clock):
+    """Test that each use increments the count and moves the last use time."""
+    store.record('twitter', COMBINATION)
+    clock.now += 60
+    store.record('twitter', COMBINATION)
+    store.record('linkedin', COMBINATION)
+
+    assert store.usage('twitter') == {COMBINATION: {'uses': 2, 'last_used_at': clock.now}}
+    assert store.usage('linkedin')[COMBINATION]['uses'] == 1
+    assert store.usage('facebook') == {}
+
+
+def test_recent_and_clear(store, clock):
+    """Test listing the latest uses and forgetting the history of a platform."""
+    store.record('twitter', COMBINATION)
+    clock.now += 60
+    store.record('facebook', COMBINATION)
+
+    assert [row['platform'] for row in store.recent()] == ['facebook', 'twitter']
+    assert store.clear('twitter') == 1
+    assert [row['platform'] for row in store.recent()] == ['facebook']
+
+
+def test_history_survives_reopening(tmp_path):
+    """Test that the history is persisted in the SQLite file."""
+    path = str(tmp_path / 'rotation.sqlite3')
+    store = RotationStore(path)
+    store.record('twitter', COMBINATION)
+    store.close()
+
+    assert RotationStore(path).usage('twitter')[COMBINATION]['uses'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,45 @@
+# tests/infrastructure/persistence/test_sqlite_store.py
+
+"""
+This module contains unit tests for the SQLiteStore base class.
+"""
+
+import pytest
+from src.infrastructure.persistence.sqlite_store import SQLiteStore
+
+
+class ItemStore(SQLiteStore):
+    SCHEMA = "CREATE TABLE IF NOT EXISTS items (name TEXT PRIMARY KEY);"
+
+
+def test_schema_is_created(tmp_path):
+    """Test that the schema exists and the database file is created with its directory."""
+    store = ItemStore(str(tmp_path / 'sub' / 'items.sqlite3'))
+
+    assert store.query("SELECT COUNT(*) FROM items")[0][0] == 0
+    assert (tmp_path / 'sub' / 'items.sqlite3').exists()
+    store.close()
+
+
+def test_transaction_commits():
+    """Test that statements of a successful transaction are committed."""
+    store = ItemStore(':memory:')
+    with store.transaction() as connection:
+        connection.execute("INSERT INTO items VALUES ('a')")
+
+    assert [row['name'] for row in store.query("SELECT name FROM items")] == ['a']
+
+
+def test_transaction_rolls_back_on_error():
+    """Test that a failing transaction leaves no trace."""
+    store = ItemStore(':memory:')
+    with pytest.raises(RuntimeError):
+        with store.transaction() as connection:
+            connection.execute("INSERT INTO items VALUES ('a')")
+            raise RuntimeError("boom")
+
+    assert store.query("SELECT COUNT(*) FROM items")[0][0] == 0
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
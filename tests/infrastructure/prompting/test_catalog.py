@@ -0,0 +1,192 @@
+# tests/infrastructure/prompting/test_catalog.py
+
+"""
+This module contains unit tests for the prompt catalog: schema validation, the compact
+shared form, and the reload of a changed catalog file.
+"""
+
+import copy
+import json
+import os
+import subprocess
+import sys
+import pytest
+from unittest.mock import MagicMock
+from src.infrastructure.prompting.catalog import (
+    Catalog, CatalogLoader, DEFAULT_CATALOG_PATH, get_catalog, reset_catalog, validate_catalog
+)
+from src.infrastructure.prompting.prompt_builder import PromptBuilder, render
+from src.use_cases.generate_campaign import GenerateCampaignUseCase
+from src.use_cases.generate_linkedin_post import GenerateLinkedInPostUseCase
+from src.use_cases.generate_tweet import GenerateTweetUseCase
+from src.domain.exceptions import ConfigurationError
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+@pytest.fixture
+def catalog_data():
+    with open(DEFAULT_CATALOG_PATH, encoding='utf-8') as catalog_file:
+        return json.load(catalog_file)
+
+
+def write(path, data, mtime=None):
+    with open(path, 'w', encoding='utf-8') as catalog_file:
+        json.dump(data, catalog_file, ensure_ascii=False)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_shipped_catalog_is_valid(catalog_data):
+    """Test that the catalog shipped with the application passes validation."""
+    assert validate_catalog(catalog_data) == []
+
+
+def test_validation_reports_problems(catalog_data):
+    """Test that missing sections, missing fields and duplicates are reported."""
+    del catalog_data['brand_tones']
+    del catalog_data['topics']['business'][0]['link']
+    catalog_data['topics']['slides'].append(copy.deepcopy(catalog_data['topics']['slides'][0]))
+    catalog_data['platform_guidelines']['twitter']['max_length'] = "280"
+
+    problems = validate_catalog(catalog_data)
+
+    assert "missing section 'brand_tones'" in problems
+    assert "topics.business[0].link must be a non-empty str" in problems
+    assert any("duplicate subject" in problem for problem in problems)
+    assert "platform_guidelines.twitter.max_length must be a non-empty int" in problems
+    with pytest.raises(ConfigurationError):
+        Catalog(catalog_data)
+
+
+def test_catalog_is_compact_and_indexed(catalog_data):
+    """Test the tuples, interned strings and indexes of a parsed catalog."""
+    catalog = Catalog(catalog_data)
+    topic = catalog.topics['business'][0]
+
+    assert isinstance(catalog.topics['business'], tuple)
+    assert catalog.topic('business', topic['subject']) is topic
+    assert catalog.topics['business'][1]['link'] is topic['link']
+    style = catalog.brand_styles[0]['name']
+    tone = catalog.brand_tones[0]['name']
+    personality = catalog.brand_personalities[0]['name']
+    assert catalog.voice(style, tone, personality)['style'] is catalog.brand_styles[0]
+    assert catalog.voice("Inconnu", tone, personality) is None
+
+
+def test_loader_reloads_changed_file(tmp_path, catalog_data):
+    """Test that a file changed on disk is reloaded, and an unchanged one is not."""
+    path = str(tmp_path / 'catalog.json')
+    write(path, catalog_data, mtime=1_000)
+    loader = CatalogLoader(path, check_interval=0)
+    first = loader.get()
+    assert loader.get() is first
+
+    catalog_data['platform_guidelines']['twitter']['max_length'] = 250
+    write(path, catalog_data, mtime=2_000)
+
+    reloaded = loader.get()
+    assert reloaded is not first
+    assert reloaded.platform_guidelines['twitter']['max_length'] == 250
+    assert reloaded.version > first.version
+
+
+def test_loader_checks_once_per_interval(tmp_path, catalog_data):
+    """Test that the file is not checked again before the interval has elapsed."""
+    path = str(tmp_path / 'catalog.json')
+    write(path, catalog_data, mtime=1_000)
+    now = [0.0]
+    loader = CatalogLoader(path, check_interval=5, clock=lambda: now[0])
+    first = loader.get()
+
+    catalog_data['brand_tones'].pop()
+    write(path, catalog_data, mtime=2_000)
+    assert loader.get() is first
+
+    now[0] += 5
+    assert len(loader.get().brand_tones) == len(first.brand_tones) - 1
+
+
+def test_invalid_reload_keeps_previous_catalog(tmp_path, catalog_data):
+    """Test that a broken edit is reported without losing the catalog in use."""
+    path = str(tmp_path / 'catalog.json')
+    write(path, catalog_data, mtime=1_000)
+    loader = CatalogLoader(path, check_interval=0)
+    first = loader.get()
+
+    with open(path, 'w', encoding='utf-8') as catalog_file:
+        catalog_file.write('{"topics": ')
+    os.utime(path, (2_000, 2_000))
+
+    assert loader.get() is first
+
+
+def test_invalid_first_load_raises(tmp_path):
+    """Test that a process cannot start without a valid catalog."""
+    with pytest.raises(ConfigurationError):
+        CatalogLoader(str(tmp_path / 'missing.json')).get()
+
+    path = str(tmp_path / 'catalog.json')
+    write(path, {'topics': {}})
+    with pytest.raises(ConfigurationError):
+        CatalogLoader(path).get()
+
+
+def test_prompt_builder_follows_the_configured_catalog(tmp_path, monkeypatch, catalog_data):
+    """Test that builders share the configured catalog and render with its reloaded guidelines."""
+    path = str(tmp_path / 'catalog.json')
+    write(path, catalog_data, mtime=1_000)
+    monkeypatch.setenv('PROMPT_CATALOG_PATH', path)
+    monkeypatch.setenv('PROMPT_CATALOG_CHECK_INTERVAL', '0')
+    reset_catalog()
+
+    assert PromptBuilder().TOPICS_DATABASE is PromptBuilder.TOPICS_DATABASE is get_catalog().topics
+    topic = PromptBuilder.TOPICS_DATABASE['business'][0]
+    voice = {'style': PromptBuilder.BRAND_STYLES[0], 'tone': PromptBuilder.BRAND_TONES[0],
+             'personality': PromptBuilder.BRAND_PERSONALITIES[0]}
+    assert "limite de 280 caractères" in render('twitter', topic, voice)
+
+    catalog_data['platform_guidelines']['twitter']['max_length'] = 250
+    write(path, catalog_data, mtime=2_000)
+
+    assert "limite de 250 caractères" in render('twitter', topic, voice)
+
+
+
+def test_use_cases_follow_catalog_reloads(tmp_path, monkeypatch, catalog_data):
+    """Test that the length limits and campaign categories of the use cases follow a reload."""
+    path = str(tmp_path / 'catalog.json')
+    write(path, catalog_data, mtime=1_000)
+    monkeypatch.setenv('PROMPT_CATALOG_PATH', path)
+    monkeypatch.setenv('PROMPT_CATALOG_CHECK_INTERVAL', '0')
+    reset_catalog()
+    gateway = MagicMock(generate=MagicMock(return_value="Un tweet #TechAware"))
+    tweet = GenerateTweetUseCase(gateway)
+    campaign = GenerateCampaignUseCase(gateway)
+    assert tweet.max_length == 280
+    assert 'events' not in campaign.categories
+
+    catalog_data['platform_guidelines']['twitter']['max_length'] = 250
+    catalog_data['platform_guidelines']['linkedin']['max_length'] = 2000
+    catalog_data['topics']['events'] = copy.deepcopy(catalog_data['topics']['business'])
+    write(path, catalog_data, mtime=2_000)
+
+    tweet.execute()
+    assert gateway.generate.call_args.kwargs['max_length'] == 250
+    assert GenerateLinkedInPostUseCase(gateway).max_length == 2000
+    assert 'events' in campaign.categories
+    assert {item['category'] for item in campaign.plan(3, platforms=['twitter'], categories=['events'])} \
+        == {'events'}
+
+
+def test_catalog_is_not_read_on_import(tmp_path):
+    """Test that a missing catalog does not break the import of the container, only its use."""
+    environment = dict(os.environ, PROMPT_CATALOG_PATH=str(tmp_path / 'missing.json'))
+    result = subprocess.run([sys.executable, '-c', 'import src.infrastructure.container'],
+                            cwd=PROJECT_ROOT, env=environment, capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -6,11 +6,12 @@ its implementation of the PromptBuilderGateway interface and its concrete
 functionality for building prompts. Tests include print outputs for manual verification.
 """
 
+import random
 import pytest
 from unittest.mock import patch, MagicMock
 from typing import Dict, Optional
 
-from src.infrastructure.prompting.prompt_builder import PromptBuilder
+from src.infrastructure.prompting.prompt_builder import PromptBuilder, random_topic, random_voice, render
 from src.interfaces.prompt_builder_gateway import PromptBuilderGateway
 from src.domain.exceptions import ValidationError, ConfigurationError
 
@@ -213,6 +214,78 @@ class TestPromptBuilder:
         print(f"Caught expected error: {str(exc_info.value)}")
         assert "Platform and topic must be set" in str(exc_info.value)
 
+    def test_build_many_shares_topic_and_tags_each_platform(self, builder: PromptBuilder):
+        """Test building a single prompt for several platforms."""
+        print("\nTest: Multi-platform prompt")
+        prompt = builder.build_many(
+            {'facebook': "Facebook instructions", 'twitter': "Twitter instructions"},
+            'business'
+        )
+        print(prompt)
+
+        assert prompt.count("Sujet:") == 1
+        assert prompt.count("Voix de marque sélectionnée") == 1
+        assert "<facebook_post>" in prompt and "</facebook_post>" in prompt
+        assert "<x_post>" in prompt and "</x_post>" in prompt
+        assert "<linkedin_post>" not in prompt
+        assert "Facebook instructions" in prompt
+        assert "Twitter instructions" in prompt
+        assert str(builder.PLATFORM_GUIDELINES['twitter']['max_length']) in prompt
+        assert str(builder.PLATFORM_GUIDELINES['facebook']['max_length']) in prompt
+
+    def test_build_many_invalid_platform(self, builder: PromptBuilder):
+        """Test that an unsupported platform is rejected in a multi-platform prompt."""
+        with pytest.raises(ValidationError) as exc_info:
+            builder.build_many({'myspace': ""}, 'business')
+        assert "Unsupported platform" in str(exc_info.value)
+
+    def test_platform_specs(self, builder: PromptBuilder):
+        """Test the output tag and length limit of each platform."""
+        specs = builder.platform_specs(['linkedin', 'twitter'])
+        assert specs == {
+            'linkedin': {'tag': 'linkedin_post', 'max_length': 3000},
+            'twitter': {'tag': 'x_post', 'max_length': 280}
+        }
+
+
+    @pytest.mark.parametrize("platform", ['twitter', 'linkedin', 'facebook'])
+    def test_render_matches_build(self, builder: PromptBuilder, platform: str):
+        """Test that the builder-free render produces exactly the prompt of build()."""
+        random.seed(7)
+        built = (builder.set_platform_and_topic_category(platform, 'developer')
+                 .add_custom_instructions("  Keep it short.  ")
+                 .build())
+
+        random.seed(7)
+        rendered = render(platform, random_topic('developer'), random_voice(), "  Keep it short.  ")
+
+        assert rendered == built
+        assert rendered.endswith("\n\nInstructions supplémentaires:\nKeep it short.")
+
+    def test_render_layout(self):
+        """Test the order of the slots around the precompiled static parts."""
+        topic = {'subject': 'S', 'context': 'C', 'problem': 'P', 'solution': 'So', 'link': 'https://l'}
+        voice = {key: {'name': f"{key} name", 'description': f"{key} description"}
+                 for key in ('style', 'tone', 'personality')}
+
+        lines = render('twitter', topic, voice).split("\n")
+
+        assert lines[0].startswith("Générez une publication twitter")
+        assert lines[3:8] == ["Sujet: S", "Contexte: C", "Problème: P", "Solution: So", "URL à inclure: https://l"]
+        assert "    Style: style name" in lines
+        assert lines[-1] == "</social_media_post>"
+        assert "Instructions supplémentaires:" not in lines
+
+    def test_render_invalid_platform(self):
+        """Test that render rejects an unsupported platform."""
+        with pytest.raises(ValidationError):
+            render('myspace', {}, {})
+
+    def test_random_topic_invalid_category(self):
+        """Test that random_topic rejects an unknown category."""
+        with pytest.raises(ValidationError):
+            random_topic('gardening')
+
 
 if __name__ == "__main__":
     pytest.main(["-v", "-s", __file__])
\ No newline at end of file
@@ -0,0 +1,86 @@
+# Location: tests/infrastructure/prompting/test_token_estimator.py
+
+"""
+This module contains unit tests for the offline token estimator: token counts,
+output budgets and the per-section cost report of the platform prompts.
+"""
+
+import random
+import pytest
+
+from src.infrastructure.prompting.prompt_builder import PromptBuilder, random_topic, random_voice, render
+from src.infrastructure.prompting.token_estimator import (
+    estimate_tokens, output_token_budget, prompt_sections, section_costs
+)
+
+
+def test_estimate_tokens_empty():
+    """Test that an empty text costs no token."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens(None) == 0
+
+
+def test_estimate_tokens_plain_words():
+    """Test that short English words cost about one token each."""
+    assert estimate_tokens("The quick brown fox") == 4
+
+
+def test_estimate_tokens_weights_non_ascii():
+    """Test that accented words and emojis cost more than their ASCII length suggests."""
+    assert estimate_tokens("éèàù") > estimate_tokens("eeau")
+    assert estimate_tokens("🚀") >= 2
+
+
+def test_estimate_tokens_digits_grouped():
+    """Test that long numbers are counted per group of three digits."""
+    assert estimate_tokens("123456789") == 3
+
+
+def test_estimate_tokens_grows_with_text():
+    """Test that the estimate is additive enough to compare prompt sections."""
+    text = "Rédigez une publication engageante pour LinkedIn."
+    assert estimate_tokens(text * 2) >= 2 * estimate_tokens(text) - 1
+
+
+def test_output_token_budget():
+    """Test the budget derived from a character limit, and its cap."""
+    assert output_token_budget(280) == 144
+    assert output_token_budget(3000) > output_token_budget(280)
+    assert output_token_budget(63206, cap=4096) == 4096
+
+
+def test_prompt_sections():
+    """Test that sections start at a heading following an empty line."""
+    prompt = "Intro line\nmore intro\n\nFirst section:\n- item: value\n\nSecond:\ntext"
+    sections = prompt_sections(prompt)
+
+    assert [heading for heading, _ in sections] == ["Introduction", "First section", "Second"]
+    assert "\n".join(text for _, text in sections) == prompt
+
+
+@pytest.mark.parametrize("platform", ['facebook', 'linkedin', 'twitter'])
+def test_section_costs_of_platform_prompts(platform):
+    """Test the cost report of every platform prompt."""
+    random.seed(3)
+    prompt = render(platform, random_topic('business'), random_voice(), "Keep it short.")
+    costs = section_costs(prompt)
+
+    assert list(costs)[0] == "Introduction"
+    assert "Consignes importantes" in costs
+    assert "Instructions supplémentaires" in costs
+    assert all(tokens > 0 for tokens in costs.values())
+    assert abs(sum(costs.values()) - estimate_tokens(prompt)) <= len(costs)
+
+
+def test_section_costs_of_multi_platform_prompt():
+    """Test that repeated headings of a multi-platform prompt are summed."""
+    builder = PromptBuilder()
+    prompt = builder.build_many({'twitter': "", 'linkedin': ""}, 'developer')
+
+    costs = section_costs(prompt)
+    assert sum(costs.values()) > 0
+    assert len(costs) == len(set(costs))
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "-s", __file__])
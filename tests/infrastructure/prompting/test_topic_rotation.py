@@ -0,0 +1,171 @@
+# tests/infrastructure/prompting/test_topic_rotation.py
+
+"""
+This module contains unit tests for TopicRotation: the least recently used and least
+used orders, the persisted history and the rotation of the prompt builder.
+"""
+
+import json
+import os
+import pytest
+from src.infrastructure.persistence.rotation_store import RotationStore
+from src.infrastructure.prompting.catalog import DEFAULT_CATALOG_PATH, reset_catalog
+from src.infrastructure.prompting.prompt_builder import PromptBuilder
+from src.infrastructure.prompting.topic_rotation import TopicRotation
+from src.domain.exceptions import ValidationError
+
+SUBJECT_COUNT = sum(len(topics) for topics in PromptBuilder.TOPICS_DATABASE.values())
+VOICE_COUNT = len(PromptBuilder.BRAND_STYLES) * len(PromptBuilder.BRAND_TONES) * len(PromptBuilder.BRAND_PERSONALITIES)
+
+
+def combination(selection):
+    category, topic, voice = selection
+    return (category, topic['subject'], voice['style']['name'], voice['tone']['name'], voice['personality']['name'])
+
+
+def test_every_subject_before_any_repeat():
+    """Test that all subjects are used once before one comes back."""
+    rotation = TopicRotation(seed=1)
+
+    subjects = [rotation.select('twitter')[1]['subject'] for _ in range(SUBJECT_COUNT)]
+
+    assert len(set(subjects)) == SUBJECT_COUNT
+
+
+def test_voice_changes_with_every_subject():
+    """Test that the voice changes at every pick instead of staying for a whole pass of subjects."""
+    rotation = TopicRotation(seed=1)
+
+    voices = [combination(rotation.select('twitter'))[2:] for _ in range(SUBJECT_COUNT)]
+
+    assert all(voice != following for voice, following in zip(voices, voices[1:]))
+    assert len(set(voices)) == min(SUBJECT_COUNT, VOICE_COUNT)
+
+
+def test_categories_alternate():
+    """Test that consecutive picks change category while every category has subjects left."""
+    rotation = TopicRotation(seed=1)
+
+    categories = [rotation.select('linkedin')[0] for _ in range(3)]
+
+    assert sorted(categories) == sorted(PromptBuilder.TOPICS_DATABASE)
+
+
+def test_lru_goes_through_every_combination():
+    """Test that no combination is repeated before all of them were used."""
+    rotation = TopicRotation(seed=2)
+    total = SUBJECT_COUNT * VOICE_COUNT
+
+    picks = [combination(rotation.select('facebook')) for _ in range(total + 1)]
+
+    assert len(set(picks[:total])) == total
+    assert picks[total] == picks[0]
+
+
+def test_category_restriction_updates_the_platform_order():
+    """Test that a pick restricted to a category is also seen by the unrestricted order."""
+    rotation = TopicRotation(seed=3)
+    first = combination(rotation.select('twitter'))
+    rotation.select('twitter', first[0])
+
+    picks = [combination(rotation.select('twitter')) for _ in range(SUBJECT_COUNT * VOICE_COUNT - 2)]
+
+    assert first not in picks
+
+
+def test_platforms_rotate_independently():
+    """Test that each platform has its own order."""
+    rotation = TopicRotation(seed=4)
+
+    assert combination(rotation.select('twitter')) == combination(rotation.select('linkedin'))
+
+
+def test_select_many_records_every_platform():
+    """Test that a shared pick counts as a use for each platform."""
+    rotation = TopicRotation(seed=5)
+    shared = combination(rotation.select_many(['facebook', 'linkedin']))
+
+    assert combination(rotation.select('linkedin')) != shared
+
+
+def test_lfu_prefers_least_used(tmp_path):
+    """Test that, with the lfu policy, a combination used more than the others waits for them."""
+    store = RotationStore(str(tmp_path / 'rotation.sqlite3'))
+    rotation = TopicRotation(store, policy='lfu', seed=6)
+    first = combination(rotation.select('twitter'))
+    for _ in range(3):
+        store.record('twitter', first)
+
+    restarted = TopicRotation(store, policy='lfu', seed=6)
+    picks = [combination(restarted.select('twitter')) for _ in range(SUBJECT_COUNT * VOICE_COUNT)]
+
+    assert first not in picks
+
+
+def test_history_survives_restart(tmp_path):
+    """Test that a new process continues the order instead of starting over."""
+    path = str(tmp_path / 'rotation.sqlite3')
+    rotation = TopicRotation(RotationStore(path), seed=7)
+    used = set()
+    for _ in range(SUBJECT_COUNT - 1):
+        selection = rotation.select('twitter')
+        rotation.record('twitter', selection)
+        used.add(selection[1]['subject'])
+
+    restarted = TopicRotation(RotationStore(path), seed=7)
+    next_subject = restarted.select('twitter')[1]['subject']
+
+    assert next_subject not in used
+
+
+def test_picks_are_persisted_only_once_recorded(tmp_path):
+    """Test that picks never recorded (e.g. of a dry run) leave the history untouched."""
+    store = RotationStore(str(tmp_path / 'rotation.sqlite3'))
+    rotation = TopicRotation(store, seed=10)
+    first = combination(rotation.select('twitter'))
+
+    assert store.usage('twitter') == {}
+    assert combination(TopicRotation(store, seed=10).select('twitter')) == first
+
+
+def test_catalog_reload_rebuilds_the_order(tmp_path, monkeypatch):
+    """Test that a subject removed from the reloaded catalog is no longer picked."""
+    with open(DEFAULT_CATALOG_PATH, encoding='utf-8') as catalog_file:
+        data = json.load(catalog_file)
+    path = tmp_path / 'catalog.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+    monkeypatch.setenv('PROMPT_CATALOG_PATH', str(path))
+    monkeypatch.setenv('PROMPT_CATALOG_CHECK_INTERVAL', '0')
+    reset_catalog()
+    rotation = TopicRotation(seed=9)
+    removed = rotation.select('twitter', 'slides')[1]['subject']
+
+    data['topics']['slides'] = [topic for topic in data['topics']['slides'] if topic['subject'] != removed]
+    path.write_text(json.dumps(data), encoding='utf-8')
+    os.utime(path, (2_000_000_000, 2_000_000_000))
+
+    subjects = {rotation.select('twitter', 'slides')[1]['subject'] for _ in range(VOICE_COUNT * 3)}
+    assert removed not in subjects
+
+
+def test_invalid_policy_and_category():
+    """Test that unknown policies and categories are rejected."""
+    with pytest.raises(ValidationError):
+        TopicRotation(policy='mru')
+    with pytest.raises(ValidationError):
+        TopicRotation().select('twitter', 'sports')
+
+
+def test_prompt_builder_uses_rotation():
+    """Test that the builder takes both the topic and the voice from the rotation."""
+    builder = PromptBuilder(TopicRotation(seed=8))
+    expected = TopicRotation(seed=8).select('twitter', 'business')
+
+    prompt = builder.set_platform_and_topic_category('twitter', 'business').build()
+
+    assert builder.selected_topic == expected[1]
+    assert expected[2]['personality']['name'] in prompt
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,130 @@
+# tests/infrastructure/stubs/test_stub_servers.py
+
+"""
+This module contains tests of the API stubs through the real gateways: each gateway is
+pointed at its stub by the base URL variables and talks HTTP to it.
+"""
+
+import asyncio
+import pytest
+import requests
+from src.infrastructure.stubs.stub_servers import StubServers
+from src.infrastructure.stubs.twitter_stub import TwitterStub
+from src.infrastructure.external.facebook_api import FacebookAPI
+from src.infrastructure.external.facebook_token_cache import PageTokenCache
+from src.infrastructure.external.linkedin_api import LinkedInAPI
+from src.infrastructure.external.openai_api import OpenAIAPI
+from src.infrastructure.external.retry_policy import RetryPolicy
+from src.infrastructure.external.twitter_api import TwitterAPI
+from src.domain.entities.facebook_publication import FacebookPublication
+from src.domain.entities.linkedin_publication import LinkedInPublication
+from src.domain.entities.tweet import Tweet
+from src.domain.exceptions import TwitterError
+
+
+@pytest.fixture(scope='module')
+def servers():
+    with StubServers() as servers:
+        yield servers
+
+
+@pytest.fixture
+def stub_environment(servers, monkeypatch):
+    for name, value in servers.environment().items():
+        monkeypatch.setenv(name, value)
+    return servers
+
+
+def test_openai_answers_in_the_tag_format(stub_environment):
+    """Test plain, streamed and multi-platform completions."""
+    api = OpenAIAPI()
+    specs = {'twitter': {'tag': 'x_post', 'max_length': 280}, 'linkedin': {'tag': 'linkedin_post', 'max_length': 3000}}
+
+    first = api.generate("Prompt", max_length=280)
+    streamed = OpenAIAPI(stream=True).generate("Prompt", max_length=280)
+    variants = api.generate_many("<x_post>...</x_post> <linkedin_post>...</linkedin_post>", specs)
+
+    assert 0 < len(first) <= 280 and first != streamed
+    assert set(variants) == {'twitter', 'linkedin'}
+    assert api.token_usage[-1]['prompt'] is not None
+    assert stub_environment.openai.requests[-1].path == '/v1/chat/completions'
+
+
+def test_openai_async_completion(stub_environment):
+    """Test that the asynchronous client is pointed at the stub too."""
+    assert asyncio.run(OpenAIAPI().generate_async("Prompt", max_length=280))
+
+
+def test_async_gateways_survive_successive_event_loops(stub_environment):
+    """Test that each asyncio.run gets clients bound to its own loop."""
+    api = OpenAIAPI()
+    linkedin = LinkedInAPI()
+
+    for _ in range(2):
+        assert asyncio.run(api.generate_async("Prompt", max_length=280))
+        assert asyncio.run(linkedin.post_async(LinkedInPublication("Bonjour")))['id'].startswith('urn:li:share:')
+
+
+def test_facebook_exchanges_the_page_token_then_posts(stub_environment):
+    """Test the page token exchange and the feed post."""
+    api = FacebookAPI(token_cache=PageTokenCache())
+
+    result = api.post(FacebookPublication("Bonjour Facebook"))
+
+    assert result['id'].startswith('1000_')
+    feed = stub_environment.graph.requests[-1]
+    assert feed.path == '/v19.0/1000/feed'
+    assert feed.form()['access_token'] == stub_environment.graph.PAGE_TOKEN
+
+
+def test_linkedin_post_is_created(stub_environment):
+    """Test that the ugcPosts answer (201) is accepted."""
+    result = LinkedInAPI().post(LinkedInPublication("Bonjour LinkedIn"))
+
+    assert result['id'].startswith('urn:li:share:')
+    assert stub_environment.linkedin.requests[-1].json()['author'] == 'urn:li:organization:2000'
+
+
+def test_tweet_is_signed_and_posted(stub_environment):
+    """Test the OAuth-signed tweet creation, synchronous and asynchronous."""
+    api = TwitterAPI()
+
+    assert api.post_tweet(Tweet("Bonjour X"))['data']['text'] == "Bonjour X"
+    assert asyncio.run(api.post_tweet_async(Tweet("Bonjour X async")))['data']['id']
+    assert stub_environment.twitter.requests[-1].headers['authorization'].startswith('OAuth ')
+
+
+def test_twitter_rate_limit_headers(monkeypatch):
+    """Test that the stub refuses tweets past its window with X's rate limit headers."""
+    now = [1_000_000.0]
+    with TwitterStub(rate_limit=1, window=60, clock=lambda: now[0]) as stub:
+        monkeypatch.setenv('TWITTER_API_URL', stub.base_url)
+        monkeypatch.setenv('CONSUMER_KEY', 'key')
+        monkeypatch.setenv('CONSUMER_SECRET', 'secret')
+        monkeypatch.setenv('ACCESS_TOKEN', 'token')
+        monkeypatch.setenv('ACCESS_TOKEN_SECRET', 'token-secret')
+        api = TwitterAPI(retry_policy=RetryPolicy(max_attempts=1))
+        api.post_tweet(Tweet("Premier"))
+
+        with pytest.raises(TwitterError) as error:
+            api.post_tweet(Tweet("Second"))
+
+        assert error.value.status_code == 429
+        assert error.value.transient
+        assert error.value.retry_after is not None
+        now[0] += 61
+        assert api.post_tweet(Tweet("Troisième"))['data']['text'] == "Troisième"
+
+
+def test_stub_keeps_connections_alive_and_rejects_unknown_routes(servers):
+    """Test that one connection serves several requests, and unknown paths get 404."""
+    with requests.Session() as session:
+        first = session.get(f"{servers.linkedin.url}/v2/unknown")
+        second = session.get(f"{servers.linkedin.url}/v2/unknown")
+
+    assert first.status_code == second.status_code == 404
+    assert first.headers.get('Connection', '').lower() != 'close'
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,176 @@
+# tests/infrastructure/test_container.py
+
+"""
+This module contains unit tests for the dependency container. It tests lazy building,
+caching, overrides, settings and the creation of use cases.
+"""
+
+import sqlite3
+import threading
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+
+from src.infrastructure.container import Container, get_container, reset_container
+from src.use_cases.post_tweet import PostTweetUseCase
+from src.use_cases.generate_tweet import GenerateTweetUseCase
+from src.infrastructure.prompting.topic_rotation import TopicRotation
+from src.domain.exceptions import ConfigurationError
+
+
+def test_gateway_is_built_lazily_and_cached():
+    """Test that a gateway is built on first resolution only."""
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI') as mock_twitter_class:
+        container = Container()
+        mock_twitter_class.assert_not_called()
+
+        first = container.resolve('twitter_gateway')
+        second = container.resolve('twitter_gateway')
+
+    assert first is second
+    mock_twitter_class.assert_called_once()
+
+
+def test_concurrent_resolution_builds_once():
+    """Test that threads resolving the same name share one instance."""
+    calls = []
+
+    def provider(container):
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    container = Container()
+    container.register('slow', provider)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(container.resolve('slow'))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_unknown_name_raises():
+    """Test that resolving an unregistered name is a configuration error."""
+    with pytest.raises(ConfigurationError):
+        Container().resolve('myspace_gateway')
+    with pytest.raises(ConfigurationError):
+        Container().use_case('post_myspace')
+
+
+def test_override_and_use_case():
+    """Test that use cases are new instances wired to the resolved gateway."""
+    container = Container()
+    gateway = MagicMock()
+    container.override('twitter_gateway', gateway)
+
+    first = container.use_case('post_twitter')
+    second = container.use_case('post_twitter')
+
+    assert isinstance(first, PostTweetUseCase)
+    assert first is not second
+    assert first.twitter_gateway is gateway
+
+
+def test_openai_gateway_receives_cache_mode():
+    """Test that the cache mode setting reaches the OpenAI gateway."""
+    with patch('src.infrastructure.external.openai_api.OpenAIAPI') as mock_openai_class:
+        container = Container(cache_mode='off')
+        container.resolve('openai_gateway')
+
+    mock_openai_class.assert_called_once_with(cache=None, cache_mode='off', stream=False)
+
+
+def test_configure_drops_instances_only_on_change():
+    """Test that changing a setting rebuilds, while an identical value keeps the instances."""
+    container = Container()
+    container.register('thing', lambda c: object())
+    first = container.resolve('thing')
+
+    container.configure(cache_mode='use')
+    assert container.resolve('thing') is first
+
+    container.configure(cache_mode='off')
+    assert not container.is_resolved('thing')
+    assert container.resolve('thing') is not first
+
+
+def test_use_case_receives_settings():
+    """Test that the tweet generator gets the number of candidates from the settings."""
+    container = Container(tweet_candidates=3)
+    container.override('openai_gateway', MagicMock())
+
+    use_case = container.use_case('generate_twitter')
+
+    assert isinstance(use_case, GenerateTweetUseCase)
+    assert use_case.candidates == 3
+
+
+def test_generators_share_the_topic_rotation(monkeypatch):
+    """Test that the generators share one rotation, and get none with the random policy."""
+    container = Container()
+    container.override('openai_gateway', MagicMock())
+
+    rotation = container.use_case('generate_linkedin').rotation
+    assert isinstance(rotation, TopicRotation)
+    assert container.use_case('generate_multi_platform').prompt_builder.rotation is rotation
+
+    monkeypatch.setenv('ROTATION_POLICY', 'random')
+    random_container = Container()
+    random_container.override('openai_gateway', MagicMock())
+    assert random_container.use_case('generate_twitter').rotation is None
+
+
+def test_outbox_publisher_gets_the_duplicate_gate():
+    """Test that the publisher is gated unless dedup is disabled."""
+    container = Container()
+    assert container.resolve('outbox_publisher').gate is container.resolve('duplicate_gate')
+
+    container.configure(dedup=False)
+    assert container.resolve('outbox_publisher').gate is None
+
+
+def test_configure_closes_dropped_instances():
+    """Test that a change of settings closes the stores and gateways built before it."""
+    container = Container()
+    publisher = container.resolve('outbox_publisher')
+    gate = container.resolve('duplicate_gate')
+    gateway = MagicMock()
+    container.override('linkedin_gateway', gateway)
+
+    container.configure(tweet_candidates=3)
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        publisher.store.counts()
+    with pytest.raises(sqlite3.ProgrammingError):
+        gate.index.count()
+    gateway.close.assert_called_once()
+    assert container.resolve('outbox_publisher').store.counts() is not None
+
+
+def test_configure_without_change_keeps_instances():
+    """Test that settings set to their current value neither drop nor close anything."""
+    container = Container()
+    gateway = MagicMock()
+    container.override('linkedin_gateway', gateway)
+
+    container.configure(cache_mode='use', dedup=True)
+
+    assert container.resolve('linkedin_gateway') is gateway
+    gateway.close.assert_not_called()
+
+
+def test_get_container_is_a_singleton():
+    """Test the process-wide container and its reset."""
+    container = get_container()
+    assert get_container() is container
+
+    reset_container()
+    assert get_container() is not container
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,83 @@
+# tests/infrastructure/utils/test_concurrency.py
+
+"""
+This module contains unit tests for the concurrency helpers defined in
+src.infrastructure.utils.concurrency.
+"""
+
+import asyncio
+import threading
+import pytest
+
+from src.infrastructure.utils.concurrency import run_concurrently, gather_bounded
+
+
+def test_run_concurrently_collects_results_in_order():
+    """Test that every task reports its result, keyed and ordered like the input."""
+    outcomes = run_concurrently({'b': lambda: 2, 'a': lambda: 1})
+
+    assert list(outcomes) == ['b', 'a']
+    assert outcomes['a']['status'] == 'success'
+    assert outcomes['a']['result'] == 1
+    assert outcomes['b']['result'] == 2
+    assert outcomes['a']['elapsed'] >= 0
+
+
+def test_run_concurrently_isolates_failures():
+    """Test that a failing task does not prevent the others from completing."""
+    def failing():
+        raise ValueError("boom")
+
+    outcomes = run_concurrently({'ok': lambda: "done", 'ko': failing})
+
+    assert outcomes['ok']['status'] == 'success'
+    assert outcomes['ko']['status'] == 'failed'
+    assert isinstance(outcomes['ko']['error'], ValueError)
+
+
+def test_run_concurrently_runs_tasks_in_parallel():
+    """Test that tasks overlap when enough workers are available."""
+    barrier = threading.Barrier(3, timeout=5)
+    outcomes = run_concurrently({key: barrier.wait for key in ('x', 'y', 'z')}, max_workers=3)
+
+    assert all(outcome['status'] == 'success' for outcome in outcomes.values())
+
+
+def test_run_concurrently_empty():
+    """Test that no tasks means no outcomes."""
+    assert run_concurrently({}) == {}
+
+
+def test_gather_bounded_limits_concurrency():
+    """Test that no more than ``limit`` coroutines run at the same time."""
+    state = {'running': 0, 'peak': 0}
+
+    async def job(value):
+        state['running'] += 1
+        state['peak'] = max(state['peak'], state['running'])
+        await asyncio.sleep(0.01)
+        state['running'] -= 1
+        return value * 2
+
+    results = asyncio.run(gather_bounded((job(i) for i in range(10)), limit=3))
+
+    assert results == [i * 2 for i in range(10)]
+    assert state['peak'] == 3
+
+
+def test_gather_bounded_return_exceptions():
+    """Test that failures can be collected instead of raised."""
+    async def failing():
+        raise ValueError("boom")
+
+    async def ok():
+        return "ok"
+
+    results = asyncio.run(gather_bounded([ok(), failing()], limit=2, return_exceptions=True))
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], ValueError)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
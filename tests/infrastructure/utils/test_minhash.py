@@ -0,0 +1,74 @@
+# tests/infrastructure/utils/test_minhash.py
+
+"""
+This module contains unit tests for the MinHash helpers defined in
+src.infrastructure.utils.minhash.
+"""
+
+import pytest
+from src.infrastructure.utils.minhash import MinHasher, shingles, similarity
+
+TEXT = ("Chez TechAware, nos développeurs juniors encadrés par des seniors livrent vos projets "
+        "digitaux à moindre coût. Découvrez comment sur https://tech-aware.fr")
+
+
+def test_shingles_ignore_case_punctuation_and_urls():
+    """Test that shingles are lowercased word 3-grams without URLs."""
+    assert shingles("Un DEUX, trois quatre https://example.com") == {'un deux trois', 'deux trois quatre'}
+    assert shingles("Bonjour !") == {'bonjour'}
+    assert shingles("") == set()
+
+
+def test_signature_is_stable():
+    """Test that the signature depends only on the text and the seed."""
+    assert MinHasher().signature(TEXT) == MinHasher().signature(TEXT)
+    assert MinHasher(seed=2).signature(TEXT) != MinHasher().signature(TEXT)
+
+
+def test_similarity_estimates_jaccard():
+    """Test that similar texts score high and unrelated texts score low."""
+    hasher = MinHasher()
+    near = TEXT.replace("Découvrez comment", "Découvrez dès maintenant comment")
+    other = "Le mentorat aide chaque développeur à gagner en confiance et en autonomie au quotidien"
+
+    assert similarity(hasher.signature(TEXT), hasher.signature(TEXT)) == 1.0
+    assert similarity(hasher.signature(TEXT), hasher.signature(near)) > 0.6
+    assert similarity(hasher.signature(TEXT), hasher.signature(other)) < 0.2
+
+
+def test_short_texts_fill_every_position():
+    """Test that the positions without shingle are filled from the others, the same way for every text."""
+    hasher = MinHasher()
+    signature = hasher.signature("Bonjour à tous les développeurs")
+
+    assert len(signature) == hasher.num_perm
+    assert max(signature) < (1 << 64) - 1
+    assert len(set(signature)) <= len(shingles("Bonjour à tous les développeurs"))
+    assert hasher.signature("Bonjour à tous les développeurs") == signature
+    assert similarity(hasher.signature("Bonjour à tous"), hasher.signature("bonjour, À TOUS")) == 1.0
+
+
+def test_fingerprint_identifies_comparable_signatures():
+    """Test that hashers computing different signatures have different fingerprints."""
+    assert MinHasher().fingerprint == MinHasher(bands=10).fingerprint
+    assert MinHasher(seed=2).fingerprint != MinHasher().fingerprint
+    assert MinHasher(num_perm=60).fingerprint != MinHasher().fingerprint
+
+
+def test_band_keys_cover_the_signature():
+    """Test that the signature is cut into ``bands`` keys of ``rows`` values."""
+    hasher = MinHasher(num_perm=12, bands=4)
+    keys = list(hasher.band_keys(hasher.signature(TEXT)))
+
+    assert [band for band, _ in keys] == [0, 1, 2, 3]
+    assert all(len(values) == 3 for _, values in keys)
+
+
+def test_bands_must_divide_num_perm():
+    """Test that an uneven banding is refused."""
+    with pytest.raises(ValueError):
+        MinHasher(num_perm=100, bands=30)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -13,6 +13,7 @@ Test cases ensure that:
 
 import sys
 import os
+import asyncio
 import pytest
 
 # Add the project root directory to the Python path
@@ -63,5 +64,18 @@ def test_facebook_gateway_post_raises_error():
     with pytest.raises(FacebookError):
         gateway.post(publication)
 
+def test_facebook_gateway_post_async_default():
+    """
+    Test that post_async falls back to the synchronous post method.
+    """
+    class ConcreteFacebookGateway(FacebookGateway):
+        def post(self, publication: FacebookPublication):
+            return {"id": "123456", "message": publication.get_text()}
+
+    gateway = ConcreteFacebookGateway()
+    result = asyncio.run(gateway.post_async(FacebookPublication("Test Facebook post")))
+    assert result == {"id": "123456", "message": "Test Facebook post"}
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
\ No newline at end of file
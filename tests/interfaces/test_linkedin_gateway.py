@@ -8,6 +8,7 @@ can be created and used as expected.
 
 import sys
 import os
+import asyncio
 import pytest
 
 # Add the project root directory to the Python path
@@ -62,5 +63,18 @@ def test_linkedin_gateway_post_raises_error():
         gateway.post(publication)
 
 
+def test_linkedin_gateway_post_async_default():
+    """
+    Test that post_async falls back to the synchronous post method.
+    """
+    class ConcreteLinkedInGateway(LinkedInGateway):
+        def post(self, publication: LinkedInPublication):
+            return {"id": "123456", "text": publication.get_text()}
+
+    gateway = ConcreteLinkedInGateway()
+    result = asyncio.run(gateway.post_async(LinkedInPublication("Test LinkedIn post")))
+    assert result == {"id": "123456", "text": "Test LinkedIn post"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -6,6 +6,7 @@ It verifies that the interface is correctly defined and that concrete implementa
 can be created and used as expected.
 """
 
+import asyncio
 import pytest
 import sys
 import os
@@ -37,6 +38,9 @@ def test_openai_gateway_generate_method():
             """Example implementation of generate method"""
             return "Generated content"
 
+        def generate_many(self, prompt: str, platform_specs: dict) -> dict:
+            return {platform: self.generate(prompt) for platform in platform_specs}
+
     gateway = ConcreteOpenAIGateway()
     assert callable(gateway.generate)
     assert isinstance(gateway.generate("test prompt"), str)
@@ -54,6 +58,9 @@ def test_openai_gateway_generate_raises_error():
             """Example implementation that raises an error"""
             raise OpenAIError("Test error")
 
+        def generate_many(self, prompt: str, platform_specs: dict) -> dict:
+            return {platform: self.generate(prompt) for platform in platform_specs}
+
     gateway = ErrorOpenAIGateway()
     with pytest.raises(OpenAIError) as exc_info:
         gateway.generate("test prompt")
@@ -74,6 +81,9 @@ def test_openai_gateway_generate_input_validation():
                 raise ValueError("Prompt cannot be empty")
             return "Valid content"
 
+        def generate_many(self, prompt: str, platform_specs: dict) -> dict:
+            return {platform: self.generate(prompt) for platform in platform_specs}
+
     gateway = ValidatingOpenAIGateway()
 
     # Test with invalid input types
@@ -90,5 +100,35 @@ def test_openai_gateway_generate_input_validation():
     assert gateway.generate("valid prompt") == "Valid content"
 
 
+def test_openai_gateway_generate_async_default():
+    """
+    Test that generate_async falls back to the synchronous generate method.
+    """
+
+    class ConcreteOpenAIGateway(OpenAIGateway):
+        def generate(self, prompt: str) -> str:
+            return f"Generated for {prompt}"
+
+        def generate_many(self, prompt: str, platform_specs: dict) -> dict:
+            return {platform: self.generate(prompt) for platform in platform_specs}
+
+    gateway = ConcreteOpenAIGateway()
+    assert asyncio.run(gateway.generate_async("test prompt")) == "Generated for test prompt"
+
+
+def test_openai_gateway_generate_many_is_abstract():
+    """
+    Test that batched generation must be implemented, like generate.
+    """
+
+    class SinglePlatformGateway(OpenAIGateway):
+        def generate(self, prompt: str) -> str:
+            return "Generated content"
+
+    with pytest.raises(TypeError) as exc_info:
+        SinglePlatformGateway()
+    assert "generate_many" in str(exc_info.value)
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
\ No newline at end of file
@@ -8,6 +8,7 @@ can be created and used as expected.
 
 import sys
 import os
+import asyncio
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -61,6 +62,19 @@ def test_twitter_gateway_post_tweet_raises_error():
         gateway.post_tweet(tweet)
 
 
+def test_twitter_gateway_post_tweet_async_default():
+    """
+    Test that post_tweet_async falls back to the synchronous post_tweet method.
+    """
+    class ConcreteTwitterGateway(TwitterGateway):
+        def post_tweet(self, tweet: Tweet):
+            return {"id": "123456", "text": tweet.get_text()}
+
+    gateway = ConcreteTwitterGateway()
+    result = asyncio.run(gateway.post_tweet_async(Tweet("Test tweet")))
+    assert result == {"id": "123456", "text": "Test tweet"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
     
\ No newline at end of file
@@ -9,6 +9,7 @@ and comprehensive error handling scenarios.
 import pytest
 from unittest.mock import patch, MagicMock, call
 from src.presentation.cli import CLI
+from src.infrastructure.container import Container
 from src.domain.exceptions import (
     ValidationError, TwitterError, FacebookError, LinkedInError,
     OpenAIError, TweetGenerationError, AutomatorError, ConfigurationError
@@ -34,10 +35,10 @@ def test_cli_initialization_success():
     """
     Test successful CLI initialization with all components.
     """
-    with patch('src.presentation.cli.TwitterAPI'), \
-            patch('src.presentation.cli.FacebookAPI'), \
-            patch('src.presentation.cli.LinkedInAPI'), \
-            patch('src.presentation.cli.OpenAIAPI'):
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI'), \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI'), \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI'), \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI'):
         cli = CLI()
         assert isinstance(cli, CLI)
 
@@ -46,15 +47,33 @@ def test_cli_initialization_error():
     """
     Test CLI initialization failure due to configuration error.
     """
-    with patch('src.presentation.cli.TwitterAPI', side_effect=ConfigurationError("Config error")), \
-            patch('src.presentation.cli.FacebookAPI'), \
-            patch('src.presentation.cli.LinkedInAPI'), \
-            patch('src.presentation.cli.OpenAIAPI'):
+    with patch('src.presentation.cli.initialize_environment', return_value=False):
         with pytest.raises(AutomatorError) as exc_info:
             CLI()
         assert "Failed to initialize CLI due to configuration error" in str(exc_info.value)
 
 
+def test_cli_initialization_is_lazy():
+    """
+    Test that no gateway is built until a use case needs it.
+    """
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI') as mock_twitter_class, \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI') as mock_facebook_class, \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI') as mock_linkedin_class, \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI') as mock_openai_class, \
+            patch('builtins.input', return_value="y"), \
+            patch('builtins.print'):
+        cli = CLI(container=Container())
+        cli.menu()
+
+        for gateway_class in (mock_twitter_class, mock_facebook_class, mock_linkedin_class, mock_openai_class):
+            gateway_class.assert_not_called()
+
+        cli.post_tweet_use_case
+        mock_twitter_class.assert_called_once()
+        mock_facebook_class.assert_not_called()
+
+
 @pytest.mark.parametrize("user_input,expected_call", [
     ("y", None),  # blog article option
     ("n", "run"),  # social media option
@@ -70,10 +89,10 @@ def test_menu_selection(mock_gateways, user_input, expected_call):
     """
     mock_twitter, mock_facebook, mock_linkedin, mock_openai = mock_gateways
 
-    with patch('src.presentation.cli.TwitterAPI', return_value=mock_twitter), \
-            patch('src.presentation.cli.FacebookAPI', return_value=mock_facebook), \
-            patch('src.presentation.cli.LinkedInAPI', return_value=mock_linkedin), \
-            patch('src.presentation.cli.OpenAIAPI', return_value=mock_openai), \
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI', return_value=mock_twitter), \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI', return_value=mock_facebook), \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI', return_value=mock_linkedin), \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI', return_value=mock_openai), \
             patch('builtins.input', return_value=user_input), \
             patch('builtins.print') as mock_print, \
             patch.object(CLI, 'run') as mock_run:
@@ -99,10 +118,10 @@ def test_cli_run_success(mock_gateways):
     mock_linkedin_content = "Generated LinkedIn content"
     mock_tweet_content = "Generated tweet content"
 
-    with patch('src.presentation.cli.TwitterAPI', return_value=mock_twitter), \
-            patch('src.presentation.cli.FacebookAPI', return_value=mock_facebook), \
-            patch('src.presentation.cli.LinkedInAPI', return_value=mock_linkedin), \
-            patch('src.presentation.cli.OpenAIAPI', return_value=mock_openai), \
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI', return_value=mock_twitter), \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI', return_value=mock_facebook), \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI', return_value=mock_linkedin), \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI', return_value=mock_openai), \
             patch('builtins.print') as mock_print, \
             patch('time.sleep'):  # Mock sleep to speed up tests
 
@@ -158,10 +177,10 @@ def test_cli_run_errors(mock_gateways, exception, expected_message):
     """
     mock_twitter, mock_facebook, mock_linkedin, mock_openai = mock_gateways
 
-    with patch('src.presentation.cli.TwitterAPI', return_value=mock_twitter), \
-            patch('src.presentation.cli.FacebookAPI', return_value=mock_facebook), \
-            patch('src.presentation.cli.LinkedInAPI', return_value=mock_linkedin), \
-            patch('src.presentation.cli.OpenAIAPI', return_value=mock_openai), \
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI', return_value=mock_twitter), \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI', return_value=mock_facebook), \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI', return_value=mock_linkedin), \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI', return_value=mock_openai), \
             patch('builtins.print') as mock_print, \
             patch('time.sleep'):
         cli = CLI()
@@ -181,10 +200,10 @@ def test_cli_reraising_automator_error(mock_gateways):
     mock_twitter, mock_facebook, mock_linkedin, mock_openai = mock_gateways
     original_error = AutomatorError("Original error")
 
-    with patch('src.presentation.cli.TwitterAPI', return_value=mock_twitter), \
-            patch('src.presentation.cli.FacebookAPI', return_value=mock_facebook), \
-            patch('src.presentation.cli.LinkedInAPI', return_value=mock_linkedin), \
-            patch('src.presentation.cli.OpenAIAPI', return_value=mock_openai), \
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI', return_value=mock_twitter), \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI', return_value=mock_facebook), \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI', return_value=mock_linkedin), \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI', return_value=mock_openai), \
             patch('builtins.print') as mock_print, \
             patch('time.sleep'):
         cli = CLI()
@@ -197,5 +216,121 @@ def test_cli_reraising_automator_error(mock_gateways):
         mock_print.assert_any_call("An error occurred: Original error")
 
 
+def test_cli_run_concurrent_success(mock_gateways):
+    """
+    Test that concurrent mode generates and posts for every platform.
+    """
+    mock_twitter, mock_facebook, mock_linkedin, mock_openai = mock_gateways
+
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI', return_value=mock_twitter), \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI', return_value=mock_facebook), \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI', return_value=mock_linkedin), \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI', return_value=mock_openai), \
+            patch('builtins.print'), \
+            patch('time.sleep') as mock_sleep:
+        cli = CLI(concurrent=True)
+        cli.generate_facebook_use_case.execute = MagicMock(return_value="Facebook content")
+        cli.generate_linkedin_use_case.execute = MagicMock(return_value="LinkedIn content")
+        cli.generate_tweet_use_case.execute = MagicMock(return_value="Tweet content")
+        cli.post_facebook_use_case.execute = MagicMock(return_value={"id": "1"})
+        cli.post_linkedin_use_case.execute = MagicMock(return_value={"id": "2"})
+        cli.post_tweet_use_case.execute = MagicMock(return_value={"data": {"id": "3"}})
+
+        reports = cli.run()
+
+        assert set(reports) == {'facebook', 'linkedin', 'twitter'}
+        assert all(report['status'] == 'success' for report in reports.values())
+        assert reports['facebook']['content'] == "Facebook content"
+        cli.post_facebook_use_case.execute.assert_called_once_with("Facebook content")
+        cli.post_linkedin_use_case.execute.assert_called_once_with("LinkedIn content")
+        cli.post_tweet_use_case.execute.assert_called_once_with("Tweet content")
+        mock_sleep.assert_not_called()  # pacing is zero by default
+
+
+def test_cli_run_concurrent_isolates_failures(mock_gateways):
+    """
+    Test that a failing platform does not prevent the others from posting.
+    """
+    mock_twitter, mock_facebook, mock_linkedin, mock_openai = mock_gateways
+
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI', return_value=mock_twitter), \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI', return_value=mock_facebook), \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI', return_value=mock_linkedin), \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI', return_value=mock_openai), \
+            patch('builtins.print') as mock_print:
+        cli = CLI(concurrent=True)
+        cli.generate_facebook_use_case.execute = MagicMock(side_effect=OpenAIError("OpenAI API error"))
+        cli.generate_linkedin_use_case.execute = MagicMock(return_value="LinkedIn content")
+        cli.generate_tweet_use_case.execute = MagicMock(return_value="Tweet content")
+        cli.post_linkedin_use_case.execute = MagicMock(return_value={"id": "2"})
+        cli.post_tweet_use_case.execute = MagicMock(return_value={"data": {"id": "3"}})
+
+        with pytest.raises(AutomatorError) as exc_info:
+            cli.run()
+
+        assert "Publication failed for: Facebook" in str(exc_info.value)
+        cli.post_linkedin_use_case.execute.assert_called_once_with("LinkedIn content")
+        cli.post_tweet_use_case.execute.assert_called_once_with("Tweet content")
+        assert any("Facebook failed: OpenAI API error" in str(call) for call in mock_print.call_args_list)
+
+
+def test_cli_pacing_is_configurable(mock_gateways):
+    """
+    Test that a non-zero pacing waits before each stage.
+    """
+    mock_twitter, mock_facebook, mock_linkedin, mock_openai = mock_gateways
+
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI', return_value=mock_twitter), \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI', return_value=mock_facebook), \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI', return_value=mock_linkedin), \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI', return_value=mock_openai), \
+            patch('builtins.print'), \
+            patch('time.sleep') as mock_sleep:
+        cli = CLI(pacing=0.5)
+        cli.generate_facebook_use_case.execute = MagicMock(return_value="Facebook content")
+        cli.generate_linkedin_use_case.execute = MagicMock(return_value="LinkedIn content")
+        cli.generate_tweet_use_case.execute = MagicMock(return_value="Tweet content")
+        cli.post_facebook_use_case.execute = MagicMock(return_value={"id": "1"})
+        cli.post_linkedin_use_case.execute = MagicMock(return_value={"id": "2"})
+        cli.post_tweet_use_case.execute = MagicMock(return_value={"id": "3"})
+
+        cli.run()
+
+        assert mock_sleep.call_count == 6
+        mock_sleep.assert_called_with(0.5)
+
+
+def test_cli_run_resumes_after_post_failure(mock_gateways):
+    """
+    Test that a rerun posts the contents generated by a failed run instead of generating new ones.
+    """
+    mock_twitter, mock_facebook, mock_linkedin, mock_openai = mock_gateways
+
+    with patch('src.infrastructure.external.twitter_api.TwitterAPI', return_value=mock_twitter), \
+            patch('src.infrastructure.external.facebook_api.FacebookAPI', return_value=mock_facebook), \
+            patch('src.infrastructure.external.linkedin_api.LinkedInAPI', return_value=mock_linkedin), \
+            patch('src.infrastructure.external.openai_api.OpenAIAPI', return_value=mock_openai), \
+            patch('builtins.print'):
+        cli = CLI()
+        cli.generate_facebook_use_case.execute = MagicMock(side_effect=["Facebook content", "Next Facebook content"])
+        cli.generate_linkedin_use_case.execute = MagicMock(return_value="LinkedIn content")
+        cli.generate_tweet_use_case.execute = MagicMock(return_value="Tweet content")
+        cli.post_facebook_use_case.execute = MagicMock(return_value={"id": "1"})
+        cli.post_linkedin_use_case.execute = MagicMock(side_effect=[LinkedInError("LinkedIn API error", transient=True), {"id": "2"}])
+        cli.post_tweet_use_case.execute = MagicMock(return_value={"data": {"id": "3"}})
+
+        with pytest.raises(AutomatorError):
+            cli.run()
+        cli.run()
+
+        # Facebook déjà publié : nouvelle publication ; LinkedIn et X repris sans nouvelle génération
+        assert cli.generate_facebook_use_case.execute.call_count == 2
+        cli.generate_linkedin_use_case.execute.assert_called_once()
+        cli.generate_tweet_use_case.execute.assert_called_once()
+        cli.post_facebook_use_case.execute.assert_called_with("Next Facebook content")
+        assert cli.post_linkedin_use_case.execute.call_count == 2
+        cli.post_tweet_use_case.execute.assert_called_once_with("Tweet content")
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
\ No newline at end of file
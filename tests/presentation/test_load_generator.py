@@ -0,0 +1,117 @@
+# tests/presentation/test_load_generator.py
+
+"""
+This module contains tests of LoadGenerator: pipelines run through the real use cases
+and gateways against the local API stubs, in both concurrency modes, and the summary and
+CSV time series built from their records.
+"""
+
+import csv
+import pytest
+from src.infrastructure.container import Container
+from src.infrastructure.stubs.stub_servers import StubServers
+from src.presentation.load_generator import LoadGenerator, percentile, summarize, write_csv
+from src.domain.exceptions import ConfigurationError
+
+
+@pytest.fixture(scope='module')
+def servers():
+    with StubServers(latency=0.005) as servers:
+        yield servers
+
+
+@pytest.fixture
+def container(servers, monkeypatch):
+    for name, value in servers.environment().items():
+        monkeypatch.setenv(name, value)
+    return Container(cache_mode='off', outbox=False, dedup=False)
+
+
+def test_percentile_uses_the_nearest_rank():
+    """Test the nearest-rank percentiles, whatever the order of the values."""
+    values = [5, 1, 4, 2, 3, 6, 7, 8, 9, 10]
+
+    assert percentile(values, 50) == 5
+    assert percentile(values, 95) == 10
+    assert percentile(values, 0) == 1
+    assert percentile([42], 99) == 42
+    assert percentile([], 50) is None
+
+
+@pytest.mark.parametrize("mode", ['threads', 'async'])
+def test_pipelines_post_through_the_stubs(container, servers, mode):
+    """Test that every pipeline generates, validates and posts, the platforms taken in turn."""
+    posted = sum(stub.request_count for stub in (servers.graph, servers.linkedin, servers.twitter))
+
+    run = LoadGenerator(container, concurrency=3, mode=mode).run(count=9)
+    summary = summarize(run)
+
+    assert summary['succeeded'] == 9 and summary['failed'] == 0
+    assert summary['throughput'] > 0
+    assert sorted(record['index'] for record in run['records']) == list(range(9))
+    assert [summary['latencies'][platform]['post']['count'] for platform in ('facebook', 'linkedin', 'twitter')] \
+        == [3, 3, 3]
+    stats = summary['latencies']['all']['generate']
+    assert stats['count'] == 9 and 0 < stats['p50'] <= stats['p95'] <= stats['p99'] == stats['max']
+    # Graph : échange du jeton de page puis publication ; LinkedIn et X : une requête chacun
+    assert sum(stub.request_count for stub in (servers.graph, servers.linkedin, servers.twitter)) - posted >= 9
+
+
+def test_failures_are_recorded_with_their_stage(monkeypatch):
+    """Test that a refused post fails its pipeline without stopping the run."""
+    with StubServers(twitter_rate_limit=2) as limited:
+        for name, value in limited.environment().items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setenv('RETRY_MAX_ATTEMPTS', '1')
+        container = Container(cache_mode='off', outbox=False, dedup=False)
+
+        run = LoadGenerator(container, platforms=['twitter'], concurrency=2).run(count=4)
+
+    summary = summarize(run)
+    failed = [record for record in run['records'] if record['status'] == 'failed']
+    assert summary['succeeded'] == 2 and summary['failed'] == 2
+    assert all(record['failed_stage'] == 'post' and record['post_ms'] is None for record in failed)
+    assert all(record['generate_ms'] is not None and record['error'] for record in failed)
+    assert summary['latencies']['twitter']['post']['count'] == 2
+    assert summary['latencies']['twitter']['generate']['count'] == 4
+
+
+def test_duration_bounds_the_run(container):
+    """Test that no pipeline is started once the duration elapsed."""
+    run = LoadGenerator(container, platforms=['linkedin'], concurrency=2).run(duration=0.3)
+
+    assert run['records']
+    assert max(record['started'] for record in run['records']) < 0.3
+
+
+def test_csv_time_series(container, tmp_path):
+    """Test one row per pipeline, ordered by start time."""
+    run = LoadGenerator(container, concurrency=2, mode='async').run(count=4)
+    path = tmp_path / 'load.csv'
+
+    write_csv(str(path), run)
+
+    with open(path, newline='', encoding='utf-8') as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    assert len(rows) == 4
+    assert [float(row['started']) for row in rows] == sorted(float(row['started']) for row in rows)
+    assert {row['status'] for row in rows} == {'success'}
+    assert all(float(row['total_ms']) >= float(row['post_ms']) for row in rows)
+    assert rows[0]['error'] == ''
+
+
+@pytest.mark.parametrize("options, run_options", [
+    ({'concurrency': 0}, {'count': 1}),
+    ({'mode': 'processes'}, {'count': 1}),
+    ({'platforms': ['mastodon']}, {'count': 1}),
+    ({'platforms': []}, {'count': 1}),
+    ({}, {}),
+])
+def test_invalid_settings_are_rejected(options, run_options):
+    """Test the settings checks."""
+    with pytest.raises(ConfigurationError):
+        LoadGenerator(Container(), **options).run(**run_options)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,376 @@
+# tests/presentation/test_post_command.py
+
+"""
+This module contains unit tests for the PostCommand class. It tests single-platform
+execution, the concurrent multi-platform fan-out and the reporting of each platform.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from src.presentation.post_command import PostCommand
+from src.infrastructure.container import Container, get_container
+from src.infrastructure.external.repair_pipeline import RepairPipeline
+from src.infrastructure.persistence.rotation_store import RotationStore
+from src.infrastructure.prompting.topic_rotation import TopicRotation
+from src.domain.exceptions import AutomatorError, DuplicateContentError, FacebookError, OpenAIError
+
+
+@pytest.fixture
+def command():
+    """
+    Fixture providing a PostCommand with a mocked OpenAI gateway.
+    """
+    container = Container()
+    mock_openai = MagicMock()
+    mock_openai.generate.return_value = "Generated content"
+    container.override('openai_gateway', mock_openai)
+    return PostCommand(container=container)
+
+
+def test_execute_dry_run_returns_content(command):
+    """
+    Test that a dry run returns the generated content without posting.
+    """
+    result = command.execute('linkedin', dry_run=True)
+
+    assert result == "Generated content"
+    assert not command.container.is_resolved('linkedin_gateway')
+
+
+def test_execute_unsupported_platform(command):
+    """
+    Test that an unknown platform is rejected.
+    """
+    with pytest.raises(ValueError):
+        command.execute('myspace')
+
+
+def test_execute_many_reports_each_platform(command):
+    """
+    Test that the fan-out reports content, post id and elapsed time per platform.
+    """
+    results = {
+        'facebook': ("Facebook content", {"id": "fb_1"}),
+        'linkedin': ("LinkedIn content", {"id": "urn:li:share:2"}),
+        'twitter': ("Tweet content", {"data": {"id": "3"}}),
+    }
+    with patch.object(command, '_generate_and_post',
+                      side_effect=lambda platform, dry_run, topic: results[platform]):
+        reports = command.execute_many(['facebook', 'linkedin', 'twitter'])
+
+    assert list(reports) == ['facebook', 'linkedin', 'twitter']
+    assert reports['facebook']['post_id'] == "fb_1"
+    assert reports['linkedin']['post_id'] == "urn:li:share:2"
+    assert reports['twitter']['post_id'] == "3"
+    assert reports['twitter']['content'] == "Tweet content"
+    assert all(report['elapsed'] >= 0 for report in reports.values())
+
+
+def test_execute_many_isolates_failures(command):
+    """
+    Test that a failing platform does not prevent the others from completing.
+    """
+    def generate_and_post(platform, dry_run, topic):
+        if platform == 'facebook':
+            raise FacebookError("Facebook API error")
+        return f"{platform} content", {"id": platform}
+
+    with patch.object(command, '_generate_and_post', side_effect=generate_and_post):
+        reports = command.execute_many(['facebook', 'twitter'])
+
+    assert reports['facebook']['status'] == 'failed'
+    assert isinstance(reports['facebook']['error'], FacebookError)
+    assert reports['twitter']['status'] == 'success'
+
+
+def test_execute_many_shares_openai_gateway(command):
+    """
+    Test that all platforms generate through the same OpenAI gateway instance.
+    """
+    reports = command.execute_many(['facebook', 'linkedin', 'twitter', 'twitter'], dry_run=True)
+
+    assert len(reports) == 3
+    assert command.openai_gateway.generate.call_count == 3
+
+
+def test_posting_gateway_is_created_once(command):
+    """
+    Test that posting gateways are built once and shared by the posts of a command.
+    """
+    mock_gateway = MagicMock()
+    mock_gateway.post.return_value = {"id": "1_2"}
+    provider = MagicMock(return_value=mock_gateway)
+    command.container.register('facebook_gateway', provider)
+    # Deux contenus distincts : un contenu déjà publié n'est pas reposté
+    command.openai_gateway.generate.side_effect = ["First content", "Second content"]
+
+    command.execute('facebook')
+    command.execute('facebook')
+
+    provider.assert_called_once()
+    assert mock_gateway.post.call_count == 2
+
+
+def test_execute_many_single_request(command):
+    """
+    Test that single-request mode generates every variant with one call, then posts each.
+    """
+    command.openai_gateway.generate_many.return_value = {
+        'facebook': "Facebook content", 'twitter': "Tweet content"
+    }
+    with patch.object(command, '_post_content',
+                      side_effect=lambda platform, content, dry_run, topic: (content, {"id": platform})) as mock_post:
+        reports = command.execute_many(['facebook', 'twitter'], topic='business', single_request=True)
+
+    command.openai_gateway.generate_many.assert_called_once()
+    command.openai_gateway.generate.assert_not_called()
+    assert mock_post.call_count == 2
+    assert reports['facebook']['content'] == "Facebook content"
+    assert reports['twitter']['post_id'] == "twitter"
+
+
+def test_execute_many_single_request_generation_failure(command):
+    """
+    Test that a failed shared generation is reported on every platform.
+    """
+    command.openai_gateway.generate_many.side_effect = OpenAIError("Variant missing")
+
+    reports = command.execute_many(['facebook', 'twitter'], single_request=True)
+
+    assert all(report['status'] == 'failed' for report in reports.values())
+    assert "Variant missing" in str(reports['twitter']['error'])
+
+
+def test_cache_mode_is_forwarded():
+    """
+    Test that the cache mode reaches the container settings.
+    """
+    container = Container()
+    PostCommand(cache_mode='only', container=container)
+
+    assert container.settings['cache_mode'] == 'only'
+
+
+
+def test_settings_do_not_rewire_the_process_wide_container():
+    """
+    Test that a command with other settings gets its own container instead of
+    reconfiguring the process-wide one under its other holders.
+    """
+    shared = get_container()
+    publisher = shared.resolve('outbox_publisher')
+
+    command = PostCommand(tweet_candidates=3, dedup=False)
+
+    assert command.container is not shared
+    assert command.container.settings['tweet_candidates'] == 3
+    assert shared.settings == Container.DEFAULT_SETTINGS
+    assert shared.resolve('outbox_publisher') is publisher
+    assert publisher.store.counts() is not None
+    assert PostCommand().container is shared
+
+
+def test_repair_stats():
+    """
+    Test that the repair counters are only read from an OpenAI gateway already built.
+    """
+    container = Container()
+    command = PostCommand(container=container)
+    assert command.repair_stats() is None
+
+    repair_pipeline = RepairPipeline()
+    repair_pipeline.clean("**Bold**")
+    container.override('openai_gateway', MagicMock(repair_pipeline=repair_pipeline))
+
+    assert command.repair_stats()['bold'] == 1
+
+
+def test_publish_reports_post_id(command):
+    """
+    Test that publish returns the content and the id of the published post.
+    """
+    with patch.object(command, '_generate_and_post',
+                      return_value=("Tweet content", {"data": {"id": "42"}})) as generate_and_post:
+        report = command.publish('twitter', topic='developer')
+
+    assert report == {'content': "Tweet content", 'result': {"data": {"id": "42"}}, 'post_id': "42"}
+    generate_and_post.assert_called_once_with('twitter', False, 'developer')
+
+
+def test_publish_unsupported_platform(command):
+    """
+    Test that publish rejects an unknown platform.
+    """
+    with pytest.raises(ValueError):
+        command.publish('myspace')
+
+
+def test_execute_resumes_pending_publication(command):
+    """
+    Test that a publication whose post failed temporarily is posted by the next run without a new generation.
+    """
+    mock_gateway = MagicMock()
+    mock_gateway.post.side_effect = [FacebookError("Facebook API error", transient=True), {"id": "1_2"}]
+    command.container.override('facebook_gateway', mock_gateway)
+
+    with pytest.raises(AutomatorError):
+        command.execute('facebook')
+    result = command.execute('facebook')
+
+    assert result == {"id": "1_2"}
+    command.openai_gateway.generate.assert_called_once()
+    assert mock_gateway.post.call_count == 2
+    assert command.outbox.store.counts()['published'] == 1
+
+
+def test_execute_does_not_repost_published_content(command):
+    """
+    Test that content already published is not posted again, even without the
+    near-duplicate check.
+    """
+    command = PostCommand(container=command.container, dedup=False)
+    command.container.override('openai_gateway', MagicMock(generate=MagicMock(return_value="Generated content")))
+    mock_gateway = MagicMock()
+    mock_gateway.post.return_value = {"id": "1_2"}
+    command.container.override('facebook_gateway', mock_gateway)
+
+    command.execute('facebook')
+    result = command.execute('facebook')
+
+    assert result == {"id": "1_2"}
+    mock_gateway.post.assert_called_once()
+
+
+def test_execute_without_outbox(command):
+    """
+    Test that the outbox can be disabled.
+    """
+    command = PostCommand(container=command.container, outbox=False, dedup=False)
+    command.container.override('openai_gateway', MagicMock(generate=MagicMock(return_value="Generated content")))
+    mock_gateway = MagicMock()
+    mock_gateway.post.return_value = {"id": "1_2"}
+    command.container.override('facebook_gateway', mock_gateway)
+
+    command.execute('facebook')
+    command.execute('facebook')
+
+    assert command.outbox.store is None
+    assert mock_gateway.post.call_count == 2
+
+
+def test_execute_regenerates_near_duplicates(command):
+    """
+    Test that content nearly identical to an earlier publication is generated again.
+    """
+    published = "Nos développeurs juniors encadrés livrent vos projets digitaux à moindre coût, découvrez comment"
+    command.container.resolve('openai_gateway').generate.side_effect = [
+        published, published + " !", "Un tout autre sujet sur le mentorat des développeurs et la confiance en soi"
+    ]
+    mock_gateway = MagicMock()
+    mock_gateway.post.return_value = {"id": "1_2"}
+    command.container.override('linkedin_gateway', mock_gateway)
+
+    command.execute('linkedin')
+    command.execute('linkedin')
+
+    posted = [call.args[0].text for call in mock_gateway.post.call_args_list]
+    assert posted[1].startswith("Un tout autre sujet")
+
+
+def test_execute_rejects_persistent_near_duplicates(command):
+    """
+    Test that a near-duplicate is rejected once the regenerations are exhausted.
+    """
+    mock_gateway = MagicMock()
+    mock_gateway.post.return_value = {"id": "1_2"}
+    command.container.override('facebook_gateway', mock_gateway)
+    command.execute('facebook')
+
+    with pytest.raises(DuplicateContentError):
+        command.execute('facebook')
+
+    mock_gateway.post.assert_called_once()
+    assert command.container.resolve('openai_gateway').generate.call_count == 4
+
+
+def test_single_request_resumes_pending_platforms(command):
+    """
+    Test that single-request mode only generates the platforms without a pending publication.
+    """
+    command.outbox.unclaim(command.outbox.record('twitter', "Pending tweet"))
+    command.openai_gateway.generate_many.return_value = {'facebook': "Facebook content"}
+    with patch.object(command, '_post_item',
+                      side_effect=lambda platform, item: (item['content'], {"id": platform})):
+        reports = command.execute_many(['facebook', 'twitter'], single_request=True)
+
+    assert reports['twitter']['content'] == "Pending tweet"
+    assert reports['facebook']['content'] == "Facebook content"
+    specs = command.openai_gateway.generate_many.call_args[0][1]
+    assert list(specs) == ['facebook']
+
+
+def test_execute_resumes_only_publications_of_the_topic(command):
+    """
+    Test that a publication pending for another topic category is left for a later run.
+    """
+    command.outbox.unclaim(command.outbox.record('linkedin', "Slides post", 'slides'))
+    mock_gateway = MagicMock()
+    mock_gateway.post.return_value = {"id": "urn:li:share:1"}
+    command.container.override('linkedin_gateway', mock_gateway)
+
+    command.execute('linkedin', topic='business')
+
+    mock_gateway.post.assert_called_once()
+    assert mock_gateway.post.call_args[0][0].get_text() == "Generated content"
+    assert command.outbox.store.counts()['pending'] == 1
+
+
+def test_rotation_records_only_posted_content(command, tmp_path):
+    """
+    Test that the topic and voice of a publication count as used once it is posted,
+    and not after a dry run or a failed post.
+    """
+    store = RotationStore(str(tmp_path / 'history.sqlite3'))
+    command.container.override('topic_rotation', TopicRotation(store, seed=1))
+    mock_gateway = MagicMock()
+    mock_gateway.post.side_effect = [FacebookError("Facebook API error"), {"id": "1_2"}]
+    command.container.override('facebook_gateway', mock_gateway)
+    command.openai_gateway.generate.side_effect = ["Dry run content", "Failed content", "Posted content"]
+
+    command.execute('facebook', dry_run=True)
+    with pytest.raises(AutomatorError):
+        command.execute('facebook')
+    assert store.usage('facebook') == {}
+
+    command.execute('facebook')
+    assert len(store.usage('facebook')) == 1
+
+
+def test_single_request_records_each_posted_platform(command, tmp_path):
+    """
+    Test that the shared pick of a single request is recorded for each platform posted.
+    """
+    store = RotationStore(str(tmp_path / 'history.sqlite3'))
+    command.container.override('topic_rotation', TopicRotation(store, seed=1))
+    command.openai_gateway.generate_many.return_value = {
+        'facebook': "Facebook content", 'twitter': "Tweet content"
+    }
+    with patch.object(command, '_post_content',
+                      side_effect=lambda platform, content, dry_run, topic: (content, {"id": platform})):
+        command.execute_many(['facebook', 'twitter'], single_request=True)
+
+    assert store.usage('facebook').keys() == store.usage('twitter').keys()
+    assert len(store.usage('twitter')) == 1
+
+
+def test_rotation_can_be_disabled():
+    """
+    Test that without rotation (e.g. with a seed) topics are drawn at random.
+    """
+    command = PostCommand(container=Container(), rotation=False)
+
+    assert command.container.resolve('topic_rotation') is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
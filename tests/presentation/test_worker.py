@@ -0,0 +1,212 @@
+# tests/presentation/test_worker.py
+
+"""
+This module contains unit tests for the Worker draining the scheduled-post queue.
+Time is simulated: the worker's sleeps advance a fake clock instead of waiting.
+"""
+
+import threading
+import pytest
+from unittest.mock import MagicMock
+from src.infrastructure.container import Container
+from src.infrastructure.persistence.job_store import JobStore
+from src.presentation.post_command import PostCommand
+from src.presentation.worker import Worker
+from src.domain.exceptions import ConfigurationError, DuplicateContentError, TwitterError
+
+DAY = 24 * 3600
+
+
+class SimulatedClock:
+    """A clock whose sleep advances time instantly."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return SimulatedClock()
+
+
+@pytest.fixture
+def store(clock):
+    return JobStore(':memory:', clock=clock)
+
+
+@pytest.fixture
+def command():
+    command = MagicMock()
+    command.publish.side_effect = lambda platform, dry_run, topic: {
+        'content': f"{platform} content", 'result': None, 'post_id': f"{platform}-id"
+    }
+    return command
+
+
+def make_worker(store, command, clock, **kwargs):
+    return Worker(store, command, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_run_once_runs_due_jobs(store, command, clock):
+    """Test that due jobs are run and completed, future ones left pending."""
+    due = store.add('twitter', clock.now, topic='developer')
+    future = store.add('facebook', clock.now + 60)
+
+    statuses = make_worker(store, command, clock, dry_run=True).run_once()
+
+    assert statuses == {due: 'done'}
+    command.publish.assert_called_once_with('twitter', True, 'developer')
+    assert store.get(due)['post_id'] == "twitter-id"
+    assert store.get(future)['status'] == 'pending'
+
+
+def test_jobs_generate_on_their_topic_category(store, clock):
+    """Test that the category of a job reaches the prompt of its generation."""
+    command = PostCommand(container=Container(), dedup=False)
+    openai = MagicMock(generate=MagicMock(return_value="Generated content #TechAware"))
+    command.container.override('openai_gateway', openai)
+    for platform in ('facebook', 'linkedin', 'twitter', 'twitter'):
+        store.add(platform, clock.now, topic='slides')
+
+    statuses = make_worker(store, command, clock, max_workers=4, dry_run=True).run_once()
+
+    assert set(statuses.values()) == {'done'}
+    prompts = [call.args[0] for call in openai.generate.call_args_list]
+    assert len(prompts) == 4
+    assert all("techaware.net/slides/" in prompt for prompt in prompts)
+
+
+def test_run_once_bounds_the_batch(store, command, clock):
+    """Test that a batch claims at most ``max_workers`` jobs."""
+    for _ in range(5):
+        store.add('linkedin', clock.now)
+
+    assert len(make_worker(store, command, clock, max_workers=2).run_once()) == 2
+    assert store.counts()['pending'] == 3
+
+
+def test_failed_job_is_retried_with_backoff(store, command, clock):
+    """Test that a transient failure reschedules the job after the retry delay, doubled per attempt."""
+    job_id = store.add('twitter', clock.now, max_attempts=3)
+    command.publish.side_effect = TwitterError("X unavailable", transient=True)
+    worker = make_worker(store, command, clock, retry_delay=100)
+
+    assert worker.run_once() == {job_id: 'pending'}
+    assert store.get(job_id)['due_at'] == clock.now + 100
+
+    summary = worker.run(drain=True)
+
+    assert summary == {'done': 0, 'pending': 1, 'failed': 1}
+    assert clock.sleeps == [100, 200]
+    assert store.get(job_id)['status'] == 'failed'
+    assert store.get(job_id)['last_error'] == "X unavailable"
+
+
+def test_permanent_failure_is_not_retried(store, command, clock):
+    """Test that content refused by a platform or by the duplicate check fails its job at once."""
+    refused = store.add('twitter', clock.now, max_attempts=3)
+    duplicate = store.add('linkedin', clock.now, max_attempts=3)
+    errors = {'twitter': TwitterError("Forbidden", status_code=403),
+              'linkedin': DuplicateContentError("Too close to an earlier post")}
+
+    def publish(platform, dry_run, topic):
+        raise errors[platform]
+
+    command.publish.side_effect = publish
+
+    statuses = make_worker(store, command, clock).run_once()
+
+    assert statuses == {refused: 'failed', duplicate: 'failed'}
+    assert store.get(refused)['attempts'] == 1
+    assert store.get(duplicate)['last_error'] == "Too close to an earlier post"
+
+
+def test_retry_honours_advertised_delay(store, command, clock):
+    """Test that the delay advertised by the platform replaces the backoff."""
+    job_id = store.add('twitter', clock.now)
+    command.publish.side_effect = TwitterError("Rate limited", transient=True, retry_after=900)
+
+    make_worker(store, command, clock, retry_delay=100).run_once()
+
+    assert store.get(job_id)['due_at'] == clock.now + 900
+
+
+def test_drain_a_week_of_posts(store, command, clock):
+    """Test that a worker drains a week of posts, waking up once per due time."""
+    start = clock.now
+    for day in range(7):
+        for platform in ('facebook', 'linkedin', 'twitter'):
+            store.add(platform, start + day * DAY + 9 * 3600)
+
+    summary = make_worker(store, command, clock, max_workers=3).run(drain=True)
+
+    assert summary == {'done': 21, 'pending': 0, 'failed': 0}
+    assert len(clock.sleeps) == 7
+    assert clock.now == start + 6 * DAY + 9 * 3600
+    assert command.publish.call_count == 21
+
+
+def test_idle_worker_polls_for_new_jobs(store, command, clock):
+    """Test that a running worker never sleeps longer than the poll interval."""
+    store.add('twitter', clock.now + 3600)
+    worker = make_worker(store, command, clock, poll_interval=600)
+
+    summary = worker.run(max_jobs=1)
+
+    assert summary['done'] == 1
+    assert clock.sleeps == [600] * 6
+
+
+def test_run_recovers_interrupted_jobs(store, command, clock):
+    """Test that jobs left running by a stopped worker are run again once their claim is stale."""
+    job_id = store.add('twitter', clock.now)
+    store.claim_due(1)
+    clock.now += 600
+
+    make_worker(store, command, clock, stale_after=600).run(drain=True)
+
+    assert store.get(job_id)['status'] == 'done'
+
+
+def test_starting_worker_leaves_running_jobs_alone(store, command, clock):
+    """Test that a second worker does not run again the jobs another worker is running."""
+    job_id = store.add('twitter', clock.now)
+    store.claim_due(1)
+
+    summary = make_worker(store, command, clock, stale_after=600).run(drain=True)
+
+    assert summary == {'done': 0, 'pending': 0, 'failed': 0}
+    command.publish.assert_not_called()
+    assert store.get(job_id)['attempts'] == 1
+
+
+def test_stop_interrupts_the_wait(store, command):
+    """Test that stop wakes up a worker waiting for its next job."""
+    store.add('twitter', store._clock() + DAY)
+    worker = Worker(store, command, poll_interval=DAY)
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+
+    worker.stop()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    command.publish.assert_not_called()
+
+
+def test_invalid_max_workers(store, command):
+    """Test that a worker needs at least one slot."""
+    with pytest.raises(ConfigurationError):
+        Worker(store, command, max_workers=0)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,65 @@
+# tests/use_cases/test_duplicate_gate.py
+
+"""
+This module contains unit tests for DuplicateGate: rejecting near-duplicates of the
+published texts, generating again, and indexing new publications.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from src.infrastructure.persistence.duplicate_index import DuplicateIndex
+from src.use_cases.duplicate_gate import DuplicateGate
+from src.domain.exceptions import DuplicateContentError, ValidationError
+
+POST = ("Nos développeurs juniors encadrés par des seniors livrent vos projets digitaux "
+        "à moindre coût, découvrez comment.")
+OTHER = "Le mentorat donne confiance aux développeurs qui débutent leur carrière chez nous."
+
+
+@pytest.fixture
+def gate():
+    gate = DuplicateGate(DuplicateIndex(':memory:'), threshold=0.8, max_regenerations=2)
+    gate.remember('linkedin', POST)
+    return gate
+
+
+def test_check_rejects_near_duplicate(gate):
+    """Test that a duplicate is rejected with its similarity and the matching publication."""
+    with pytest.raises(DuplicateContentError) as error:
+        gate.check('linkedin', POST)
+
+    assert isinstance(error.value, ValidationError)
+    assert error.value.similarity == 1.0
+    assert error.value.match_id is not None
+    gate.check('linkedin', OTHER)
+    gate.check('twitter', POST)
+
+
+def test_generate_retries_until_original(gate):
+    """Test that a duplicate is generated again until the content is original."""
+    generate = MagicMock(side_effect=[POST, OTHER])
+
+    assert gate.generate('linkedin', generate) == OTHER
+    assert generate.call_count == 2
+
+
+def test_generate_gives_up_after_max_regenerations(gate):
+    """Test that the duplicate is rejected once the regenerations are exhausted."""
+    generate = MagicMock(return_value=POST)
+
+    with pytest.raises(DuplicateContentError):
+        gate.generate('linkedin', generate)
+    assert generate.call_count == 3
+
+
+def test_backfill_indexes_publications():
+    """Test that earlier publications are indexed and counted."""
+    gate = DuplicateGate(DuplicateIndex(':memory:'))
+
+    assert gate.backfill([('linkedin', POST), ('twitter', OTHER)]) == 2
+    with pytest.raises(DuplicateContentError):
+        gate.check('twitter', OTHER)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,133 @@
+# tests/use_cases/test_generate_campaign.py
+
+"""
+This module contains unit tests for the GenerateCampaignUseCase class: the campaign
+plan, the bounded concurrent generation and the resumption of an interrupted campaign.
+"""
+
+import asyncio
+import pytest
+from collections import Counter
+from unittest.mock import Mock
+
+from src.infrastructure.persistence.campaign_log import CampaignLog
+from src.infrastructure.prompting.prompt_builder import PromptBuilder
+from src.use_cases.generate_campaign import GenerateCampaignUseCase
+from src.domain.exceptions import OpenAIError, ValidationError
+
+
+class FakeGateway:
+    """Asynchronous gateway recording the highest number of requests in flight."""
+
+    def __init__(self, fail_on=()):
+        self.fail_on = fail_on
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_async(self, prompt, max_length=None):
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if any(subject in prompt for subject in self.fail_on):
+            raise OpenAIError("OpenAI API error")
+        return f"Post {len(self.prompts)}"
+
+
+@pytest.fixture
+def log(tmp_path):
+    return CampaignLog(str(tmp_path / 'campaign.jsonl'))
+
+
+def test_plan_covers_platforms_and_categories():
+    """Test that each topic is adapted to every platform and categories are used in turn."""
+    plan = GenerateCampaignUseCase(Mock()).plan(18, seed=1)
+
+    assert [item['index'] for item in plan] == list(range(18))
+    assert Counter(item['platform'] for item in plan) == {'facebook': 6, 'linkedin': 6, 'twitter': 6}
+    assert Counter(item['category'] for item in plan) == {'business': 6, 'developer': 6, 'slides': 6}
+    assert plan[0]['topic'] == plan[1]['topic'] == plan[2]['topic']
+    assert plan[0]['category'] != plan[3]['category']
+
+
+def test_plan_exhausts_topics_before_reuse():
+    """Test that no topic of a category is repeated before all of them were used."""
+    topics = PromptBuilder.TOPICS_DATABASE['developer']
+    plan = GenerateCampaignUseCase(Mock()).plan(len(topics), platforms=['twitter'], categories=['developer'])
+
+    assert sorted(item['topic']['subject'] for item in plan) == sorted(topic['subject'] for topic in topics)
+
+
+def test_plan_is_reproducible_with_seed():
+    """Test that a seed gives the same plan."""
+    use_case = GenerateCampaignUseCase(Mock())
+
+    assert use_case.plan(9, seed=7) == use_case.plan(9, seed=7)
+
+
+def test_plan_validation():
+    """Test that invalid counts, platforms and categories are rejected."""
+    use_case = GenerateCampaignUseCase(Mock())
+
+    with pytest.raises(ValidationError):
+        use_case.plan(0)
+    with pytest.raises(ValidationError):
+        use_case.plan(3, platforms=['mastodon'])
+    with pytest.raises(ValidationError):
+        use_case.plan(3, categories=['sports'])
+
+
+def test_execute_writes_every_item_with_bounded_concurrency(log):
+    """Test that every item is written and no more requests than allowed are in flight."""
+    gateway = FakeGateway()
+    use_case = GenerateCampaignUseCase(gateway)
+    plan = use_case.plan(12, seed=3)
+
+    summary = use_case.execute(plan, log, concurrency=2)
+
+    assert summary == {'planned': 12, 'skipped': 0, 'success': 12, 'failed': 0}
+    assert gateway.max_in_flight == 2
+    records = log.records()
+    assert sorted(record['index'] for record in records) == list(range(12))
+    assert all(record['content'] and record['error'] is None for record in records)
+
+
+def test_failures_are_recorded_then_retried(log):
+    """Test that a failed item does not stop the campaign and is retried by the next run."""
+    use_case = GenerateCampaignUseCase(FakeGateway())
+    plan = use_case.plan(6, platforms=['linkedin'], seed=5)
+    failing = plan[2]['topic']['subject']
+    use_case.openai_gateway = FakeGateway(fail_on=[failing])
+
+    first = use_case.execute(plan, log)
+    assert first['failed'] == sum(item['topic']['subject'] == failing for item in plan)
+    assert first['success'] == 6 - first['failed']
+
+    retry_gateway = FakeGateway()
+    use_case.openai_gateway = retry_gateway
+    second = use_case.execute(plan, log)
+
+    assert second == {'planned': 6, 'skipped': first['success'], 'success': first['failed'], 'failed': 0}
+    assert len(retry_gateway.prompts) == first['failed']
+    assert log.completed() == set(range(6))
+
+
+def test_too_long_publication_fails(log):
+    """Test that a publication over the platform limit is recorded as failed."""
+    gateway = Mock()
+
+    async def too_long(prompt, max_length=None):
+        return "x" * (max_length + 1)
+    gateway.generate_async = too_long
+    use_case = GenerateCampaignUseCase(gateway)
+
+    summary = use_case.execute(use_case.plan(1, platforms=['twitter']), log)
+
+    assert summary['failed'] == 1
+    assert "exceeds 280" in log.records()[0]['error']
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
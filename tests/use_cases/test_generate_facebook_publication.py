@@ -8,8 +8,9 @@ successful publication generation and error handling.
 
 import sys
 import os
+import asyncio
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -88,5 +89,18 @@ def test_generate_facebook_publication_prompt_building(mock_openai_gateway):
     assert "storytelling" in call_args.lower()
 
 
+def test_generate_facebook_publication_async(mock_openai_gateway):
+    """
+    Test asynchronous Facebook publication generation through generate_async.
+    """
+    mock_openai_gateway.generate_async = AsyncMock(return_value="Async Facebook publication")
+    use_case = GenerateFacebookPublicationUseCase(mock_openai_gateway)
+
+    result = asyncio.run(use_case.execute_async())
+
+    assert result == "Async Facebook publication"
+    assert "facebook" in mock_openai_gateway.generate_async.call_args[0][0].lower()
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
\ No newline at end of file
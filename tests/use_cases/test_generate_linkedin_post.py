@@ -8,8 +8,9 @@ successful post generation and error handling.
 
 import sys
 import os
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, AsyncMock, patch
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -76,5 +77,18 @@ def test_generate_linkedin_post_unexpected_error(mock_openai_gateway):
     assert "Unexpected error generating LinkedIn post" in str(exc_info.value)
 
 
+def test_generate_linkedin_post_async(mock_openai_gateway):
+    """
+    Test asynchronous LinkedIn post generation through generate_async.
+    """
+    mock_openai_gateway.generate_async = AsyncMock(return_value="Async LinkedIn post")
+    use_case = GenerateLinkedInPostUseCase(mock_openai_gateway)
+
+    result = asyncio.run(use_case.execute_async())
+
+    assert result == "Async LinkedIn post"
+    assert "linkedin" in mock_openai_gateway.generate_async.call_args[0][0].lower()
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
\ No newline at end of file
@@ -0,0 +1,91 @@
+# tests/use_cases/test_generate_multi_platform.py
+
+"""
+This module contains unit tests for the GenerateMultiPlatformUseCase class.
+It tests the single-request generation of several platform variants and its
+error handling.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from src.use_cases.generate_multi_platform import GenerateMultiPlatformUseCase
+from src.domain.exceptions import OpenAIError
+
+
+@pytest.fixture
+def mock_openai_gateway():
+    """
+    Fixture providing a mock OpenAI gateway.
+    """
+    mock = Mock()
+    mock.generate_many.return_value = {'facebook': "Facebook", 'linkedin': "LinkedIn", 'twitter': "Tweet"}
+    return mock
+
+
+def test_generate_all_platforms_in_one_request(mock_openai_gateway):
+    """
+    Test that every platform is requested in a single prompt.
+    """
+    use_case = GenerateMultiPlatformUseCase(mock_openai_gateway)
+
+    result = use_case.execute(topic_category='developer')
+
+    assert result == {'facebook': "Facebook", 'linkedin': "LinkedIn", 'twitter': "Tweet"}
+    mock_openai_gateway.generate_many.assert_called_once()
+    prompt, specs = mock_openai_gateway.generate_many.call_args[0]
+    assert list(specs) == ['facebook', 'linkedin', 'twitter']
+    assert specs['twitter'] == {'tag': 'x_post', 'max_length': 280}
+    assert GenerateMultiPlatformUseCase.PLATFORM_INSTRUCTIONS['linkedin'] in prompt
+
+
+def test_generate_selected_platforms(mock_openai_gateway):
+    """
+    Test that only the selected platforms are requested.
+    """
+    use_case = GenerateMultiPlatformUseCase(mock_openai_gateway)
+
+    use_case.execute(platforms=['twitter', 'facebook'])
+
+    _, specs = mock_openai_gateway.generate_many.call_args[0]
+    assert list(specs) == ['twitter', 'facebook']
+
+
+def test_generate_openai_error(mock_openai_gateway):
+    """
+    Test that OpenAI errors are propagated unchanged.
+    """
+    mock_openai_gateway.generate_many.side_effect = OpenAIError("Variant missing")
+    use_case = GenerateMultiPlatformUseCase(mock_openai_gateway)
+
+    with pytest.raises(OpenAIError) as exc_info:
+        use_case.execute()
+    assert "Variant missing" in str(exc_info.value)
+
+
+def test_generate_invalid_topic(mock_openai_gateway):
+    """
+    Test that an invalid topic category is reported as an OpenAIError.
+    """
+    use_case = GenerateMultiPlatformUseCase(mock_openai_gateway)
+
+    with pytest.raises(OpenAIError) as exc_info:
+        use_case.execute(topic_category='cooking')
+    assert "Invalid topic category" in str(exc_info.value)
+
+
+def test_generate_async(mock_openai_gateway):
+    """
+    Test asynchronous generation through generate_many_async.
+    """
+    mock_openai_gateway.generate_many_async = AsyncMock(return_value={'twitter': "Tweet"})
+    use_case = GenerateMultiPlatformUseCase(mock_openai_gateway)
+
+    result = asyncio.run(use_case.execute_async(platforms=['twitter']))
+
+    assert result == {'twitter': "Tweet"}
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -6,15 +6,16 @@ It tests the execution of the use case with various scenarios including
 successful tweet generation and error handling.
 """
 
+import asyncio
 import pytest
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock
 from src.use_cases.generate_tweet import GenerateTweetUseCase
-from src.domain.exceptions import OpenAIError, TweetGenerationError
+from src.domain.exceptions import ContentLengthError, OpenAIError, TweetGenerationError, TweetLengthError
 
 
 @pytest.fixture
@@ -75,6 +76,88 @@ def test_generate_tweet_too_long(mock_openai_gateway):
     assert mock_openai_gateway.generate.call_count == 2  # Should be called twice
 
 
+def test_generate_tweet_too_long_gives_up(mock_openai_gateway):
+    """
+    Test that generation stops with a typed error after max_attempts over-length tweets.
+    """
+    mock_openai_gateway.generate.return_value = "x" * 281
+
+    use_case = GenerateTweetUseCase(mock_openai_gateway, max_attempts=3)
+    with pytest.raises(TweetLengthError) as exc_info:
+        use_case.execute()
+
+    assert "after 3 attempts" in str(exc_info.value)
+    assert mock_openai_gateway.generate.call_count == 3
+
+
+def test_generate_tweet_aborted_stream_counts_as_attempt(mock_openai_gateway):
+    """
+    Test that a generation aborted for its length is retried within max_attempts.
+    """
+    mock_openai_gateway.generate.side_effect = [
+        ContentLengthError("Generated content exceeds 280 characters, generation aborted"),
+        "Valid short tweet",
+    ]
+
+    use_case = GenerateTweetUseCase(mock_openai_gateway)
+
+    assert use_case.execute() == "Valid short tweet"
+    assert mock_openai_gateway.generate.call_args.kwargs['max_length'] == 280
+
+
+def test_generate_tweet_candidates_selects_best(mock_openai_gateway):
+    """
+    Test that candidates mode makes one request and keeps the best tweet within the limit.
+    """
+    mock_openai_gateway.generate_candidates.return_value = [
+        "x" * 290,  # trop long
+        "y" * 260,  # dans la limite mais au-delà de la cible
+        "z" * 120,
+        "w" * 240,
+    ]
+
+    use_case = GenerateTweetUseCase(mock_openai_gateway, candidates=4)
+    result = use_case.execute()
+
+    assert result == "w" * 240
+    mock_openai_gateway.generate_candidates.assert_called_once()
+    assert mock_openai_gateway.generate_candidates.call_args[0][1] == 4
+    assert mock_openai_gateway.generate_candidates.call_args.kwargs['max_length'] == 280
+    mock_openai_gateway.generate.assert_not_called()
+
+
+def test_generate_tweet_candidates_over_target(mock_openai_gateway):
+    """
+    Test that the shortest fitting candidate is kept when none is within the target length.
+    """
+    mock_openai_gateway.generate_candidates.return_value = ["a" * 275, "b" * 255, "c" * 300]
+
+    use_case = GenerateTweetUseCase(mock_openai_gateway, candidates=3)
+
+    assert use_case.execute() == "b" * 255
+
+
+def test_generate_tweet_candidates_bounded(mock_openai_gateway):
+    """
+    Test that candidates mode retries a new batch, up to max_attempts.
+    """
+    mock_openai_gateway.generate_candidates.return_value = ["x" * 300, "y" * 281]
+
+    use_case = GenerateTweetUseCase(mock_openai_gateway, candidates=2, max_attempts=2)
+    with pytest.raises(TweetLengthError):
+        use_case.execute()
+
+    assert mock_openai_gateway.generate_candidates.call_count == 2
+
+
+def test_generate_tweet_invalid_settings(mock_openai_gateway):
+    """
+    Test that the number of candidates and attempts must be positive.
+    """
+    with pytest.raises(TweetGenerationError):
+        GenerateTweetUseCase(mock_openai_gateway, candidates=0)
+
+
 def test_generate_tweet_unexpected_error(mock_openai_gateway):
     """
     Test handling of unexpected errors during tweet generation.
@@ -88,5 +171,56 @@ def test_generate_tweet_unexpected_error(mock_openai_gateway):
     assert "Unexpected error generating tweet: Unexpected error" in str(exc_info.value)
 
 
+def test_generate_tweet_async_success(mock_openai_gateway):
+    """
+    Test asynchronous tweet generation through generate_async.
+    """
+    mock_openai_gateway.generate_async = AsyncMock(return_value="Short async tweet")
+    use_case = GenerateTweetUseCase(mock_openai_gateway)
+
+    result = asyncio.run(use_case.execute_async())
+
+    assert result == "Short async tweet"
+    prompt = mock_openai_gateway.generate_async.call_args[0][0]
+    assert "twitter" in prompt.lower()
+    mock_openai_gateway.generate.assert_not_called()
+
+
+def test_generate_tweet_async_openai_error(mock_openai_gateway):
+    """
+    Test handling of OpenAIError during asynchronous tweet generation.
+    """
+    mock_openai_gateway.generate_async = AsyncMock(side_effect=OpenAIError("API error"))
+    use_case = GenerateTweetUseCase(mock_openai_gateway)
+
+    with pytest.raises(TweetGenerationError) as exc_info:
+        asyncio.run(use_case.execute_async())
+
+    assert "Error generating tweet: API error" in str(exc_info.value)
+
+
+
+def test_generate_tweet_async_candidates(mock_openai_gateway):
+    """
+    Test asynchronous candidates mode through generate_candidates_async.
+    """
+    mock_openai_gateway.generate_candidates_async = AsyncMock(return_value=["x" * 281, "Async tweet"])
+    use_case = GenerateTweetUseCase(mock_openai_gateway, candidates=2)
+
+    assert asyncio.run(use_case.execute_async()) == "Async tweet"
+
+
+def test_generate_tweet_async_too_long_gives_up(mock_openai_gateway):
+    """
+    Test that asynchronous generation is bounded as well.
+    """
+    mock_openai_gateway.generate_async = AsyncMock(return_value="x" * 281)
+    use_case = GenerateTweetUseCase(mock_openai_gateway, max_attempts=2)
+
+    with pytest.raises(TweetLengthError):
+        asyncio.run(use_case.execute_async())
+    assert mock_openai_gateway.generate_async.call_count == 2
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
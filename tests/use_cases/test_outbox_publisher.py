@@ -0,0 +1,189 @@
+# tests/use_cases/test_outbox_publisher.py
+
+"""
+This module contains unit tests for OutboxPublisher: resuming pending publications,
+posting each publication once and surviving a crash between the post and its record.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from src.infrastructure.persistence.duplicate_index import DuplicateIndex
+from src.infrastructure.persistence.outbox_store import OutboxStore
+from src.use_cases.duplicate_gate import DuplicateGate
+from src.use_cases.outbox_publisher import OutboxPublisher, extract_post_id
+from src.infrastructure.utils.concurrency import run_concurrently
+from src.domain.exceptions import AutomatorError, DuplicateContentError, FacebookError, TwitterError
+
+
+@pytest.fixture
+def store(tmp_path):
+    return OutboxStore(str(tmp_path / 'outbox.sqlite3'))
+
+
+def test_prepare_generates_and_records(store):
+    """Test that new content is generated and recorded as pending before posting."""
+    publisher = OutboxPublisher(store)
+    generate = MagicMock(return_value="New post")
+
+    item = publisher.prepare('linkedin', generate)
+
+    assert item['content'] == "New post"
+    assert store.get(item['id'])['status'] == 'pending'
+    generate.assert_called_once()
+
+
+def test_prepare_resumes_pending_without_generating(store):
+    """Test that a pending publication is reused instead of generating a new one."""
+    publisher = OutboxPublisher(store)
+    pending = publisher.record('linkedin', "Pending post")
+    publisher.unclaim(pending)  # le processus précédent l'a rendue sans la poster
+    generate = MagicMock()
+
+    assert publisher.prepare('linkedin', generate)['id'] == pending['id']
+    generate.assert_not_called()
+
+
+def test_concurrent_prepares_never_share_a_publication(store):
+    """Test that concurrent posts of a platform never take the same pending publication."""
+    publisher = OutboxPublisher(store)
+    publisher.unclaim(publisher.record('twitter', "Pending tweet"))
+
+    outcomes = run_concurrently({index: (lambda index=index: publisher.prepare('twitter', lambda: f"Tweet {index}"))
+                                 for index in range(4)}, max_workers=4)
+
+    ids = [outcome['result']['id'] for outcome in outcomes.values()]
+    assert len(set(ids)) == 4
+    assert sum(outcome['result']['content'] == "Pending tweet" for outcome in outcomes.values()) == 1
+
+
+def test_prepare_resumes_only_the_requested_category(store):
+    """Test that a run asking for a category generates rather than resume another category."""
+    publisher = OutboxPublisher(store)
+    publisher.unclaim(publisher.record('facebook', "Slides post", category='slides'))
+
+    item = publisher.prepare('facebook', lambda: "Developer post", category='developer')
+
+    assert item['content'] == "Developer post"
+    assert store.get(item['id'])['category'] == 'developer'
+    assert publisher.prepare('facebook', MagicMock(), category='slides')['content'] == "Slides post"
+
+
+def test_post_records_post_id(store):
+    """Test that a successful post is marked published with its post id."""
+    publisher = OutboxPublisher(store)
+    item = publisher.record('twitter', "Tweet")
+    post = MagicMock(return_value={"data": {"id": "42"}})
+
+    assert publisher.post(item, post) == {"data": {"id": "42"}}
+    post.assert_called_once_with("Tweet")
+    assert store.get(item['id'])['post_id'] == "42"
+
+
+def test_post_failure_keeps_publication_pending(store):
+    """Test that a post that failed temporarily can be resumed by the next run."""
+    publisher = OutboxPublisher(store)
+    item = publisher.record('facebook', "Post")
+
+    with pytest.raises(FacebookError):
+        publisher.post(item, MagicMock(side_effect=FacebookError("Facebook API error", transient=True)))
+
+    assert store.next_pending('facebook')['id'] == item['id']
+
+
+def test_permanent_failure_does_not_block_the_platform(store):
+    """Test that a post refused for good is marked failed, so that new content is generated."""
+    publisher = OutboxPublisher(store)
+    generate = MagicMock(side_effect=["Refused tweet", "Next tweet"])
+    refused = publisher.prepare('twitter', generate)
+
+    with pytest.raises(TwitterError):
+        publisher.post(refused, MagicMock(side_effect=TwitterError("Forbidden", transient=False, status_code=403)))
+
+    failed = store.get(refused['id'])
+    assert failed['status'] == 'failed'
+    assert failed['attempts'] == 1 and failed['last_error'] == "Forbidden"
+    item = publisher.prepare('twitter', generate)
+    assert item['content'] == "Next tweet"
+    assert publisher.post(item, MagicMock(return_value={"data": {"id": "7"}})) == {"data": {"id": "7"}}
+    assert generate.call_count == 2
+
+
+def test_published_content_is_not_posted_again(store):
+    """Test that identical content already published returns the recorded response."""
+    publisher = OutboxPublisher(store)
+    publisher.post(publisher.record('facebook', "Post"), MagicMock(return_value={"id": "1_2"}))
+    post = MagicMock()
+
+    assert publisher.post(publisher.record('facebook', "Post"), post) == {"id": "1_2"}
+    post.assert_not_called()
+
+
+def test_crash_after_post_is_never_reposted(tmp_path):
+    """
+    Test that a publication interrupted between its post and its record is neither
+    posted again nor regenerated by the next process.
+    """
+    path = str(tmp_path / 'outbox.sqlite3')
+    clock = MagicMock(return_value=1_000_000.0)
+    store = OutboxStore(path, clock=clock)
+    item = OutboxPublisher(store).record('facebook', "Post")
+    store.begin_posting(item['id'])  # le processus s'arrête pendant la requête
+    store.close()
+
+    clock.return_value += 7200
+    restarted = OutboxPublisher(OutboxStore(path, clock=clock))
+    generate = MagicMock(return_value="New post")
+
+    assert restarted.store.get(item['id'])['status'] == 'unknown'
+    assert restarted.prepare('facebook', generate)['content'] == "New post"
+    with pytest.raises(AutomatorError):
+        restarted.post(restarted.store.get(item['id']), MagicMock())
+
+
+def test_without_store_posts_directly():
+    """Test that without a store the publisher just generates and posts."""
+    publisher = OutboxPublisher(None)
+    item = publisher.prepare('twitter', lambda: "Tweet")
+    post = MagicMock(return_value={"id": "1"})
+
+    assert publisher.post(item, post) == {"id": "1"}
+    assert publisher.post(item, post) == {"id": "1"}
+    assert post.call_count == 2
+
+
+def test_gate_regenerates_and_indexes_published_content(store):
+    """Test that near-duplicates are generated again and posted content is indexed."""
+    gate = DuplicateGate(DuplicateIndex(':memory:'))
+    publisher = OutboxPublisher(store, gate=gate)
+    first = "Nos développeurs juniors encadrés livrent vos projets digitaux à moindre coût"
+    publisher.post(publisher.prepare('facebook', lambda: first), MagicMock(return_value={"id": "1_2"}))
+    generate = MagicMock(side_effect=[first, "Un tout autre sujet sur le mentorat des développeurs"])
+
+    item = publisher.prepare('facebook', generate)
+
+    assert item['content'].startswith("Un tout autre sujet")
+    assert gate.index.count('facebook') == 1
+    with pytest.raises(DuplicateContentError):
+        publisher.record('facebook', first)
+
+
+def test_failed_post_is_not_indexed(store):
+    """Test that only content actually published is indexed."""
+    gate = DuplicateGate(DuplicateIndex(':memory:'))
+    publisher = OutboxPublisher(store, gate=gate)
+    item = publisher.record('facebook', "Post")
+
+    with pytest.raises(FacebookError):
+        publisher.post(item, MagicMock(side_effect=FacebookError("Facebook API error")))
+    assert gate.index.count() == 0
+
+
+def test_extract_post_id():
+    """Test the post id of each platform's response format."""
+    assert extract_post_id({"id": "1_2"}) == "1_2"
+    assert extract_post_id({"data": {"id": "3"}}) == "3"
+    assert extract_post_id("ok") is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -8,8 +8,9 @@ successful posting and error handling.
 
 import sys
 import os
+import asyncio
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock
 
 # Add the project root directory to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -17,7 +18,7 @@ sys.path.insert(0, project_root)
 
 from src.use_cases.post_facebook import PostFacebookUseCase
 from src.domain.entities.facebook_publication import FacebookPublication
-from src.domain.exceptions import AutomatorError, ValidationError
+from src.domain.exceptions import AutomatorError, FacebookError, ValidationError
 
 @pytest.fixture
 def mock_facebook_gateway():
@@ -78,6 +79,36 @@ def test_post_facebook_gateway_error(mock_facebook_gateway):
 
     assert "Failed to post to Facebook" in str(exc_info.value)
     assert "Gateway error" in str(exc_info.value)
+    assert not exc_info.value.transient
+
+def test_post_facebook_keeps_transient_errors_transient(mock_facebook_gateway):
+    """
+    Test that a temporary gateway failure stays flagged as such once wrapped.
+    """
+    mock_facebook_gateway.post.side_effect = FacebookError("Rate limited", transient=True, retry_after=30,
+                                                           status_code=429)
+    use_case = PostFacebookUseCase(mock_facebook_gateway)
+
+    with pytest.raises(AutomatorError) as exc_info:
+        use_case.execute("Test Facebook post")
+
+    assert exc_info.value.transient
+    assert exc_info.value.retry_after == 30 and exc_info.value.status_code == 429
+
+def test_post_facebook_async(mock_facebook_gateway):
+    """
+    Test asynchronous posting through post_async.
+    """
+    mock_facebook_gateway.post_async = AsyncMock(return_value={"id": "123_456"})
+    use_case = PostFacebookUseCase(mock_facebook_gateway)
+
+    result = asyncio.run(use_case.execute_async("Test Facebook post"))
+
+    assert result == {"id": "123_456"}
+    publication = mock_facebook_gateway.post_async.call_args[0][0]
+    assert isinstance(publication, FacebookPublication)
+    assert publication.get_text() == "Test Facebook post"
+
 
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
\ No newline at end of file
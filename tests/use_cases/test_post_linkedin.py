@@ -6,6 +6,7 @@ It tests the execution of the use case with various scenarios including
 successful publication posting and error handling.
 """
 
+import asyncio
 import pytest
 import sys
 import os
@@ -14,7 +15,7 @@ import os
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
 
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock
 from src.use_cases.post_linkedin import PostLinkedInUseCase
 from src.domain.entities.linkedin_publication import LinkedInPublication
 from src.domain.exceptions import LinkedInError, ValidationError, AutomatorError
@@ -80,5 +81,18 @@ def test_post_linkedin_unexpected_error(mock_linkedin_gateway):
     mock_linkedin_gateway.post.assert_called_once()
 
 
+def test_post_linkedin_async(mock_linkedin_gateway):
+    """
+    Test asynchronous posting through post_async.
+    """
+    mock_linkedin_gateway.post_async = AsyncMock(return_value={"id": "urn:li:share:1"})
+    use_case = PostLinkedInUseCase(mock_linkedin_gateway)
+
+    result = asyncio.run(use_case.execute_async("Test LinkedIn post"))
+
+    assert result == {"id": "urn:li:share:1"}
+    assert isinstance(mock_linkedin_gateway.post_async.call_args[0][0], LinkedInPublication)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
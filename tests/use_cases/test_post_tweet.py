@@ -6,13 +6,14 @@ It tests the execution of the use case with various scenarios including
 successful tweet posting and error handling.
 """
 
+import asyncio
 import pytest
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock
 from src.use_cases.post_tweet import PostTweetUseCase
 from src.domain.entities.tweet import Tweet
 from src.domain.exceptions import TwitterError, ValidationError, AutomatorError
@@ -75,5 +76,30 @@ def test_post_tweet_unexpected_error(mock_twitter_gateway):
     mock_twitter_gateway.post_tweet.assert_called_once()
 
 
+def test_post_tweet_async(mock_twitter_gateway):
+    """
+    Test asynchronous tweet posting through post_tweet_async.
+    """
+    mock_twitter_gateway.post_tweet_async = AsyncMock(return_value={"data": {"id": "123456"}})
+    use_case = PostTweetUseCase(mock_twitter_gateway)
+
+    result = asyncio.run(use_case.execute_async("Test tweet"))
+
+    assert result == {"data": {"id": "123456"}}
+    assert mock_twitter_gateway.post_tweet_async.call_args[0][0].get_text() == "Test tweet"
+
+
+def test_post_tweet_async_too_long(mock_twitter_gateway):
+    """
+    Test that an invalid tweet is rejected before any asynchronous call.
+    """
+    mock_twitter_gateway.post_tweet_async = AsyncMock()
+    use_case = PostTweetUseCase(mock_twitter_gateway)
+
+    with pytest.raises(AutomatorError):
+        asyncio.run(use_case.execute_async("x" * 281))
+    mock_twitter_gateway.post_tweet_async.assert_not_awaited()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file